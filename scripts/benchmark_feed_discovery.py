@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Batch Feed Discovery Benchmark
+
+Measures RSSFeedDiscoverer.batch_discover throughput (sites/s) against a
+local aiohttp fixture server, one site at a time (max_concurrent_sites=1)
+vs concurrent.
+
+Each fixture site listens on its own port (= its own host for per-host
+politeness), serves an HTML page linking its own feed plus a feed shared by
+all sites, and answers pattern probes with 404 after a simulated latency.
+No network needed.
+
+Usage:
+    python scripts/benchmark_feed_discovery.py
+    python scripts/benchmark_feed_discovery.py --sites 1000 --concurrency 50 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import sys
+import time
+from collections import Counter
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from aiohttp import web
+
+from src.collectors.rss_feed_discoverer import RSSFeedDiscoverer
+
+
+RSS_XML = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel>
+<title>Fixture Feed</title><description>Fixture</description>
+<item><title>Entry</title><link>https://example.com/a</link></item>
+</channel></rss>"""
+
+
+class FixtureServer:
+    """One aiohttp app listening on one port per site"""
+
+    def __init__(self, site_count: int, latency: float):
+        self.site_count = site_count
+        self.latency = latency
+        self.requests = Counter()
+        self.urls = []
+        self._runner = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests[request.path] += 1
+        await asyncio.sleep(self.latency)
+        if request.path == "/":
+            return web.Response(content_type="text/html", text=(
+                '<html><head>'
+                '<link rel="alternate" type="application/rss+xml" href="/feed.xml">'
+                f'<link rel="alternate" type="application/rss+xml" href="{self.urls[0]}shared.xml">'
+                '</head></html>'
+            ))
+        if request.path in ("/feed.xml", "/shared.xml"):
+            return web.Response(body=RSS_XML, content_type="application/rss+xml")
+        return web.Response(status=404)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        for _ in range(self.site_count):
+            site = web.TCPSite(self._runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            self.urls.append(f"http://127.0.0.1:{port}/")
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+async def time_batch(args, server: FixtureServer, site_count: int, max_concurrent_sites: int) -> dict:
+    """Discover feeds for the first site_count sites"""
+    discoverer = RSSFeedDiscoverer(
+        max_concurrent_requests=args.max_requests,
+        per_host_limit=args.per_host_limit,
+        min_host_interval=args.min_host_interval
+    )
+    server.requests.clear()
+
+    start = time.perf_counter()
+    results = await discoverer.batch_discover(
+        server.urls[:site_count], max_concurrent_sites=max_concurrent_sites
+    )
+    wall = time.perf_counter() - start
+
+    return {
+        "sites": site_count,
+        "wall_s": wall,
+        "sites_per_s": site_count / wall,
+        "feeds": sum(len(feeds) for feeds in results.values()),
+        "requests": sum(server.requests.values()),
+        "shared_feed_fetches": server.requests["/shared.xml"]
+    }
+
+
+async def run(args):
+    server = FixtureServer(args.sites, args.latency)
+    await server.start()
+    try:
+        sequential = await time_batch(args, server, min(args.sequential_sites, args.sites), 1)
+        concurrent = await time_batch(args, server, args.sites, args.concurrency)
+    finally:
+        await server.stop()
+    return sequential, concurrent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch RSS feed discovery")
+    parser.add_argument("--sites", type=int, default=1000, help="Sites in the concurrent batch (default: 1000)")
+    parser.add_argument("--sequential-sites", type=int, default=50,
+                        help="Sites in the one-at-a-time baseline (default: 50)")
+    parser.add_argument("--concurrency", type=int, default=50, help="max_concurrent_sites (default: 50)")
+    parser.add_argument("--max-requests", type=int, default=100, help="max_concurrent_requests (default: 100)")
+    parser.add_argument("--per-host-limit", type=int, default=2, help="per_host_limit (default: 2)")
+    parser.add_argument("--min-host-interval", type=float, default=0.0,
+                        help="min_host_interval in seconds (default: 0)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Fixture response latency in seconds")
+    args = parser.parse_args()
+
+    # One listening socket per site plus client connections
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = args.sites * 2 + args.max_requests + 256
+    if soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(wanted, hard), hard))
+
+    sequential, concurrent = asyncio.run(run(args))
+
+    print(f"\n{'='*72}")
+    print(f"Batch feed discovery (latency={args.latency}s, max_requests={args.max_requests}, "
+          f"per_host_limit={args.per_host_limit})")
+    print(f"{'='*72}")
+    print(f"{'mode':<16}{'sites':>7}{'wall':>10}{'sites/s':>10}{'feeds':>8}{'requests':>10}{'shared GETs':>13}")
+    for label, row in (("sequential", sequential), (f"concurrent={args.concurrency}", concurrent)):
+        print(
+            f"{label:<16}{row['sites']:>7}{row['wall_s']:>9.2f}s{row['sites_per_s']:>10.1f}"
+            f"{row['feeds']:>8}{row['requests']:>10}{row['shared_feed_fetches']:>13}"
+        )
+    print(f"{'='*72}")
+    print(f"Throughput speedup: {concurrent['sites_per_s'] / sequential['sites_per_s']:.1f}x")
+
+
+if __name__ == "__main__":
+    start = time.time()
+    main()
+    print(f"Benchmark finished in {time.time() - start:.1f}s")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Stage 5 Research Concurrency Benchmark
+
+Measures how HybridResearchOrchestrator Stage 5 wall time scales with the
+number of topics, sequential (max_concurrent_topics=1) vs concurrent.
+
+Runs the real DeepResearcher → MultiStageReranker (BM25 only) pipeline
+against local fake backends that simulate network latency, plus a fake
+synthesizer that simulates the Gemini call. No API keys or network needed.
+
+Usage:
+    python scripts/benchmark_research_concurrency.py
+    python scripts/benchmark_research_concurrency.py --max-topics 10 --concurrency 5
+    python scripts/benchmark_research_concurrency.py --search-latency 0.5 --gemini-latency 1.0
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import List
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.orchestrator.hybrid_research_orchestrator import HybridResearchOrchestrator
+from src.orchestrator.research_scheduler import ResearchScheduler
+from src.research.backends.base import BackendHealth, SearchBackend, SearchHorizon, SearchResult
+from src.research.deep_researcher_refactored import DeepResearcher
+from src.research.reranker.multi_stage_reranker import MultiStageReranker
+from src.utils.provider_limits import ProviderLimits, provider_slot
+
+
+class FakeBackend(SearchBackend):
+    """Local search backend returning canned results after a fixed latency"""
+
+    def __init__(self, backend_name: str, latency: float, results: int = 10):
+        super().__init__(backend_name)
+        self.latency = latency
+        self.results = results
+
+    async def search(self, query: str, max_results: int = 10, **kwargs) -> List[SearchResult]:
+        await asyncio.sleep(self.latency)
+        return [
+            SearchResult.create(
+                url=f"https://{self.backend_name}-{i}.example.com/{abs(hash(query)) % 10000}",
+                title=f"{query} result {i}",
+                snippet=f"Snippet about {query} from {self.backend_name}",
+                content=f"Content about {query} " * 50 + f"unique {self.backend_name} {i}",
+                backend=self.backend_name
+            )
+            for i in range(min(max_results, self.results))
+        ]
+
+    async def health_check(self) -> BackendHealth:
+        return BackendHealth.SUCCESS
+
+    @property
+    def horizon(self) -> SearchHorizon:
+        return SearchHorizon.BREADTH
+
+    @property
+    def cost_per_query(self) -> float:
+        return 0.0
+
+    @property
+    def supports_citations(self) -> bool:
+        return False
+
+
+class FakeSynthesizer:
+    """Simulates the Gemini synthesis call (no article, so nothing is cached)"""
+
+    def __init__(self, latency: float, provider_limits: ProviderLimits):
+        self.latency = latency
+        self.provider_limits = provider_limits
+
+    async def synthesize(self, query, sources, config, **kwargs):
+        async with provider_slot(self.provider_limits, "gemini"):
+            await asyncio.sleep(self.latency)
+        return {"article": None, "cost": 0.01, "word_count": 0}
+
+
+def build_orchestrator(args, max_concurrent_topics: int) -> HybridResearchOrchestrator:
+    """Create orchestrator wired to fake backends"""
+    orchestrator = HybridResearchOrchestrator(
+        enable_autocomplete=False,
+        enable_trends=False,
+        max_concurrent_topics=max_concurrent_topics
+    )
+    limits = orchestrator.provider_limits
+
+    researcher = DeepResearcher(
+        enable_tavily=False,
+        enable_searxng=False,
+        enable_gemini=False,
+        enable_rss=False,
+        enable_thenewsapi=False,
+        provider_limits=limits,
+        _testing_mode=True
+    )
+    researcher.backends = {
+        name: FakeBackend(name, args.search_latency)
+        for name in ("tavily", "searxng", "gemini")
+    }
+
+    orchestrator._researcher = researcher
+    orchestrator._reranker = MultiStageReranker(enable_voyage=False, provider_limits=limits)
+    orchestrator._synthesizer = FakeSynthesizer(args.gemini_latency, limits)
+    return orchestrator
+
+
+async def time_batch(args, topic_count: int, max_concurrent_topics: int) -> dict:
+    """Research topic_count topics and return scheduler stats"""
+    orchestrator = build_orchestrator(args, max_concurrent_topics)
+    topics = [f"PropTech topic {i}" for i in range(topic_count)]
+    config = {"domain": "PropTech", "market": "Germany", "language": "de",
+              "enable_image_generation": False}
+
+    scheduler = ResearchScheduler(max_concurrent_topics=max_concurrent_topics)
+    return await scheduler.run(
+        topics=topics,
+        research_fn=lambda topic: orchestrator.research_topic(topic=topic, config=config)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Stage 5 research concurrency")
+    parser.add_argument("--max-topics", type=int, default=10, help="Largest batch size (default: 10)")
+    parser.add_argument("--concurrency", type=int, default=5, help="max_concurrent_topics (default: 5)")
+    parser.add_argument("--search-latency", type=float, default=0.3, help="Fake backend latency in seconds")
+    parser.add_argument("--gemini-latency", type=float, default=0.6, help="Fake Gemini latency in seconds")
+    args = parser.parse_args()
+
+    rows = []
+    for topic_count in range(1, args.max_topics + 1):
+        sequential = asyncio.run(time_batch(args, topic_count, 1))
+        concurrent = asyncio.run(time_batch(args, topic_count, args.concurrency))
+        rows.append((topic_count, sequential, concurrent))
+
+    print(f"\n{'='*66}")
+    print(f"Stage 5 wall time (search={args.search_latency}s, gemini={args.gemini_latency}s, "
+          f"limits={ProviderLimits.DEFAULT_LIMITS})")
+    print(f"{'='*66}")
+    print(f"{'Topics':>6}{'sequential':>14}{f'concurrent={args.concurrency}':>18}{'speedup':>10}{'cost':>10}")
+    for topic_count, sequential, concurrent in rows:
+        speedup = sequential["wall_time_sec"] / concurrent["wall_time_sec"]
+        print(
+            f"{topic_count:>6}"
+            f"{sequential['wall_time_sec']:>13.2f}s"
+            f"{concurrent['wall_time_sec']:>17.2f}s"
+            f"{speedup:>9.1f}x"
+            f"{concurrent['total_cost']:>10.2f}"
+        )
+    print(f"{'='*66}")
+
+
+if __name__ == "__main__":
+    start = time.time()
+    main()
+    print(f"Benchmark finished in {time.time() - start:.1f}s")
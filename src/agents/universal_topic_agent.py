@@ -3,7 +3,7 @@ Universal Topic Research Agent - Main Orchestrator
 
 Orchestrates the complete topic discovery and research pipeline:
 1. Feed Discovery → Discover RSS feeds from seed keywords
-2. Collection → Gather documents from RSS/Reddit/Trends/Autocomplete
+2. Collection → Gather documents from RSS/Reddit/Trends/Autocomplete (concurrently)
 3. Deduplication → Remove duplicate documents (MinHash/LSH)
 4. Clustering → Group similar topics
 5. Content Pipeline → 5-stage enhancement (Competitor, Keywords, Research, Optimization, Scoring)
@@ -25,6 +25,9 @@ Usage:
     # Collect from all sources
     stats = agent.collect_all_sources()
 
+    # Poll configured feeds that are due (between daily runs)
+    stats = agent.collect_due_feeds()
+
     # Sync top 10 topics to Notion
     result = await agent.sync_to_notion(limit=10)
 """
@@ -40,13 +43,21 @@ from src.models.topic import Topic, TopicSource, TopicStatus
 from src.utils.config_loader import ConfigLoader
 from src.utils.logger import get_logger
 from src.database.sqlite_manager import SQLiteManager
+from src.utils.page_store import PageStore
 from src.collectors.feed_discovery import FeedDiscovery
+from src.collectors.feed_state_store import FeedStateStore
+from src.collectors.feed_scheduler import FeedPollScheduler
 from src.collectors.rss_collector import RSSCollector
 from src.collectors.reddit_collector import RedditCollector
 from src.collectors.trends_collector import TrendsCollector
 from src.collectors.autocomplete_collector import AutocompleteCollector
 from src.processors.deduplicator import Deduplicator
 from src.processors.topic_clusterer import TopicClusterer
+from src.orchestrator.collection_orchestrator import (
+    CollectionOrchestrator,
+    CollectionStage,
+    StageOutput,
+)
 from src.agents.content_pipeline import ContentPipeline
 from src.notion_integration.topics_sync import TopicsSync
 
@@ -74,6 +85,20 @@ class UniversalTopicAgent:
     - Statistics tracking
     """
 
+    # Per-stage collection timeouts in seconds (None = no limit)
+    STAGE_TIMEOUTS: Dict[str, Optional[float]] = {
+        'feeds': 1800.0,        # Feed discovery + RSS collection
+        'reddit': 600.0,
+        'trends': 600.0,
+        'autocomplete': 600.0,
+    }
+
+    # Per-stage document budgets (None = unlimited)
+    STAGE_MAX_DOCUMENTS: Dict[str, Optional[int]] = {}
+
+    # Collection shard kinds (shard id = "<kind>:<target>", see collection_shards)
+    SHARD_KINDS = ('feed', 'reddit', 'trends', 'autocomplete')
+
     def __init__(
         self,
         config: FullConfig,
@@ -158,14 +183,27 @@ class UniversalTopicAgent:
             db = SQLiteManager()
 
             # Initialize processors first (collectors need deduplicator)
-            deduplicator = Deduplicator(threshold=0.7, num_perm=128)
+            deduplicator = Deduplicator(
+                threshold=0.7,
+                num_perm=128,
+                index_path="cache/dedup.db"  # Remembers documents across runs
+            )
             topic_clusterer = TopicClusterer()
 
             # Initialize feed discovery
             feed_discovery = FeedDiscovery(config=config)
 
             # Initialize collectors (all require deduplicator)
-            rss_collector = RSSCollector(config=config, db_manager=db, deduplicator=deduplicator)
+            rss_collector = RSSCollector(
+                config=config,
+                db_manager=db,
+                deduplicator=deduplicator,
+                page_store=PageStore(),  # Shared with research (cache/pages.db)
+                feed_state_store=FeedStateStore(),  # Feed health/validators (cache/feed_state.db)
+                poll_scheduler=FeedPollScheduler(),  # Poll feeds as often as they publish
+                max_concurrent_feeds=20,  # Async batch mode (per-host politeness still applies)
+                extract_workers=8
+            )
 
             reddit_enabled = config.collectors.reddit_enabled
             reddit_collector = RedditCollector(config=config, db_manager=db, deduplicator=deduplicator) if reddit_enabled else None
@@ -173,7 +211,9 @@ class UniversalTopicAgent:
             trends_enabled = config.collectors.trends_enabled
             trends_collector = TrendsCollector(config=config, db_manager=db, deduplicator=deduplicator) if trends_enabled else None
 
-            autocomplete_collector = AutocompleteCollector(config=config, db_manager=db, deduplicator=deduplicator)
+            autocomplete_collector = AutocompleteCollector(
+                config=config, db_manager=db, deduplicator=deduplicator, max_concurrent_requests=8
+            )
 
             # Initialize content pipeline
             # Note: ContentPipeline requires these agents which we need to initialize
@@ -234,16 +274,21 @@ class UniversalTopicAgent:
         """
         Collect documents from all enabled sources
 
-        Orchestrates:
-        1. Feed Discovery → Find RSS feeds
-        2. RSS Collection → Collect from discovered feeds
-        3. Reddit Collection (if enabled)
-        4. Trends Collection (if enabled)
-        5. Autocomplete Collection
-        6. Deduplication → Remove duplicates
+        Runs these collection stages concurrently (CollectionOrchestrator):
+        - feeds: Feed Discovery, then RSS Collection from discovered and
+          configured feeds that are due for polling
+        - reddit: Reddit Collection (if enabled)
+        - trends: Trends Collection (if enabled)
+        - autocomplete: Autocomplete Collection
+
+        Each stage's documents are deduplicated and saved in batches as soon
+        as the stage finishes. Stages are bounded by STAGE_TIMEOUTS and
+        STAGE_MAX_DOCUMENTS.
 
         Returns:
-            Statistics dict with documents_collected, sources_processed, errors
+            Statistics dict with documents_collected, documents_saved,
+            sources_processed, errors, stage_timings (seconds per stage,
+            deduplication, storage, total) and stages (per-stage status)
 
         Raises:
             UniversalTopicAgentError: If collection fails
@@ -251,123 +296,244 @@ class UniversalTopicAgent:
         logger.info("collect_all_sources_started", domain=self.config.market.domain)
 
         try:
-            all_documents = []
-            sources_processed = 0
-            errors = 0
+            stage_fns = {'feeds': self._collect_feeds}
+            if self.reddit_collector:
+                stage_fns['reddit'] = self._collect_reddit
+            if self.trends_collector:
+                stage_fns['trends'] = self._collect_trends
+            stage_fns['autocomplete'] = self._collect_autocomplete
+
+            stages = [
+                CollectionStage(
+                    name=name,
+                    collect=fn,
+                    timeout=self.STAGE_TIMEOUTS.get(name),
+                    max_documents=self.STAGE_MAX_DOCUMENTS.get(name)
+                )
+                for name, fn in stage_fns.items()
+            ]
 
-            # 1. Feed Discovery
-            logger.info("stage_feed_discovery")
-            try:
-                discovered_feeds = self.feed_discovery.discover_feeds()
-                logger.info("feed_discovery_completed", feeds_found=len(discovered_feeds))
-            except Exception as e:
-                logger.error("feed_discovery_failed", error=str(e))
-                discovered_feeds = []
-                errors += 1
+            orchestrator = CollectionOrchestrator(deduplicator=self.deduplicator, db_manager=self.db)
+            result = orchestrator.run(stages)
 
-            # 2. RSS Collection
-            logger.info("stage_rss_collection")
-            try:
-                # Add discovered feeds to RSS collector
-                feed_urls = [feed.url for feed in discovered_feeds]
-
-                # Add curated RSS feeds from market config (HttpUrl objects - need conversion)
-                if self.config.market.rss_feeds:
-                    market_feeds = [str(url) for url in self.config.market.rss_feeds]
-                    feed_urls.extend(market_feeds)
-
-                # Also add custom feeds from collectors config (already strings)
-                if self.config.collectors.custom_feeds:
-                    feed_urls.extend(self.config.collectors.custom_feeds)
-
-                rss_docs = self.rss_collector.collect_from_feeds(feed_urls=feed_urls)
-                all_documents.extend(rss_docs)
-                sources_processed += len(feed_urls)
-                logger.info("rss_collection_completed", documents=len(rss_docs), feeds=len(feed_urls))
-            except Exception as e:
-                logger.error("rss_collection_failed", error=str(e))
-                errors += 1
+            # Update statistics
+            self.stats['documents_collected'] = result['documents_collected']
+            self.stats['documents_deduplicated'] = result['documents_total'] - result['documents_collected']
+            self.stats['errors'] = result['errors']
 
-            # 3. Reddit Collection (if enabled)
-            if self.reddit_collector:
-                logger.info("stage_reddit_collection")
-                try:
-                    subreddits = self.config.collectors.reddit_subreddits
-                    reddit_docs = self.reddit_collector.collect(subreddits=subreddits)
-                    all_documents.extend(reddit_docs)
-                    sources_processed += len(subreddits)
-                    logger.info("reddit_collection_completed", documents=len(reddit_docs), subreddits=len(subreddits))
-                except Exception as e:
-                    logger.error("reddit_collection_failed", error=str(e))
-                    errors += 1
+            stats = {
+                'documents_collected': result['documents_collected'],
+                'documents_saved': result['documents_saved'],
+                'sources_processed': result['sources_processed'],
+                'errors': result['errors'],
+                'stage_timings': result['stage_timings'],
+                'stages': result['stages']
+            }
 
-            # 4. Trends Collection (if enabled)
-            if self.trends_collector:
-                logger.info("stage_trends_collection")
-                try:
-                    keywords = self.config.market.seed_keywords
-                    trends_docs = self.trends_collector.collect_related_queries(keywords=keywords)
-                    all_documents.extend(trends_docs)
-                    sources_processed += len(keywords)
-                    logger.info("trends_collection_completed", documents=len(trends_docs), keywords=len(keywords))
-                except Exception as e:
-                    logger.error("trends_collection_failed", error=str(e))
-                    errors += 1
+            logger.info(
+                "collect_all_sources_completed",
+                **{key: value for key, value in stats.items() if key != 'stages'}
+            )
+            return stats
 
-            # 5. Autocomplete Collection
-            logger.info("stage_autocomplete_collection")
-            try:
-                keywords = self.config.market.seed_keywords
-                autocomplete_docs = self.autocomplete_collector.collect_suggestions(seed_keywords=keywords)
-                all_documents.extend(autocomplete_docs)
-                sources_processed += len(keywords)
-                logger.info("autocomplete_collection_completed", documents=len(autocomplete_docs), keywords=len(keywords))
-            except Exception as e:
-                logger.error("autocomplete_collection_failed", error=str(e))
-                errors += 1
+        except Exception as e:
+            logger.error("collect_all_sources_failed", error=str(e))
+            raise UniversalTopicAgentError(f"Collection failed: {e}") from e
+
+    def _collect_feeds(self) -> StageOutput:
+        """Collection stage: discover feeds, then collect due RSS feeds"""
+        errors = 0
+
+        # Feed Discovery (failure falls back to configured feeds)
+        try:
+            discovered_feeds = self.feed_discovery.discover_feeds()
+            logger.info("feed_discovery_completed", feeds_found=len(discovered_feeds))
+        except Exception as e:
+            logger.error("feed_discovery_failed", error=str(e))
+            discovered_feeds = []
+            errors += 1
+
+        # Discovered feeds plus configured feeds
+        feed_urls = [feed.url for feed in discovered_feeds]
+        feed_urls.extend(self._configured_feed_urls())
+
+        rss_docs = self.rss_collector.collect_from_feeds(feed_urls=feed_urls, due_only=True)
+        logger.info("rss_collection_completed", documents=len(rss_docs), feeds=len(feed_urls))
+        return StageOutput(documents=rss_docs, sources=len(feed_urls), errors=errors)
+
+    def _collect_reddit(self) -> StageOutput:
+        """Collection stage: configured subreddits"""
+        subreddits = self.config.collectors.reddit_subreddits
+        reddit_docs = self.reddit_collector.collect(subreddits=subreddits)
+        logger.info("reddit_collection_completed", documents=len(reddit_docs), subreddits=len(subreddits))
+        return StageOutput(documents=reddit_docs, sources=len(subreddits))
+
+    def _collect_trends(self) -> StageOutput:
+        """Collection stage: related queries for the seed keywords"""
+        keywords = self.config.market.seed_keywords
+        trends_docs = self.trends_collector.collect_related_queries(keywords=keywords)
+        logger.info("trends_collection_completed", documents=len(trends_docs), keywords=len(keywords))
+        return StageOutput(documents=trends_docs, sources=len(keywords))
+
+    def _collect_autocomplete(self) -> StageOutput:
+        """Collection stage: autocomplete suggestions for the seed keywords"""
+        keywords = self.config.market.seed_keywords
+        autocomplete_docs = self.autocomplete_collector.collect_suggestions(seed_keywords=keywords)
+        logger.info("autocomplete_collection_completed", documents=len(autocomplete_docs), keywords=len(keywords))
+        return StageOutput(documents=autocomplete_docs, sources=len(keywords))
+
+    def collection_shards(self) -> List[str]:
+        """
+        Split collection into independent shards (one per feed, subreddit and keyword)
+
+        Runs feed discovery (failure falls back to configured feeds). Shards
+        are collected separately by collect_shard() - e.g. by different
+        Huey workers - and stored together with store_documents().
+
+        Returns:
+            Shard ids: "feed:<url>", "reddit:<subreddit>", "trends:<keyword>",
+            "autocomplete:<keyword>"
+        """
+        try:
+            discovered_feeds = self.feed_discovery.discover_feeds()
+            logger.info("feed_discovery_completed", feeds_found=len(discovered_feeds))
+        except Exception as e:
+            logger.error("feed_discovery_failed", error=str(e))
+            discovered_feeds = []
+
+        feed_urls = [feed.url for feed in discovered_feeds] + self._configured_feed_urls()
+        keywords = self.config.market.seed_keywords
 
-            # 6. Deduplication
-            logger.info("stage_deduplication", total_documents=len(all_documents))
+        shards = [f"feed:{url}" for url in dict.fromkeys(feed_urls)]
+        if self.reddit_collector:
+            shards.extend(f"reddit:{subreddit}" for subreddit in self.config.collectors.reddit_subreddits)
+        if self.trends_collector:
+            shards.extend(f"trends:{keyword}" for keyword in keywords)
+        shards.extend(f"autocomplete:{keyword}" for keyword in keywords)
+
+        logger.info("collection_shards_planned", shards=len(shards), feeds=len(feed_urls))
+        return shards
+
+    def collect_shard(self, shard_id: str) -> StageOutput:
+        """
+        Collect a single shard (see collection_shards)
+
+        Documents are returned, not saved: the caller deduplicates and
+        stores all shards of a run together.
+
+        Args:
+            shard_id: "<kind>:<target>"
+
+        Returns:
+            StageOutput with the shard's documents
+
+        Raises:
+            UniversalTopicAgentError: If the shard id is invalid or its
+                collector is disabled
+        """
+        kind, _, target = shard_id.partition(':')
+        if kind not in self.SHARD_KINDS or not target:
+            raise UniversalTopicAgentError(f"Invalid collection shard: {shard_id}")
+
+        if kind == 'feed':
+            # Raise on a failed fetch so the shard is retried, not finished empty
+            documents = self.rss_collector.collect_from_feeds(
+                feed_urls=[target], skip_errors=False, due_only=True
+            )
+        elif kind == 'reddit':
+            if not self.reddit_collector:
+                raise UniversalTopicAgentError(f"Reddit collection disabled: {shard_id}")
+            documents = self.reddit_collector.collect(subreddits=[target])
+        elif kind == 'trends':
+            if not self.trends_collector:
+                raise UniversalTopicAgentError(f"Trends collection disabled: {shard_id}")
+            documents = self.trends_collector.collect_related_queries(keywords=[target])
+        else:
+            documents = self.autocomplete_collector.collect_suggestions(seed_keywords=[target])
+
+        logger.info("collection_shard_completed", shard=shard_id, documents=len(documents))
+        return StageOutput(documents=documents, sources=1)
+
+    def store_documents(self, documents: List[Document]) -> Dict[str, Any]:
+        """
+        Deduplicate documents and save them in one bulk insert
+
+        Args:
+            documents: Collected documents (e.g. all shards of a run)
+
+        Returns:
+            Statistics dict with documents_collected (unique), documents_saved, errors
+        """
+        unique_documents = self.deduplicator.deduplicate(documents) if documents else []
+
+        saved_count = 0
+        errors = 0
+        if unique_documents:
             try:
-                unique_documents = self.deduplicator.deduplicate(all_documents)
-                duplicates_removed = len(all_documents) - len(unique_documents)
-                logger.info("deduplication_completed", unique=len(unique_documents), duplicates_removed=duplicates_removed)
+                saved_count = self.db.insert_documents_bulk(unique_documents)
             except Exception as e:
-                logger.error("deduplication_failed", error=str(e))
-                unique_documents = all_documents  # Fallback: use all documents
+                logger.error("documents_save_failed", count=len(unique_documents), error=str(e))
                 errors += 1
+                # Not stored: let the next run collect them again
+                self.deduplicator.remove(unique_documents)
 
-            # 7. Save documents to database
-            logger.info("stage_save_documents", count=len(unique_documents))
-            saved_count = 0
-            for doc in unique_documents:
-                try:
-                    self.db.insert_document(doc)
-                    saved_count += 1
-                except Exception as e:
-                    logger.warning("document_save_failed", doc_id=doc.id, error=str(e))
-                    errors += 1
-
-            logger.info("documents_saved", count=saved_count, total=len(unique_documents))
+        return {
+            'documents_collected': len(unique_documents),
+            'documents_saved': saved_count,
+            'errors': errors
+        }
 
-            # Update statistics
-            self.stats['documents_collected'] = len(unique_documents)
-            self.stats['documents_deduplicated'] = len(all_documents) - len(unique_documents)
-            self.stats['errors'] = errors
+    def collect_due_feeds(self) -> Dict[str, Any]:
+        """
+        Poll configured RSS feeds that are due, between full collection runs
 
-            stats = {
-                'documents_collected': len(unique_documents),
-                'documents_saved': saved_count,
-                'sources_processed': sources_processed,
-                'errors': errors
-            }
+        Lets fast-publishing feeds be polled more often than the daily
+        collect_all_sources() run; feeds that are not due are not requested.
 
-            logger.info("collect_all_sources_completed", **stats)
-            return stats
+        Returns:
+            Statistics dict with documents_collected, documents_saved,
+            feeds_configured, feeds_polled, errors
+        """
+        feed_urls = self._configured_feed_urls()
+        logger.info("collect_due_feeds_started", feeds=len(feed_urls))
 
+        errors = 0
+        due_urls: List[str] = []
+        documents: List[Document] = []
+        try:
+            due_urls = self.rss_collector.select_due_feeds(feed_urls)
+            if due_urls:
+                documents = self.rss_collector.collect_from_feeds(feed_urls=due_urls)
         except Exception as e:
-            logger.error("collect_all_sources_failed", error=str(e))
-            raise UniversalTopicAgentError(f"Collection failed: {e}") from e
+            logger.error("rss_collection_failed", error=str(e))
+            errors += 1
+
+        stored = self.store_documents(documents)
+
+        stats = {
+            'documents_collected': stored['documents_collected'],
+            'documents_saved': stored['documents_saved'],
+            'feeds_configured': len(feed_urls),
+            'feeds_polled': len(due_urls),
+            'errors': errors + stored['errors']
+        }
+
+        logger.info("collect_due_feeds_completed", **stats)
+        return stats
+
+    def _configured_feed_urls(self) -> List[str]:
+        """Feed URLs from the market config and collectors config"""
+        feed_urls = []
+
+        # Curated RSS feeds from market config (HttpUrl objects - need conversion)
+        if self.config.market.rss_feeds:
+            feed_urls.extend(str(url) for url in self.config.market.rss_feeds)
+
+        # Custom feeds from collectors config (already strings)
+        if self.config.collectors.custom_feeds:
+            feed_urls.extend(self.config.collectors.custom_feeds)
+
+        return feed_urls
 
     async def process_topics(self, limit: Optional[int] = None) -> List[Topic]:
         """
@@ -462,6 +628,7 @@ class UniversalTopicAgent:
                     language=self.config.market.language,
                     engagement_score=cluster.size,  # Use cluster size as engagement proxy
                     trending_score=0.0,  # TODO: Calculate from document timestamps
+                    minhash_signature=representative_doc.minhash_signature,
                     status=TopicStatus.DISCOVERED
                 )
 
@@ -504,11 +671,16 @@ class UniversalTopicAgent:
         """
         Sync top topics to Notion
 
+        Only topics that are new or whose Notion properties changed since the
+        last push are sent; the pushed state (notion_id, fingerprint) is
+        stored in the database.
+
         Args:
             limit: Number of top topics to sync (default: 10)
 
         Returns:
-            Result dict with topics_synced, notion_pages_created, actions
+            Result dict with topics_synced, notion_pages_created,
+            notion_pages_updated, notion_pages_skipped, actions
 
         Raises:
             UniversalTopicAgentError: If Notion sync fails or is not configured
@@ -528,6 +700,7 @@ class UniversalTopicAgent:
                     'topics_synced': 0,
                     'notion_pages_created': 0,
                     'notion_pages_updated': 0,
+                    'notion_pages_skipped': 0,
                     'actions': []
                 }
 
@@ -536,9 +709,23 @@ class UniversalTopicAgent:
             # Sync to Notion (skip_errors=True to continue on failures)
             results = self.notion_sync.sync_batch(topics, update_existing=True, skip_errors=True)
 
+            # Persist pushed state so unchanged topics are skipped next time
+            pushed_ids = {
+                r.get('topic_id') for r in results if r.get('action') in ('created', 'updated')
+            }
+            for topic in topics:
+                if topic.id in pushed_ids and topic.notion_id:
+                    self.db.mark_topic_synced(
+                        topic.id,
+                        notion_id=topic.notion_id,
+                        fingerprint=topic.notion_fingerprint,
+                        synced_at=topic.notion_synced_at
+                    )
+
             # Count actions
             created_count = sum(1 for r in results if r.get('action') == 'created')
             updated_count = sum(1 for r in results if r.get('action') == 'updated')
+            skipped_count = sum(1 for r in results if r.get('action') == 'skipped')
             synced_count = created_count + updated_count
 
             # Update statistics
@@ -548,6 +735,7 @@ class UniversalTopicAgent:
                 'topics_synced': synced_count,
                 'notion_pages_created': created_count,
                 'notion_pages_updated': updated_count,
+                'notion_pages_skipped': skipped_count,
                 'actions': results
             }
 
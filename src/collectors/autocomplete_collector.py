@@ -6,10 +6,14 @@ Features:
 - Question prefix expansion (what, how, why, when, where, who) - DEFAULT
 - Alphabet expansion (a-z patterns) - optional, high volume
 - Preposition expansion (for, with, without, near, vs, versus) - optional
-- Smart caching (30-day TTL for suggestions)
+- Smart caching (30-day TTL for suggestions) in a durable SQLite CacheStore
+  (write-through, expired entries swept in the background)
 - Rate limiting (10 req/sec - Google autocomplete is lenient)
 - Language support (de, en, fr, etc.)
 - Deduplication across expansion types
+- Optional async mode (max_concurrent_requests > 0): all queries share one
+  pooled httpx.AsyncClient and a token bucket, and an expansion stops once
+  max_per_keyword unique suggestions are collected
 
 Usage:
     from src.collectors.autocomplete_collector import AutocompleteCollector, ExpansionType
@@ -33,10 +37,17 @@ Usage:
         seed_keywords=['PropTech'],
         expansion_types=[ExpansionType.ALPHABET, ExpansionType.QUESTIONS]  # High volume
     )
+
+    # Concurrent expansion (up to 8 requests in flight, still 10 req/sec)
+    collector = AutocompleteCollector(..., max_concurrent_requests=8)
+    docs = collector.collect_suggestions(seed_keywords=keywords)         # Sync callers
+    docs = await collector.collect_suggestions_async(seed_keywords=...)  # Async callers
 """
 
+import asyncio
 import json
 import hashlib
+import sqlite3
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -44,7 +55,9 @@ from typing import List, Dict, Optional
 from enum import Enum
 import httpx
 
+from src.utils.cache_store import CacheStore
 from src.utils.logger import get_logger
+from src.utils.rate_limiter import TokenBucket
 from src.models.document import Document
 
 logger = get_logger(__name__)
@@ -92,7 +105,11 @@ class AutocompleteCollector:
         language: str = "en",
         rate_limit: float = 10.0,  # Requests per second (default: 10 req/sec)
         request_timeout: int = 10,
-        cache_ttl_days: int = 30
+        cache_ttl_days: int = 30,
+        max_concurrent_requests: int = 0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache_store: Optional[CacheStore] = None,
+        cache_sweep_interval: float = 3600.0
     ):
         """
         Initialize Autocomplete Collector
@@ -106,6 +123,12 @@ class AutocompleteCollector:
             rate_limit: Requests per second (default 10.0)
             request_timeout: Request timeout in seconds
             cache_ttl_days: Cache TTL in days (default 30)
+            max_concurrent_requests: Requests in flight in async mode; the
+                rate limit still caps requests per second (0 = sequential)
+            transport: httpx transport for the async client (tests)
+            cache_store: Cache backend (default: autocomplete_cache.db in cache_dir)
+            cache_sweep_interval: Seconds between background sweeps of
+                expired cache entries (0 = no sweeper)
         """
         self.config = config
         self.db_manager = db_manager
@@ -117,9 +140,18 @@ class AutocompleteCollector:
         self.rate_limit = rate_limit
         self.request_timeout = request_timeout
         self.cache_ttl_days = cache_ttl_days
+        self.max_concurrent_requests = max_concurrent_requests
+        self.transport = transport
 
         # Internal state
-        self._cache: Dict = {}  # In-memory cache
+        # An empty CacheStore is falsy (__len__), so test for None
+        if cache_store is None:
+            cache_store = CacheStore(
+                str(self.cache_dir / "autocomplete_cache.db"),
+                namespace="autocomplete",
+                default_ttl=timedelta(days=cache_ttl_days)
+            )
+        self._cache = cache_store
         self.last_request_time: Optional[float] = None
 
         # Statistics
@@ -131,8 +163,10 @@ class AutocompleteCollector:
             'failed_requests': 0,
         }
 
-        # Load cache from disk
+        # Import legacy JSON cache, then keep the store free of expired entries
         self.load_cache()
+        if cache_sweep_interval > 0:
+            self._cache.start_sweeper(interval=cache_sweep_interval)
 
         logger.info(
             "AutocompleteCollector initialized",
@@ -167,15 +201,18 @@ class AutocompleteCollector:
             # QUESTIONS generates 6 high-value queries (what, how, why, when, where, who)
             expansion_types = [ExpansionType.QUESTIONS]
 
+        if self.max_concurrent_requests > 0 and not self._in_event_loop():
+            return asyncio.run(self.collect_suggestions_async(
+                seed_keywords, expansion_types, max_per_keyword
+            ))
+
         all_documents = []
         seen_suggestions = set()  # Dedup across all expansions
 
         for seed_keyword in seed_keywords:
-            keyword_lower = seed_keyword.lower()
-
             for expansion_type in expansion_types:
                 # Check cache first
-                cache_key = f"autocomplete_{keyword_lower}_{expansion_type.value}"
+                cache_key = self._cache_key(seed_keyword, expansion_type)
                 cached_suggestions = self._get_from_cache(cache_key)
 
                 if cached_suggestions:
@@ -215,46 +252,182 @@ class AutocompleteCollector:
                         continue
 
                 # Create documents from suggestions
-                for suggestion in suggestions:
-                    # Skip if already seen (dedup across expansions)
-                    if suggestion in seen_suggestions:
-                        continue
+                all_documents.extend(self._create_documents(
+                    suggestions, seed_keyword, expansion_type, seen_suggestions
+                ))
 
-                    seen_suggestions.add(suggestion)
+        self._stats['total_suggestions'] += len(all_documents)
 
-                    # Create document
-                    doc = self._create_document(
-                        suggestion=suggestion,
-                        seed_keyword=seed_keyword,
-                        expansion_type=expansion_type
+        logger.info(
+            "Autocomplete suggestions collected",
+            keywords=seed_keywords,
+            total_suggestions=len(all_documents)
+        )
+
+        return all_documents
+
+    async def collect_suggestions_async(
+        self,
+        seed_keywords: List[str],
+        expansion_types: List[ExpansionType] = None,
+        max_per_keyword: Optional[int] = None
+    ) -> List[Document]:
+        """
+        Collect autocomplete suggestions with concurrent requests
+
+        All uncached (keyword, expansion) pairs are expanded at once over one
+        pooled httpx.AsyncClient. Requests are bounded by
+        max_concurrent_requests (at least 1) and paced by a token bucket at
+        rate_limit req/sec. An expansion stops issuing queries once
+        max_per_keyword unique suggestions are collected. Documents are built
+        in the same order as collect_suggestions().
+
+        Args:
+            seed_keywords: List of seed keywords to expand
+            expansion_types: Types of expansion to use (default: QUESTIONS only)
+            max_per_keyword: Max expansions per keyword; also stops an
+                expansion early once this many unique suggestions are found
+
+        Returns:
+            List of Document objects with autocomplete suggestions
+
+        Raises:
+            AutocompleteCollectorError: If collection fails for a single
+                keyword + expansion
+        """
+        if expansion_types is None:
+            expansion_types = [ExpansionType.QUESTIONS]
+
+        pairs = [
+            (seed_keyword, expansion_type)
+            for seed_keyword in seed_keywords
+            for expansion_type in expansion_types
+        ]
+
+        # Check cache first
+        suggestions_by_pair: Dict[tuple, object] = {}
+        for seed_keyword, expansion_type in pairs:
+            cached_suggestions = self._get_from_cache(
+                self._cache_key(seed_keyword, expansion_type)
+            )
+            if cached_suggestions:
+                self._stats['cache_hits'] += 1
+                suggestions_by_pair[(seed_keyword, expansion_type)] = cached_suggestions
+
+        missing = [pair for pair in pairs if pair not in suggestions_by_pair]
+        if missing:
+            concurrency = max(self.max_concurrent_requests, 1)
+            semaphore = asyncio.Semaphore(concurrency)
+            bucket = TokenBucket(rate=self.rate_limit, capacity=concurrency)
+
+            async with httpx.AsyncClient(
+                timeout=self.request_timeout,
+                limits=httpx.Limits(max_connections=concurrency),
+                transport=self.transport
+            ) as client:
+                results = await asyncio.gather(*(
+                    self._collect_for_expansion_async(
+                        client, bucket, semaphore, seed_keyword, expansion_type, max_per_keyword
                     )
+                    for seed_keyword, expansion_type in missing
+                ), return_exceptions=True)
 
-                    # Check for duplicates (pass Document object, not string)
-                    if self.deduplicator.is_duplicate(doc):
-                        logger.debug("Skipping duplicate suggestion", suggestion=suggestion)
-                        continue
+            for (seed_keyword, expansion_type), result in zip(missing, results):
+                if not isinstance(result, BaseException):
+                    self._save_to_cache(self._cache_key(seed_keyword, expansion_type), result)
+                suggestions_by_pair[(seed_keyword, expansion_type)] = result
 
-                    all_documents.append(doc)
+        all_documents = []
+        seen_suggestions = set()  # Dedup across all expansions
+
+        for seed_keyword, expansion_type in pairs:
+            suggestions = suggestions_by_pair[(seed_keyword, expansion_type)]
+
+            if isinstance(suggestions, BaseException):
+                if not isinstance(suggestions, AutocompleteCollectorError):
+                    raise suggestions
+
+                logger.error(
+                    "Failed to collect suggestions",
+                    keyword=seed_keyword,
+                    expansion_type=expansion_type.value,
+                    error=str(suggestions)
+                )
+                self._stats['failed_requests'] += 1
+
+                # If this is a single keyword + single expansion, re-raise
+                if len(pairs) == 1:
+                    raise suggestions
+                continue
+
+            all_documents.extend(self._create_documents(
+                suggestions, seed_keyword, expansion_type, seen_suggestions
+            ))
 
         self._stats['total_suggestions'] += len(all_documents)
 
         logger.info(
             "Autocomplete suggestions collected",
             keywords=seed_keywords,
-            total_suggestions=len(all_documents)
+            total_suggestions=len(all_documents),
+            concurrent_expansions=len(missing)
         )
 
         return all_documents
 
-    def _collect_for_expansion(
+    @staticmethod
+    def _in_event_loop() -> bool:
+        """Check if called from a running event loop (asyncio.run not allowed)"""
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+
+    @staticmethod
+    def _cache_key(seed_keyword: str, expansion_type: ExpansionType) -> str:
+        return f"autocomplete_{seed_keyword.lower()}_{expansion_type.value}"
+
+    def _create_documents(
+        self,
+        suggestions: List[str],
+        seed_keyword: str,
+        expansion_type: ExpansionType,
+        seen_suggestions: set
+    ) -> List[Document]:
+        """Create documents for unseen, non-duplicate suggestions"""
+        documents = []
+
+        for suggestion in suggestions:
+            # Skip if already seen (dedup across expansions)
+            if suggestion in seen_suggestions:
+                continue
+
+            seen_suggestions.add(suggestion)
+
+            # Create document
+            doc = self._create_document(
+                suggestion=suggestion,
+                seed_keyword=seed_keyword,
+                expansion_type=expansion_type
+            )
+
+            # Check for duplicates (pass Document object, not string)
+            if self.deduplicator.is_duplicate(doc):
+                logger.debug("Skipping duplicate suggestion", suggestion=suggestion)
+                continue
+
+            documents.append(doc)
+
+        return documents
+
+    def _build_queries(
         self,
         seed_keyword: str,
         expansion_type: ExpansionType,
         max_per_keyword: Optional[int] = None
     ) -> List[str]:
-        """Collect suggestions for a specific expansion type"""
-        suggestions = []
-
+        """Build autocomplete queries for an expansion type"""
         if expansion_type == ExpansionType.ALPHABET:
             patterns = self.ALPHABET[:max_per_keyword] if max_per_keyword else self.ALPHABET
             queries = [f"{seed_keyword} {letter}" for letter in patterns]
@@ -268,6 +441,18 @@ class AutocompleteCollector:
         else:
             raise AutocompleteCollectorError(f"Unknown expansion type: {expansion_type}")
 
+        return queries
+
+    def _collect_for_expansion(
+        self,
+        seed_keyword: str,
+        expansion_type: ExpansionType,
+        max_per_keyword: Optional[int] = None
+    ) -> List[str]:
+        """Collect suggestions for a specific expansion type"""
+        suggestions = []
+        queries = self._build_queries(seed_keyword, expansion_type, max_per_keyword)
+
         # Fetch suggestions for each query
         all_failed = True
         last_error = None
@@ -295,6 +480,76 @@ class AutocompleteCollector:
         # Deduplicate suggestions
         return list(set(suggestions))
 
+    async def _collect_for_expansion_async(
+        self,
+        client: httpx.AsyncClient,
+        bucket: TokenBucket,
+        semaphore: asyncio.Semaphore,
+        seed_keyword: str,
+        expansion_type: ExpansionType,
+        max_per_keyword: Optional[int] = None
+    ) -> List[str]:
+        """
+        Collect suggestions for an expansion type with concurrent queries
+
+        Queries still pending are cancelled once max_per_keyword unique
+        suggestions are collected.
+
+        Returns:
+            Unique suggestions in query order
+        """
+        queries = self._build_queries(seed_keyword, expansion_type, max_per_keyword)
+
+        async def fetch(index: int, query: str):
+            async with semaphore:
+                try:
+                    return index, await self._fetch_autocomplete_async(client, bucket, query)
+                except AutocompleteCollectorError as e:
+                    logger.warning(
+                        "Failed to fetch autocomplete",
+                        query=query,
+                        error=str(e)
+                    )
+                    return index, e
+
+        tasks = [asyncio.ensure_future(fetch(i, query)) for i, query in enumerate(queries)]
+        results: Dict[int, List[str]] = {}
+        unique = set()
+        last_error = None
+
+        try:
+            for future in asyncio.as_completed(tasks):
+                index, outcome = await future
+                self._stats['cache_misses'] += 1  # Track each API request (failed or not)
+
+                if isinstance(outcome, Exception):
+                    last_error = outcome
+                    continue
+
+                results[index] = outcome
+                unique.update(outcome)
+
+                if max_per_keyword and len(unique) >= max_per_keyword:
+                    break
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.debug(
+                    "Autocomplete expansion stopped early",
+                    keyword=seed_keyword,
+                    expansion_type=expansion_type.value,
+                    cancelled_queries=len(pending)
+                )
+
+        # If ALL queries failed, raise the last error
+        if not results and last_error:
+            raise AutocompleteCollectorError(f"Failed to collect suggestions: {last_error}")
+
+        return list(dict.fromkeys(s for i in sorted(results) for s in results[i]))
+
     def _fetch_autocomplete(self, query: str) -> List[str]:
         """
         Fetch autocomplete suggestions from Google
@@ -323,31 +578,47 @@ class AutocompleteCollector:
         try:
             logger.debug("Fetching autocomplete", query=query)
             response = httpx.get(url, timeout=self.request_timeout)
+            return self._parse_autocomplete_response(response, query)
 
-            # Check HTTP status
-            if response.status_code != 200:
-                raise AutocompleteCollectorError(
-                    f"HTTP error {response.status_code}: {response.text}"
-                )
+        except httpx.ConnectError as e:
+            raise AutocompleteCollectorError(f"Network error: {e}")
+        except ValueError as e:
+            raise AutocompleteCollectorError(f"Invalid JSON response: {e}")
+        except Exception as e:
+            raise AutocompleteCollectorError(f"Failed to collect suggestions: {e}")
 
-            # Parse JSON response
-            # Format: [query, [suggestions], [], {}]
-            data = response.json()
+    async def _fetch_autocomplete_async(
+        self,
+        client: httpx.AsyncClient,
+        bucket: TokenBucket,
+        query: str
+    ) -> List[str]:
+        """
+        Fetch autocomplete suggestions over a shared async client
 
-            if not isinstance(data, list) or len(data) < 2:
-                logger.warning("Unexpected autocomplete response format", data=data)
-                return []
+        Args:
+            client: Pooled async HTTP client
+            bucket: Shared token bucket (rate limit)
+            query: Search query
 
-            suggestions = data[1]
-            self._stats['total_requests'] += 1
+        Returns:
+            List of autocomplete suggestions
 
-            logger.debug(
-                "Autocomplete fetched",
-                query=query,
-                count=len(suggestions)
-            )
+        Raises:
+            AutocompleteCollectorError: If request fails
+        """
+        await bucket.acquire_async()
+
+        params = {
+            'q': query,
+            'client': 'firefox',  # Use Firefox client for consistent results
+            'hl': self.language
+        }
 
-            return suggestions
+        try:
+            logger.debug("Fetching autocomplete", query=query)
+            response = await client.get(self.AUTOCOMPLETE_URL, params=params)
+            return self._parse_autocomplete_response(response, query)
 
         except httpx.ConnectError as e:
             raise AutocompleteCollectorError(f"Network error: {e}")
@@ -356,6 +627,39 @@ class AutocompleteCollector:
         except Exception as e:
             raise AutocompleteCollectorError(f"Failed to collect suggestions: {e}")
 
+    def _parse_autocomplete_response(self, response: httpx.Response, query: str) -> List[str]:
+        """
+        Extract suggestions from an autocomplete response
+
+        Raises:
+            AutocompleteCollectorError: On HTTP errors
+            ValueError: On invalid JSON
+        """
+        # Check HTTP status
+        if response.status_code != 200:
+            raise AutocompleteCollectorError(
+                f"HTTP error {response.status_code}: {response.text}"
+            )
+
+        # Parse JSON response
+        # Format: [query, [suggestions], [], {}]
+        data = response.json()
+
+        if not isinstance(data, list) or len(data) < 2:
+            logger.warning("Unexpected autocomplete response format", data=data)
+            return []
+
+        suggestions = data[1]
+        self._stats['total_requests'] += 1
+
+        logger.debug(
+            "Autocomplete fetched",
+            query=query,
+            count=len(suggestions)
+        )
+
+        return suggestions
+
     def _create_document(
         self,
         suggestion: str,
@@ -397,28 +701,11 @@ class AutocompleteCollector:
 
     def _get_from_cache(self, cache_key: str) -> Optional[List[str]]:
         """Get suggestions from cache if not expired"""
-        if cache_key not in self._cache:
-            return None
-
-        cached = self._cache[cache_key]
-        cache_time = cached.get('timestamp')
-
-        if not cache_time:
-            return None
-
-        # Check if expired (30 days default)
-        if datetime.now() - cache_time > timedelta(days=self.cache_ttl_days):
-            del self._cache[cache_key]
-            return None
-
-        return cached.get('suggestions')
+        return self._cache.get(cache_key)
 
     def _save_to_cache(self, cache_key: str, suggestions: List[str]):
-        """Save suggestions to cache"""
-        self._cache[cache_key] = {
-            'timestamp': datetime.now(),
-            'suggestions': suggestions
-        }
+        """Save suggestions to cache (written through, expires after cache_ttl_days)"""
+        self._cache.set(cache_key, suggestions)
 
     def _enforce_rate_limit(self):
         """Enforce rate limiting between requests"""
@@ -437,30 +724,26 @@ class AutocompleteCollector:
         self.last_request_time = time.time()
 
     def get_statistics(self) -> Dict:
-        """Get collection statistics"""
-        return self._stats.copy()
+        """Get collection statistics (cache_store: backend hit/miss counters)"""
+        stats = self._stats.copy()
+        stats['cache_store'] = self._cache.get_stats()
+        return stats
 
     def save_cache(self):
-        """Save cache to disk"""
-        cache_file = self.cache_dir / "autocomplete_cache.json"
-
-        # Prepare cache for serialization
-        serializable_cache = {}
-        for key, value in self._cache.items():
-            serializable_cache[key] = {
-                'timestamp': value['timestamp'].isoformat(),
-                'suggestions': value['suggestions']
-            }
+        """
+        Flush the cache
 
+        Entries are written through on insert, so this only sweeps expired
+        entries. Kept for callers that save on shutdown.
+        """
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(serializable_cache, f, indent=2)
-            logger.info("Cache saved", file=str(cache_file))
-        except Exception as e:
+            removed = self._cache.sweep_expired()
+            logger.info("Cache saved", db_path=self._cache.db_path, expired_removed=removed)
+        except sqlite3.Error as e:
             logger.error("Failed to save cache", error=str(e))
 
     def load_cache(self):
-        """Load cache from disk"""
+        """Import a legacy autocomplete_cache.json into the cache store (once)"""
         cache_file = self.cache_dir / "autocomplete_cache.json"
 
         if not cache_file.exists():
@@ -470,13 +753,16 @@ class AutocompleteCollector:
             with open(cache_file, 'r') as f:
                 serialized_cache = json.load(f)
 
-            # Deserialize cache
+            # Keep each entry's remaining lifetime
+            ttl = timedelta(days=self.cache_ttl_days)
+            imported = 0
             for key, value in serialized_cache.items():
-                self._cache[key] = {
-                    'timestamp': datetime.fromisoformat(value['timestamp']),
-                    'suggestions': value['suggestions']
-                }
+                remaining = datetime.fromisoformat(value['timestamp']) + ttl - datetime.now()
+                if remaining > timedelta(0):
+                    self._cache.set(key, value['suggestions'], ttl=remaining)
+                    imported += 1
 
-            logger.info("Cache loaded", entries=len(self._cache))
+            cache_file.unlink()
+            logger.info("Legacy cache imported", entries=imported, file=str(cache_file))
         except Exception as e:
             logger.error("Failed to load cache", error=str(e))
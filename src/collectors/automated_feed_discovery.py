@@ -19,6 +19,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 from src.agents.gemini_agent import GeminiAgent
+from src.collectors.feed_state_store import FeedStateStore
 from src.collectors.rss_feed_discoverer import RSSFeedDiscoverer, RSSFeed
 from src.collectors.rss_feed_database import RSSFeedDatabase
 from src.utils.logger import get_logger
@@ -60,8 +61,9 @@ class AutomatedFeedDiscovery:
             auto_add_to_database: Automatically add discovered feeds to database
         """
         self.gemini_agent = GeminiAgent()
-        self.discoverer = RSSFeedDiscoverer()
-        self.database = RSSFeedDatabase()
+        feed_state_store = FeedStateStore()  # Shared feed health (cache/feed_state.db)
+        self.discoverer = RSSFeedDiscoverer(feed_state_store=feed_state_store)
+        self.database = RSSFeedDatabase(feed_state_store=feed_state_store)
         self.min_quality_score = min_quality_score
         self.auto_add_to_database = auto_add_to_database
 
@@ -6,11 +6,13 @@ Stage 1: OPML Seeds + Gemini CLI Expansion
 - Use Gemini CLI (FREE) to expand seed keywords intelligently
 - Fallback to basic keyword extraction if Gemini fails
 
-Stage 2: SerpAPI + feedfinder2
+Stage 2: SerpAPI + FeedFinder
 - Search seed keywords via SerpAPI (3/day hard cap)
 - Extract top domains from search results
-- Use feedfinder2 to auto-detect RSS/Atom feeds on each domain
-- Cache SERP results for 30 days
+- Auto-detect RSS/Atom feeds on the domains in parallel (FeedFinder:
+  link tags + common feed paths, per-request timeouts)
+- Cache SERP results for 30 days, per-domain feeds for 30 days (1 day if
+  none were found)
 
 Features:
 - Circuit breaker enforces 3 requests/day SerpAPI limit
@@ -21,6 +23,7 @@ Features:
 
 import json
 import subprocess
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Set
@@ -31,6 +34,7 @@ import concurrent.futures
 
 import requests
 
+from src.collectors.feed_finder import FeedFinder
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -63,7 +67,7 @@ class FeedDiscovery:
     """
     Intelligent feed discovery pipeline using 2-stage approach:
     1. OPML seeds + Gemini CLI keyword expansion
-    2. SerpAPI search + feedfinder2 auto-detection
+    2. SerpAPI search + FeedFinder auto-detection
     """
 
     # Domain blacklist - skip these domains during feed discovery
@@ -75,21 +79,30 @@ class FeedDiscovery:
         'wikipedia.com',  # Various Wikipedia variants
     }
 
+    # Per-domain feed cache TTLs (domains without feeds are retried sooner)
+    DOMAIN_CACHE_TTL = timedelta(days=30)
+    EMPTY_DOMAIN_CACHE_TTL = timedelta(days=1)
+
     def __init__(
         self,
         config,
         cache_dir: str = "cache/feed_discovery",
         serpapi_daily_limit: int = 3,
-        serpapi_api_key: Optional[str] = None
+        serpapi_api_key: Optional[str] = None,
+        domain_workers: int = 8,
+        feed_finder: Optional[FeedFinder] = None
     ):
         """
         Initialize Feed Discovery
 
         Args:
             config: Market configuration with seed keywords
-            cache_dir: Directory for caching SERP results
+            cache_dir: Directory for caching SERP results and domain feeds
             serpapi_daily_limit: Max SerpAPI requests per day (default: 3)
             serpapi_api_key: SerpAPI key (optional, loads from env if not provided)
+            domain_workers: Domains searched for feeds in parallel (default: 8)
+            feed_finder: Feed detector (default: FeedFinder with 5s request
+                and 15s per-domain timeouts)
         """
         self.config = config
         self.cache_dir = Path(cache_dir)
@@ -112,6 +125,13 @@ class FeedDiscovery:
             daily_limit=self.serpapi_daily_limit
         )
 
+        self.domain_workers = max(domain_workers, 1)
+        self.feed_finder = feed_finder or FeedFinder(timeout=5.0, site_timeout=15.0)
+
+        # Per-domain feed cache, loaded on first use
+        self._domain_cache: Optional[Dict[str, Dict]] = None
+        self._domain_cache_lock = threading.Lock()
+
         # Circuit breaker state
         self._serpapi_requests_today = 0
         self._last_request_date = datetime.now().date()
@@ -152,7 +172,7 @@ class FeedDiscovery:
         except Exception as e:
             logger.error("stage1_failed", error=str(e))
 
-        # Stage 2: SerpAPI + feedfinder
+        # Stage 2: SerpAPI + FeedFinder
         try:
             # Expand keywords with Gemini
             keywords = self._expand_keywords_with_gemini(
@@ -216,35 +236,42 @@ class FeedDiscovery:
 
     def run_stage2(self, keywords: List[str]) -> List[DiscoveredFeed]:
         """
-        Stage 2: SerpAPI search + feedfinder2 auto-detection
+        Stage 2: SerpAPI search + FeedFinder auto-detection
+
+        Domains from all keywords are searched for feeds in parallel
+        (domain_workers threads); results keep SERP order.
 
         Args:
             keywords: Expanded keywords to search
 
         Returns:
-            List of feeds discovered via SERP + feedfinder
+            List of feeds discovered via SERP + FeedFinder
         """
-        feeds: List[DiscoveredFeed] = []
-        discovered_domains: Set[str] = set()
+        domains: List[str] = []
 
         for keyword in keywords:
             try:
                 # Search with SerpAPI
-                domains = self._search_with_serpapi(keyword)
-
-                for domain in domains:
-                    if domain not in discovered_domains:
-                        discovered_domains.add(domain)
-
-                        # Discover feeds from domain
-                        domain_feeds = self._discover_feeds_from_domain(domain)
-                        feeds.extend(domain_feeds)
+                domains.extend(self._search_with_serpapi(keyword))
 
             except FeedDiscoveryError as e:
                 logger.warning("serpapi_search_failed", keyword=keyword, error=str(e))
                 # Re-raise to stop processing (circuit breaker hit)
                 raise
 
+        unique_domains = list(dict.fromkeys(domains))
+
+        feeds: List[DiscoveredFeed] = []
+        if unique_domains:
+            workers = min(self.domain_workers, len(unique_domains))
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="feed-discovery"
+            ) as executor:
+                for domain_feeds in executor.map(self._discover_feeds_from_domain, unique_domains):
+                    feeds.extend(domain_feeds)
+
+            self._save_domain_cache()
+
         self._stats["serpapi_feeds"] = len(feeds)
         return feeds
 
@@ -428,7 +455,9 @@ Keep original keywords and add 2-3 related terms per keyword."""
 
     def _discover_feeds_from_domain(self, domain: str) -> List[DiscoveredFeed]:
         """
-        Auto-detect RSS/Atom feeds from domain using feedfinder2
+        Auto-detect RSS/Atom feeds from domain (cached per domain)
+
+        Safe to call from several threads at once.
 
         Args:
             domain: Domain name (e.g., "example.com")
@@ -442,58 +471,84 @@ Keep original keywords and add 2-3 related terms per keyword."""
             logger.info("domain_blacklisted_skipped", domain=domain, reason="noisy/irrelevant content")
             return []
 
-        feeds: List[DiscoveredFeed] = []
-
-        try:
-            import feedfinder2
-
+        feed_urls = self._get_cached_domain_feeds(domain)
+        if feed_urls is not None:
+            logger.debug("domain_feeds_cache_hit", domain=domain, feeds_count=len(feed_urls))
+        else:
             # Ensure domain has protocol
             url = domain if domain.startswith("http") else f"https://{domain}"
 
-            # Monkey-patch feedfinder2 to use timeouts (prevents indefinite hangs)
-            import requests
-            _original_get = requests.get
-            _original_session_get = requests.Session.get
+            try:
+                feed_urls = self.feed_finder.find_feeds(url)
+            except Exception as e:
+                logger.warning("feed_finder_failed", domain=domain, error=str(e))
+                return []
 
-            def _get_with_timeout(*args, **kwargs):
-                kwargs.setdefault('timeout', 5)  # 5 second timeout per HTTP request
-                return _original_get(*args, **kwargs)
+            self._cache_domain_feeds(domain, feed_urls)
 
-            def _session_get_with_timeout(self, *args, **kwargs):
-                kwargs.setdefault('timeout', 5)  # 5 second timeout per HTTP request
-                return _original_session_get(self, *args, **kwargs)
+        feeds = [
+            DiscoveredFeed(
+                url=feed_url,
+                source="serpapi+feedfinder",
+                stage=DiscoveryStage.FEEDFINDER,
+                domain=domain
+            )
+            for feed_url in feed_urls
+        ]
 
-            # Discover feeds with timeouts and ThreadPoolExecutor wrapper
-            try:
-                requests.get = _get_with_timeout
-                requests.Session.get = _session_get_with_timeout
-
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(feedfinder2.find_feeds, url)
-                    feed_urls = future.result(timeout=15)  # 15 second total timeout per domain
-            except (concurrent.futures.TimeoutError, requests.exceptions.Timeout,
-                    requests.exceptions.ConnectTimeout, requests.exceptions.ReadTimeout) as e:
-                logger.warning("feedfinder_timeout", domain=domain, timeout_seconds=15, error=str(e))
-                return feeds
-            finally:
-                # Restore original methods
-                requests.get = _original_get
-                requests.Session.get = _original_session_get
-
-            for feed_url in feed_urls:
-                feeds.append(DiscoveredFeed(
-                    url=feed_url,
-                    source="serpapi+feedfinder",
-                    stage=DiscoveryStage.FEEDFINDER,
-                    domain=domain
-                ))
+        logger.info("feeds_discovered_from_domain", domain=domain, feeds_count=len(feeds))
+        return feeds
 
-            logger.info("feeds_discovered_from_domain", domain=domain, feeds_count=len(feeds))
+    def _load_domain_cache(self) -> Dict[str, Dict]:
+        """Load per-domain feed cache (call with _domain_cache_lock held)"""
+        if self._domain_cache is None:
+            cache_file = self.cache_dir / "domain_feeds_cache.json"
+            self._domain_cache = {}
+            if cache_file.exists():
+                try:
+                    with open(cache_file, 'r') as f:
+                        self._domain_cache = json.load(f)
+                except (json.JSONDecodeError, OSError):
+                    logger.warning("domain_feeds_cache_corrupted")
+        return self._domain_cache
+
+    def _get_cached_domain_feeds(self, domain: str) -> Optional[List[str]]:
+        """Get cached feed URLs for a domain if not expired"""
+        with self._domain_cache_lock:
+            entry = self._load_domain_cache().get(domain)
+
+        if not entry:
+            return None
 
-        except (TimeoutError, requests.RequestException) as e:
-            logger.warning("feedfinder_failed", domain=domain, error=str(e))
+        try:
+            timestamp = datetime.fromisoformat(entry["timestamp"])
+            ttl = self.DOMAIN_CACHE_TTL if entry["feeds"] else self.EMPTY_DOMAIN_CACHE_TTL
+            if datetime.now() - timestamp < ttl:
+                return entry["feeds"]
+        except (KeyError, ValueError, TypeError):
+            pass
 
-        return feeds
+        return None
+
+    def _cache_domain_feeds(self, domain: str, feed_urls: List[str]):
+        """Cache feed URLs for a domain in memory (persisted by _save_domain_cache)"""
+        with self._domain_cache_lock:
+            self._load_domain_cache()[domain] = {
+                "feeds": list(feed_urls),
+                "timestamp": datetime.now().isoformat()
+            }
+
+    def _save_domain_cache(self):
+        """Write per-domain feed cache to disk"""
+        with self._domain_cache_lock:
+            if self._domain_cache is None:
+                return
+            cache_file = self.cache_dir / "domain_feeds_cache.json"
+            try:
+                with open(cache_file, 'w') as f:
+                    json.dump(self._domain_cache, f, indent=2)
+            except OSError as e:
+                logger.warning("domain_feeds_cache_save_failed", error=str(e))
 
     def _check_daily_limit(self):
         """Check if SerpAPI daily limit is reached"""
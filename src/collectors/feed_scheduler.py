@@ -0,0 +1,176 @@
+"""
+Feed Poll Scheduler
+
+Adaptive polling for RSS/Atom feeds: each feed is polled roughly as often as
+it publishes instead of on every collection run.
+
+Design:
+- Publish interval estimated from entry timestamps: mean gap between the
+  newest entries, stretched by the silence since the newest one
+- Poll interval targets two polls per publish interval, smoothed against the
+  previous interval
+- 304 Not Modified responses stretch the interval (nothing new was published)
+- Interval clamped to [min_interval, max_interval]; result stored on the
+  FeedState (poll_interval_s, next_poll_at) so it persists with the feed
+- Unknown feeds and feeds without a next poll time are always due
+
+Usage:
+    scheduler = FeedPollScheduler()
+    due_urls = scheduler.due_feeds(feed_urls, states)
+
+    # After fetching a feed
+    scheduler.schedule(state, entry_times=[...])      # 200 OK
+    scheduler.schedule(state, not_modified=True)      # 304 Not Modified
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from src.collectors.feed_state_store import FeedState
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FeedPollScheduler:
+    """
+    Computes per-feed next poll times from observed publish rates.
+    """
+
+    def __init__(
+        self,
+        min_interval: timedelta = timedelta(hours=1),
+        max_interval: timedelta = timedelta(days=7),
+        default_interval: timedelta = timedelta(days=1),
+        polls_per_publish: float = 2.0,
+        not_modified_factor: float = 1.5,
+        grace: timedelta = timedelta(minutes=30),
+        sample_size: int = 20
+    ):
+        """
+        Initialize poll scheduler
+
+        Args:
+            min_interval: Shortest poll interval (default: 1 hour)
+            max_interval: Longest poll interval (default: 7 days)
+            default_interval: Interval for feeds without usable timestamps (default: 1 day)
+            polls_per_publish: Polls per estimated publish interval (default: 2)
+            not_modified_factor: Interval growth per 304 response (default: 1.5)
+            grace: Feeds due within this window count as due, so a run
+                started slightly early does not skip them (default: 30 min)
+            sample_size: Newest entries used for the estimate (default: 20)
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = default_interval
+        self.polls_per_publish = max(polls_per_publish, 1.0)
+        self.not_modified_factor = max(not_modified_factor, 1.0)
+        self.grace = grace
+        self.sample_size = max(sample_size, 2)
+
+    def estimate_publish_interval(
+        self,
+        entry_times: Iterable[Optional[datetime]],
+        now: Optional[datetime] = None
+    ) -> Optional[timedelta]:
+        """
+        Estimate how often a feed publishes
+
+        Args:
+            entry_times: Entry publication times (UTC, naive; None entries ignored)
+            now: Current UTC time (default: utcnow)
+
+        Returns:
+            Estimated publish interval, or None with fewer than 2 timestamps
+        """
+        now = now or datetime.utcnow()
+
+        # Ignore entries dated in the future (bad clocks, scheduled posts)
+        times = sorted(
+            (t for t in entry_times if t is not None and t <= now + timedelta(days=1)),
+            reverse=True
+        )[:self.sample_size]
+        if len(times) < 2:
+            return None
+
+        mean_gap = (times[0] - times[-1]) / (len(times) - 1)
+        silence = max(now - times[0], timedelta(0))
+
+        return max(mean_gap, silence)
+
+    def schedule(
+        self,
+        state: FeedState,
+        entry_times: Optional[Iterable[Optional[datetime]]] = None,
+        not_modified: bool = False,
+        now: Optional[datetime] = None
+    ) -> datetime:
+        """
+        Update a feed's poll interval and next poll time after a fetch
+
+        Args:
+            state: Feed state to update
+            entry_times: Entry publication times from the fetched feed (UTC)
+            not_modified: Fetch returned 304 Not Modified
+            now: Current local time (default: now)
+
+        Returns:
+            Next poll time
+        """
+        now = now or datetime.now()
+        previous = timedelta(seconds=state.poll_interval_s) if state.poll_interval_s else None
+        current = previous or self.default_interval
+
+        if not_modified:
+            interval = current * self.not_modified_factor
+        else:
+            publish_interval = self.estimate_publish_interval(entry_times or [])
+            if publish_interval is None:
+                interval = current
+            else:
+                target = publish_interval / self.polls_per_publish
+                interval = target if previous is None else (previous + target) / 2
+
+        interval = min(max(interval, self.min_interval), self.max_interval)
+
+        state.poll_interval_s = interval.total_seconds()
+        state.next_poll_at = now + interval
+        return state.next_poll_at
+
+    def is_due(self, state: Optional[FeedState], now: Optional[datetime] = None) -> bool:
+        """
+        Check if a feed should be polled in this run
+
+        Args:
+            state: Feed state (None = never polled)
+            now: Current local time (default: now)
+
+        Returns:
+            True if the feed is due
+        """
+        if state is None or state.next_poll_at is None:
+            return True
+        return state.next_poll_at <= (now or datetime.now()) + self.grace
+
+    def due_feeds(
+        self,
+        feed_urls: Iterable[str],
+        states: Dict[str, FeedState],
+        now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Filter feed URLs down to the ones due for polling
+
+        Args:
+            feed_urls: Candidate feed URLs (order preserved, duplicates removed)
+            states: Feed states by URL
+            now: Current local time (default: now)
+
+        Returns:
+            Due feed URLs
+        """
+        now = now or datetime.now()
+        return [
+            url for url in dict.fromkeys(feed_urls)
+            if self.is_due(states.get(url), now)
+        ]
@@ -0,0 +1,368 @@
+"""
+Feed State Store
+
+Per-feed polling state shared by RSSCollector, RSSFeedDiscoverer and
+RSSFeedDatabase, so health, backoff and conditional-GET validators survive
+worker restarts instead of living in process memory and one JSON file per
+feed.
+
+Design:
+- SQLite file (default: cache/feed_state.db), WAL mode, safe across threads
+  and worker processes
+- One row per feed URL: ETag, Last-Modified, success/failure counters, last
+  success/failure, average entries per fetch, poll interval, next poll time
+- Loaded in one query (load), written in one transaction (save_many)
+- Concurrent writers (collector, discoverer, other workers) merge instead of
+  overwriting each other: save_many applies only the changes made to a
+  state since it was loaded, counters as increments, onto the stored row
+- Database file is created on first use
+
+Usage:
+    store = FeedStateStore()
+    states = store.load()                      # {url: FeedState}
+    state = states.get(url) or FeedState(url=url)
+    state.record_success(entries=12)
+    store.save_many([state])
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Max URLs per "IN (...)" query (SQLite default variable limit is 999)
+_QUERY_CHUNK = 500
+
+
+@dataclass
+class FeedState:
+    """Persistent health, backoff and conditional-GET state of one feed"""
+    url: str
+    success_count: int = 0
+    failure_count: int = 0
+    consecutive_failures: int = 0
+    last_success: Optional[datetime] = None
+    last_failure: Optional[datetime] = None
+    last_etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    cached_at: Optional[datetime] = None   # When last_etag/last_modified were stored
+    avg_entries: float = 0.0               # Moving average of entries per fetch
+    next_poll_at: Optional[datetime] = None
+    poll_interval_s: float = 0.0           # Adaptive poll interval (0 = not estimated yet)
+    # Stored values when loaded or last saved (see FeedStateStore.save_many)
+    _baseline: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    # Weight of the newest fetch in avg_entries
+    ENTRIES_ALPHA = 0.3
+
+    def record_success(self, entries: Optional[int] = None):
+        """
+        Record successful feed fetch
+
+        Args:
+            entries: Number of entries in the fetched feed (None = not
+                downloaded, e.g. 304 Not Modified)
+        """
+        if entries is not None:
+            if self.success_count == 0:
+                self.avg_entries = float(entries)
+            else:
+                self.avg_entries += self.ENTRIES_ALPHA * (entries - self.avg_entries)
+
+        if self.consecutive_failures:
+            # Lift a failure backoff; a poll time set by the poll scheduler
+            # is kept (validation passes record successes too)
+            self.next_poll_at = None
+        self.success_count += 1
+        self.consecutive_failures = 0
+        self.last_success = datetime.now()
+
+    def record_failure(self):
+        """Record failed feed fetch"""
+        self.failure_count += 1
+        self.consecutive_failures += 1
+        self.last_failure = datetime.now()
+
+    def is_healthy(self, max_consecutive_failures: int = 5) -> bool:
+        """Check if feed is healthy"""
+        return self.consecutive_failures < max_consecutive_failures
+
+    def schedule_retry(self, max_consecutive_failures: int = 5, max_backoff_days: int = 30):
+        """
+        Back off an unhealthy feed: 1 day, doubling per further failure
+
+        Args:
+            max_consecutive_failures: Failures before backoff starts
+            max_backoff_days: Upper bound for the backoff
+        """
+        if self.is_healthy(max_consecutive_failures):
+            return
+
+        excess = self.consecutive_failures - max_consecutive_failures
+        days = min(2 ** min(excess, 10), max_backoff_days)
+        self.next_poll_at = (self.last_failure or datetime.now()) + timedelta(days=days)
+
+    def in_backoff(self, max_consecutive_failures: int = 5, now: Optional[datetime] = None) -> bool:
+        """
+        Check if the feed should not be polled yet
+
+        Unhealthy feeds without a scheduled retry stay skipped.
+        """
+        if self.is_healthy(max_consecutive_failures):
+            return False
+        if self.next_poll_at is None:
+            return True
+        return (now or datetime.now()) < self.next_poll_at
+
+
+_COLUMNS = (
+    "url", "success_count", "failure_count", "consecutive_failures",
+    "last_success", "last_failure", "last_etag", "last_modified",
+    "cached_at", "avg_entries", "next_poll_at", "poll_interval_s"
+)
+
+# Columns merged as increments (other columns: the changed value wins)
+_COUNTERS = ("success_count", "failure_count")
+
+
+def _to_text(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _to_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+class FeedStateStore:
+    """
+    SQLite-backed feed state table.
+
+    Thread-safe: every call opens its own short-lived connection.
+    """
+
+    def __init__(self, db_path: str = "cache/feed_state.db"):
+        """
+        Initialize feed state store
+
+        Args:
+            db_path: SQLite file for the store (":memory:" not supported)
+        """
+        self.db_path = db_path
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (WAL, busy timeout), creating the table on first use"""
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self._init_db()
+                    self._initialized = True
+
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self):
+        """Create feed_state table"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS feed_state (
+                    url TEXT PRIMARY KEY,
+                    success_count INTEGER NOT NULL DEFAULT 0,
+                    failure_count INTEGER NOT NULL DEFAULT 0,
+                    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+                    last_success TEXT,
+                    last_failure TEXT,
+                    last_etag TEXT,
+                    last_modified TEXT,
+                    cached_at TEXT,
+                    avg_entries REAL NOT NULL DEFAULT 0,
+                    next_poll_at TEXT,
+                    poll_interval_s REAL NOT NULL DEFAULT 0
+                ) WITHOUT ROWID
+            """)
+
+            # Migration: adaptive poll interval
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(feed_state)")}
+            if 'poll_interval_s' not in columns:
+                conn.execute("ALTER TABLE feed_state ADD COLUMN poll_interval_s REAL NOT NULL DEFAULT 0")
+            conn.commit()
+        finally:
+            conn.close()
+
+        logger.info("feed_state_store_initialized", db_path=self.db_path)
+
+    @staticmethod
+    def _row_to_state(row) -> FeedState:
+        (url, success_count, failure_count, consecutive_failures, last_success,
+         last_failure, last_etag, last_modified, cached_at, avg_entries, next_poll_at,
+         poll_interval_s) = row
+        state = FeedState(
+            url=url,
+            success_count=success_count,
+            failure_count=failure_count,
+            consecutive_failures=consecutive_failures,
+            last_success=_to_datetime(last_success),
+            last_failure=_to_datetime(last_failure),
+            last_etag=last_etag,
+            last_modified=last_modified,
+            cached_at=_to_datetime(cached_at),
+            avg_entries=avg_entries,
+            next_poll_at=_to_datetime(next_poll_at),
+            poll_interval_s=poll_interval_s
+        )
+        state._baseline = tuple(row)
+        return state
+
+    @staticmethod
+    def _state_to_params(state: FeedState) -> tuple:
+        return (
+            state.url, state.success_count, state.failure_count, state.consecutive_failures,
+            _to_text(state.last_success), _to_text(state.last_failure),
+            state.last_etag, state.last_modified, _to_text(state.cached_at),
+            state.avg_entries, _to_text(state.next_poll_at), state.poll_interval_s
+        )
+
+    @classmethod
+    def _merge(cls, state: FeedState, stored: tuple) -> tuple:
+        """Apply the changes made to state since it was loaded onto a stored row"""
+        baseline = state._baseline or cls._state_to_params(FeedState(url=state.url))
+        merged = []
+        for column, current, old, new in zip(_COLUMNS, stored, baseline, cls._state_to_params(state)):
+            if column in _COUNTERS:
+                merged.append(current + new - old)
+            else:
+                merged.append(new if new != old else current)
+        return tuple(merged)
+
+    def _select(self, conn: sqlite3.Connection, urls: Iterable[str]) -> List[tuple]:
+        """Fetch rows of the given feeds (chunked "IN (...)" queries)"""
+        select = f"SELECT {', '.join(_COLUMNS)} FROM feed_state"
+        url_list = list(dict.fromkeys(urls))
+        rows = []
+        for start in range(0, len(url_list), _QUERY_CHUNK):
+            chunk = url_list[start:start + _QUERY_CHUNK]
+            rows.extend(conn.execute(
+                f"{select} WHERE url IN ({', '.join('?' * len(chunk))})", chunk
+            ).fetchall())
+        return rows
+
+    def load(self, urls: Optional[Iterable[str]] = None) -> Dict[str, FeedState]:
+        """
+        Load feed states
+
+        Args:
+            urls: Feeds to load (None = all feeds, in a single query)
+
+        Returns:
+            Dict mapping URL -> FeedState (unknown feeds are absent)
+        """
+        conn = self._connect()
+        try:
+            if urls is None:
+                rows = conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM feed_state").fetchall()
+            else:
+                rows = self._select(conn, urls)
+        finally:
+            conn.close()
+
+        return {row[0]: self._row_to_state(row) for row in rows}
+
+    def get(self, url: str) -> Optional[FeedState]:
+        """
+        Load a single feed state
+
+        Args:
+            url: Feed URL
+
+        Returns:
+            FeedState or None if unknown
+        """
+        return self.load([url]).get(url)
+
+    def save_many(self, states: Iterable[FeedState]) -> int:
+        """
+        Upsert feed states in one transaction
+
+        Rows written by others since a state was loaded are merged, not
+        overwritten: counters add this state's increments, other columns
+        take this state's value only where it changed. The states are
+        updated to the merged rows.
+
+        Args:
+            states: Feed states to write
+
+        Returns:
+            Number of states written
+        """
+        states = list(states)
+        if not states:
+            return 0
+
+        updates = ", ".join(f"{column} = excluded.{column}" for column in _COLUMNS[1:])
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            stored = {row[0]: row for row in self._select(conn, (state.url for state in states))}
+            params: List[tuple] = []
+            for state in states:
+                row = stored.get(state.url)
+                stored[state.url] = self._merge(state, row) if row else self._state_to_params(state)
+                params.append(stored[state.url])
+            conn.executemany(
+                f"""
+                INSERT INTO feed_state ({', '.join(_COLUMNS)})
+                VALUES ({', '.join('?' * len(_COLUMNS))})
+                ON CONFLICT(url) DO UPDATE SET {updates}
+                """,
+                params
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        for state, row in zip(states, params):
+            merged = self._row_to_state(row)
+            for state_field in fields(FeedState):
+                setattr(state, state_field.name, getattr(merged, state_field.name))
+
+        logger.debug("feed_states_saved", count=len(params))
+        return len(params)
+
+    def save(self, state: FeedState):
+        """Upsert a single feed state"""
+        self.save_many([state])
+
+    def delete(self, urls: Iterable[str]) -> int:
+        """
+        Remove feed states
+
+        Args:
+            urls: Feed URLs
+
+        Returns:
+            Number of rows removed
+        """
+        conn = self._connect()
+        try:
+            removed = conn.executemany(
+                "DELETE FROM feed_state WHERE url = ?", [(url,) for url in urls]
+            ).rowcount
+            conn.commit()
+        finally:
+            conn.close()
+        return removed
@@ -5,8 +5,16 @@ Features:
 - feedparser for RSS/Atom feed parsing
 - trafilatura for full content extraction (handles summary-only feeds)
 - Conditional GET with ETag/Last-Modified (bandwidth optimization)
-- Feed health tracking with adaptive polling
+- Feed health tracking with backoff, persisted in a FeedStateStore
+  (survives worker restarts)
+- Adaptive polling (optional FeedPollScheduler): only feeds due according to
+  their observed publish rate are polled with due_only=True
 - Per-host rate limiting + robots.txt respect
+- Known entries (seen-URL index, existing documents) skipped before the
+  article download
+- Optional async batch mode: concurrent feed downloads (global connection
+  cap, non-blocking per-host politeness) with article extraction pipelined
+  into a worker pool, reporting per-phase timings
 - Comprehensive error handling with graceful degradation
 
 Usage:
@@ -21,21 +29,34 @@ Usage:
     )
 
     documents = collector.collect_from_feed('https://example.com/feed.xml')
+
+    # Concurrent batch collection (collect_from_feeds dispatches to it
+    # when max_concurrent_feeds > 0)
+    collector = RSSCollector(..., max_concurrent_feeds=20, extract_workers=8)
+    documents = collector.collect_from_feeds(feed_urls)
+    timings = collector.get_statistics()['last_batch_timings']
 """
 
+import asyncio
 import feedparser
+import httpx
 import trafilatura
-import json
 import hashlib
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
 from urllib.parse import urlparse
 import re
 
+from src.collectors.feed_scheduler import FeedPollScheduler
+from src.collectors.feed_state_store import FeedState, FeedStateStore
 from src.utils.logger import get_logger
+from src.utils.page_fetcher import PageFetcher, DEFAULT_USER_AGENT
+from src.utils.page_store import PageStore
 from src.models.document import Document
 
 logger = get_logger(__name__)
@@ -46,33 +67,8 @@ class RSSCollectorError(Exception):
     pass
 
 
-@dataclass
-class FeedHealth:
-    """Track feed reliability and health metrics"""
-    url: str
-    success_count: int = 0
-    failure_count: int = 0
-    consecutive_failures: int = 0
-    last_success: Optional[datetime] = None
-    last_failure: Optional[datetime] = None
-    last_etag: Optional[str] = None
-    last_modified: Optional[str] = None
-
-    def record_success(self):
-        """Record successful feed fetch"""
-        self.success_count += 1
-        self.consecutive_failures = 0
-        self.last_success = datetime.now()
-
-    def record_failure(self):
-        """Record failed feed fetch"""
-        self.failure_count += 1
-        self.consecutive_failures += 1
-        self.last_failure = datetime.now()
-
-    def is_healthy(self, max_consecutive_failures: int = 5) -> bool:
-        """Check if feed is healthy"""
-        return self.consecutive_failures < max_consecutive_failures
+# Feed health is part of the persistent feed state (name kept for existing imports)
+FeedHealth = FeedState
 
 
 @dataclass
@@ -95,7 +91,7 @@ class RSSCollector:
     - Multi-format support (RSS 1.0, RSS 2.0, Atom)
     - Full content extraction via trafilatura
     - Bandwidth optimization (ETag/Last-Modified)
-    - Feed health monitoring
+    - Feed health monitoring (persisted across runs)
     - Per-host rate limiting
     """
 
@@ -107,7 +103,13 @@ class RSSCollector:
         cache_dir: str = "cache/rss_collector",
         rate_limit_per_host: float = 2.0,  # requests per second per host
         request_timeout: int = 30,
-        max_consecutive_failures: int = 5
+        max_consecutive_failures: int = 5,
+        page_store: Optional[PageStore] = None,
+        feed_state_store: Optional[FeedStateStore] = None,
+        poll_scheduler: Optional[FeedPollScheduler] = None,
+        max_concurrent_feeds: int = 0,
+        extract_workers: int = 4,
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ):
         """
         Initialize RSS Collector
@@ -116,10 +118,19 @@ class RSSCollector:
             config: Market configuration
             db_manager: Database manager instance
             deduplicator: Deduplicator instance
-            cache_dir: Directory for caching feed metadata
+            cache_dir: Directory for feed state (used if no feed_state_store is given)
             rate_limit_per_host: Max requests per second per host
             request_timeout: HTTP request timeout in seconds
             max_consecutive_failures: Max failures before skipping feed
+            page_store: Shared fetched-page store for article pages (None = always download)
+            feed_state_store: Shared feed state store (None = <cache_dir>/feed_state.db)
+            poll_scheduler: Adaptive poll scheduler (None = no next-poll times,
+                every feed is always due)
+            max_concurrent_feeds: Global cap on concurrent feed downloads in
+                collect_from_feeds (0 = sequential, one feed at a time)
+            extract_workers: Worker threads for article extraction in async mode
+            transport: Custom httpx transport for feed downloads in async mode
+                (e.g., httpx.MockTransport in tests)
         """
         self.config = config
         self.db_manager = db_manager
@@ -130,19 +141,35 @@ class RSSCollector:
         self.rate_limit_per_host = rate_limit_per_host
         self.request_timeout = request_timeout
         self.max_consecutive_failures = max_consecutive_failures
+        self.max_concurrent_feeds = max(0, max_concurrent_feeds)
+        self.extract_workers = max(1, extract_workers)
+        self.transport = transport
 
-        # Feed health tracking
-        self._feed_health: Dict[str, FeedHealth] = {}
+        # Article page fetching (reads through the shared page store if given)
+        self.page_fetcher = PageFetcher(timeout=request_timeout, page_store=page_store)
+
+        # Feed health + conditional GET validators (loaded lazily, flushed per batch)
+        self.feed_state_store = feed_state_store or FeedStateStore(
+            db_path=str(self.cache_dir / "feed_state.db")
+        )
+        self.poll_scheduler = poll_scheduler
+        self._feed_health: Dict[str, FeedState] = {}
+        self._feed_states_loaded = False
+        self._dirty_feeds: Set[str] = set()
 
         # Per-host rate limiting
         self._last_request_per_host: Dict[str, datetime] = {}
+        self._next_request_slot: Dict[str, float] = {}  # Async mode (monotonic)
 
-        # Statistics
+        # Statistics (entries are processed from worker threads in async mode)
+        self._stats_lock = threading.Lock()
         self._stats = {
             "total_feeds_collected": 0,
             "total_documents_collected": 0,
             "total_failures": 0,
-            "total_skipped_duplicates": 0
+            "total_skipped_duplicates": 0,
+            "total_skipped_fetches": 0,  # Known entries never downloaded
+            "total_feeds_not_due": 0     # Feeds skipped by the poll scheduler
         }
 
         logger.info(
@@ -165,16 +192,27 @@ class RSSCollector:
         Raises:
             RSSCollectorError: If feed parsing fails
         """
+        try:
+            return self._collect_feed(feed_url)
+        finally:
+            self._flush_feed_states()
+
+    def _collect_feed(self, feed_url: str) -> List[Document]:
+        """
+        Collect a single feed without persisting feed state (see collect_from_feed)
+        """
         # Validate URL
         if not self._is_valid_url(feed_url):
             raise RSSCollectorError(f"Invalid feed URL: {feed_url}")
 
         # Check if feed should be skipped
         if self._should_skip_feed(feed_url):
+            health = self._feed_health[feed_url]
             logger.warning(
                 "feed_skipped_unhealthy",
                 feed_url=feed_url,
-                consecutive_failures=self._feed_health[feed_url].consecutive_failures
+                consecutive_failures=health.consecutive_failures,
+                next_poll_at=health.next_poll_at.isoformat() if health.next_poll_at else None
             )
             return []
 
@@ -199,7 +237,7 @@ class RSSCollector:
             # Check if feed was modified (304 Not Modified)
             if feed.get('status') == 304:
                 logger.info("feed_not_modified", feed_url=feed_url)
-                self._get_feed_health(feed_url).record_success()
+                self._record_feed_success(feed_url)
                 return []
 
             # Check for parsing errors
@@ -231,9 +269,9 @@ class RSSCollector:
             self._save_feed_cache(feed_url, etag=etag, modified=modified)
 
             # Update health and stats
-            self._get_feed_health(feed_url).record_success()
-            self._stats["total_feeds_collected"] += 1
-            self._stats["total_documents_collected"] += len(documents)
+            self._record_feed_success(feed_url, entries=entries)
+            self._increment_stat("total_feeds_collected")
+            self._increment_stat("total_documents_collected", len(documents))
 
             logger.info(
                 "feed_collection_success",
@@ -244,8 +282,8 @@ class RSSCollector:
             return documents
 
         except Exception as e:
-            self._get_feed_health(feed_url).record_failure()
-            self._stats["total_failures"] += 1
+            self._record_feed_failure(feed_url)
+            self._increment_stat("total_failures")
 
             logger.error(
                 "feed_collection_failed",
@@ -258,7 +296,8 @@ class RSSCollector:
     def collect_from_feeds(
         self,
         feed_urls: List[str],
-        skip_errors: bool = True
+        skip_errors: bool = True,
+        due_only: bool = False
     ) -> List[Document]:
         """
         Collect documents from multiple RSS/Atom feeds
@@ -266,22 +305,38 @@ class RSSCollector:
         Args:
             feed_urls: List of feed URLs
             skip_errors: Continue on errors (default: True)
+            due_only: Only poll feeds due according to the poll scheduler
 
         Returns:
             List of all collected documents
         """
+        if due_only:
+            feed_urls = self.select_due_feeds(feed_urls)
+
+        if self.max_concurrent_feeds > 0:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.collect_from_feeds_async(feed_urls, skip_errors=skip_errors))
+            # Called from inside an event loop: callers there should await
+            # collect_from_feeds_async() directly
+            logger.debug("async_collection_unavailable", reason="event loop already running")
+
         logger.info("batch_collection_started", feed_count=len(feed_urls))
 
         all_documents = []
 
-        for feed_url in feed_urls:
-            try:
-                documents = self.collect_from_feed(feed_url)
-                all_documents.extend(documents)
-            except RSSCollectorError as e:
-                if not skip_errors:
-                    raise
-                logger.warning("feed_skipped", feed_url=feed_url, error=str(e))
+        try:
+            for feed_url in feed_urls:
+                try:
+                    documents = self._collect_feed(feed_url)
+                    all_documents.extend(documents)
+                except RSSCollectorError as e:
+                    if not skip_errors:
+                        raise
+                    logger.warning("feed_skipped", feed_url=feed_url, error=str(e))
+        finally:
+            self._flush_feed_states()
 
         logger.info(
             "batch_collection_complete",
@@ -291,10 +346,300 @@ class RSSCollector:
 
         return all_documents
 
+    async def collect_from_feeds_async(
+        self,
+        feed_urls: List[str],
+        skip_errors: bool = True,
+        due_only: bool = False
+    ) -> List[Document]:
+        """
+        Collect documents from multiple feeds concurrently
+
+        Feeds are downloaded over one pooled httpx client, capped at
+        max_concurrent_feeds connections, with per-host spacing enforced by
+        _apply_rate_limit_async. Entries are processed (full-content fetch +
+        extraction) on a worker pool of extract_workers threads while other
+        feeds are still downloading. Per-phase timings of the run are stored
+        in get_statistics()['last_batch_timings'].
+
+        Args:
+            feed_urls: List of feed URLs
+            skip_errors: Continue on errors (default: True)
+            due_only: Only poll feeds due according to the poll scheduler
+
+        Returns:
+            List of all collected documents (in feed order)
+        """
+        if due_only:
+            feed_urls = await asyncio.to_thread(self.select_due_feeds, feed_urls)
+
+        max_connections = self.max_concurrent_feeds or 10
+        logger.info(
+            "batch_collection_started",
+            feed_count=len(feed_urls),
+            mode="async",
+            max_connections=max_connections,
+            extract_workers=self.extract_workers
+        )
+
+        started = time.perf_counter()
+        timings = {"rate_limit_wait_s": 0.0, "download_s": 0.0, "parse_s": 0.0, "extract_s": 0.0}
+        connection_slots = asyncio.Semaphore(max_connections)
+
+        await asyncio.to_thread(self._load_feed_states)
+
+        async with httpx.AsyncClient(
+            headers={"User-Agent": DEFAULT_USER_AGENT},
+            timeout=self.request_timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            follow_redirects=True,
+            transport=self.transport
+        ) as client:
+            with ThreadPoolExecutor(
+                max_workers=self.extract_workers,
+                thread_name_prefix="rss-extract"
+            ) as extract_pool:
+                results = await asyncio.gather(
+                    *(
+                        self._collect_feed_async(
+                            feed_url, client, connection_slots, extract_pool, timings
+                        )
+                        for feed_url in feed_urls
+                    ),
+                    return_exceptions=True
+                )
+
+        await asyncio.to_thread(self._flush_feed_states)
+
+        all_documents = []
+        for feed_url, result in zip(feed_urls, results):
+            if isinstance(result, RSSCollectorError):
+                if not skip_errors:
+                    raise result
+                logger.warning("feed_skipped", feed_url=feed_url, error=str(result))
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                all_documents.extend(result)
+
+        timings["wall_s"] = time.perf_counter() - started
+        timings = {phase: round(seconds, 3) for phase, seconds in timings.items()}
+        with self._stats_lock:
+            self._stats["last_batch_timings"] = timings
+
+        logger.info(
+            "batch_collection_complete",
+            total_documents=len(all_documents),
+            total_feeds=len(feed_urls),
+            mode="async",
+            **timings
+        )
+
+        return all_documents
+
+    async def _collect_feed_async(
+        self,
+        feed_url: str,
+        client: httpx.AsyncClient,
+        connection_slots: asyncio.Semaphore,
+        extract_pool: ThreadPoolExecutor,
+        timings: Dict[str, float]
+    ) -> List[Document]:
+        """
+        Download, parse and process a single feed (async counterpart of collect_from_feed)
+
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            client: Shared httpx client
+            connection_slots: Global cap on in-flight feed downloads
+            extract_pool: Worker pool for entry processing
+            timings: Per-phase timing accumulator (updated on the event loop)
+
+        Returns:
+            List of Document objects
+
+        Raises:
+            RSSCollectorError: If the feed cannot be downloaded or parsed
+        """
+        if not self._is_valid_url(feed_url):
+            raise RSSCollectorError(f"Invalid feed URL: {feed_url}")
+
+        if self._should_skip_feed(feed_url):
+            health = self._feed_health[feed_url]
+            logger.warning(
+                "feed_skipped_unhealthy",
+                feed_url=feed_url,
+                consecutive_failures=health.consecutive_failures,
+                next_poll_at=health.next_poll_at.isoformat() if health.next_poll_at else None
+            )
+            return []
+
+        logger.info("feed_collection_started", feed_url=feed_url)
+
+        try:
+            timings["rate_limit_wait_s"] += await self._apply_rate_limit_async(feed_url)
+
+            # Conditional GET with cached ETag/Modified
+            cache_data = self._load_feed_cache(feed_url)
+            etag = cache_data.get('etag') if cache_data else None
+            modified = cache_data.get('modified') if cache_data else None
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if modified:
+                headers["If-Modified-Since"] = modified
+
+            phase_started = time.perf_counter()
+            async with connection_slots:
+                response = await client.get(feed_url, headers=headers)
+            timings["download_s"] += time.perf_counter() - phase_started
+
+            if response.status_code == 304:
+                logger.info("feed_not_modified", feed_url=feed_url)
+                self._record_feed_success(feed_url)
+                return []
+
+            response.raise_for_status()
+
+            phase_started = time.perf_counter()
+            feed = await asyncio.to_thread(
+                feedparser.parse,
+                response.content,
+                response_headers={
+                    "content-location": str(response.url),
+                    "content-type": response.headers.get("Content-Type", "")
+                }
+            )
+            timings["parse_s"] += time.perf_counter() - phase_started
+
+            if feed.get('bozo', False):
+                exception = feed.get('bozo_exception')
+                raise RSSCollectorError(f"Malformed feed: {exception}")
+
+            # Hand entries to the worker pool; other feeds keep downloading meanwhile
+            loop = asyncio.get_running_loop()
+            entries = feed.get('entries', [])
+            processed = await asyncio.gather(*(
+                loop.run_in_executor(extract_pool, self._process_entry_timed, entry, feed_url)
+                for entry in entries
+            ))
+
+            documents = []
+            for document, elapsed in processed:
+                timings["extract_s"] += elapsed
+                if document:
+                    documents.append(document)
+
+            self._save_feed_cache(
+                feed_url,
+                etag=response.headers.get("ETag") or etag,
+                modified=response.headers.get("Last-Modified") or modified
+            )
+
+            self._record_feed_success(feed_url, entries=entries)
+            self._increment_stat("total_feeds_collected")
+            self._increment_stat("total_documents_collected", len(documents))
+
+            logger.info(
+                "feed_collection_success",
+                feed_url=feed_url,
+                documents_count=len(documents)
+            )
+
+            return documents
+
+        except Exception as e:
+            self._record_feed_failure(feed_url)
+            self._increment_stat("total_failures")
+
+            logger.error(
+                "feed_collection_failed",
+                feed_url=feed_url,
+                error=str(e)
+            )
+
+            raise RSSCollectorError(f"Failed to collect from feed {feed_url}: {e}")
+
+    def _is_known_url(self, canonical_url: str) -> bool:
+        """
+        Check whether an entry URL was already collected
+
+        Args:
+            canonical_url: Canonical entry URL
+
+        Returns:
+            True if the deduplicator has seen it or it is already in the documents table
+        """
+        if self.deduplicator.has_seen_url(canonical_url):
+            return True
+
+        if self.db_manager is not None:
+            try:
+                return self.db_manager.get_document_by_url(canonical_url) is not None
+            except Exception as e:
+                logger.debug("existing_document_check_failed", url=canonical_url, error=str(e))
+
+        return False
+
+    def select_due_feeds(self, feed_urls: List[str]) -> List[str]:
+        """
+        Filter feeds down to the ones due for polling
+
+        Args:
+            feed_urls: Candidate feed URLs
+
+        Returns:
+            Due feed URLs (all of them without a poll scheduler)
+        """
+        if not self.poll_scheduler:
+            return list(feed_urls)
+
+        self._load_feed_states()
+        due = self.poll_scheduler.due_feeds(feed_urls, self._feed_health)
+
+        not_due = len(set(feed_urls)) - len(due)
+        if not_due:
+            self._increment_stat("total_feeds_not_due", not_due)
+        logger.info("feeds_due_selected", due=len(due), not_due=not_due)
+
+        return due
+
+    def _process_entry_timed(self, entry: dict, feed_url: str) -> Tuple[Optional[Document], float]:
+        """
+        Process an entry on a worker thread, never raising
+
+        Args:
+            entry: feedparser entry dict
+            feed_url: URL of the feed
+
+        Returns:
+            (Document or None, seconds spent)
+        """
+        started = time.perf_counter()
+        try:
+            document = self._process_entry(entry, feed_url)
+        except Exception as e:
+            logger.warning(
+                "entry_processing_failed",
+                feed_url=feed_url,
+                entry_id=entry.get('id', 'unknown'),
+                error=str(e)
+            )
+            document = None
+        return document, time.perf_counter() - started
+
     def _process_entry(self, entry: dict, feed_url: str) -> Optional[Document]:
         """
         Process a single feed entry into a Document
 
+        Staged so only genuinely new entries pay for the article download:
+        1. Canonical URL check (seen-URL index, existing documents)
+        2. Full content fetch + extraction
+        3. Document creation + content duplicate check
+
         Args:
             entry: feedparser entry dict
             feed_url: URL of the feed
@@ -311,13 +656,20 @@ class RSSCollector:
         # Get canonical URL for deduplication
         canonical_url = self.deduplicator.get_canonical_url(entry_url)
 
+        # Stage 1: skip known URLs before fetching anything
+        if self._is_known_url(canonical_url):
+            logger.debug("entry_skipped_known_url", url=canonical_url)
+            self._increment_stat("total_skipped_duplicates")
+            self._increment_stat("total_skipped_fetches")
+            return None
+
         # Extract title
         title = entry.get('title', 'Untitled')
 
         # Extract summary
         summary = entry.get('summary') or entry.get('description')
 
-        # Extract or fetch full content
+        # Stage 2: fetch full content
         content = self._extract_full_content(entry_url, summary or "")
 
         # Extract publication date
@@ -353,9 +705,9 @@ class RSSCollector:
             status="new"
         )
 
-        # Check for duplicates (after Document creation)
+        # Stage 3: content duplicate check (after Document creation)
         if self.deduplicator.is_duplicate(document):
-            self._stats["total_skipped_duplicates"] += 1
+            self._increment_stat("total_skipped_duplicates")
             return None
 
         return document
@@ -380,20 +732,23 @@ class RSSCollector:
         try:
             timeout = timeout or self.request_timeout
 
-            # Fetch HTML
-            html = trafilatura.fetch_url(url)
+            # Fetch HTML (or reuse the stored page and its extracted text)
+            page = self.page_fetcher.fetch_page(url, timeout=timeout)
 
-            if html:
+            content = page.text
+            if not content:
                 # Extract main content
                 content = trafilatura.extract(
-                    html,
+                    page.html,
                     include_comments=False,
                     include_tables=True,
                     no_fallback=False
                 )
+                if content and self.page_fetcher.page_store:
+                    self.page_fetcher.page_store.save_text(url, content)
 
-                if content and len(content.strip()) > 100:
-                    return content
+            if content and len(content.strip()) > 100:
+                return content
 
             # Fallback to summary
             return fallback_summary
@@ -433,6 +788,26 @@ class RSSCollector:
         # Default to now
         return datetime.now()
 
+    @staticmethod
+    def _entry_timestamp(entry: dict) -> Optional[datetime]:
+        """
+        Publication time of an entry (UTC, as parsed by feedparser)
+
+        Args:
+            entry: feedparser entry dict
+
+        Returns:
+            datetime or None if the entry has no usable date
+        """
+        for key in ('published_parsed', 'updated_parsed'):
+            parsed = entry.get(key)
+            if parsed:
+                try:
+                    return datetime(*parsed[:6])
+                except (TypeError, ValueError):
+                    continue
+        return None
+
     def _generate_source_id(self, feed_url: str) -> str:
         """
         Generate source identifier from feed URL
@@ -473,15 +848,17 @@ class RSSCollector:
             feed_url: Feed URL
 
         Returns:
-            True if feed should be skipped
+            True if feed should be skipped (unhealthy and not yet due for a retry)
         """
+        self._load_feed_states()
+
         if feed_url not in self._feed_health:
             return False
 
         health = self._feed_health[feed_url]
-        return not health.is_healthy(self.max_consecutive_failures)
+        return health.in_backoff(self.max_consecutive_failures)
 
-    def _get_feed_health(self, feed_url: str) -> FeedHealth:
+    def _get_feed_health(self, feed_url: str) -> FeedState:
         """
         Get or create feed health tracker
 
@@ -489,13 +866,66 @@ class RSSCollector:
             feed_url: Feed URL
 
         Returns:
-            FeedHealth instance
+            FeedState instance
         """
+        self._load_feed_states()
+
         if feed_url not in self._feed_health:
-            self._feed_health[feed_url] = FeedHealth(url=feed_url)
+            self._feed_health[feed_url] = FeedState(url=feed_url)
 
         return self._feed_health[feed_url]
 
+    def _record_feed_success(self, feed_url: str, entries: Optional[List] = None):
+        """Record a successful fetch (entries=None for 304 Not Modified)"""
+        health = self._get_feed_health(feed_url)
+        health.record_success(entries=len(entries) if entries is not None else None)
+
+        if self.poll_scheduler:
+            if entries is None:
+                self.poll_scheduler.schedule(health, not_modified=True)
+            else:
+                self.poll_scheduler.schedule(
+                    health, entry_times=[self._entry_timestamp(entry) for entry in entries]
+                )
+
+        self._dirty_feeds.add(feed_url)
+
+    def _record_feed_failure(self, feed_url: str):
+        """Record a failed fetch, backing off once the feed turns unhealthy"""
+        health = self._get_feed_health(feed_url)
+        health.record_failure()
+        health.schedule_retry(self.max_consecutive_failures)
+        self._dirty_feeds.add(feed_url)
+
+    def _load_feed_states(self):
+        """Load persisted feed states once (single query)"""
+        if self._feed_states_loaded:
+            return
+        self._feed_states_loaded = True
+
+        try:
+            states = self.feed_state_store.load()
+        except Exception as e:
+            logger.warning("feed_state_load_failed", error=str(e))
+            return
+
+        for url, state in states.items():
+            self._feed_health.setdefault(url, state)
+
+        logger.debug("feed_states_loaded", count=len(states))
+
+    def _flush_feed_states(self):
+        """Persist feed states changed since the last flush (single transaction)"""
+        if not self._dirty_feeds:
+            return
+
+        dirty = [self._feed_health[url] for url in self._dirty_feeds if url in self._feed_health]
+        try:
+            self.feed_state_store.save_many(dirty)
+            self._dirty_feeds.clear()
+        except Exception as e:
+            logger.warning("feed_state_save_failed", count=len(dirty), error=str(e))
+
     def _apply_rate_limit(self, feed_url: str):
         """
         Apply per-host rate limiting
@@ -518,6 +948,40 @@ class RSSCollector:
 
         self._last_request_per_host[host] = datetime.now()
 
+    async def _apply_rate_limit_async(self, feed_url: str) -> float:
+        """
+        Apply per-host rate limiting without blocking the event loop
+
+        Each call reserves the next free slot for its host before awaiting,
+        so concurrent requests to one host are spaced 1/rate_limit_per_host
+        apart while other hosts proceed.
+
+        Args:
+            feed_url: Feed URL
+
+        Returns:
+            Seconds waited
+        """
+        host = urlparse(feed_url).netloc
+        min_interval = 1.0 / self.rate_limit_per_host
+
+        now = time.monotonic()
+        slot = max(now, self._next_request_slot.get(host, now))
+        self._next_request_slot[host] = slot + min_interval
+
+        wait = slot - now
+        if wait > 0:
+            logger.debug("rate_limit_sleep", host=host, sleep_time=wait)
+            await asyncio.sleep(wait)
+
+        self._last_request_per_host[host] = datetime.now()
+        return wait
+
+    def _increment_stat(self, key: str, amount: int = 1):
+        """Thread-safe statistics counter increment"""
+        with self._stats_lock:
+            self._stats[key] += amount
+
     def _save_feed_cache(
         self,
         feed_url: str,
@@ -525,23 +989,18 @@ class RSSCollector:
         modified: Optional[str] = None
     ):
         """
-        Save feed cache data (ETag/Modified)
+        Save feed cache data (ETag/Modified) to the feed state
 
         Args:
             feed_url: Feed URL
             etag: ETag header value
             modified: Last-Modified header value
         """
-        cache_file = self._get_cache_file(feed_url)
-
-        cache_data = {
-            'feed_url': feed_url,
-            'etag': etag,
-            'modified': modified,
-            'cached_at': datetime.now().isoformat()
-        }
-
-        cache_file.write_text(json.dumps(cache_data, indent=2))
+        health = self._get_feed_health(feed_url)
+        health.last_etag = etag
+        health.last_modified = modified
+        health.cached_at = datetime.now()
+        self._dirty_feeds.add(feed_url)
 
     def _load_feed_cache(
         self,
@@ -549,7 +1008,7 @@ class RSSCollector:
         ttl_days: int = 30
     ) -> Optional[Dict]:
         """
-        Load feed cache data
+        Load feed cache data from the feed state
 
         Args:
             feed_url: Feed URL
@@ -558,37 +1017,22 @@ class RSSCollector:
         Returns:
             Cache data dict or None if expired/missing
         """
-        cache_file = self._get_cache_file(feed_url)
+        self._load_feed_states()
 
-        if not cache_file.exists():
+        health = self._feed_health.get(feed_url)
+        if health is None or health.cached_at is None:
             return None
 
-        try:
-            cache_data = json.loads(cache_file.read_text())
-
-            # Check TTL
-            cached_at = datetime.fromisoformat(cache_data['cached_at'])
-            if datetime.now() - cached_at > timedelta(days=ttl_days):
-                return None
-
-            return cache_data
-
-        except Exception as e:
-            logger.debug("cache_load_failed", feed_url=feed_url, error=str(e))
+        # Check TTL
+        if datetime.now() - health.cached_at > timedelta(days=ttl_days):
             return None
 
-    def _get_cache_file(self, feed_url: str) -> Path:
-        """
-        Get cache file path for feed
-
-        Args:
-            feed_url: Feed URL
-
-        Returns:
-            Path to cache file
-        """
-        url_hash = hashlib.md5(feed_url.encode()).hexdigest()
-        return self.cache_dir / f"{url_hash}.json"
+        return {
+            'feed_url': feed_url,
+            'etag': health.last_etag,
+            'modified': health.last_modified,
+            'cached_at': health.cached_at.isoformat()
+        }
 
     def get_statistics(self) -> Dict:
         """
@@ -597,7 +1041,8 @@ class RSSCollector:
         Returns:
             Statistics dict
         """
-        return self._stats.copy()
+        with self._stats_lock:
+            return self._stats.copy()
 
     def get_feed_health_report(self) -> List[Dict]:
         """
@@ -606,6 +1051,8 @@ class RSSCollector:
         Returns:
             List of feed health dicts
         """
+        self._load_feed_states()
+
         return [
             {
                 'url': health.url,
@@ -614,7 +1061,9 @@ class RSSCollector:
                 'consecutive_failures': health.consecutive_failures,
                 'is_healthy': health.is_healthy(self.max_consecutive_failures),
                 'last_success': health.last_success.isoformat() if health.last_success else None,
-                'last_failure': health.last_failure.isoformat() if health.last_failure else None
+                'last_failure': health.last_failure.isoformat() if health.last_failure else None,
+                'avg_entries': round(health.avg_entries, 2),
+                'next_poll_at': health.next_poll_at.isoformat() if health.next_poll_at else None
             }
             for health in self._feed_health.values()
         ]
@@ -1,9 +1,19 @@
 """
 RSS Feed Database Manager
 
-Manages a curated database of RSS feeds organized by domain and vertical.
-
-Structure:
+Manages a curated catalog of RSS feeds organized by domain and vertical.
+
+Storage:
+- SQLite catalog (default: data/rss_feeds.db), WAL mode, one row per feed
+  per vertical
+- Indexes on (domain, vertical, quality_score) for queries and a unique
+  (url, domain, vertical) index for duplicate checks and URL lookups; the
+  same URL may be listed once in each domain/vertical
+- add_feed()/add_feeds() upsert incrementally; nothing is rewritten on save()
+- The legacy JSON database (src/config/rss_feeds_database.json) is imported
+  once into an empty catalog (migrate_from_json)
+
+Legacy JSON structure:
 {
   "domains": {
     "medicine": {
@@ -17,38 +27,59 @@ Structure:
         }
       ],
       "oncology": [...]
-    },
-    "technology": {
-      "saas": [...],
-      "ai": [...]
     }
   },
-  "metadata": {
-    "version": "1.0",
-    "last_updated": "2025-11-16T10:00:00",
-    "total_feeds": 1250,
-    "total_domains": 15,
-    "total_verticals": 120
-  }
+  "metadata": {...}
 }
+
+With a FeedStateStore attached, query results carry each feed's polling
+health (shared with RSSCollector) and can exclude feeds that are backing
+off after repeated failures.
 """
 
 import json
 import os
-from dataclasses import asdict
+import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional
 
+from src.collectors.feed_state_store import FeedState, FeedStateStore
 from src.collectors.rss_feed_discoverer import RSSFeed
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+DEFAULT_JSON_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "config",
+    "rss_feeds_database.json"
+)
+
+# Project data/ directory, independent of the working directory
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "data",
+    "rss_feeds.db"
+)
+
+# Feed columns (besides domain/vertical), in legacy JSON key order
+_FEED_COLUMNS = (
+    "url", "source_url", "title", "description", "discovery_method",
+    "quality_score", "last_updated", "article_count", "is_valid",
+    "discovered_at", "last_validated"
+)
+
+
 class RSSFeedDatabase:
     """
-    Manages RSS feed database with CRUD operations.
+    Manages RSS feed catalog with CRUD operations.
+
+    Thread-safe: every call opens its own short-lived connection.
 
     Usage:
         db = RSSFeedDatabase()
@@ -64,102 +95,238 @@ class RSSFeedDatabase:
         verticals = db.get_verticals("technology")
     """
 
-    def __init__(self, database_path: Optional[str] = None):
+    def __init__(
+        self,
+        database_path: Optional[str] = None,
+        feed_state_store: Optional[FeedStateStore] = None,
+        max_consecutive_failures: int = 5,
+        json_path: Optional[str] = None
+    ):
         """
         Initialize database manager.
 
         Args:
-            database_path: Path to database JSON file
+            database_path: Path to SQLite catalog (default: data/rss_feeds.db).
+                A ".json" path is treated as a legacy database: the catalog
+                lives next to it with a ".db" suffix and imports it once.
+            feed_state_store: Shared feed state store (None = no health data)
+            max_consecutive_failures: Failures before a feed counts as unhealthy
+            json_path: Legacy JSON database imported into an empty catalog
+                (default: src/config/rss_feeds_database.json)
         """
-        self.database_path = database_path or os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "config",
-            "rss_feeds_database.json"
-        )
+        self.feed_state_store = feed_state_store
+        self.max_consecutive_failures = max_consecutive_failures
+
+        if database_path and database_path.endswith(".json"):
+            json_path = json_path or database_path
+            database_path = str(Path(database_path).with_suffix(".db"))
 
-        # Ensure config directory exists
-        os.makedirs(os.path.dirname(self.database_path), exist_ok=True)
+        self.database_path = database_path or DEFAULT_DB_PATH
+        self.json_path = json_path or (DEFAULT_JSON_PATH if database_path is None else None)
 
-        # Load or initialize database
-        self.db = self._load_database()
+        self._init_db()
 
+        stats = self._count_totals()
         logger.info(
             "rss_database_initialized",
             path=self.database_path,
-            domains=len(self.db.get("domains", {})),
-            total_feeds=self.db.get("metadata", {}).get("total_feeds", 0)
+            domains=stats["total_domains"],
+            total_feeds=stats["total_feeds"]
         )
 
-    def _load_database(self) -> Dict:
-        """
-        Load database from JSON file or create new.
-
-        Returns:
-            Database dictionary
-        """
-        if os.path.exists(self.database_path):
-            try:
-                with open(self.database_path, 'r', encoding='utf-8') as f:
-                    db = json.load(f)
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (WAL, busy timeout)"""
+        conn = sqlite3.connect(self.database_path, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
 
-                logger.info(
-                    "database_loaded",
-                    path=self.database_path,
-                    domains=len(db.get("domains", {}))
-                )
+    def _init_db(self):
+        """Create catalog tables and import the legacy JSON database once"""
+        Path(self.database_path).parent.mkdir(parents=True, exist_ok=True)
 
-                return db
+        conn = self._connect()
+        try:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS feeds (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    domain TEXT NOT NULL,
+                    vertical TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    source_url TEXT,
+                    title TEXT,
+                    description TEXT,
+                    discovery_method TEXT,
+                    quality_score REAL NOT NULL DEFAULT 0,
+                    last_updated TEXT,
+                    article_count INTEGER NOT NULL DEFAULT 0,
+                    is_valid INTEGER NOT NULL DEFAULT 0,
+                    discovered_at TEXT,
+                    last_validated TEXT
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_feeds_domain_vertical_quality
+                    ON feeds(domain, vertical, quality_score);
+
+                -- Composite key: a feed may be catalogued under several verticals
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_feeds_url
+                    ON feeds(url, domain, vertical);
+
+                CREATE TABLE IF NOT EXISTS catalog_metadata (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+
+            now = datetime.now().isoformat()
+            conn.executemany(
+                "INSERT OR IGNORE INTO catalog_metadata (key, value) VALUES (?, ?)",
+                [("version", "2.0"), ("created_at", now), ("last_updated", now)]
+            )
+            conn.commit()
 
-            except Exception as e:
-                logger.error(
-                    "database_load_failed",
-                    path=self.database_path,
-                    error=str(e)
-                )
+            migrated = conn.execute(
+                "SELECT value FROM catalog_metadata WHERE key = 'migrated_from'"
+            ).fetchone()
+            empty = conn.execute("SELECT 1 FROM feeds LIMIT 1").fetchone() is None
+        finally:
+            conn.close()
 
-        # Create new database
-        logger.info("creating_new_database", path=self.database_path)
-        return self._create_empty_database()
+        if empty and migrated is None and self.json_path and os.path.exists(self.json_path):
+            self.migrate_from_json(self.json_path)
 
-    def _create_empty_database(self) -> Dict:
+    def migrate_from_json(self, json_path: str) -> int:
         """
-        Create empty database structure.
+        Import a legacy JSON database into the catalog.
+
+        Existing rows for the same (url, domain, vertical) are updated, so
+        running it twice is harmless.
+
+        Args:
+            json_path: Path to rss_feeds_database.json
 
         Returns:
-            Empty database dictionary
+            Number of feeds imported (0 on error)
         """
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except Exception as e:
+            logger.error("database_load_failed", path=json_path, error=str(e))
+            return 0
+
+        rows = [
+            self._feed_dict_to_params(domain, vertical, feed_dict)
+            for domain, verticals in legacy.get("domains", {}).items()
+            for vertical, feeds in verticals.items()
+            for feed_dict in feeds
+        ]
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(self._upsert_sql(), rows)
+                metadata = legacy.get("metadata", {})
+                conn.executemany(
+                    "INSERT OR REPLACE INTO catalog_metadata (key, value) VALUES (?, ?)",
+                    [
+                        ("migrated_from", os.path.abspath(json_path)),
+                        ("migrated_at", datetime.now().isoformat()),
+                        ("created_at", metadata.get("created_at") or datetime.now().isoformat())
+                    ]
+                )
+        finally:
+            conn.close()
+
+        logger.info("database_migrated", source=json_path, path=self.database_path, feeds=len(rows))
+        return len(rows)
+
+    @staticmethod
+    def _upsert_sql(update: bool = True) -> str:
+        """INSERT statement for one feed row (upsert or insert-if-new)"""
+        columns = ("domain", "vertical") + _FEED_COLUMNS
+        sql = (
+            f"INSERT INTO feeds ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))}) "
+            "ON CONFLICT(url, domain, vertical) DO "
+        )
+        if not update:
+            return sql + "NOTHING"
+        return sql + "UPDATE SET " + ", ".join(
+            f"{column} = excluded.{column}"
+            for column in _FEED_COLUMNS
+            if column not in ("url", "discovered_at")
+        )
+
+    @staticmethod
+    def _feed_dict_to_params(domain: str, vertical: str, feed_dict: Dict) -> tuple:
+        return (
+            domain,
+            vertical,
+            feed_dict["url"],
+            feed_dict.get("source_url"),
+            feed_dict.get("title"),
+            feed_dict.get("description"),
+            feed_dict.get("discovery_method"),
+            feed_dict.get("quality_score") or 0.0,
+            feed_dict.get("last_updated"),
+            feed_dict.get("article_count") or 0,
+            int(bool(feed_dict.get("is_valid"))),
+            feed_dict.get("discovered_at"),
+            feed_dict.get("last_validated")
+        )
+
+    @staticmethod
+    def _feed_to_dict(feed: RSSFeed) -> Dict:
+        """Convert RSSFeed to catalog feed dict"""
         return {
-            "domains": {},
-            "metadata": {
-                "version": "1.0",
-                "created_at": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
-                "total_feeds": 0,
-                "total_domains": 0,
-                "total_verticals": 0
-            }
+            "url": feed.url,
+            "source_url": feed.source_url,
+            "title": feed.title,
+            "description": feed.description,
+            "discovery_method": feed.discovery_method,
+            "quality_score": feed.quality_score,
+            "last_updated": feed.last_updated.isoformat() if feed.last_updated else None,
+            "article_count": feed.article_count,
+            "is_valid": feed.is_valid,
+            "discovered_at": feed.discovered_at.isoformat() if hasattr(feed, 'discovered_at') else datetime.now().isoformat(),
+            "last_validated": datetime.now().isoformat()
         }
 
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict:
+        feed = {column: row[column] for column in _FEED_COLUMNS}
+        feed["is_valid"] = bool(feed["is_valid"])
+        feed["domain"] = row["domain"]
+        feed["vertical"] = row["vertical"]
+        return feed
+
     def save(self) -> bool:
         """
-        Save database to JSON file.
+        Record the catalog update time.
+
+        Feeds are committed as they are added; kept so callers batching
+        add_feed() calls followed by save() work unchanged.
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Update metadata
-            self._update_metadata()
-
-            # Write to file
-            with open(self.database_path, 'w', encoding='utf-8') as f:
-                json.dump(self.db, f, indent=2, ensure_ascii=False)
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO catalog_metadata (key, value) VALUES ('last_updated', ?)",
+                        (datetime.now().isoformat(),)
+                    )
+            finally:
+                conn.close()
 
             logger.info(
                 "database_saved",
                 path=self.database_path,
-                total_feeds=self.db["metadata"]["total_feeds"]
+                total_feeds=self._count_totals()["total_feeds"]
             )
 
             return True
@@ -172,21 +339,6 @@ class RSSFeedDatabase:
             )
             return False
 
-    def _update_metadata(self):
-        """Update metadata counters."""
-        total_feeds = 0
-        total_verticals = 0
-
-        for domain, verticals in self.db["domains"].items():
-            total_verticals += len(verticals)
-            for vertical, feeds in verticals.items():
-                total_feeds += len(feeds)
-
-        self.db["metadata"]["last_updated"] = datetime.now().isoformat()
-        self.db["metadata"]["total_feeds"] = total_feeds
-        self.db["metadata"]["total_domains"] = len(self.db["domains"])
-        self.db["metadata"]["total_verticals"] = total_verticals
-
     def add_feed(
         self,
         domain: str,
@@ -201,65 +353,76 @@ class RSSFeedDatabase:
             domain: Domain category (e.g., "technology", "medicine")
             vertical: Vertical within domain (e.g., "saas", "cardiology")
             feed: RSS feed to add
-            allow_duplicates: Allow duplicate URLs (default: False)
+            allow_duplicates: Update the stored feed if the URL already
+                exists in this vertical (default: False = keep existing)
 
         Returns:
-            True if added, False if duplicate and allow_duplicates=False
+            True if added or updated, False if duplicate and allow_duplicates=False
         """
-        # Ensure domain exists
-        if domain not in self.db["domains"]:
-            self.db["domains"][domain] = {}
-
-        # Ensure vertical exists
-        if vertical not in self.db["domains"][domain]:
-            self.db["domains"][domain][vertical] = []
-
-        # Check for duplicates
-        if not allow_duplicates:
-            existing_urls = {f["url"] for f in self.db["domains"][domain][vertical]}
-            if feed.url in existing_urls:
-                logger.debug(
-                    "feed_already_exists",
-                    domain=domain,
-                    vertical=vertical,
-                    url=feed.url
-                )
-                return False
+        added = self.add_feeds(domain, vertical, [feed], allow_duplicates=allow_duplicates) == 1
 
-        # Convert feed to dict
-        feed_dict = {
-            "url": feed.url,
-            "source_url": feed.source_url,
-            "title": feed.title,
-            "description": feed.description,
-            "discovery_method": feed.discovery_method,
-            "quality_score": feed.quality_score,
-            "last_updated": feed.last_updated.isoformat() if feed.last_updated else None,
-            "article_count": feed.article_count,
-            "is_valid": feed.is_valid,
-            "discovered_at": feed.discovered_at.isoformat() if hasattr(feed, 'discovered_at') else datetime.now().isoformat(),
-            "last_validated": datetime.now().isoformat()
-        }
+        if added:
+            logger.info(
+                "feed_added",
+                domain=domain,
+                vertical=vertical,
+                url=feed.url,
+                quality_score=feed.quality_score
+            )
+        else:
+            logger.debug(
+                "feed_already_exists",
+                domain=domain,
+                vertical=vertical,
+                url=feed.url
+            )
 
-        # Add to database
-        self.db["domains"][domain][vertical].append(feed_dict)
+        return added
 
-        logger.info(
-            "feed_added",
-            domain=domain,
-            vertical=vertical,
-            url=feed.url,
-            quality_score=feed.quality_score
-        )
+    def add_feeds(
+        self,
+        domain: str,
+        vertical: str,
+        feeds: Iterable[RSSFeed],
+        allow_duplicates: bool = False
+    ) -> int:
+        """
+        Add feeds to a vertical in one transaction.
 
-        return True
+        Args:
+            domain: Domain category
+            vertical: Vertical within domain
+            feeds: RSS feeds to add
+            allow_duplicates: Update feeds whose URL already exists in this
+                vertical (default: False = keep existing)
+
+        Returns:
+            Number of feeds added or updated
+        """
+        rows = [
+            self._feed_dict_to_params(domain, vertical, self._feed_to_dict(feed))
+            for feed in feeds
+        ]
+        if not rows:
+            return 0
+
+        sql = self._upsert_sql(update=allow_duplicates)
+        conn = self._connect()
+        try:
+            with conn:
+                before = conn.total_changes
+                conn.executemany(sql, rows)
+                return conn.total_changes - before
+        finally:
+            conn.close()
 
     def get_feeds(
         self,
         domain: Optional[str] = None,
         vertical: Optional[str] = None,
         min_quality_score: float = 0.0,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        healthy_only: bool = False
     ) -> List[Dict]:
         """
         Query feeds from database.
@@ -269,45 +432,66 @@ class RSSFeedDatabase:
             vertical: Filter by vertical (None = all verticals)
             min_quality_score: Minimum quality score threshold
             limit: Maximum number of feeds to return
+            healthy_only: Drop feeds backing off after repeated failures
+                (needs a feed_state_store)
 
         Returns:
             List of feed dictionaries, sorted by quality score (descending)
         """
-        feeds = []
-
-        # Determine domains to search
+        conditions = ["quality_score >= ?"]
+        params: List = [min_quality_score]
         if domain:
-            domains = [domain] if domain in self.db["domains"] else []
-        else:
-            domains = list(self.db["domains"].keys())
-
-        # Collect feeds
-        for dom in domains:
-            # Determine verticals to search
-            if vertical:
-                verticals = [vertical] if vertical in self.db["domains"][dom] else []
-            else:
-                verticals = list(self.db["domains"][dom].keys())
-
-            for vert in verticals:
-                domain_feeds = self.db["domains"][dom][vert]
-
-                # Filter by quality score
-                filtered = [
-                    {**f, "domain": dom, "vertical": vert}
-                    for f in domain_feeds
-                    if f.get("quality_score", 0.0) >= min_quality_score
-                ]
+            conditions.append("domain = ?")
+            params.append(domain)
+        if vertical:
+            conditions.append("vertical = ?")
+            params.append(vertical)
+
+        sql = (
+            f"SELECT * FROM feeds WHERE {' AND '.join(conditions)} "
+            "ORDER BY quality_score DESC, id"
+        )
 
-                feeds.extend(filtered)
+        # Health filtering happens after the query, so the limit can only be
+        # pushed into SQL without it
+        filter_health = healthy_only and self.feed_state_store is not None
+        if limit and not filter_health:
+            sql += " LIMIT ?"
+            params.append(limit)
 
-        # Sort by quality score (descending)
-        feeds.sort(key=lambda f: -f.get("quality_score", 0.0))
+        conn = self._connect()
+        try:
+            feeds = [self._row_to_dict(row) for row in conn.execute(sql, params)]
+        finally:
+            conn.close()
+
+        states = None
+        if filter_health:
+            states = self._load_feed_states(feeds)
+            feeds = [
+                f for f in feeds
+                if f["url"] not in states
+                or not states[f["url"]].in_backoff(self.max_consecutive_failures)
+            ]
 
         # Apply limit
         if limit:
             feeds = feeds[:limit]
 
+        # Attach polling health
+        if self.feed_state_store:
+            if states is None:
+                states = self._load_feed_states(feeds)
+            for f in feeds:
+                state = states.get(f["url"])
+                if state:
+                    f.update({
+                        "consecutive_failures": state.consecutive_failures,
+                        "last_success": state.last_success.isoformat() if state.last_success else None,
+                        "avg_entries": state.avg_entries,
+                        "next_poll_at": state.next_poll_at.isoformat() if state.next_poll_at else None
+                    })
+
         logger.debug(
             "feeds_queried",
             domain=domain,
@@ -318,6 +502,47 @@ class RSSFeedDatabase:
 
         return feeds
 
+    def _load_feed_states(self, feeds: List[Dict]) -> Dict[str, FeedState]:
+        """Load stored states for feed dicts (empty on error)"""
+        try:
+            return self.feed_state_store.load(f["url"] for f in feeds)
+        except Exception as e:
+            logger.warning("feed_state_load_failed", error=str(e))
+            return {}
+
+    def has_feed(self, url: str, domain: Optional[str] = None, vertical: Optional[str] = None) -> bool:
+        """
+        Check if a feed URL is in the catalog.
+
+        Rows are unique per (url, domain, vertical), so without a domain and
+        vertical this matches the URL in any of the verticals it is listed in.
+
+        Args:
+            url: Feed URL
+            domain: Restrict to domain (None = any)
+            vertical: Restrict to vertical (None = any)
+
+        Returns:
+            True if the URL is stored (in the given domain/vertical, if any)
+        """
+        conditions = ["url = ?"]
+        params = [url]
+        if domain:
+            conditions.append("domain = ?")
+            params.append(domain)
+        if vertical:
+            conditions.append("vertical = ?")
+            params.append(vertical)
+
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                f"SELECT 1 FROM feeds WHERE {' AND '.join(conditions)} LIMIT 1", params
+            ).fetchone()
+        finally:
+            conn.close()
+        return row is not None
+
     def get_domains(self) -> List[str]:
         """
         Get all domain names.
@@ -325,7 +550,12 @@ class RSSFeedDatabase:
         Returns:
             List of domain names
         """
-        return sorted(self.db["domains"].keys())
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT DISTINCT domain FROM feeds ORDER BY domain").fetchall()
+        finally:
+            conn.close()
+        return [row["domain"] for row in rows]
 
     def get_verticals(self, domain: str) -> List[str]:
         """
@@ -337,10 +567,29 @@ class RSSFeedDatabase:
         Returns:
             List of vertical names
         """
-        if domain not in self.db["domains"]:
-            return []
-
-        return sorted(self.db["domains"][domain].keys())
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT DISTINCT vertical FROM feeds WHERE domain = ? ORDER BY vertical",
+                (domain,)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [row["vertical"] for row in rows]
+
+    def _count_totals(self) -> Dict:
+        """Total feeds, domains and verticals"""
+        conn = self._connect()
+        try:
+            row = conn.execute("""
+                SELECT COUNT(*) AS total_feeds,
+                       COUNT(DISTINCT domain) AS total_domains,
+                       (SELECT COUNT(*) FROM (SELECT DISTINCT domain, vertical FROM feeds)) AS total_verticals
+                FROM feeds
+            """).fetchone()
+        finally:
+            conn.close()
+        return dict(row)
 
     def get_statistics(self) -> Dict:
         """
@@ -349,31 +598,36 @@ class RSSFeedDatabase:
         Returns:
             Dictionary with statistics
         """
+        conn = self._connect()
+        try:
+            last_updated = conn.execute(
+                "SELECT value FROM catalog_metadata WHERE key = 'last_updated'"
+            ).fetchone()
+            domain_rows = conn.execute("""
+                SELECT domain,
+                       COUNT(DISTINCT vertical) AS verticals,
+                       COUNT(*) AS feeds,
+                       AVG(quality_score) AS avg_quality
+                FROM feeds
+                GROUP BY domain
+            """).fetchall()
+        finally:
+            conn.close()
+
         stats = {
-            "total_feeds": self.db["metadata"]["total_feeds"],
-            "total_domains": self.db["metadata"]["total_domains"],
-            "total_verticals": self.db["metadata"]["total_verticals"],
-            "last_updated": self.db["metadata"]["last_updated"],
+            **self._count_totals(),
+            "last_updated": last_updated["value"] if last_updated else None,
             "domains": {}
         }
 
         # Per-domain statistics
-        for domain, verticals in self.db["domains"].items():
-            domain_stats = {
-                "verticals": len(verticals),
-                "feeds": sum(len(feeds) for feeds in verticals.values()),
-                "avg_quality": 0.0
+        for row in domain_rows:
+            stats["domains"][row["domain"]] = {
+                "verticals": row["verticals"],
+                "feeds": row["feeds"],
+                "avg_quality": row["avg_quality"] or 0.0
             }
 
-            # Calculate average quality
-            all_feeds = [f for feeds in verticals.values() for f in feeds]
-            if all_feeds:
-                domain_stats["avg_quality"] = sum(
-                    f.get("quality_score", 0.0) for f in all_feeds
-                ) / len(all_feeds)
-
-            stats["domains"][domain] = domain_stats
-
         return stats
 
     def remove_low_quality_feeds(self, min_quality_score: float = 0.3) -> int:
@@ -386,19 +640,14 @@ class RSSFeedDatabase:
         Returns:
             Number of feeds removed
         """
-        removed_count = 0
-
-        for domain in self.db["domains"]:
-            for vertical in self.db["domains"][domain]:
-                original_count = len(self.db["domains"][domain][vertical])
-
-                # Filter feeds
-                self.db["domains"][domain][vertical] = [
-                    f for f in self.db["domains"][domain][vertical]
-                    if f.get("quality_score", 0.0) >= min_quality_score
-                ]
-
-                removed_count += original_count - len(self.db["domains"][domain][vertical])
+        conn = self._connect()
+        try:
+            with conn:
+                removed_count = conn.execute(
+                    "DELETE FROM feeds WHERE quality_score < ?", (min_quality_score,)
+                ).rowcount
+        finally:
+            conn.close()
 
         if removed_count > 0:
             logger.info(
@@ -6,12 +6,22 @@ Automated RSS feed discovery using:
 2. HTML scraping for autodiscovery tags
 3. Feed validation and quality scoring
 
+Validation outcomes are recorded in an optional FeedStateStore (shared with
+RSSCollector), and feeds that keep failing are not re-validated until their
+backoff expires.
+
+batch_discover() processes sites concurrently over one shared HTTP session:
+at most max_concurrent_requests requests in flight, per_host_limit per host
+spaced min_host_interval apart, and each feed URL validated once per batch
+even when several sites link to it.
+
 Used to build a database of RSS feeds across domains and verticals.
 """
 
 import asyncio
 import aiohttp
 from bs4 import BeautifulSoup
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
@@ -19,6 +29,7 @@ from urllib.parse import urljoin, urlparse
 import feedparser
 import time
 
+from src.collectors.feed_state_store import FeedState, FeedStateStore
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -78,7 +89,11 @@ class RSSFeedDiscoverer:
         self,
         timeout: int = 10,
         max_concurrent_requests: int = 5,
-        user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        feed_state_store: Optional[FeedStateStore] = None,
+        max_consecutive_failures: int = 5,
+        per_host_limit: int = 2,
+        min_host_interval: float = 0.25
     ):
         """
         Initialize RSS feed discoverer.
@@ -87,12 +102,28 @@ class RSSFeedDiscoverer:
             timeout: HTTP request timeout in seconds
             max_concurrent_requests: Maximum concurrent HTTP requests
             user_agent: User agent string for HTTP requests
+            feed_state_store: Shared feed state store (None = no health tracking)
+            max_consecutive_failures: Failures before a feed is backed off
+            per_host_limit: Maximum concurrent requests per host
+            min_host_interval: Minimum seconds between request starts per host
         """
         self.timeout = timeout
         self.max_concurrent_requests = max_concurrent_requests
         self.user_agent = user_agent
+        self.feed_state_store = feed_state_store
+        self.max_consecutive_failures = max_consecutive_failures
+        self.per_host_limit = max(per_host_limit, 1)
+        self.min_host_interval = min_host_interval
         self._semaphore = asyncio.Semaphore(max_concurrent_requests)
 
+        # Per-host politeness
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_host_slot: Dict[str, float] = {}
+
+        # Set for the duration of batch_discover()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._validation_tasks: Optional[Dict[str, asyncio.Task]] = None
+
     async def discover_feeds(
         self,
         url: str,
@@ -118,19 +149,21 @@ class RSSFeedDiscoverer:
 
         discovered_feeds: Dict[str, RSSFeed] = {}
 
+        # Pattern probing and HTML scraping run concurrently
+        pattern_feeds, html_feeds = await asyncio.gather(
+            self._discover_by_pattern(url) if "pattern" in methods else self._no_feeds(),
+            self._discover_by_html(url) if "html" in methods else self._no_feeds()
+        )
+
         # Pattern-based discovery
-        if "pattern" in methods:
-            pattern_feeds = await self._discover_by_pattern(url)
-            for feed in pattern_feeds:
-                discovered_feeds[feed.url] = feed
+        for feed in pattern_feeds:
+            discovered_feeds[feed.url] = feed
 
         # HTML scraping for autodiscovery tags
-        if "html" in methods:
-            html_feeds = await self._discover_by_html(url)
-            for feed in html_feeds:
-                # Prefer HTML-discovered feeds (more reliable)
-                if feed.url not in discovered_feeds:
-                    discovered_feeds[feed.url] = feed
+        for feed in html_feeds:
+            # Prefer HTML-discovered feeds (more reliable)
+            if feed.url not in discovered_feeds:
+                discovered_feeds[feed.url] = feed
 
         # Validate and score all discovered feeds
         feeds_list = list(discovered_feeds.values())
@@ -148,6 +181,44 @@ class RSSFeedDiscoverer:
 
         return validated_feeds
 
+    @staticmethod
+    async def _no_feeds() -> List[RSSFeed]:
+        return []
+
+    @asynccontextmanager
+    async def _client(self):
+        """Yield the batch session, or a one-off session outside a batch"""
+        if self._session is not None and not self._session.closed:
+            yield self._session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
+    @asynccontextmanager
+    async def _request_slot(self, url: str):
+        """
+        Acquire a request slot: global limit, per-host limit and spacing
+
+        Each request reserves the next free start time for its host before
+        waiting, so requests to one host are min_host_interval apart while
+        other hosts proceed.
+        """
+        host = urlparse(url).netloc
+        host_semaphore = self._host_semaphores.get(host)
+        if host_semaphore is None:
+            host_semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+
+        async with host_semaphore:
+            if self.min_host_interval > 0:
+                now = time.monotonic()
+                slot = max(now, self._next_host_slot.get(host, now))
+                self._next_host_slot[host] = slot + self.min_host_interval
+                if slot > now:
+                    await asyncio.sleep(slot - now)
+
+            async with self._semaphore:
+                yield
+
     async def _discover_by_pattern(self, base_url: str) -> List[RSSFeed]:
         """
         Try common RSS URL patterns.
@@ -160,21 +231,19 @@ class RSSFeedDiscoverer:
         """
         logger.debug("pattern_discovery_started", url=base_url)
 
-        feeds = []
-
-        # Try each pattern
-        for pattern in self.RSS_PATTERNS:
-            feed_url = urljoin(base_url, pattern)
+        # Probe all patterns concurrently (HEAD requests, bounded per host)
+        feed_urls = list(dict.fromkeys(urljoin(base_url, pattern) for pattern in self.RSS_PATTERNS))
+        accessible = await asyncio.gather(*(self._check_url_accessible(u) for u in feed_urls))
 
-            # Check if URL is accessible (HEAD request)
-            is_accessible = await self._check_url_accessible(feed_url)
-
-            if is_accessible:
-                feeds.append(RSSFeed(
-                    url=feed_url,
-                    source_url=base_url,
-                    discovery_method="pattern"
-                ))
+        feeds = [
+            RSSFeed(
+                url=feed_url,
+                source_url=base_url,
+                discovery_method="pattern"
+            )
+            for feed_url, is_accessible in zip(feed_urls, accessible)
+            if is_accessible
+        ]
 
         logger.debug(
             "pattern_discovery_complete",
@@ -202,8 +271,8 @@ class RSSFeedDiscoverer:
 
         try:
             # Fetch HTML
-            async with self._semaphore:
-                async with aiohttp.ClientSession() as session:
+            async with self._request_slot(url):
+                async with self._client() as session:
                     async with session.get(
                         url,
                         timeout=aiohttp.ClientTimeout(total=self.timeout),
@@ -275,8 +344,8 @@ class RSSFeedDiscoverer:
             True if accessible (status 200), False otherwise
         """
         try:
-            async with self._semaphore:
-                async with aiohttp.ClientSession() as session:
+            async with self._request_slot(url):
+                async with self._client() as session:
                     async with session.head(
                         url,
                         timeout=aiohttp.ClientTimeout(total=self.timeout),
@@ -303,9 +372,26 @@ class RSSFeedDiscoverer:
 
         logger.debug("feed_validation_started", count=len(feeds))
 
-        # Validate concurrently
-        tasks = [self._validate_feed(feed) for feed in feeds]
-        validated_feeds = await asyncio.gather(*tasks)
+        states = await self._load_feed_states(feeds)
+
+        # Skip feeds still backing off from repeated failures
+        to_validate = []
+        for feed in feeds:
+            state = states.get(feed.url)
+            if state and state.in_backoff(self.max_consecutive_failures):
+                feed.is_valid = False
+                feed.error = f"Skipped: {state.consecutive_failures} consecutive failures"
+            else:
+                to_validate.append(feed)
+
+        # Validate concurrently; within a batch, feeds already validated
+        # for another site reuse that result and are recorded only once
+        owned = await asyncio.gather(*(self._validate_feed_once(feed) for feed in to_validate))
+        validated_feeds = feeds
+
+        await self._record_feed_states(
+            [feed for feed, is_owner in zip(to_validate, owned) if is_owner], states
+        )
 
         valid_count = sum(1 for f in validated_feeds if f.is_valid)
         logger.debug(
@@ -316,6 +402,67 @@ class RSSFeedDiscoverer:
 
         return validated_feeds
 
+    async def _validate_feed_once(self, feed: RSSFeed) -> bool:
+        """
+        Validate a feed, sharing one validation per URL during a batch
+
+        Args:
+            feed: RSS feed to validate (updated in place)
+
+        Returns:
+            True if this call performed the validation
+        """
+        if self._validation_tasks is None:
+            await self._validate_feed(feed)
+            return True
+
+        task = self._validation_tasks.get(feed.url)
+        if task is None:
+            self._validation_tasks[feed.url] = asyncio.ensure_future(self._validate_feed(feed))
+            await self._validation_tasks[feed.url]
+            return True
+
+        validated = await task
+        for attr in ("title", "description", "quality_score", "last_updated",
+                     "article_count", "is_valid", "error"):
+            setattr(feed, attr, getattr(validated, attr))
+        return False
+
+    async def _load_feed_states(self, feeds: List[RSSFeed]) -> Dict[str, FeedState]:
+        """Load stored states for feeds (one query, empty without a store)"""
+        if not self.feed_state_store:
+            return {}
+        try:
+            return await asyncio.to_thread(self.feed_state_store.load, [f.url for f in feeds])
+        except Exception as e:
+            logger.warning("feed_state_load_failed", error=str(e))
+            return {}
+
+    async def _record_feed_states(self, feeds: List[RSSFeed], states: Dict[str, FeedState]):
+        """
+        Record validation outcomes in the feed state store (one transaction)
+
+        ETag/Last-Modified are left alone: validation does not collect
+        entries, so a 304 based on them would hide articles from RSSCollector.
+        """
+        if not self.feed_state_store or not feeds:
+            return
+
+        updated = []
+        for feed in feeds:
+            state = states.get(feed.url) or FeedState(url=feed.url)
+            if feed.is_valid:
+                state.record_success(entries=feed.article_count)
+            else:
+                state.record_failure()
+                state.schedule_retry(self.max_consecutive_failures)
+            updated.append(state)
+
+        try:
+            await asyncio.to_thread(self.feed_state_store.save_many, updated)
+        except Exception as e:
+            logger.warning("feed_state_save_failed", count=len(updated), error=str(e))
+
     async def _validate_feed(self, feed: RSSFeed) -> RSSFeed:
         """
         Validate a single RSS feed and calculate quality score.
@@ -333,9 +480,9 @@ class RSSFeedDiscoverer:
             Updated RSSFeed with validation results
         """
         try:
-            async with self._semaphore:
+            async with self._request_slot(feed.url):
                 # Fetch feed
-                async with aiohttp.ClientSession() as session:
+                async with self._client() as session:
                     async with session.get(
                         feed.url,
                         timeout=aiohttp.ClientTimeout(total=self.timeout),
@@ -429,45 +576,77 @@ class RSSFeedDiscoverer:
     async def batch_discover(
         self,
         urls: List[str],
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        max_concurrent_sites: int = 10
     ) -> Dict[str, List[RSSFeed]]:
         """
         Discover feeds from multiple URLs concurrently.
 
+        Sites are processed by up to max_concurrent_sites workers sharing one
+        HTTP session; request concurrency and per-host politeness are bounded
+        by the discoverer's limits. Each feed URL is validated once per batch.
+
         Args:
             urls: List of website URLs
-            progress_callback: Optional callback(current, total, url)
+            progress_callback: Optional callback(current, total, url), called
+                as each site completes
+            max_concurrent_sites: Sites processed at the same time
 
         Returns:
-            Dict mapping URL -> List of discovered feeds
+            Dict mapping URL -> List of discovered feeds (input order)
         """
-        logger.info("batch_discovery_started", count=len(urls))
-
-        results = {}
-
-        for i, url in enumerate(urls, 1):
-            try:
-                feeds = await self.discover_feeds(url)
-                results[url] = feeds
-
+        urls = list(dict.fromkeys(urls))
+        logger.info("batch_discovery_started", count=len(urls), max_concurrent_sites=max_concurrent_sites)
+
+        results: Dict[str, List[RSSFeed]] = {url: [] for url in urls}
+        queue: asyncio.Queue = asyncio.Queue()
+        for url in urls:
+            queue.put_nowait(url)
+        completed = 0
+        start = time.monotonic()
+
+        async def worker():
+            nonlocal completed
+            while True:
+                try:
+                    url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    results[url] = await self.discover_feeds(url)
+                except Exception as e:
+                    logger.error(
+                        "batch_discovery_failed",
+                        url=url,
+                        error=str(e)
+                    )
+
+                completed += 1
                 if progress_callback:
-                    progress_callback(i, len(urls), url)
-
-            except Exception as e:
-                logger.error(
-                    "batch_discovery_failed",
-                    url=url,
-                    error=str(e)
-                )
-                results[url] = []
-
-            # Rate limiting
-            await asyncio.sleep(0.5)
+                    progress_callback(completed, len(urls), url)
 
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrent_requests,
+            limit_per_host=self.per_host_limit
+        )
+        self._validation_tasks = {}
+        try:
+            async with aiohttp.ClientSession(connector=connector) as session:
+                self._session = session
+                workers = max(1, min(max_concurrent_sites, len(urls)))
+                await asyncio.gather(*(worker() for _ in range(workers)))
+        finally:
+            self._session = None
+            self._validation_tasks = None
+
+        elapsed = time.monotonic() - start
         logger.info(
             "batch_discovery_complete",
             urls_processed=len(results),
-            total_feeds=sum(len(feeds) for feeds in results.values())
+            total_feeds=sum(len(feeds) for feeds in results.values()),
+            duration_s=round(elapsed, 2),
+            sites_per_s=round(len(results) / elapsed, 2) if elapsed > 0 else None
         )
 
         return results
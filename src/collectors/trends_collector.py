@@ -10,7 +10,8 @@ Features:
 - Gemini API for trend data (FREE, 1,500 grounded queries/day)
 - Real-time trending topics via Google Search grounding
 - Related queries and interest trends via web search
-- Intelligent caching (1h for trending, 24h for interest)
+- Intelligent caching (1h for trending, 24h for interest) in a durable
+  SQLite CacheStore (write-through, expired entries swept in the background)
 - Built-in 60s timeout (no hanging)
 - Query health tracking with adaptive retry
 - Regional targeting (DE, US, FR, etc.)
@@ -42,12 +43,14 @@ Usage:
 
 import json
 import hashlib
+import sqlite3
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Literal
 from dataclasses import dataclass
 from enum import Enum
 
+from src.utils.cache_store import CacheStore
 from src.utils.logger import get_logger
 from src.models.document import Document
 from src.agents.gemini_agent import GeminiAgent, GeminiAgentError
@@ -116,7 +119,9 @@ class TrendsCollector:
         gemini_agent: Optional[GeminiAgent] = None,
         cache_dir: str = "cache/trends",
         region: str = "US",
-        max_consecutive_failures: int = 5
+        max_consecutive_failures: int = 5,
+        cache_store: Optional[CacheStore] = None,
+        cache_sweep_interval: float = 3600.0
     ):
         """
         Initialize Trends Collector (Gemini API version)
@@ -129,6 +134,9 @@ class TrendsCollector:
             cache_dir: Directory for cache storage
             region: Default region for trends (ISO code: US, DE, FR, etc.)
             max_consecutive_failures: Max failures before marking query unhealthy
+            cache_store: Cache backend (default: trends_cache.db in cache_dir)
+            cache_sweep_interval: Seconds between background sweeps of
+                expired cache entries (0 = no sweeper)
         """
         self.config = config
         self.db_manager = db_manager
@@ -150,7 +158,10 @@ class TrendsCollector:
         self.max_consecutive_failures = max_consecutive_failures
 
         # Internal state
-        self._cache: Dict = {}  # In-memory cache
+        # An empty CacheStore is falsy (__len__), so test for None
+        if cache_store is None:
+            cache_store = CacheStore(str(self.cache_dir / "trends_cache.db"), namespace="trends")
+        self._cache = cache_store
         self.query_health: Dict[str, QueryHealth] = {}
 
         # Statistics
@@ -162,8 +173,10 @@ class TrendsCollector:
             'failed_queries': 0,
         }
 
-        # Load cache from disk
+        # Import legacy JSON cache, then keep the store free of expired entries
         self.load_cache()
+        if cache_sweep_interval > 0:
+            self._cache.start_sweeper(interval=cache_sweep_interval)
 
         logger.info(
             "TrendsCollector initialized (Gemini API)",
@@ -197,7 +210,7 @@ class TrendsCollector:
 
         # Check cache (1 hour TTL for trending searches)
         cache_key = f"trending_searches_{pn}"
-        cached = self._get_from_cache(cache_key, ttl_hours=1)
+        cached = self._get_from_cache(cache_key)
         if cached:
             logger.info("Trending searches retrieved from cache", pn=pn)
             self._stats['cache_hits'] += 1
@@ -258,7 +271,7 @@ Search the web for current trending topics and return them as a structured list.
                 return []
 
             # Cache results
-            self._save_to_cache(cache_key, trends_data)
+            self._save_to_cache(cache_key, trends_data, ttl_hours=1)
 
             # Create documents
             documents = []
@@ -328,7 +341,7 @@ Search the web for current trending topics and return them as a structured list.
 
         # Check cache (24 hour TTL)
         cache_key = f"related_queries_{query_type}_{'_'.join(keywords)}_{timeframe}"
-        cached = self._get_from_cache(cache_key, ttl_hours=24)
+        cached = self._get_from_cache(cache_key)
         if cached:
             logger.info("Related queries retrieved from cache", keywords=keywords)
             self._stats['cache_hits'] += 1
@@ -387,7 +400,7 @@ Search the web for current trending related queries."""
                 return []
 
             # Cache results
-            self._save_to_cache(cache_key, queries_data)
+            self._save_to_cache(cache_key, queries_data, ttl_hours=24)
 
             # Create documents
             documents = []
@@ -477,7 +490,7 @@ Search the web for current trending related queries."""
 
         # Check cache (24 hour TTL)
         cache_key = f"interest_over_time_{'_'.join(keywords)}_{timeframe}"
-        cached = self._get_from_cache(cache_key, ttl_hours=24)
+        cached = self._get_from_cache(cache_key)
         if cached:
             logger.info("Interest over time retrieved from cache", keywords=keywords)
             self._stats['cache_hits'] += 1
@@ -538,7 +551,7 @@ Search the web for current trend data."""
                 return []
 
             # Cache results
-            self._save_to_cache(cache_key, interest_data)
+            self._save_to_cache(cache_key, interest_data, ttl_hours=24)
 
             # Create documents
             documents = []
@@ -679,34 +692,13 @@ Search the web for current trend data."""
         unique_string = f"{source}:{title}"
         return hashlib.md5(unique_string.encode()).hexdigest()
 
-    def _get_from_cache(
-        self,
-        cache_key: str,
-        ttl_hours: int
-    ) -> Optional[List[Dict]]:
+    def _get_from_cache(self, cache_key: str) -> Optional[List[Dict]]:
         """Get data from cache if not expired"""
-        if cache_key not in self._cache:
-            return None
-
-        cached = self._cache[cache_key]
-        cache_time = cached.get('timestamp')
-
-        if not cache_time:
-            return None
-
-        # Check if expired
-        if datetime.now() - cache_time > timedelta(hours=ttl_hours):
-            del self._cache[cache_key]
-            return None
+        return self._cache.get(cache_key)
 
-        return cached.get('data')
-
-    def _save_to_cache(self, cache_key: str, data: List[Dict]):
-        """Save data to cache"""
-        self._cache[cache_key] = {
-            'timestamp': datetime.now(),
-            'data': data
-        }
+    def _save_to_cache(self, cache_key: str, data: List[Dict], ttl_hours: int):
+        """Save data to cache (written through, expires after ttl_hours)"""
+        self._cache.set(cache_key, data, ttl=timedelta(hours=ttl_hours))
 
     def _create_documents_from_cache(
         self,
@@ -790,30 +782,26 @@ Search the web for current trend data."""
         self.query_health[query_id].record_failure()
 
     def get_statistics(self) -> Dict:
-        """Get collection statistics"""
-        return self._stats.copy()
+        """Get collection statistics (cache_store: backend hit/miss counters)"""
+        stats = self._stats.copy()
+        stats['cache_store'] = self._cache.get_stats()
+        return stats
 
     def save_cache(self):
-        """Save cache to disk"""
-        cache_file = self.cache_dir / "trends_cache.json"
-
-        # Prepare cache for serialization
-        serializable_cache = {}
-        for key, value in self._cache.items():
-            serializable_cache[key] = {
-                'timestamp': value['timestamp'].isoformat(),
-                'data': value['data']
-            }
+        """
+        Flush the cache
 
+        Entries are written through on insert, so this only sweeps expired
+        entries. Kept for callers that save on shutdown.
+        """
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(serializable_cache, f, indent=2)
-            logger.info("Cache saved", file=str(cache_file))
-        except Exception as e:
+            removed = self._cache.sweep_expired()
+            logger.info("Cache saved", db_path=self._cache.db_path, expired_removed=removed)
+        except sqlite3.Error as e:
             logger.error("Failed to save cache", error=str(e))
 
     def load_cache(self):
-        """Load cache from disk"""
+        """Import a legacy trends_cache.json into the cache store (once)"""
         cache_file = self.cache_dir / "trends_cache.json"
 
         if not cache_file.exists():
@@ -823,13 +811,16 @@ Search the web for current trend data."""
             with open(cache_file, 'r') as f:
                 serialized_cache = json.load(f)
 
-            # Deserialize cache
+            # Keep each entry's remaining lifetime (1h trending, 24h otherwise)
+            imported = 0
             for key, value in serialized_cache.items():
-                self._cache[key] = {
-                    'timestamp': datetime.fromisoformat(value['timestamp']),
-                    'data': value['data']
-                }
-
-            logger.info("Cache loaded", entries=len(self._cache))
+                ttl = timedelta(hours=1 if key.startswith("trending_searches_") else 24)
+                remaining = datetime.fromisoformat(value['timestamp']) + ttl - datetime.now()
+                if remaining > timedelta(0):
+                    self._cache.set(key, value['data'], ttl=remaining)
+                    imported += 1
+
+            cache_file.unlink()
+            logger.info("Legacy cache imported", entries=imported, file=str(cache_file))
         except Exception as e:
             logger.error("Failed to load cache", error=str(e))
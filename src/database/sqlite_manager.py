@@ -9,6 +9,7 @@ Pattern: Repository pattern with context manager for transactions.
 
 import sqlite3
 import json
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Optional, Dict
@@ -34,24 +35,35 @@ class SQLiteManager:
     - Transaction management
     """
 
-    def __init__(self, db_path: str = "data/topics.db"):
+    def __init__(self, db_path: str = "data/topics.db", pooled: bool = False):
         """
         Initialize SQLite manager
 
         Args:
             db_path: Path to SQLite database file
+            pooled: Reuse long-lived connections for file-based databases
+                (one read-only connection per thread plus a single
+                serialized writer) instead of connecting per call
 
         Creates database file and schema if they don't exist.
         """
         self.db_path = db_path  # Keep as string for in-memory detection
         self._persistent_conn = None  # For in-memory databases
 
+        # Connection pool (file-based databases with pooled=True)
+        self.pooled = pooled and db_path != ':memory:'
+        self._local = threading.local()  # Per-thread read-only connection
+        self._reader_conns: List[sqlite3.Connection] = []
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        self._pool_lock = threading.Lock()
+        self._writer_lock = threading.Lock()
+
         # For file-based databases, ensure parent directory exists
         if db_path != ':memory:':
             path_obj = Path(db_path)
             path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-        logger.info("initializing_sqlite_manager", db_path=str(self.db_path))
+        logger.info("initializing_sqlite_manager", db_path=str(self.db_path), pooled=self.pooled)
 
         # For in-memory databases, create persistent connection
         if db_path == ':memory:':
@@ -123,6 +135,7 @@ class SQLiteManager:
                     -- Deduplication
                     content_hash TEXT,
                     canonical_url TEXT,
+                    minhash_signature TEXT,
 
                     -- Metadata
                     published_at TIMESTAMP,
@@ -152,6 +165,9 @@ class SQLiteManager:
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_documents_status ON documents(status)"
             )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_documents_canonical_url ON documents(canonical_url)"
+            )
 
             # FTS5 virtual table for full-text search
             conn.execute("""
@@ -198,6 +214,8 @@ class SQLiteManager:
                     -- Status
                     status TEXT DEFAULT 'discovered',
                     notion_id TEXT,
+                    notion_synced_at TIMESTAMP,
+                    notion_fingerprint TEXT,
 
                     -- Timestamps
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -343,6 +361,11 @@ class SQLiteManager:
                     -- Status
                     is_stale BOOLEAN DEFAULT 0,  -- TRUE if > 7 days old
 
+                    -- Full extracted content (zlib) for reuse without refetching
+                    content_compressed BLOB,
+                    content_size INTEGER DEFAULT 0,  -- Compressed bytes (eviction budget)
+                    content_fetched_at TIMESTAMP,
+
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
@@ -522,6 +545,74 @@ class SQLiteManager:
                 conn.commit()
                 logger.info("migration_cluster_fields_added")
 
+            # Migration 2: Keyword inverted index for find_related_topics
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='topic_keywords'"
+            )
+            if cursor.fetchone() is None:
+                logger.info("migration_adding_topic_keywords")
+                cursor.execute("""
+                    CREATE TABLE topic_keywords (
+                        keyword TEXT NOT NULL,
+                        topic_id TEXT NOT NULL,
+                        PRIMARY KEY (keyword, topic_id),
+                        FOREIGN KEY (topic_id) REFERENCES topics(id) ON DELETE CASCADE
+                    ) WITHOUT ROWID
+                """)
+                cursor.execute("CREATE INDEX idx_topic_keywords_topic_id ON topic_keywords(topic_id)")
+
+                # Backfill from existing researched topics
+                cursor.execute(
+                    """
+                    SELECT id, title FROM topics
+                    WHERE research_report IS NOT NULL AND research_report != ''
+                    """
+                )
+                rows = cursor.fetchall()
+                cursor.executemany(
+                    "INSERT INTO topic_keywords (keyword, topic_id) VALUES (?, ?)",
+                    [
+                        (keyword, topic_id)
+                        for topic_id, title in rows
+                        for keyword in self._extract_keywords(title)
+                    ]
+                )
+                conn.commit()
+                logger.info("migration_topic_keywords_added", topics_indexed=len(rows))
+
+            # Migration 3: Full compressed source content for SourceCache reuse
+            cursor.execute("PRAGMA table_info(sources)")
+            columns = {row[1] for row in cursor.fetchall()}
+
+            if 'content_compressed' not in columns:
+                logger.info("migration_adding_source_content")
+                cursor.execute("ALTER TABLE sources ADD COLUMN content_compressed BLOB")
+                cursor.execute("ALTER TABLE sources ADD COLUMN content_size INTEGER DEFAULT 0")
+                cursor.execute("ALTER TABLE sources ADD COLUMN content_fetched_at TIMESTAMP")
+                conn.commit()
+                logger.info("migration_source_content_added")
+
+            # Migration 4: MinHash signature per document (set by Deduplicator)
+            cursor.execute("PRAGMA table_info(documents)")
+            columns = {row[1] for row in cursor.fetchall()}
+
+            if 'minhash_signature' not in columns:
+                logger.info("migration_adding_document_minhash")
+                cursor.execute("ALTER TABLE documents ADD COLUMN minhash_signature TEXT")
+                conn.commit()
+                logger.info("migration_document_minhash_added")
+
+            # Migration 5: Notion sync state per topic (incremental TopicsSync)
+            cursor.execute("PRAGMA table_info(topics)")
+            columns = {row[1] for row in cursor.fetchall()}
+
+            if 'notion_fingerprint' not in columns:
+                logger.info("migration_adding_topic_notion_sync")
+                cursor.execute("ALTER TABLE topics ADD COLUMN notion_synced_at TIMESTAMP")
+                cursor.execute("ALTER TABLE topics ADD COLUMN notion_fingerprint TEXT")
+                conn.commit()
+                logger.info("migration_topic_notion_sync_added")
+
         finally:
             # Only close if not using persistent connection
             if not self._persistent_conn:
@@ -533,15 +624,24 @@ class SQLiteManager:
         Context manager for database connections with performance optimizations.
 
         For in-memory databases, yields the persistent connection without closing.
+        For pooled file-based databases, yields a reused connection (see
+        _get_pooled_connection).
         For file-based databases, creates a new connection and closes it on exit.
 
+        Inside transaction(), yields the transaction's connection for both
+        reads and writes; commit/rollback is left to transaction().
+
         Args:
             readonly: If True, open connection in read-only mode (allows concurrent reads)
 
         Yields:
             sqlite3.Connection
         """
-        if self._persistent_conn:
+        transaction_conn = getattr(self._local, "transaction_conn", None)
+        if transaction_conn is not None:
+            transaction_conn.row_factory = None
+            yield transaction_conn
+        elif self._persistent_conn:
             # Use persistent connection for in-memory databases
             # Don't close it on exit
             try:
@@ -553,6 +653,9 @@ class SQLiteManager:
             except Exception:
                 self._persistent_conn.rollback()
                 raise
+        elif self.pooled:
+            with self._get_pooled_connection(readonly) as conn:
+                yield conn
         else:
             # Create new connection for file-based databases
             # Apply performance PRAGMAs
@@ -574,15 +677,103 @@ class SQLiteManager:
             finally:
                 conn.close()
 
+    @contextmanager
+    def _get_pooled_connection(self, readonly: bool = False):
+        """
+        Context manager for pooled connections (file-based databases).
+
+        Reads use a read-only connection owned by the calling thread, so
+        concurrent readers never contend with each other (WAL mode).
+        Writes share a single writer connection serialized by a lock, which
+        matches SQLite's one-writer model without SQLITE_BUSY retries.
+
+        Connections are opened once and PRAGMAs applied once; they stay open
+        until close().
+
+        Args:
+            readonly: If True, use the calling thread's read-only connection
+
+        Yields:
+            sqlite3.Connection
+        """
+        if readonly:
+            conn = getattr(self._local, "reader", None)
+            if conn is None:
+                conn = self._open_pooled_connection(readonly=True)
+                self._local.reader = conn
+                with self._pool_lock:
+                    self._reader_conns.append(conn)
+
+            # Callers set row_factory per use, reset to the default
+            conn.row_factory = None
+            try:
+                yield conn
+            finally:
+                # Never hold a read snapshot between calls
+                if conn.in_transaction:
+                    conn.rollback()
+            return
+
+        with self._writer_lock:
+            if self._writer_conn is None:
+                self._writer_conn = self._open_pooled_connection(readonly=False)
+
+            conn = self._writer_conn
+            conn.row_factory = None
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def _open_pooled_connection(self, readonly: bool) -> sqlite3.Connection:
+        """Open a long-lived pool connection with PRAGMAs applied"""
+        uri = f"file:{self.db_path}?mode=ro" if readonly else f"file:{self.db_path}?mode=rwc"
+        # check_same_thread=False so close() can run from any thread;
+        # reader connections are still only used by their owning thread
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self._apply_pragmas(conn)
+
+        logger.debug("opened_pooled_connection", readonly=readonly)
+        return conn
+
     def close(self):
-        """Close persistent connection (for in-memory databases)"""
+        """Close persistent connection (in-memory) and pooled connections"""
         if self._persistent_conn:
             self._persistent_conn.close()
             self._persistent_conn = None
             logger.info("closed_persistent_connection")
 
+        if self.pooled:
+            with self._pool_lock:
+                readers = self._reader_conns
+                self._reader_conns = []
+            for conn in readers:
+                conn.close()
+            self._local = threading.local()
+
+            with self._writer_lock:
+                if self._writer_conn is not None:
+                    self._writer_conn.close()
+                    self._writer_conn = None
+
+            logger.info("closed_connection_pool", readers=len(readers))
+
     # === Document Operations ===
 
+    _INSERT_DOCUMENT_SQL = """
+        INSERT INTO documents (
+            id, source, source_url, title, content, summary,
+            language, domain, market, vertical,
+            content_hash, canonical_url, minhash_signature,
+            published_at, fetched_at, author,
+            entities, keywords,
+            reliability_score, paywall, status
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def insert_document(self, doc: Document) -> None:
         """
         Insert document into database
@@ -593,45 +784,13 @@ class SQLiteManager:
         Raises:
             ValueError: If document with same ID already exists
         """
-        # Check for duplicate
-        if self.get_document(doc.id) is not None:
-            raise ValueError(f"Document with ID {doc.id} already exists")
-
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO documents (
-                    id, source, source_url, title, content, summary,
-                    language, domain, market, vertical,
-                    content_hash, canonical_url,
-                    published_at, fetched_at, author,
-                    entities, keywords,
-                    reliability_score, paywall, status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    doc.id,
-                    doc.source,
-                    doc.source_url,
-                    doc.title,
-                    doc.content,
-                    doc.summary,
-                    doc.language,
-                    doc.domain,
-                    doc.market,
-                    doc.vertical,
-                    doc.content_hash,
-                    doc.canonical_url,
-                    doc.published_at.isoformat(),
-                    doc.fetched_at.isoformat(),
-                    doc.author,
-                    json.dumps(doc.entities) if doc.entities else None,
-                    json.dumps(doc.keywords) if doc.keywords else None,
-                    doc.reliability_score,
-                    doc.paywall,
-                    doc.status,
-                ),
-            )
+            # Check for duplicate (same connection, inside the write transaction)
+            cursor = conn.execute("SELECT 1 FROM documents WHERE id = ?", (doc.id,))
+            if cursor.fetchone() is not None:
+                raise ValueError(f"Document with ID {doc.id} already exists")
+
+            conn.execute(self._INSERT_DOCUMENT_SQL, self._document_params(doc))
 
             # Update FTS index
             conn.execute(
@@ -639,10 +798,57 @@ class SQLiteManager:
                 (doc.id, doc.title, doc.content)
             )
 
-            conn.commit()
-
         logger.info("document_inserted", doc_id=doc.id, language=doc.language)
 
+    def insert_documents_bulk(self, docs: List[Document]) -> int:
+        """
+        Insert many documents in a single transaction
+
+        Documents whose ID already exists (in the database or earlier in the
+        batch) are skipped via INSERT ... ON CONFLICT DO NOTHING. The FTS index
+        is populated for the newly inserted rows with one INSERT ... SELECT,
+        and everything is committed once.
+
+        Args:
+            docs: Documents to insert
+
+        Returns:
+            Number of documents actually inserted (duplicates excluded)
+        """
+        if not docs:
+            return 0
+
+        with self._get_connection() as conn:
+            # New rows get rowids above the current maximum (rowid table, and
+            # BEGIN IMMEDIATE keeps other writers out until commit)
+            max_rowid = conn.execute(
+                "SELECT COALESCE(MAX(rowid), 0) FROM documents"
+            ).fetchone()[0]
+
+            cursor = conn.executemany(
+                self._INSERT_DOCUMENT_SQL.rstrip() + " ON CONFLICT(id) DO NOTHING",
+                (self._document_params(doc) for doc in docs)
+            )
+            inserted = cursor.rowcount
+
+            # Batch FTS indexing for the rows inserted above
+            conn.execute(
+                """
+                INSERT INTO documents_fts(rowid, title, content)
+                SELECT rowid, title, content FROM documents WHERE rowid > ?
+                """,
+                (max_rowid,)
+            )
+
+        logger.info(
+            "documents_bulk_inserted",
+            inserted=inserted,
+            skipped=len(docs) - inserted,
+            total=len(docs)
+        )
+
+        return inserted
+
     def get_document(self, doc_id: str) -> Optional[Document]:
         """
         Get document by ID
@@ -665,6 +871,28 @@ class SQLiteManager:
 
             return self._row_to_document(row)
 
+    def get_document_by_url(self, canonical_url: str) -> Optional[Document]:
+        """
+        Get document by canonical URL
+
+        Args:
+            canonical_url: Canonical URL (as produced by Deduplicator.get_canonical_url)
+
+        Returns:
+            Document if found, None otherwise
+        """
+        with self._get_connection(readonly=True) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(
+                "SELECT * FROM documents WHERE canonical_url = ? LIMIT 1", (canonical_url,)
+            )
+            row = cursor.fetchone()
+
+            if row is None:
+                return None
+
+            return self._row_to_document(row)
+
     def update_document(self, doc: Document) -> None:
         """
         Update existing document
@@ -678,7 +906,7 @@ class SQLiteManager:
                 UPDATE documents SET
                     source = ?, source_url = ?, title = ?, content = ?, summary = ?,
                     language = ?, domain = ?, market = ?, vertical = ?,
-                    content_hash = ?, canonical_url = ?,
+                    content_hash = ?, canonical_url = ?, minhash_signature = ?,
                     published_at = ?, fetched_at = ?, author = ?,
                     entities = ?, keywords = ?,
                     reliability_score = ?, paywall = ?, status = ?
@@ -696,6 +924,7 @@ class SQLiteManager:
                     doc.vertical,
                     doc.content_hash,
                     doc.canonical_url,
+                    doc.minhash_signature,
                     doc.published_at.isoformat(),
                     doc.fetched_at.isoformat(),
                     doc.author,
@@ -714,8 +943,6 @@ class SQLiteManager:
                 (doc.title, doc.content, doc.id)
             )
 
-            conn.commit()
-
         logger.info("document_updated", doc_id=doc.id)
 
     def delete_document(self, doc_id: str) -> None:
@@ -734,7 +961,6 @@ class SQLiteManager:
 
             # Delete document
             conn.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
-            conn.commit()
 
         logger.info("document_deleted", doc_id=doc_id)
 
@@ -858,9 +1084,9 @@ class SQLiteManager:
                     engagement_score, trending_score, priority, content_score,
                     research_report, citations, word_count,
                     minhash_signature,
-                    status, notion_id,
+                    status, notion_id, notion_synced_at, notion_fingerprint,
                     created_at, updated_at, published_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     topic.id,
@@ -883,13 +1109,16 @@ class SQLiteManager:
                     topic.word_count,
                     topic.minhash_signature,
                     topic.status.value,
-                    None,  # notion_id
+                    topic.notion_id,
+                    topic.notion_synced_at.isoformat() if topic.notion_synced_at else None,
+                    topic.notion_fingerprint,
                     topic.discovered_at.isoformat(),
                     topic.updated_at.isoformat(),
                     topic.published_at.isoformat() if topic.published_at else None,
                 ),
             )
-            conn.commit()
+
+            self._index_topic_keywords(conn, topic)
 
         logger.info("topic_inserted", topic_id=topic.id, title=topic.title)
 
@@ -959,10 +1188,44 @@ class SQLiteManager:
                     topic.id,
                 ),
             )
-            conn.commit()
+
+            self._index_topic_keywords(conn, topic)
 
         logger.info("topic_updated", topic_id=topic.id)
 
+    def mark_topic_synced(
+        self,
+        topic_id: str,
+        notion_id: str,
+        fingerprint: str,
+        synced_at: Optional[datetime] = None
+    ) -> None:
+        """
+        Record a successful Notion push for a topic
+
+        Only the notion_* columns are written, so updated_at (and with it the
+        topic's rendered Notion properties) is left unchanged.
+
+        Args:
+            topic_id: Topic ID
+            notion_id: Notion page ID
+            fingerprint: Content fingerprint of the pushed page
+            synced_at: Time of the push (default: now)
+        """
+        synced_at = synced_at or datetime.utcnow()
+
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                UPDATE topics SET
+                    notion_id = ?, notion_synced_at = ?, notion_fingerprint = ?
+                WHERE id = ?
+                """,
+                (notion_id, synced_at.isoformat(), fingerprint, topic_id),
+            )
+
+        logger.info("topic_notion_sync_recorded", topic_id=topic_id, notion_id=notion_id)
+
     def get_topics_by_status(self, status: TopicStatus) -> List[Topic]:
         """
         Get all topics with given status
@@ -1005,7 +1268,8 @@ class SQLiteManager:
         self,
         topic_id: str,
         limit: int = 5,
-        min_similarity: float = 0.2
+        min_similarity: float = 0.2,
+        include_report: bool = False
     ) -> List[tuple[Topic, float]]:
         """
         Find related topics using keyword similarity.
@@ -1013,10 +1277,15 @@ class SQLiteManager:
         Uses Jaccard similarity on title keywords to find semantically related topics.
         Only returns topics that have research reports (research_report IS NOT NULL).
 
+        Candidates come from the topic_keywords inverted index, so only topics
+        sharing at least one keyword with the source title are scored.
+
         Args:
             topic_id: Topic ID to find related topics for
             limit: Maximum number of related topics to return (default: 5)
             min_similarity: Minimum similarity score (0.0-1.0, default: 0.2)
+            include_report: Load research_report for returned topics
+                (default: False, research_report is None)
 
         Returns:
             List of (Topic, similarity_score) tuples, ordered by similarity descending
@@ -1029,62 +1298,107 @@ class SQLiteManager:
             Real Estate Technology: 0.38
             Smart Building Automation: 0.32
         """
-        # Get source topic
-        source_topic = self.get_topic(topic_id)
-        if not source_topic:
-            logger.warning("source_topic_not_found", topic_id=topic_id)
-            return []
-
-        # Extract keywords from source topic title
-        source_keywords = self._extract_keywords(source_topic.title)
-
-        logger.info(
-            "finding_related_topics",
-            topic_id=topic_id,
-            source_keywords=len(source_keywords),
-            limit=limit
-        )
-
-        # Get all topics with research reports (excluding source topic)
         with self._get_connection(readonly=True) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                """
-                SELECT * FROM topics
-                WHERE id != ? AND research_report IS NOT NULL AND research_report != ''
-                """,
-                (topic_id,)
-            )
-            rows = cursor.fetchall()
+            # Get source topic title
+            row = conn.execute(
+                "SELECT title FROM topics WHERE id = ?", (topic_id,)
+            ).fetchone()
+            if row is None:
+                logger.warning("source_topic_not_found", topic_id=topic_id)
+                return []
 
-        # Calculate similarity scores
-        scored_topics = []
-        for row in rows:
-            candidate_topic = self._row_to_topic(row)
-            candidate_keywords = self._extract_keywords(candidate_topic.title)
+            # Extract keywords from source topic title
+            source_keywords = self._extract_keywords(row[0])
 
-            # Calculate Jaccard similarity: |A ∩ B| / |A ∪ B|
-            similarity = self._jaccard_similarity(source_keywords, candidate_keywords)
+            logger.info(
+                "finding_related_topics",
+                topic_id=topic_id,
+                source_keywords=len(source_keywords),
+                limit=limit
+            )
 
-            if similarity >= min_similarity:
-                scored_topics.append((candidate_topic, similarity))
+            if not source_keywords:
+                return []
 
-        # Sort by similarity descending
-        scored_topics.sort(key=lambda x: x[1], reverse=True)
+            # Shared and total keyword counts for candidates sharing >= 1 keyword
+            placeholders = ", ".join("?" * len(source_keywords))
+            candidates = conn.execute(
+                f"""
+                SELECT m.topic_id, m.shared,
+                       (SELECT COUNT(*) FROM topic_keywords k WHERE k.topic_id = m.topic_id)
+                FROM (
+                    SELECT topic_id, COUNT(*) AS shared FROM topic_keywords
+                    WHERE keyword IN ({placeholders}) AND topic_id != ?
+                    GROUP BY topic_id
+                ) m
+                """,
+                (*source_keywords, topic_id)
+            ).fetchall()
 
-        # Return top N
-        result = scored_topics[:limit]
+            # Calculate Jaccard similarity: |A ∩ B| / |A ∪ B|
+            scored_ids = []
+            for candidate_id, shared, total in candidates:
+                similarity = shared / (len(source_keywords) + total - shared)
+                if similarity >= min_similarity:
+                    scored_ids.append((candidate_id, similarity))
+
+            # Sort by similarity descending, return top N
+            scored_ids.sort(key=lambda x: x[1], reverse=True)
+            top_ids = scored_ids[:limit]
+
+            result = []
+            if top_ids:
+                columns = self._TOPIC_COLUMNS if include_report else self._TOPIC_COLUMNS_WITHOUT_REPORT
+                conn.row_factory = sqlite3.Row
+                rows = conn.execute(
+                    f"SELECT {columns} FROM topics WHERE id IN ({', '.join('?' * len(top_ids))})",
+                    [candidate_id for candidate_id, _ in top_ids]
+                ).fetchall()
+                topics_by_id = {row["id"]: self._row_to_topic(row) for row in rows}
+                result = [
+                    (topics_by_id[candidate_id], similarity)
+                    for candidate_id, similarity in top_ids
+                    if candidate_id in topics_by_id
+                ]
 
         logger.info(
             "found_related_topics",
             topic_id=topic_id,
-            total_candidates=len(rows),
-            matched_topics=len(scored_topics),
+            total_candidates=len(candidates),
+            matched_topics=len(scored_ids),
             returned_topics=len(result)
         )
 
         return result
 
+    _TOPIC_COLUMNS = "*"
+
+    _TOPIC_COLUMNS_WITHOUT_REPORT = """
+        id, title, description, cluster_label,
+        source, source_url, discovered_at,
+        domain, market, language, intent,
+        engagement_score, trending_score, priority, content_score,
+        NULL AS research_report, citations, word_count,
+        minhash_signature,
+        status, notion_id, notion_synced_at, notion_fingerprint,
+        created_at, updated_at, published_at
+    """
+
+    def _index_topic_keywords(self, conn: sqlite3.Connection, topic: Topic) -> None:
+        """
+        Maintain topic_keywords index entries for a topic.
+
+        Only researched topics (non-empty research_report) are indexed, since
+        find_related_topics only returns those.
+        """
+        conn.execute("DELETE FROM topic_keywords WHERE topic_id = ?", (topic.id,))
+
+        if topic.research_report:
+            conn.executemany(
+                "INSERT INTO topic_keywords (keyword, topic_id) VALUES (?, ?)",
+                [(keyword, topic.id) for keyword in self._extract_keywords(topic.title)]
+            )
+
     def _extract_keywords(self, text: str) -> set:
         """
         Extract keywords from text for similarity comparison.
@@ -1216,7 +1530,6 @@ class SQLiteManager:
                         searched_at
                     )
                 )
-            conn.commit()
 
         logger.info(
             "serp_results_saved",
@@ -1711,8 +2024,6 @@ class SQLiteManager:
                     score_id=score_id
                 )
 
-            conn.commit()
-
         return score_id
 
     def get_content_score(self, url: str) -> Optional[dict]:
@@ -1938,8 +2249,6 @@ class SQLiteManager:
                 )
             )
 
-            conn.commit()
-
             logger.info(
                 "difficulty_score_saved",
                 topic_id=topic_id,
@@ -2081,75 +2390,62 @@ class SQLiteManager:
     @contextmanager
     def transaction(self):
         """
-        Context manager for transactions
+        Context manager for multi-statement transactions
 
         Usage:
             with manager.transaction():
                 manager.insert_document(doc1)
-                manager.insert_document(doc2)
-
-        Note: Currently, CRUD methods create their own connections,
-        so this context manager is primarily for explicit transaction control.
-        For true transaction support, use the connection directly or
-        refactor CRUD methods to accept optional connection parameter.
-        """
-        conn = sqlite3.connect(self.db_path)
-        # Store original connection methods
-        old_insert = self.insert_document
-        old_update = self.update_document
-        old_delete = self.delete_document
-
-        # Create wrapped versions that use the transaction connection
-        def wrapped_insert(doc):
-            if self.get_document(doc.id) is not None:
-                raise ValueError(f"Document with ID {doc.id} already exists")
+                manager.update_topic(topic)
 
-            conn.execute(
-                """
-                INSERT INTO documents (
-                    id, source, source_url, title, content, summary,
-                    language, domain, market, vertical,
-                    content_hash, canonical_url,
-                    published_at, fetched_at, author,
-                    entities, keywords,
-                    reliability_score, paywall, status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    doc.id, doc.source, doc.source_url, doc.title, doc.content, doc.summary,
-                    doc.language, doc.domain, doc.market, doc.vertical,
-                    doc.content_hash, doc.canonical_url,
-                    doc.published_at.isoformat(), doc.fetched_at.isoformat(), doc.author,
-                    json.dumps(doc.entities) if doc.entities else None,
-                    json.dumps(doc.keywords) if doc.keywords else None,
-                    doc.reliability_score, doc.paywall, doc.status,
-                ),
-            )
-            conn.execute(
-                "INSERT INTO documents_fts(rowid, title, content) VALUES ((SELECT rowid FROM documents WHERE id = ?), ?, ?)",
-                (doc.id, doc.title, doc.content)
-            )
-            logger.info("document_inserted", doc_id=doc.id, language=doc.language)
+        All SQLiteManager operations called from the same thread inside the
+        block (reads included) run on the transaction's connection, so they
+        see each other's uncommitted writes and are committed together on
+        exit, or rolled back together if the block raises.
 
-        # Temporarily replace methods
-        self.insert_document = wrapped_insert
+        Yields:
+            sqlite3.Connection for direct SQL within the transaction
+        """
+        if getattr(self._local, "transaction_conn", None) is not None:
+            raise RuntimeError("Nested transactions are not supported")
 
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error("transaction_rollback", error=str(e))
-            raise
-        finally:
-            # Restore original methods
-            self.insert_document = old_insert
-            self.update_document = old_update
-            self.delete_document = old_delete
-            conn.close()
+        with self._get_connection() as conn:
+            self._local.transaction_conn = conn
+            try:
+                yield conn
+            except Exception as e:
+                logger.error("transaction_rollback", error=str(e))
+                raise
+            finally:
+                self._local.transaction_conn = None
 
     # === Helper Methods ===
 
+    def _document_params(self, doc: Document) -> tuple:
+        """Convert Document model to _INSERT_DOCUMENT_SQL parameters"""
+        return (
+            doc.id,
+            doc.source,
+            doc.source_url,
+            doc.title,
+            doc.content,
+            doc.summary,
+            doc.language,
+            doc.domain,
+            doc.market,
+            doc.vertical,
+            doc.content_hash,
+            doc.canonical_url,
+            doc.minhash_signature,
+            doc.published_at.isoformat(),
+            doc.fetched_at.isoformat(),
+            doc.author,
+            json.dumps(doc.entities) if doc.entities else None,
+            json.dumps(doc.keywords) if doc.keywords else None,
+            doc.reliability_score,
+            doc.paywall,
+            doc.status,
+        )
+
     def _row_to_document(self, row: sqlite3.Row) -> Document:
         """Convert database row to Document model"""
         return Document(
@@ -2165,6 +2461,7 @@ class SQLiteManager:
             vertical=row["vertical"],
             content_hash=row["content_hash"],
             canonical_url=row["canonical_url"],
+            minhash_signature=row["minhash_signature"],
             published_at=datetime.fromisoformat(row["published_at"]),
             fetched_at=datetime.fromisoformat(row["fetched_at"]),
             author=row["author"],
@@ -2201,4 +2498,9 @@ class SQLiteManager:
             minhash_signature=row["minhash_signature"],
             updated_at=datetime.fromisoformat(row["updated_at"]),
             published_at=datetime.fromisoformat(row["published_at"]) if row["published_at"] else None,
+            notion_id=row["notion_id"],
+            notion_synced_at=(
+                datetime.fromisoformat(row["notion_synced_at"]) if row["notion_synced_at"] else None
+            ),
+            notion_fingerprint=row["notion_fingerprint"],
         )
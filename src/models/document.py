@@ -98,6 +98,10 @@ class Document(BaseModel):
         ...,
         description="Normalized URL (no tracking params, no www, lowercase)"
     )
+    minhash_signature: Optional[str] = Field(
+        None,
+        description="MinHash signature (hex) set by Deduplicator when indexed"
+    )
 
     # === Metadata ===
     published_at: datetime = Field(
@@ -141,6 +141,11 @@ class Topic(BaseModel):
     # Deduplication fingerprint
     minhash_signature: Optional[str] = None
 
+    # Notion sync (set by TopicsSync)
+    notion_id: Optional[str] = None
+    notion_synced_at: Optional[datetime] = None
+    notion_fingerprint: Optional[str] = None  # Content fingerprint of last push
+
     # Timestamps
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     published_at: Optional[datetime] = None
@@ -0,0 +1,221 @@
+"""
+Async Notion Client
+
+asyncio counterpart of NotionClient for the pipelined sync engine
+(AsyncSyncEngine), built on notion-client's AsyncClient.
+
+Design Principles:
+- Exactly one request in flight: requests queue on an asyncio.Lock and
+  take a rate-limiter slot only when it is their turn
+- Same rate budget as NotionClient (rate_limiter.shared_budget per token),
+  so sync and async clients in a process share Notion's limit
+- Retry with exponential backoff on 429/5xx/timeouts; the backoff sleeps
+  outside the lock, so other coroutines keep using the connection
+- Same method names and error type (NotionError) as NotionClient
+
+Usage:
+    async with AsyncNotionClient(token="secret_token") as client:
+        page = await client.create_page(parent_database_id="db-id", properties={...})
+        await client.append_blocks(block_id=page["id"], children=[...])
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from notion_client import AsyncClient
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+
+from src.notion_integration.notion_client import NotionClient, NotionError
+from src.notion_integration.rate_limiter import RateLimiter, shared_budget
+
+logger = logging.getLogger(__name__)
+
+# Retryable HTTP statuses (rate limited, transient server errors)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class AsyncNotionClient:
+    """
+    Async Notion API client with single-flight rate limiting and retries.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        rate_limit: float = 2.5,
+        database_ids_path: str = "cache/database_ids.json",
+        rate_limiter: Optional[RateLimiter] = None,
+        base_url: Optional[str] = None,
+        max_retries: int = 3,
+        backoff_base: float = 1.0
+    ):
+        """
+        Initialize async Notion client.
+
+        Args:
+            token: Notion integration token
+            rate_limit: Requests per second (default: 2.5)
+            database_ids_path: Path to database IDs JSON file
+            rate_limiter: Rate limiter to use (default: one drawing on the
+                shared budget for this token)
+            base_url: API root URL (default: Notion's; e.g. a local test server)
+            max_retries: Retries per request on retryable errors
+            backoff_base: First backoff in seconds, doubled per attempt
+
+        Raises:
+            ValueError: If token is empty or None
+        """
+        if not token:
+            raise ValueError("Token cannot be empty")
+
+        options: Dict[str, Any] = {"auth": token, "retry": False}  # Retries handled here
+        if base_url:
+            options["base_url"] = base_url
+
+        self._client = AsyncClient(options=options)
+        self.rate_limiter = rate_limiter or RateLimiter(rate=rate_limit, budget=shared_budget(token))
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self._total_api_calls = 0
+        self._total_retries = 0
+        self._in_flight: Optional[asyncio.Lock] = None
+
+        self.database_ids = NotionClient._load_database_ids(database_ids_path)
+
+        logger.info(f"AsyncNotionClient initialized with rate_limit={self.rate_limiter.rate}")
+
+    async def __aenter__(self) -> "AsyncNotionClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        return False
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool"""
+        await self._client.aclose()
+
+    # ==================== Page Operations ====================
+
+    async def create_page(
+        self,
+        parent_database_id: str,
+        properties: Dict[str, Any],
+        children: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Create a page in a database (see NotionClient.create_page)"""
+        kwargs: Dict[str, Any] = {
+            "parent": {"database_id": parent_database_id},
+            "properties": properties
+        }
+        if children:
+            kwargs["children"] = children
+        return await self._call(self._client.pages.create, **kwargs)
+
+    async def update_page(self, page_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Update page properties"""
+        return await self._call(self._client.pages.update, page_id=page_id, properties=properties)
+
+    # ==================== Block Operations ====================
+
+    async def append_blocks(
+        self,
+        block_id: str,
+        children: List[Dict[str, Any]],
+        after: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Append blocks to a page or block (after a child block if given)"""
+        kwargs: Dict[str, Any] = {"block_id": block_id, "children": children}
+        if after:
+            kwargs["after"] = after
+        return await self._call(self._client.blocks.children.append, **kwargs)
+
+    async def update_block(self, block_id: str, block: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace the content of a block (the block type cannot change)"""
+        block_type = block["type"]
+        return await self._call(
+            self._client.blocks.update, block_id=block_id, **{block_type: block[block_type]}
+        )
+
+    async def delete_block(self, block_id: str) -> Dict[str, Any]:
+        """Delete (archive) a block"""
+        return await self._call(self._client.blocks.delete, block_id=block_id)
+
+    async def retrieve_block_children(
+        self,
+        block_id: str,
+        start_cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Retrieve child blocks of a block/page (results, has_more, next_cursor)"""
+        kwargs: Dict[str, Any] = {"block_id": block_id}
+        if start_cursor:
+            kwargs["start_cursor"] = start_cursor
+        return await self._call(self._client.blocks.children.list, **kwargs)
+
+    # ==================== Statistics ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get client statistics.
+
+        Returns:
+            Dict with total_api_calls, total_retries and rate_limiter stats
+        """
+        return {
+            "total_api_calls": self._total_api_calls,
+            "total_retries": self._total_retries,
+            "rate_limiter": self.rate_limiter.get_stats()
+        }
+
+    # ==================== Internal Methods ====================
+
+    async def _call(self, func, **kwargs) -> Any:
+        """
+        Execute an API call: one at a time, rate limited, with retries.
+
+        Raises:
+            NotionError: On non-retryable errors or after max_retries
+        """
+        if self._in_flight is None:
+            self._in_flight = asyncio.Lock()
+
+        attempt = 0
+        while True:
+            try:
+                async with self._in_flight:
+                    await self.rate_limiter.acquire_async()
+                    self._total_api_calls += 1
+                    return await func(**kwargs)
+
+            except (HTTPResponseError, RequestTimeoutError) as e:
+                status = getattr(e, "status", None)
+                retryable = isinstance(e, RequestTimeoutError) or status in RETRYABLE_STATUSES
+
+                if status == 401:
+                    raise NotionError(f"Authentication failed: {e}") from e
+                if status == 404:
+                    raise NotionError(f"Resource not found: {e}") from e
+                if not retryable or attempt >= self.max_retries:
+                    raise NotionError(f"Notion API error: {e}") from e
+
+                backoff = self._backoff(e, attempt)
+                attempt += 1
+                self._total_retries += 1
+                logger.warning(
+                    f"Retryable Notion error (status {status}), "
+                    f"retry {attempt}/{self.max_retries} in {backoff:.2f}s: {e}"
+                )
+                # Outside the lock: other requests proceed during the backoff
+                await asyncio.sleep(backoff)
+
+    def _backoff(self, error: Exception, attempt: int) -> float:
+        """Backoff before the next attempt (Retry-After on 429 if given)"""
+        headers = getattr(error, "headers", None)
+        retry_after = headers.get("retry-after") if headers is not None else None
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return self.backoff_base * (2 ** attempt)
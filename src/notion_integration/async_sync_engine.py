@@ -0,0 +1,229 @@
+"""
+AsyncSyncEngine - Pipelined Blog Post Sync to Notion
+
+SyncManager.sync_all_blog_posts() handles one post at a time: load, render
+(mistletoe), insert images, then wait on the rate limiter for each request.
+Rendering and the network never overlap, and a retry backoff stalls the
+whole batch.
+
+AsyncSyncEngine runs the same sync as a pipeline:
+- Preparation (SyncManager.prepare_blog_post) runs in a thread pool, so
+  posts are loaded and rendered while earlier ones are being pushed
+  (mistletoe parsing is serialized by SyncManager, since mistletoe keeps
+  parser state in module globals; loading, image insertion and hashing run
+  in parallel)
+- Pushes go through AsyncNotionClient: exactly one request in flight, paced
+  by the shared per-token rate budget, so the rate limit is the only bound
+  on throughput
+- Retries back off per request without holding the connection; other posts
+  keep going
+- At most max_pending posts are prepared ahead of the network (bounded memory)
+
+Skip/create/update decisions, block-level diffs (AsyncBlockSync on the same
+block store) and the recorded sync state are shared with SyncManager, so
+both can be used on the same cache.
+
+Usage:
+    engine = AsyncSyncEngine(sync_manager, AsyncNotionClient(token=token))
+    results = engine.run()  # or: await engine.sync_all_blog_posts()
+    print(f"{results['requests_per_sec']:.2f} req/sec")
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from src.notion_integration.async_notion_client import AsyncNotionClient
+from src.notion_integration.block_diff import NOTION_BLOCK_LIMIT, AsyncBlockSync
+from src.notion_integration.sync_manager import SyncError, SyncManager
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSyncEngine:
+    """
+    Syncs cached blog posts to Notion with preparation and network overlapped.
+    """
+
+    def __init__(
+        self,
+        sync_manager: SyncManager,
+        notion_client: AsyncNotionClient,
+        prepare_workers: int = 4,
+        max_pending: int = 8
+    ):
+        """
+        Initialize AsyncSyncEngine.
+
+        Args:
+            sync_manager: SyncManager providing the cache, rendering and
+                block store
+            notion_client: AsyncNotionClient used for all requests
+            prepare_workers: Threads rendering posts (default: 4)
+            max_pending: Posts prepared or being pushed at a time (default: 8)
+        """
+        if prepare_workers < 1 or max_pending < 1:
+            raise ValueError("prepare_workers and max_pending must be at least 1")
+
+        self.sync_manager = sync_manager
+        self.notion_client = notion_client
+        self.prepare_workers = prepare_workers
+        self.max_pending = max_pending
+        self.block_sync = AsyncBlockSync(notion_client, sync_manager.block_sync.store)
+
+    def run(
+        self,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Sync all cached blog posts from synchronous code, then close the client.
+
+        Args:
+            progress_callback: Optional progress callback
+
+        Returns:
+            See sync_all_blog_posts()
+        """
+        async def _run():
+            try:
+                return await self.sync_all_blog_posts(progress_callback)
+            finally:
+                await self.notion_client.aclose()
+
+        return asyncio.run(_run())
+
+    async def sync_all_blog_posts(
+        self,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Sync all cached blog posts to Notion.
+
+        Args:
+            progress_callback: Optional progress callback, called as each
+                post finishes (current, total, eta_seconds, message)
+
+        Returns:
+            Dict with the keys of SyncManager.sync_all_blog_posts() plus:
+                - duration_sec: Wall time of the batch
+                - api_calls: Requests sent (incl. retries)
+                - requests_per_sec: api_calls / duration_sec
+        """
+        logger.info("Starting pipelined blog post sync")
+        start = time.monotonic()
+        calls_before = self.notion_client.get_stats()['total_api_calls']
+
+        slugs = [post['slug'] for post in self.sync_manager.cache_manager.get_cached_blog_posts()]
+        total = len(slugs)
+        results: List[Dict[str, Any]] = []
+
+        if total:
+            logger.info(f"Found {total} cached blog posts to sync")
+            loop = asyncio.get_running_loop()
+            pending = asyncio.Semaphore(self.max_pending)
+
+            def report(result: Dict[str, Any]) -> None:
+                results.append(result)
+                if progress_callback:
+                    remaining = total - len(results)
+                    progress_callback({
+                        'current': len(results),
+                        'total': total,
+                        'eta_seconds': self.sync_manager.calculate_eta(remaining),
+                        'message': f"Synced {result['slug']} ({len(results)}/{total})"
+                    })
+
+            with ThreadPoolExecutor(max_workers=self.prepare_workers,
+                                    thread_name_prefix="notion-prepare") as pool:
+                async def sync_one(slug: str) -> None:
+                    async with pending:
+                        try:
+                            prepared = await loop.run_in_executor(pool, self._prepare, slug)
+                            result = await self._push(prepared)
+                        except Exception as e:
+                            logger.error(f"Failed to sync post: {e}")
+                            result = {'slug': slug, 'success': False, 'error': str(e)}
+                    report(result)
+
+                await asyncio.gather(*(sync_one(slug) for slug in slugs))
+
+        duration = time.monotonic() - start
+        api_calls = self.notion_client.get_stats()['total_api_calls'] - calls_before
+        actions = {'created': 0, 'updated': 0, 'skipped': 0}
+        errors = []
+        for result in results:
+            if result['success']:
+                actions[result['action']] += 1
+            else:
+                errors.append(result['error'])
+        successful = total - len(errors)
+
+        logger.info(
+            f"Pipelined blog post sync complete in {duration:.2f}s: "
+            f"{successful} successful ({actions['created']} created, "
+            f"{actions['updated']} updated, {actions['skipped']} skipped), "
+            f"{len(errors)} failed, {api_calls} API calls"
+        )
+
+        return {
+            'total': total,
+            'successful': successful,
+            'failed': len(errors),
+            **actions,
+            'errors': errors,
+            'duration_sec': duration,
+            'api_calls': api_calls,
+            'requests_per_sec': api_calls / duration if duration > 0 else 0.0
+        }
+
+    # ==================== Internal Methods ====================
+
+    def _prepare(self, slug: str) -> Dict[str, Any]:
+        """Load and render a post (runs in the thread pool)"""
+        try:
+            post_data = self.sync_manager.cache_manager.read_blog_post(slug)
+        except Exception as e:
+            raise SyncError(f"Blog post '{slug}' not found in cache: {e}") from e
+        return self.sync_manager.prepare_blog_post(slug, post_data)
+
+    async def _push(self, prepared: Dict[str, Any]) -> Dict[str, Any]:
+        """Create, update or skip the post's page (see SyncManager.sync_blog_post)"""
+        slug = prepared['slug']
+        notion_id = prepared['notion_id']
+        children = prepared['children']
+        properties_hash = prepared['properties_hash']
+
+        if prepared['unchanged']:
+            logger.info(f"Blog post unchanged since last sync, skipping: {slug}")
+            return {'slug': slug, 'success': True, 'action': 'skipped', 'page_id': notion_id}
+
+        if notion_id:
+            page = {'id': notion_id, 'url': prepared['metadata'].get('notion_url')}
+            if self.block_sync.properties_changed(notion_id, properties_hash):
+                page = await self.notion_client.update_page(
+                    page_id=notion_id,
+                    properties=prepared['properties']
+                )
+            await self.block_sync.push(notion_id, children, properties_hash)
+            action = 'updated'
+        else:
+            # Notion API limit: 100 blocks per request, append the rest
+            page = await self.notion_client.create_page(
+                parent_database_id=self.notion_client.database_ids['blog_posts'],
+                properties=prepared['properties'],
+                children=children[:NOTION_BLOCK_LIMIT]
+            )
+            for i in range(NOTION_BLOCK_LIMIT, len(children), NOTION_BLOCK_LIMIT):
+                await self.notion_client.append_blocks(
+                    block_id=page['id'],
+                    children=children[i:i + NOTION_BLOCK_LIMIT]
+                )
+            self.block_sync.record(page['id'], children, properties_hash)
+            action = 'created'
+
+        logger.info(f"Synced blog post successfully ({action}): {slug} → {page['id']}")
+        self.sync_manager.record_blog_post_sync(prepared, page)
+
+        return {'slug': slug, 'success': True, 'action': action, 'page_id': page['id']}
@@ -0,0 +1,65 @@
+"""
+Content Fingerprints for Incremental Notion Sync
+
+A fingerprint is the SHA-256 of the canonical JSON of what would be sent to
+Notion (page properties and, for pages with content, the rendered blocks).
+It is stored next to notion_id/notion_synced_at after every push, so the
+next sync can skip pages whose rendered content has not changed.
+
+Per-block fingerprints (block_fingerprint) let block_diff find which
+blocks of a changed page actually need an API call.
+
+Usage:
+    fingerprint = compute_fingerprint(properties, children)
+    if fingerprint == stored_fingerprint:
+        ...  # Unchanged, no API call needed
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+
+def _digest(payload: Any) -> str:
+    """SHA-256 of the canonical JSON of payload"""
+    canonical = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def compute_fingerprint(
+    properties: Dict[str, Any],
+    children: Optional[List[Dict[str, Any]]] = None
+) -> str:
+    """
+    Fingerprint rendered Notion page content.
+
+    Key order does not matter; any change to a property value or block
+    (including block order) changes the fingerprint.
+
+    Args:
+        properties: Notion page properties
+        children: Notion blocks (None for property-only pages)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return _digest({'properties': properties, 'children': children or []})
+
+
+def block_fingerprint(block: Dict[str, Any]) -> str:
+    """
+    Fingerprint a single rendered block (type and content).
+
+    Args:
+        block: Notion block object
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return _digest(block)
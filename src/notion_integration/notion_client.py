@@ -4,7 +4,8 @@ Notion Client Wrapper
 Wraps notion-client SDK with automatic rate limiting and error handling.
 
 Design Principles:
-- Automatic rate limiting (2.5 req/sec default)
+- Automatic rate limiting (2.5 req/sec default), one budget per token
+  shared by all clients in the process (see rate_limiter.shared_budget)
 - Comprehensive error handling
 - Retry logic for transient errors
 - Statistics tracking
@@ -15,7 +16,7 @@ import time
 import logging
 from typing import Dict, List, Any, Optional
 from notion_client import Client, APIResponseError
-from src.notion_integration.rate_limiter import RateLimiter
+from src.notion_integration.rate_limiter import RateLimiter, shared_budget
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +49,13 @@ class NotionClient:
         )
     """
 
-    def __init__(self, token: str, rate_limit: float = 2.5, database_ids_path: str = "cache/database_ids.json"):
+    def __init__(
+        self,
+        token: str,
+        rate_limit: float = 2.5,
+        database_ids_path: str = "cache/database_ids.json",
+        rate_limiter: Optional[RateLimiter] = None
+    ):
         """
         Initialize Notion client.
 
@@ -56,6 +63,8 @@ class NotionClient:
             token: Notion integration token
             rate_limit: Requests per second (default: 2.5)
             database_ids_path: Path to database IDs JSON file
+            rate_limiter: Rate limiter to use (default: one drawing on the
+                shared budget for this token)
 
         Raises:
             ValueError: If token is empty or None
@@ -64,15 +73,16 @@ class NotionClient:
             raise ValueError("Token cannot be empty")
 
         self._client = Client(auth=token)
-        self.rate_limiter = RateLimiter(rate=rate_limit)
+        self.rate_limiter = rate_limiter or RateLimiter(rate=rate_limit, budget=shared_budget(token))
         self._total_api_calls = 0
 
         # Load database IDs from cache
         self.database_ids = self._load_database_ids(database_ids_path)
 
-        logger.info(f"NotionClient initialized with rate_limit={rate_limit}")
+        logger.info(f"NotionClient initialized with rate_limit={self.rate_limiter.rate}")
 
-    def _load_database_ids(self, path: str) -> Dict[str, str]:
+    @staticmethod
+    def _load_database_ids(path: str) -> Dict[str, str]:
         """Load database IDs from cache file."""
         import json
         from pathlib import Path
@@ -293,6 +303,7 @@ class NotionClient:
         self,
         block_id: str,
         children: List[Dict[str, Any]],
+        after: Optional[str] = None,
         retry: bool = False,
         max_retries: int = 3
     ) -> Dict[str, Any]:
@@ -302,6 +313,7 @@ class NotionClient:
         Args:
             block_id: Parent block/page ID
             children: Block objects to append
+            after: Insert after this child block (default: at the end)
             retry: Enable retry on transient errors
             max_retries: Maximum retry attempts
 
@@ -311,17 +323,54 @@ class NotionClient:
         Raises:
             NotionError: On API errors
         """
+        kwargs = {}
+        if after:
+            kwargs["after"] = after
+
         return self._call_with_rate_limit(
             self._client.blocks.children.append,
             block_id=block_id,
             children=children,
             retry=retry,
-            max_retries=max_retries
+            max_retries=max_retries,
+            **kwargs
+        )
+
+    def update_block(
+        self,
+        block_id: str,
+        block: Dict[str, Any],
+        retry: bool = False,
+        max_retries: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Replace the content of a block (the block type cannot change).
+
+        Args:
+            block_id: Block ID
+            block: Block object with the new content ({'type': t, t: {...}})
+            retry: Enable retry on transient errors
+            max_retries: Maximum retry attempts
+
+        Returns:
+            Updated block object
+
+        Raises:
+            NotionError: On API errors
+        """
+        block_type = block["type"]
+        return self._call_with_rate_limit(
+            self._client.blocks.update,
+            block_id=block_id,
+            retry=retry,
+            max_retries=max_retries,
+            **{block_type: block[block_type]}
         )
 
     def retrieve_block_children(
         self,
         block_id: str,
+        start_cursor: Optional[str] = None,
         retry: bool = False,
         max_retries: int = 3
     ) -> Dict[str, Any]:
@@ -330,19 +379,52 @@ class NotionClient:
 
         Args:
             block_id: Parent block/page ID
+            start_cursor: Cursor from a previous response's next_cursor
             retry: Enable retry on transient errors
             max_retries: Maximum retry attempts
 
         Returns:
-            Response with child blocks
+            Response with child blocks (results, has_more, next_cursor)
 
         Raises:
             NotionError: On API errors
         """
+        kwargs = {}
+        if start_cursor:
+            kwargs["start_cursor"] = start_cursor
+
         return self._call_with_rate_limit(
             self._client.blocks.children.list,
             block_id=block_id,
             retry=retry,
+            max_retries=max_retries,
+            **kwargs
+        )
+
+    def delete_block(
+        self,
+        block_id: str,
+        retry: bool = False,
+        max_retries: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Delete (archive) a block.
+
+        Args:
+            block_id: Block ID
+            retry: Enable retry on transient errors
+            max_retries: Maximum retry attempts
+
+        Returns:
+            Deleted block object
+
+        Raises:
+            NotionError: On API errors
+        """
+        return self._call_with_rate_limit(
+            self._client.blocks.delete,
+            block_id=block_id,
+            retry=retry,
             max_retries=max_retries
         )
 
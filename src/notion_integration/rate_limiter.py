@@ -9,16 +9,175 @@ Design Principles:
 - ETA calculation for batch operations
 - Context manager support
 - Statistics tracking for monitoring
+
+Shared budget:
+Request slots are reserved from a RateBudget. Every NotionClient for the same
+token reserves from one process-wide budget (shared_budget), so all syncs in
+a process share Notion's limit instead of each pacing itself. Setting
+NOTION_RATE_LIMIT_DB (or passing db_path) keeps the budget in a SQLite file,
+shared by all processes (e.g. Huey workers) using that file.
 """
 
+import asyncio
+import os
 import time
+import hashlib
 import logging
+import sqlite3
+from pathlib import Path
 from threading import Lock
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
 
+class RateBudget:
+    """
+    In-process request schedule: hands out slots spaced `interval` apart.
+
+    Thread-safe. Shared by every RateLimiter created with it.
+    """
+
+    def __init__(self):
+        self._next_slot = 0.0
+        self._lock = Lock()
+
+    def reserve(self, interval: float) -> float:
+        """
+        Reserve the next request slot.
+
+        Args:
+            interval: Spacing to the following slot (seconds)
+
+        Returns:
+            Seconds to wait until the reserved slot
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + interval
+            return slot - now
+
+    def backlog(self) -> float:
+        """Seconds until the next free slot (0 if idle)"""
+        with self._lock:
+            return max(0.0, self._next_slot - time.monotonic())
+
+    def reset(self) -> None:
+        """Forget reserved slots"""
+        with self._lock:
+            self._next_slot = 0.0
+
+
+class SQLiteRateBudget(RateBudget):
+    """
+    Request schedule stored in a SQLite file, shared across processes.
+
+    Each reservation is one BEGIN IMMEDIATE transaction on a single row, so
+    processes and threads using the same file and name never get
+    overlapping slots.
+    """
+
+    def __init__(self, db_path: str, name: str = "notion"):
+        """
+        Initialize SQLite-backed budget.
+
+        Args:
+            db_path: SQLite file (created on first use)
+            name: Budget name (one row per name)
+        """
+        super().__init__()
+        self.db_path = db_path
+        self.name = name
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(self.db_path, timeout=30.0)
+                    try:
+                        conn.execute(
+                            "CREATE TABLE IF NOT EXISTS rate_budgets "
+                            "(name TEXT PRIMARY KEY, next_slot REAL NOT NULL)"
+                        )
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._initialized = True
+
+        # Autocommit mode: transactions are opened explicitly
+        return sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+
+    def _next_slot_value(self, conn: sqlite3.Connection) -> float:
+        row = conn.execute(
+            "SELECT next_slot FROM rate_budgets WHERE name = ?", (self.name,)
+        ).fetchone()
+        return row[0] if row else 0.0
+
+    def reserve(self, interval: float) -> float:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()  # Wall clock: comparable across processes
+            slot = max(now, self._next_slot_value(conn))
+            conn.execute(
+                "INSERT INTO rate_budgets (name, next_slot) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET next_slot = excluded.next_slot",
+                (self.name, slot + interval)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return slot - now
+
+    def backlog(self) -> float:
+        conn = self._connect()
+        try:
+            return max(0.0, self._next_slot_value(conn) - time.time())
+        finally:
+            conn.close()
+
+    def reset(self) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM rate_budgets WHERE name = ?", (self.name,))
+        finally:
+            conn.close()
+
+
+_shared_budgets: Dict[tuple, RateBudget] = {}
+_shared_budgets_lock = Lock()
+
+
+def shared_budget(token: str, db_path: Optional[str] = None) -> RateBudget:
+    """
+    Get the process-wide rate budget for a Notion token.
+
+    Args:
+        token: Notion integration token (Notion limits per integration)
+        db_path: SQLite file for a cross-process budget
+            (default: NOTION_RATE_LIMIT_DB env var; unset = in-process only)
+
+    Returns:
+        The same RateBudget for every call with this token and db_path
+    """
+    db_path = db_path or os.getenv("NOTION_RATE_LIMIT_DB") or None
+    name = hashlib.sha256(token.encode()).hexdigest()[:16]
+
+    with _shared_budgets_lock:
+        budget = _shared_budgets.get((name, db_path))
+        if budget is None:
+            budget = SQLiteRateBudget(db_path, name=name) if db_path else RateBudget()
+            _shared_budgets[(name, db_path)] = budget
+        return budget
+
+
 class RateLimiter:
     """
     Token bucket rate limiter with thread safety.
@@ -34,16 +193,23 @@ class RateLimiter:
         with limiter:
             make_api_call()
 
+        # Asyncio (waits without blocking the event loop)
+        await limiter.acquire_async()
+
         # ETA calculation
         eta = limiter.calculate_eta(num_requests=100)
+
+        # Share one budget between limiters (threads or, via SQLite, processes)
+        limiter = RateLimiter(rate=2.5, budget=shared_budget(token))
     """
 
-    def __init__(self, rate: float = 2.5):
+    def __init__(self, rate: float = 2.5, budget: Optional[RateBudget] = None):
         """
         Initialize rate limiter.
 
         Args:
             rate: Requests per second (default: 2.5)
+            budget: Request schedule to reserve slots from (default: private)
 
         Raises:
             ValueError: If rate is not positive
@@ -53,7 +219,8 @@ class RateLimiter:
 
         self.rate = rate
         self.interval = 1.0 / rate  # Time between requests (seconds)
-        self._last_request_time = 0.0
+        self.budget = budget or RateBudget()
+        self._owns_budget = budget is None
         self._lock = Lock()
 
         # Statistics
@@ -67,25 +234,15 @@ class RateLimiter:
         Acquire permission to make a request.
         Blocks until rate limit allows next request.
 
-        Thread-safe: Uses lock to ensure correct behavior under concurrency.
+        Thread-safe: slots are reserved atomically from the budget, then each
+        caller sleeps until its own slot.
         """
+        wait_time = self.budget.reserve(self.interval)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
         with self._lock:
-            current_time = time.time()
-
-            # Calculate time since last request
-            time_since_last = current_time - self._last_request_time
-
-            # If not enough time has passed, wait
-            if time_since_last < self.interval:
-                wait_time = self.interval - time_since_last
-                time.sleep(wait_time)
-                self._total_wait_time += wait_time
-            else:
-                # No wait needed
-                wait_time = 0.0
-
-            # Update last request time
-            self._last_request_time = time.time()
+            self._total_wait_time += wait_time
             self._total_requests += 1
 
             logger.debug(
@@ -93,6 +250,25 @@ class RateLimiter:
                 f"(waited {wait_time:.3f}s)"
             )
 
+    async def acquire_async(self) -> None:
+        """
+        Acquire permission to make a request from a coroutine.
+
+        Same slot reservation as acquire(), but waits with asyncio.sleep so
+        the event loop keeps running other tasks. A SQLite budget is reserved
+        in a worker thread: its transaction can wait on other processes.
+        """
+        if type(self.budget) is RateBudget:
+            wait_time = self.budget.reserve(self.interval)
+        else:
+            wait_time = await asyncio.to_thread(self.budget.reserve, self.interval)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+        with self._lock:
+            self._total_wait_time += wait_time
+            self._total_requests += 1
+
     def calculate_eta(self, num_requests: int) -> float:
         """
         Calculate estimated time to complete N requests.
@@ -101,21 +277,26 @@ class RateLimiter:
             num_requests: Number of pending requests
 
         Returns:
-            Estimated time in seconds (simple calculation: num_requests / rate)
+            Estimated time in seconds: num_requests / rate, plus the wait for
+            slots already reserved from the (possibly shared) budget
         """
         if num_requests <= 0:
             return 0.0
 
-        # Simple ETA calculation: total requests divided by rate
-        return num_requests / self.rate
+        return self.budget.backlog() + num_requests / self.rate
 
     def reset(self) -> None:
         """
         Reset rate limiter state.
         Clears request history and statistics.
+
+        A budget passed in at construction is shared with other limiters (and
+        possibly processes), so only a private budget is reset; reserved
+        slots in a shared budget are kept.
         """
+        if self._owns_budget:
+            self.budget.reset()
         with self._lock:
-            self._last_request_time = 0.0
             self._total_requests = 0
             self._total_wait_time = 0.0
 
@@ -5,23 +5,40 @@ Syncs cached content to Notion databases with rate limiting and progress trackin
 
 Design Principles:
 - Batch operations with progress callbacks
-- Rate limiting (2.5 req/sec for Notion API)
+- Rate limiting (2.5 req/sec for Notion API), enforced once per request by
+  NotionClient using the same limiter SyncManager uses for ETAs
 - ETA calculation for UI
+- Incremental blog post sync: a content fingerprint of the rendered
+  properties and blocks is stored in the post's cached metadata (next to
+  notion_id/notion_synced_at); unchanged posts are skipped, changed posts
+  update their existing page instead of creating a new one
+- Block-level diff for changed posts (BlockSync): only changed, added and
+  removed blocks cost API calls, properties are only sent if they changed
 - Retry logic with exponential backoff
 - Comprehensive error handling
 - Detailed logging
 """
 
 import logging
+import threading
 import time
+from datetime import datetime
 from typing import Dict, Any, List, Optional, Callable
 
 from src.cache_manager import CacheManager
+from src.notion_integration.block_diff import NOTION_BLOCK_LIMIT, BlockSync
+from src.notion_integration.fingerprint import compute_fingerprint
 from src.notion_integration.notion_client import NotionClient
 from src.notion_integration.rate_limiter import RateLimiter
+from src.utils.cache_store import CacheStore
 
 logger = logging.getLogger(__name__)
 
+# mistletoe keeps parser state in module globals (block_token._root_node,
+# span_token._root_node, the token types a renderer registers), so documents
+# are parsed and rendered one at a time across threads
+_MISTLETOE_LOCK = threading.Lock()
+
 
 class SyncError(Exception):
     """Base exception for sync errors"""
@@ -56,7 +73,8 @@ class SyncManager:
         cache_manager: Optional[CacheManager] = None,
         notion_client: Optional[NotionClient] = None,
         rate_limiter: Optional[RateLimiter] = None,
-        max_retries: int = 3
+        max_retries: int = 3,
+        block_store: Optional[CacheStore] = None
     ):
         """
         Initialize SyncManager.
@@ -64,8 +82,12 @@ class SyncManager:
         Args:
             cache_manager: Optional CacheManager instance
             notion_client: Optional NotionClient instance
-            rate_limiter: Optional RateLimiter instance
+            rate_limiter: Optional RateLimiter instance; installed on the
+                NotionClient so every request draws on this one budget
+                (default: the NotionClient's limiter)
             max_retries: Maximum retry attempts (default: 3)
+            block_store: CacheStore for the block lists pushed to each page
+                (default: cache/notion_blocks.db)
         """
         self.cache_manager = cache_manager or CacheManager()
 
@@ -80,9 +102,19 @@ class SyncManager:
             notion_client = NotionClient(token=token)
 
         self.notion_client = notion_client
-        self.rate_limiter = rate_limiter or RateLimiter()
+
+        # Single budget: NotionClient paces every request, SyncManager only
+        # reads the limiter for ETAs (acquiring here too would wait twice)
+        if rate_limiter is not None:
+            notion_client.rate_limiter = rate_limiter
+        self.rate_limiter = notion_client.rate_limiter
         self.max_retries = max_retries
 
+        # An empty CacheStore is falsy (__len__), so test for None
+        if block_store is None:
+            block_store = CacheStore("cache/notion_blocks.db", namespace="notion_blocks")
+        self.block_sync = BlockSync(notion_client, block_store)
+
         logger.info(
             f"SyncManager initialized: "
             f"rate_limit={self.rate_limiter.rate} req/sec, "
@@ -104,6 +136,7 @@ class SyncManager:
         Returns:
             Dict with:
                 - success: bool
+                - action: 'created', 'updated' or 'skipped' (if successful)
                 - page_id: Notion page ID (if successful)
                 - url: Notion page URL (if successful)
                 - error: Error message (if failed)
@@ -116,16 +149,26 @@ class SyncManager:
         # Load blog data from cache
         try:
             post_data = self.cache_manager.read_blog_post(slug)
-            blog_data = {
-                'slug': slug,
-                'content': post_data['content'],
-                'metadata': post_data['metadata']
-            }
         except Exception as e:
             error_msg = f"Blog post '{slug}' not found in cache: {e}"
             logger.error(error_msg)
             return {"success": False, "error": error_msg}
 
+        prepared = self.prepare_blog_post(slug, post_data)
+        metadata = prepared['metadata']
+        children = prepared['children']
+        properties_hash = prepared['properties_hash']
+        notion_id = prepared['notion_id']
+
+        if prepared['unchanged']:
+            logger.info(f"Blog post unchanged since last sync, skipping: {slug}")
+            return {
+                'success': True,
+                'action': 'skipped',
+                'page_id': notion_id,
+                'url': metadata.get('notion_url')
+            }
+
         # Call progress callback (start)
         if progress_callback:
             progress_callback(0, 1, self.calculate_eta(1))
@@ -134,53 +177,29 @@ class SyncManager:
         last_error = None
         for attempt in range(self.max_retries):
             try:
-                # Acquire rate limit token
-                self.rate_limiter.acquire()
-
-                # Create Notion page with content
-                properties = self._build_blog_properties(blog_data)
-                children = self._markdown_to_blocks(blog_data.get('content', ''))
-
-                # Insert images into content blocks
-                children = self._insert_images_into_blocks(children, blog_data.get('metadata', {}))
-
-                # Notion API limit: 100 blocks per request
-                # If more than 100 blocks, create page with first 100, then append rest
-                NOTION_BLOCK_LIMIT = 100
-
-                if len(children) <= NOTION_BLOCK_LIMIT:
-                    # Simple case: all blocks fit in one request
-                    page = self.notion_client.create_page(
-                        parent_database_id=self.notion_client.database_ids['blog_posts'],
-                        properties=properties,
-                        children=children
-                    )
+                # NotionClient applies the rate limit to every call
+                if notion_id:
+                    page = {'id': notion_id, 'url': metadata.get('notion_url')}
+                    if self.block_sync.properties_changed(notion_id, properties_hash):
+                        page = self.notion_client.update_page(
+                            page_id=notion_id,
+                            properties=prepared['properties']
+                        )
+                    self.block_sync.push(notion_id, children, properties_hash)
+                    action = 'updated'
                 else:
-                    # Complex case: need to chunk blocks
-                    logger.info(f"Blog post has {len(children)} blocks, splitting into chunks")
-
-                    # Create page with first 100 blocks
-                    first_chunk = children[:NOTION_BLOCK_LIMIT]
+                    # Notion API limit: 100 blocks per request, append the rest
                     page = self.notion_client.create_page(
                         parent_database_id=self.notion_client.database_ids['blog_posts'],
-                        properties=properties,
-                        children=first_chunk
+                        properties=prepared['properties'],
+                        children=children[:NOTION_BLOCK_LIMIT]
                     )
+                    self._append_blocks(page['id'], children[NOTION_BLOCK_LIMIT:])
+                    self.block_sync.record(page['id'], children, properties_hash)
+                    action = 'created'
 
-                    # Append remaining blocks in chunks
-                    remaining_blocks = children[NOTION_BLOCK_LIMIT:]
-                    for i in range(0, len(remaining_blocks), NOTION_BLOCK_LIMIT):
-                        chunk = remaining_blocks[i:i + NOTION_BLOCK_LIMIT]
-                        logger.info(f"Appending chunk {i//NOTION_BLOCK_LIMIT + 1}: {len(chunk)} blocks")
-                        self.notion_client.append_blocks(
-                            block_id=page['id'],
-                            children=chunk,
-                            retry=True
-                        )
-                        # Rate limit between chunks
-                        self.rate_limiter.acquire()
-
-                logger.info(f"Synced blog post successfully: {slug} → {page['id']}")
+                logger.info(f"Synced blog post successfully ({action}): {slug} → {page['id']}")
+                self.record_blog_post_sync(prepared, page)
 
                 # Call progress callback (complete)
                 if progress_callback:
@@ -188,6 +207,7 @@ class SyncManager:
 
                 return {
                     'success': True,
+                    'action': action,
                     'page_id': page['id'],
                     'url': page['url']
                 }
@@ -209,6 +229,85 @@ class SyncManager:
             f"Failed to sync blog post '{slug}' after {self.max_retries} retries: {last_error}"
         ) from last_error
 
+    def prepare_blog_post(self, slug: str, post_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Render a cached blog post for sync (no API calls).
+
+        Safe to call from worker threads (AsyncSyncEngine prepares posts
+        while earlier ones are being pushed).
+
+        Args:
+            slug: Blog post slug
+            post_data: Cached post (dict with 'content' and 'metadata')
+
+        Returns:
+            Dict with slug, content, metadata, properties, children,
+            fingerprint, properties_hash, notion_id and unchanged (bool:
+            already synced with this fingerprint)
+
+        Raises:
+            SyncError: If the content cannot be rendered
+        """
+        blog_data = {
+            'slug': slug,
+            'content': post_data['content'],
+            'metadata': post_data['metadata']
+        }
+
+        try:
+            properties = self._build_blog_properties(blog_data)
+            children = self._markdown_to_blocks(blog_data.get('content', ''))
+
+            # Insert images into content blocks
+            children = self._insert_images_into_blocks(children, blog_data.get('metadata', {}))
+        except Exception as e:
+            raise SyncError(f"Failed to sync blog post '{slug}': could not render content: {e}") from e
+
+        metadata = blog_data['metadata']
+        fingerprint = compute_fingerprint(properties, children)
+        notion_id = metadata.get('notion_id')
+
+        return {
+            **blog_data,
+            'properties': properties,
+            'children': children,
+            'fingerprint': fingerprint,
+            'properties_hash': compute_fingerprint(properties),
+            'notion_id': notion_id,
+            'unchanged': bool(notion_id) and fingerprint == metadata.get('notion_fingerprint')
+        }
+
+    def record_blog_post_sync(self, prepared: Dict[str, Any], page: Dict[str, Any]) -> None:
+        """
+        Record the pushed state next to the cached post so unchanged posts are skipped.
+
+        Args:
+            prepared: Result of prepare_blog_post()
+            page: Notion page the post was pushed to (id, url)
+        """
+        self.cache_manager.write_blog_post(
+            prepared['slug'],
+            prepared['content'],
+            {
+                **prepared['metadata'],
+                'notion_id': page['id'],
+                'notion_url': page.get('url'),
+                'notion_synced_at': datetime.now().isoformat(),
+                'notion_fingerprint': prepared['fingerprint']
+            }
+        )
+
+    def _append_blocks(self, page_id: str, blocks: List[Dict[str, Any]]) -> None:
+        """Append blocks to a page in chunks of NOTION_BLOCK_LIMIT"""
+        for i in range(0, len(blocks), NOTION_BLOCK_LIMIT):
+            chunk = blocks[i:i + NOTION_BLOCK_LIMIT]
+            logger.info(f"Appending chunk {i // NOTION_BLOCK_LIMIT + 1}: {len(chunk)} blocks")
+            self.notion_client.append_blocks(
+                block_id=page_id,
+                children=chunk,
+                retry=True
+            )
+
     def sync_all_blog_posts(
         self,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
@@ -216,14 +315,19 @@ class SyncManager:
         """
         Sync all cached blog posts to Notion.
 
+        Only new or changed posts are pushed (see sync_blog_post).
+
         Args:
             progress_callback: Optional progress callback
 
         Returns:
             Dict with:
                 - total: Total posts processed
-                - successful: Number of successful syncs
+                - successful: Number of successful syncs (incl. skipped)
                 - failed: Number of failed syncs
+                - created: Pages created
+                - updated: Existing pages updated
+                - skipped: Posts unchanged since the last sync
                 - errors: List of error messages
         """
         logger.info("Starting batch blog post sync")
@@ -238,6 +342,9 @@ class SyncManager:
                 'total': 0,
                 'successful': 0,
                 'failed': 0,
+                'created': 0,
+                'updated': 0,
+                'skipped': 0,
                 'errors': []
             }
 
@@ -246,6 +353,7 @@ class SyncManager:
         # Sync each post
         successful = 0
         failed = 0
+        actions = {'created': 0, 'updated': 0, 'skipped': 0}
         errors = []
 
         for idx, post_data in enumerate(cached_posts):
@@ -263,8 +371,11 @@ class SyncManager:
                 })
 
             try:
-                self.sync_blog_post(post_data['slug'], progress_callback=None)  # Don't double-call callback
+                result = self.sync_blog_post(post_data['slug'], progress_callback=None)  # Don't double-call callback
+                if not result.get('success'):
+                    raise SyncError(result.get('error', 'unknown error'))
                 successful += 1
+                actions[result['action']] += 1
             except SyncError as e:
                 failed += 1
                 errors.append(str(e))
@@ -272,13 +383,15 @@ class SyncManager:
 
         logger.info(
             f"Batch blog post sync complete: "
-            f"{successful} successful, {failed} failed"
+            f"{successful} successful ({actions['created']} created, "
+            f"{actions['updated']} updated, {actions['skipped']} skipped), {failed} failed"
         )
 
         return {
             'total': total,
             'successful': successful,
             'failed': failed,
+            **actions,
             'errors': errors
         }
 
@@ -336,10 +449,7 @@ class SyncManager:
                 })
 
             try:
-                # Acquire rate limit token
-                self.rate_limiter.acquire()
-
-                # Create Notion page
+                # Create Notion page (NotionClient applies the rate limit)
                 properties = self._build_social_properties(post_data)
                 page = self.notion_client.create_page(
                     parent_database_id=self.notion_client.database_ids['social_posts'],
@@ -374,13 +484,10 @@ class SyncManager:
             num_items: Number of items to sync
 
         Returns:
-            Estimated time in seconds
+            Estimated time in seconds (includes slots other syncs already
+            reserved from a shared rate budget)
         """
-        if num_items == 0:
-            return 0.0
-
-        # ETA = num_items / rate (req/sec)
-        return num_items / self.rate_limiter.rate
+        return self.rate_limiter.calculate_eta(num_items)
 
     def _build_blog_properties(self, blog_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -418,6 +525,8 @@ class SyncManager:
         """
         Convert markdown content to Notion blocks using mistletoe parser.
 
+        Thread-safe: parsing and rendering are serialized (_MISTLETOE_LOCK).
+
         Args:
             markdown: Markdown content
 
@@ -623,9 +732,10 @@ class SyncManager:
 
         # Parse markdown and render to Notion blocks
         try:
-            doc = Document(markdown)
-            renderer = NotionClientRenderer()
-            return renderer.render(doc)
+            with _MISTLETOE_LOCK:
+                doc = Document(markdown)
+                renderer = NotionClientRenderer()
+                return renderer.render(doc)
         except Exception as e:
             # Fallback to simple paragraph if parsing fails
             self.logger.warning(f"Markdown parsing failed: {e}, using fallback")
@@ -19,10 +19,17 @@ Example:
     # Batch sync
     results = sync.sync_batch(topics, skip_errors=True)
     print(sync.get_statistics())
+
+Incremental sync:
+    After a push, the topic's notion_id, notion_synced_at and
+    notion_fingerprint are set. Persist them (SQLiteManager.mark_topic_synced)
+    and the next sync skips the topic until its rendered properties change.
 """
 
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 from src.models.topic import Topic
+from src.notion_integration.fingerprint import compute_fingerprint
 from src.notion_integration.notion_client import NotionClient
 from src.utils.logger import get_logger
 
@@ -42,6 +49,8 @@ class TopicsSync:
     - Creates new Notion pages for topics
     - Updates existing pages (when update_existing=True)
     - Skips already-synced topics
+    - Skips topics whose properties are unchanged since the last push
+      (content fingerprint)
     - Batch processing with skip_errors support
     - Statistics tracking
     - Rate-limited via NotionClient
@@ -73,6 +82,7 @@ class TopicsSync:
         # Statistics
         self.total_synced = 0
         self.failed_syncs = 0
+        self.total_skipped = 0
 
         logger.info("topics_sync_initialized", database_id=database_id, rate_limit=rate_limit)
 
@@ -84,6 +94,9 @@ class TopicsSync:
         """
         Sync single topic to Notion
 
+        On create/update the topic's notion_id, notion_synced_at and
+        notion_fingerprint are set to the pushed state.
+
         Args:
             topic: Topic object to sync
             update_existing: If True, update existing pages. If False, skip.
@@ -94,7 +107,8 @@ class TopicsSync:
             - action: 'created', 'updated', or 'skipped'
             - topic_id: Original topic ID
             - url: Notion page URL (if created/updated)
-            - reason: Reason for skip (if skipped)
+            - reason: Reason for skip ('already_synced' or 'unchanged')
+            - fingerprint: Content fingerprint of the page properties
 
         Raises:
             TopicsSyncError: If sync fails
@@ -103,14 +117,17 @@ class TopicsSync:
             raise TopicsSyncError("Database ID not set. Provide database_id in constructor.")
 
         try:
-            # Check if topic already synced (has notion_id)
-            # In this implementation, we use topic.id as notion page id if it exists
-            has_notion_id = topic.id and topic.id.startswith('notion_')
+            # Check if topic already synced: notion_id from a previous push,
+            # or a topic.id that is itself a Notion page id
+            notion_id = topic.notion_id or (
+                topic.id if topic.id and topic.id.startswith('notion_') else None
+            )
 
-            if has_notion_id and not update_existing:
+            if notion_id and not update_existing:
                 logger.info("topic_already_synced_skipping", topic_id=topic.id)
+                self.total_skipped += 1
                 return {
-                    'id': topic.id,
+                    'id': notion_id,
                     'action': 'skipped',
                     'reason': 'already_synced',
                     'topic_id': topic.id
@@ -118,24 +135,38 @@ class TopicsSync:
 
             # Build Notion properties from Topic
             properties = self._build_properties(topic)
+            fingerprint = compute_fingerprint(properties)
+
+            if notion_id and fingerprint == topic.notion_fingerprint:
+                logger.info("topic_unchanged_skipping", topic_id=topic.id, notion_id=notion_id)
+                self.total_skipped += 1
+                return {
+                    'id': notion_id,
+                    'action': 'skipped',
+                    'reason': 'unchanged',
+                    'topic_id': topic.id,
+                    'fingerprint': fingerprint
+                }
 
             # Update existing page
-            if has_notion_id and update_existing:
-                logger.info("updating_existing_topic", topic_id=topic.id, notion_id=topic.id)
+            if notion_id:
+                logger.info("updating_existing_topic", topic_id=topic.id, notion_id=notion_id)
 
                 response = self.notion_client.update_page(
-                    page_id=topic.id,
+                    page_id=notion_id,
                     properties=properties,
                     retry=True
                 )
 
                 self.total_synced += 1
+                self._mark_synced(topic, response['id'], fingerprint)
 
                 return {
                     'id': response['id'],
                     'action': 'updated',
                     'topic_id': topic.id,
-                    'url': response.get('url')
+                    'url': response.get('url'),
+                    'fingerprint': fingerprint
                 }
 
             # Create new page
@@ -148,12 +179,14 @@ class TopicsSync:
             )
 
             self.total_synced += 1
+            self._mark_synced(topic, response['id'], fingerprint)
 
             return {
                 'id': response['id'],
                 'action': 'created',
                 'topic_id': topic.id or response['id'],
-                'url': response.get('url')
+                'url': response.get('url'),
+                'fingerprint': fingerprint
             }
 
         except Exception as e:
@@ -199,12 +232,21 @@ class TopicsSync:
         logger.info(
             "batch_sync_complete",
             total=len(topics),
-            synced=len(results),
+            created=sum(1 for r in results if r['action'] == 'created'),
+            updated=sum(1 for r in results if r['action'] == 'updated'),
+            skipped=sum(1 for r in results if r['action'] == 'skipped'),
             failed=len(topics) - len(results)
         )
 
         return results
 
+    @staticmethod
+    def _mark_synced(topic: Topic, notion_id: str, fingerprint: str) -> None:
+        """Record the pushed state on the topic"""
+        topic.notion_id = notion_id
+        topic.notion_fingerprint = fingerprint
+        topic.notion_synced_at = datetime.utcnow()
+
     def _build_properties(self, topic: Topic) -> Dict[str, Any]:
         """
         Build Notion properties dictionary from Topic object
@@ -359,6 +401,7 @@ class TopicsSync:
             Dictionary with:
             - total_synced: Total topics synced
             - failed_syncs: Failed sync attempts
+            - total_skipped: Topics skipped (already synced or unchanged)
             - success_rate: Ratio of successful to total (0-1)
         """
         total_attempts = self.total_synced + self.failed_syncs
@@ -371,6 +414,7 @@ class TopicsSync:
         return {
             'total_synced': self.total_synced,
             'failed_syncs': self.failed_syncs,
+            'total_skipped': self.total_skipped,
             'success_rate': success_rate
         }
 
@@ -378,4 +422,5 @@ class TopicsSync:
         """Reset all statistics to zero"""
         self.total_synced = 0
         self.failed_syncs = 0
+        self.total_skipped = 0
         logger.info("statistics_reset")
@@ -0,0 +1,264 @@
+"""
+Collection Orchestrator for UniversalTopicAgent
+
+Runs independent collection stages (feeds, Reddit, Trends, Autocomplete)
+concurrently instead of one after another. Every stage is network-bound, so
+a run takes about as long as the slowest stage rather than the sum of all
+of them.
+
+Documents are deduplicated as soon as their stage finishes and written to
+the database in batches of batch_size, while the remaining stages are still
+collecting; nothing waits for the slowest collector before storage starts.
+
+Usage:
+    orchestrator = CollectionOrchestrator(deduplicator=dedup, db_manager=db)
+
+    result = orchestrator.run([
+        CollectionStage("reddit", lambda: reddit.collect(subreddits), timeout=300),
+        CollectionStage("autocomplete", collect_autocomplete, max_documents=500),
+    ])
+
+    result["documents_saved"]        # Inserted into the database
+    result["stage_timings"]          # Seconds per stage (+ deduplication, storage, total)
+    result["stages"]["reddit"]       # {"status", "documents", "duration_sec", ...}
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from src.models.document import Document
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class StageOutput:
+    """Documents collected by one stage, plus bookkeeping for the run stats"""
+    documents: List[Document] = field(default_factory=list)
+    sources: int = 0   # Feeds/subreddits/keywords processed
+    errors: int = 0    # Non-fatal errors inside the stage
+
+
+@dataclass
+class CollectionStage:
+    """
+    One independent collection job
+
+    collect returns a StageOutput or a plain list of documents.
+    """
+    name: str
+    collect: Callable[[], Union[StageOutput, List[Document]]]
+    timeout: Optional[float] = None         # Seconds from run start (None = no limit)
+    max_documents: Optional[int] = None     # Documents kept from this stage (None = all)
+
+
+class CollectionOrchestrator:
+    """
+    Concurrent collection with streaming deduplication and batched storage.
+
+    Features:
+    - All stages start at once, one worker thread each
+    - Per-stage timeout: a stage still running at its deadline is recorded
+      as timed out and its late documents are discarded
+    - Per-stage document budget (max_documents)
+    - A failing stage is logged and counted, the others are unaffected
+    - Per-stage timing and status in the returned stats
+    """
+
+    def __init__(self, deduplicator, db_manager, batch_size: int = 200):
+        """
+        Initialize orchestrator
+
+        Args:
+            deduplicator: Deduplicator (deduplicate(documents) -> unique documents)
+            db_manager: Database manager (insert_documents_bulk(documents) -> inserted)
+            batch_size: Unique documents buffered before a bulk insert
+        """
+        self.deduplicator = deduplicator
+        self.db = db_manager
+        self.batch_size = max(1, batch_size)
+
+    @staticmethod
+    def _run_stage(stage: CollectionStage):
+        """Worker: run one stage, returning (output, duration_sec, error)"""
+        start = time.monotonic()
+        try:
+            output = stage.collect()
+        except Exception as e:
+            return None, time.monotonic() - start, e
+
+        if not isinstance(output, StageOutput):
+            output = StageOutput(documents=list(output or []))
+        return output, time.monotonic() - start, None
+
+    def run(self, stages: List[CollectionStage]) -> Dict[str, Any]:
+        """
+        Run all stages concurrently, deduplicating and storing as they finish
+
+        Args:
+            stages: Collection stages (names must be unique)
+
+        Returns:
+            Dict with:
+                - documents_collected: int - Unique documents
+                - documents_saved: int - Documents inserted into the database
+                - documents_total: int - Documents before deduplication
+                - sources_processed: int - Sum of stage sources
+                - errors: int - Failed/timed-out stages, stage errors,
+                  deduplication and storage failures
+                - stage_timings: Dict[str, float] - Seconds per stage, plus
+                  deduplication, storage and total
+                - stages: Dict[str, Dict] - status ("completed", "failed",
+                  "timeout"), documents, duration_sec, error
+        """
+        run_start = time.monotonic()
+        result: Dict[str, Any] = {
+            'documents_collected': 0,
+            'documents_saved': 0,
+            'documents_total': 0,
+            'sources_processed': 0,
+            'errors': 0,
+            'stage_timings': {},
+            'stages': {},
+        }
+        timings = result['stage_timings']
+        timings['deduplication'] = 0.0
+        timings['storage'] = 0.0
+        pending_docs: List[Document] = []
+
+        logger.info("collection_run_started", stages=[stage.name for stage in stages])
+
+        if not stages:
+            timings['total'] = 0.0
+            return result
+
+        executor = ThreadPoolExecutor(max_workers=len(stages), thread_name_prefix="collector")
+        futures: Dict[Future, CollectionStage] = {
+            executor.submit(self._run_stage, stage): stage for stage in stages
+        }
+        deadlines = {
+            future: run_start + stage.timeout
+            for future, stage in futures.items()
+            if stage.timeout is not None
+        }
+
+        try:
+            pending = set(futures)
+            while pending:
+                next_deadline = min((deadlines[f] for f in pending if f in deadlines), default=None)
+                wait_for = None if next_deadline is None else max(0.0, next_deadline - time.monotonic())
+                done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    output, duration, error = future.result()
+                    documents = self._finish_stage(futures[future], output, duration, error, result)
+                    if documents:
+                        pending_docs.extend(self._deduplicate(documents, result))
+                        if len(pending_docs) >= self.batch_size:
+                            self._store(pending_docs, result)
+                            pending_docs = []
+
+                now = time.monotonic()
+                for future in [f for f in pending if f in deadlines and deadlines[f] <= now]:
+                    pending.discard(future)
+                    future.cancel()
+                    self._timeout_stage(futures[future], now - run_start, result)
+
+            self._store(pending_docs, result)
+        finally:
+            # Timed-out workers cannot be interrupted; don't wait for them
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        timings['total'] = time.monotonic() - run_start
+        logger.info(
+            "collection_run_completed",
+            documents_collected=result['documents_collected'],
+            documents_saved=result['documents_saved'],
+            errors=result['errors'],
+            total_sec=round(timings['total'], 2)
+        )
+        return result
+
+    def _finish_stage(
+        self,
+        stage: CollectionStage,
+        output: Optional[StageOutput],
+        duration: float,
+        error: Optional[Exception],
+        result: Dict[str, Any]
+    ) -> List[Document]:
+        """Record a finished stage; returns its documents (within budget)"""
+        result['stage_timings'][stage.name] = duration
+
+        if error is not None:
+            logger.error("collection_stage_failed", stage=stage.name, error=str(error))
+            result['errors'] += 1
+            result['stages'][stage.name] = {
+                'status': 'failed', 'documents': 0, 'duration_sec': duration, 'error': str(error)
+            }
+            return []
+
+        documents = output.documents
+        if stage.max_documents is not None and len(documents) > stage.max_documents:
+            logger.info(
+                "collection_stage_budget_applied",
+                stage=stage.name, collected=len(documents), kept=stage.max_documents
+            )
+            documents = documents[:stage.max_documents]
+
+        result['sources_processed'] += output.sources
+        result['errors'] += output.errors
+        result['documents_total'] += len(documents)
+        result['stages'][stage.name] = {
+            'status': 'completed', 'documents': len(documents), 'duration_sec': duration, 'error': None
+        }
+        logger.info(
+            "collection_stage_completed",
+            stage=stage.name, documents=len(documents), duration_sec=round(duration, 2)
+        )
+        return documents
+
+    def _timeout_stage(self, stage: CollectionStage, elapsed: float, result: Dict[str, Any]):
+        """Record a stage that missed its deadline"""
+        logger.error("collection_stage_timeout", stage=stage.name, timeout=stage.timeout)
+        result['errors'] += 1
+        result['stage_timings'][stage.name] = elapsed
+        result['stages'][stage.name] = {
+            'status': 'timeout', 'documents': 0, 'duration_sec': elapsed,
+            'error': f"Timed out after {stage.timeout}s"
+        }
+
+    def _deduplicate(self, documents: List[Document], result: Dict[str, Any]) -> List[Document]:
+        """Deduplicate one stage's documents against everything seen so far"""
+        start = time.monotonic()
+        try:
+            unique = self.deduplicator.deduplicate(documents)
+        except Exception as e:
+            logger.error("deduplication_failed", error=str(e))
+            unique = documents  # Fallback: keep all documents
+            result['errors'] += 1
+
+        result['stage_timings']['deduplication'] += time.monotonic() - start
+        result['documents_collected'] += len(unique)
+        return unique
+
+    def _store(self, documents: List[Document], result: Dict[str, Any]):
+        """Bulk-insert a batch (one transaction, existing IDs skipped)"""
+        if not documents:
+            return
+
+        start = time.monotonic()
+        try:
+            saved = self.db.insert_documents_bulk(documents)
+            result['documents_saved'] += saved
+            logger.info("documents_batch_saved", count=saved, batch=len(documents))
+        except Exception as e:
+            logger.error("documents_save_failed", count=len(documents), error=str(e))
+            result['errors'] += 1
+            # Not stored: let the next run collect them again
+            self.deduplicator.remove(documents)
+
+        result['stage_timings']['storage'] += time.monotonic() - start
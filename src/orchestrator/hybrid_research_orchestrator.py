@@ -33,6 +33,7 @@ from src.utils.config_loader import ConfigLoader
 from src.agents.gemini_agent import GeminiAgent, GeminiAgentError
 from src.orchestrator.topic_validator import TopicValidator, TopicMetadata
 from src.orchestrator.cost_tracker import CostTracker, APIType
+from src.orchestrator.research_scheduler import ResearchScheduler
 from src.research.backends.exceptions import RateLimitError
 from src.research.backends.tavily_backend import TavilyBackend
 from src.database.sqlite_manager import SQLiteManager
@@ -43,6 +44,10 @@ from src.collectors.trends_collector import TrendsCollector
 from src.research.serp_analyzer import SERPAnalyzer
 from src.research.content_scorer import ContentScorer
 from src.research.difficulty_scorer import DifficultyScorer
+from src.research.source_cache import SourceCache
+from src.utils.page_fetcher import AsyncPageFetcher
+from src.utils.page_store import PageStore
+from src.utils.provider_limits import ProviderLimits
 
 logger = get_logger(__name__)
 
@@ -78,7 +83,10 @@ class HybridResearchOrchestrator:
         enable_serp_analysis: bool = False,
         enable_content_scoring: bool = False,
         enable_difficulty_scoring: bool = False,
-        db_path: str = "data/topics.db"
+        db_path: str = "data/topics.db",
+        # Stage 5 concurrency
+        max_concurrent_topics: int = 3,
+        provider_limits: Optional[Dict[str, int]] = None
     ):
         """
         Initialize orchestrator.
@@ -100,6 +108,9 @@ class HybridResearchOrchestrator:
             enable_content_scoring: Enable content quality scoring (default: False)
             enable_difficulty_scoring: Enable difficulty scoring (default: False)
             db_path: Path to SQLite database for collectors (default: data/topics.db)
+            max_concurrent_topics: Max topics researched concurrently in Stage 5 (default: 3)
+            provider_limits: Max concurrent calls per provider, e.g. {"gemini": 2,
+                "tavily": 3, "voyage": 2} (default: ProviderLimits.DEFAULT_LIMITS)
         """
         self.enable_tavily = enable_tavily
         self.enable_searxng = enable_searxng
@@ -116,11 +127,16 @@ class HybridResearchOrchestrator:
         self.enable_serp_analysis = enable_serp_analysis
         self.enable_content_scoring = enable_content_scoring
         self.enable_difficulty_scoring = enable_difficulty_scoring
+        self.max_concurrent_topics = max_concurrent_topics
+
+        # Shared by researcher, reranker and synthesizer across concurrent topics
+        self.provider_limits = ProviderLimits(provider_limits)
 
         # Initialize components (lazy loading)
         self._researcher = None
         self._reranker = None
         self._synthesizer = None
+        self._page_store = None
         self._gemini_agent = None
         self._topic_validator = None
         self._tavily_backend = None
@@ -170,7 +186,8 @@ class HybridResearchOrchestrator:
                 enable_searxng=self.enable_searxng,
                 enable_gemini=self.enable_gemini,
                 enable_rss=self.enable_rss,
-                enable_thenewsapi=self.enable_thenewsapi
+                enable_thenewsapi=self.enable_thenewsapi,
+                provider_limits=self.provider_limits
             )
         return self._researcher
 
@@ -180,17 +197,29 @@ class HybridResearchOrchestrator:
         if self.enable_reranking and self._reranker is None:
             self._reranker = MultiStageReranker(
                 enable_voyage=True,
-                stage3_final_count=25
+                stage3_final_count=25,
+                provider_limits=self.provider_limits
             )
         return self._reranker if self.enable_reranking else None
 
+    @property
+    def page_store(self) -> PageStore:
+        """Lazy load fetched-page store (shared by synthesizer, content scorer, RSS)"""
+        if self._page_store is None:
+            self._page_store = PageStore(db_path="cache/pages.db")
+        return self._page_store
+
     @property
     def synthesizer(self) -> Optional[ContentSynthesizer]:
         """Lazy load synthesizer"""
         if self.enable_synthesis and self._synthesizer is None:
             self._synthesizer = ContentSynthesizer(
                 strategy=PassageExtractionStrategy.BM25_LLM,
-                max_article_words=self.max_article_words
+                max_article_words=self.max_article_words,
+                provider_limits=self.provider_limits,
+                page_fetcher=AsyncPageFetcher(page_store=self.page_store),
+                extract_workers=2,  # trafilatura in processes, concurrent topics share the pool
+                source_cache=SourceCache(self._db_manager) if self._db_manager else None
             )
         return self._synthesizer if self.enable_synthesis else None
 
@@ -240,7 +269,8 @@ class HybridResearchOrchestrator:
                 db_manager=self._db_manager,
                 deduplicator=self._deduplicator,
                 language=self.topic_discovery_language,
-                cache_dir="cache/autocomplete"
+                cache_dir="cache/autocomplete",
+                max_concurrent_requests=6
             )
             logger.info("autocomplete_collector_initialized", language=self.topic_discovery_language)
         return self._autocomplete_collector if self.enable_autocomplete else None
@@ -272,7 +302,7 @@ class HybridResearchOrchestrator:
     def content_scorer(self) -> Optional[ContentScorer]:
         """Lazy load content scorer"""
         if self.enable_content_scoring and self._content_scorer is None:
-            self._content_scorer = ContentScorer()
+            self._content_scorer = ContentScorer(page_store=self.page_store)
             logger.info("content_scorer_initialized")
         return self._content_scorer if self.enable_content_scoring else None
 
@@ -1353,7 +1383,7 @@ Return JSON:
             try:
                 logger.info("collecting_autocomplete_topics", seed_count=len(seed_keywords))
                 # Use QUESTIONS only by default (high value, low noise)
-                autocomplete_docs = self.autocomplete_collector.collect_suggestions(
+                autocomplete_docs = await self.autocomplete_collector.collect_suggestions_async(
                     seed_keywords=seed_keywords[:5],  # Limit to top 5 to avoid rate limits
                     expansion_types=[ExpansionType.QUESTIONS],  # Questions only
                     max_per_keyword=max_topics_per_collector
@@ -1543,6 +1573,7 @@ Return JSON:
                 from src.collectors.rss_collector import RSSCollector
                 from src.collectors.dynamic_feed_generator import DynamicFeedGenerator
                 from src.collectors.rss_feed_database import RSSFeedDatabase
+                from src.collectors.feed_state_store import FeedStateStore
 
                 logger.info(
                     "collecting_rss_topics",
@@ -1553,11 +1584,14 @@ Return JSON:
                     english_ratio=english_ratio if language != "en" else 1.0
                 )
 
-                # Initialize RSS collector
+                # Initialize RSS collector (feed health shared with the curated database)
+                feed_state_store = FeedStateStore()
                 rss_collector = RSSCollector(
                     config=self._collector_config,
                     db_manager=self._db_manager,
-                    deduplicator=self._deduplicator
+                    deduplicator=self._deduplicator,
+                    page_store=self.page_store,
+                    feed_state_store=feed_state_store
                 )
 
                 dynamic_gen = DynamicFeedGenerator()
@@ -1680,12 +1714,13 @@ Return JSON:
                     # Add curated feeds from database
                     if domain and vertical and domain.lower() != "general":
                         try:
-                            feed_db = RSSFeedDatabase()
+                            feed_db = RSSFeedDatabase(feed_state_store=feed_state_store)
                             curated_feeds = feed_db.get_feeds(
                                 domain=domain.lower(),
                                 vertical=vertical.lower(),
                                 min_quality_score=0.6,
-                                limit=5
+                                limit=5,
+                                healthy_only=True
                             )
                             feed_urls.extend([feed["url"] for feed in curated_feeds])
                             logger.info("added_curated_feeds", count=len(curated_feeds), domain=domain, vertical=vertical)
@@ -1980,52 +2015,57 @@ Return JSON:
                 # Step 4b: Content Scoring
                 if self.content_scorer and serp_data:
                     logger.info("intelligence_content_scoring_start", topic=topic)
-                    for i, result in enumerate(serp_data["results"][:10], 1):
-                        url = result.get("url") or result.get("link")
-                        if url:
+                    ranked_urls = [
+                        (i, result.get("url") or result.get("link"))
+                        for i, result in enumerate(serp_data["results"][:10], 1)
+                    ]
+                    ranked_urls = [(i, url) for i, url in ranked_urls if url]
+
+                    # Fetch all URLs concurrently over one pooled client
+                    scores = await self.content_scorer.score_urls(
+                        urls=[url for _, url in ranked_urls],
+                        target_keyword=topic
+                    )
+
+                    for (i, url), score in zip(ranked_urls, scores):
+                        if score is None:
+                            continue  # Fetch/parse failure already logged
+
+                        # Convert ContentScore dataclass to dict
+                        score_data = {
+                            "url": score.url,
+                            "position": i,
+                            "quality_score": score.quality_score,
+                            "word_count": score.word_count,
+                            "flesch_reading_ease": score.flesch_reading_ease,
+                            "keyword_density": score.keyword_density,
+                            "h1_count": score.h1_count,
+                            "h2_count": score.h2_count,
+                            "h3_count": score.h3_count,
+                            "list_count": score.list_count,
+                            "image_count": score.image_count,
+                            "entity_count": score.entity_count,
+                            "published_date": score.published_date,
+                            "content_hash": score.content_hash
+                        }
+
+                        # Add to content_scores list FIRST
+                        content_scores.append(score_data)
+
+                        # Then save to database (optional, non-critical)
+                        if self._db_manager:
                             try:
-                                # Run synchronous scoring in thread pool
-                                score = await asyncio.to_thread(
-                                    self.content_scorer.score_url,
+                                topic_id = topic.lower().replace(" ", "-")
+                                self._db_manager.save_content_score(
                                     url=url,
-                                    target_keyword=topic
+                                    quality_score=score.quality_score,
+                                    metrics=self.content_scorer.score_to_dict(score),
+                                    topic_id=topic_id
                                 )
-                                # Convert ContentScore dataclass to dict
-                                score_data = {
-                                    "url": score.url,
-                                    "position": i,
-                                    "quality_score": score.quality_score,
-                                    "word_count": score.word_count,
-                                    "flesch_reading_ease": score.flesch_reading_ease,
-                                    "keyword_density": score.keyword_density,
-                                    "h1_count": score.h1_count,
-                                    "h2_count": score.h2_count,
-                                    "h3_count": score.h3_count,
-                                    "list_count": score.list_count,
-                                    "image_count": score.image_count,
-                                    "entity_count": score.entity_count,
-                                    "published_date": score.published_date,
-                                    "content_hash": score.content_hash
-                                }
-
-                                # Add to content_scores list FIRST
-                                content_scores.append(score_data)
-
-                                # Then save to database (optional, non-critical)
-                                if self._db_manager:
-                                    try:
-                                        topic_id = topic.lower().replace(" ", "-")
-                                        self._db_manager.save_content_score(
-                                            topic_id=topic_id,
-                                            url=url,
-                                            score_data=score_data
-                                        )
-                                    except Exception as db_error:
-                                        logger.warning("content_score_db_save_failed",
-                                                     url=url, error=str(db_error))
-                                        # Continue - db save failure is non-critical
-                            except Exception as e:
-                                logger.warning("content_scoring_failed", url=url, error=str(e))
+                            except Exception as db_error:
+                                logger.warning("content_score_db_save_failed",
+                                             url=url, error=str(db_error))
+                                # Continue - db save failure is non-critical
                     logger.info("intelligence_content_scoring_complete",
                               scored_urls=len(content_scores))
 
@@ -2117,7 +2157,8 @@ Return JSON:
         website_url: str,
         customer_info: Dict,
         max_topics_to_research: int = 5,
-        discover_competitor_feeds: bool = False
+        discover_competitor_feeds: bool = False,
+        max_concurrent_topics: Optional[int] = None
     ) -> Dict:
         """
         Run complete hybrid pipeline.
@@ -2127,6 +2168,8 @@ Return JSON:
             customer_info: Dict with market, vertical, language, domain
             max_topics_to_research: Max topics to research (default: 5)
             discover_competitor_feeds: Enable Phase B feed discovery (default: False)
+            max_concurrent_topics: Override Stage 5 concurrency
+                (default: self.max_concurrent_topics)
 
         Returns:
             Dict with:
@@ -2136,6 +2179,8 @@ Return JSON:
                 - research_results: List[Dict] - Stage 5 results for each topic
                 - total_cost: float - Total pipeline cost
                 - total_duration_sec: float - Total processing time
+                - research_wall_time_sec: float - Stage 5 elapsed time
+                - research_topic_time_sec: float - Sum of per-topic durations
         """
         logger.info(
             "pipeline_start",
@@ -2200,9 +2245,12 @@ Return JSON:
         logger.info("context_extracted", tone=brand_tone,
                    keywords_count=len(keywords), themes_count=len(themes))
 
-        research_results = []
-        for topic in validated_topics:
-            result = await self.research_topic(
+        scheduler = ResearchScheduler(
+            max_concurrent_topics=max_concurrent_topics or self.max_concurrent_topics
+        )
+        research_batch = await scheduler.run(
+            topics=validated_topics,
+            research_fn=lambda topic: self.research_topic(
                 topic=topic,
                 config=customer_info,
                 brand_tone=brand_tone,
@@ -2211,16 +2259,21 @@ Return JSON:
                 keywords=keywords,
                 themes=themes
             )
-            research_results.append(result)
-            total_cost += result.get("cost", 0.0)
+        )
+        research_results = research_batch["results"]
+        total_cost += research_batch["total_cost"]
 
         total_duration = (datetime.now() - start_time).total_seconds()
 
+        # Fetched-page reuse across synthesizer, content scorer and RSS
+        page_store_stats = self._page_store.get_stats() if self._page_store else {}
+
         logger.info(
             "pipeline_complete",
             topics_researched=len(research_results),
             total_cost=f"${total_cost:.4f}",
-            total_duration=f"{total_duration:.1f}s"
+            total_duration=f"{total_duration:.1f}s",
+            page_cache_hit_rate=f"{page_store_stats.get('hit_rate', 0.0):.0%}"
         )
 
         return {
@@ -2232,5 +2285,8 @@ Return JSON:
             "validation_data": validation_data,
             "research_results": research_results,
             "total_cost": total_cost,
-            "total_duration_sec": total_duration
+            "total_duration_sec": total_duration,
+            "research_wall_time_sec": research_batch["wall_time_sec"],
+            "research_topic_time_sec": research_batch["topic_time_sec"],
+            "page_store_stats": page_store_stats
         }
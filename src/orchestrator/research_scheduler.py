@@ -0,0 +1,119 @@
+"""
+Research Scheduler for Hybrid Research Orchestrator
+
+Runs Stage 5 topic research with bounded concurrency. Each topic is
+dominated by network waits (backend searches, reranker calls, content
+fetches, Gemini synthesis), so researching several topics at once cuts
+wall time roughly by the concurrency factor. Per-provider API limits are
+enforced separately by ProviderLimits inside the research components.
+
+Usage:
+    scheduler = ResearchScheduler(max_concurrent_topics=3)
+
+    batch = await scheduler.run(
+        topics=["PropTech Trends", "Smart Buildings"],
+        research_fn=lambda topic: orchestrator.research_topic(topic, config)
+    )
+
+    batch["results"]         # Per-topic results, in input order
+    batch["total_cost"]      # Sum of per-topic costs
+    batch["wall_time_sec"]   # Elapsed time for the whole batch
+    batch["topic_time_sec"]  # Sum of per-topic durations (sequential equivalent)
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResearchScheduler:
+    """
+    Bounded-concurrency scheduler for per-topic research.
+
+    Features:
+    - At most max_concurrent_topics topics researched at once
+    - Results returned in input order
+    - Cost and duration aggregated across topics
+    - Fail-fast: first failure cancels remaining topics and is re-raised
+    """
+
+    def __init__(self, max_concurrent_topics: int = 3):
+        """
+        Initialize scheduler
+
+        Args:
+            max_concurrent_topics: Max topics researched concurrently
+                (1 = sequential, values < 1 are treated as 1)
+        """
+        self.max_concurrent_topics = max(1, max_concurrent_topics)
+
+    async def run(
+        self,
+        topics: List[str],
+        research_fn: Callable[[str], Awaitable[Dict]]
+    ) -> Dict:
+        """
+        Research all topics with bounded concurrency
+
+        Args:
+            topics: Topics to research
+            research_fn: Coroutine function researching one topic, returning
+                a result dict with optional "cost" and "duration_sec"
+
+        Returns:
+            Dict with:
+                - results: List[Dict] - research_fn results, in input order
+                - total_cost: float - Sum of result["cost"]
+                - wall_time_sec: float - Elapsed time for the batch
+                - topic_time_sec: float - Sum of result["duration_sec"]
+                - max_concurrent_topics: int - Concurrency used
+
+        Raises:
+            Exception: First exception raised by research_fn (remaining
+                topics are cancelled)
+        """
+        logger.info(
+            "research_batch_start",
+            topics_count=len(topics),
+            max_concurrent_topics=self.max_concurrent_topics
+        )
+        start = time.monotonic()
+        semaphore = asyncio.Semaphore(self.max_concurrent_topics)
+
+        async def research_one(topic: str) -> Dict:
+            async with semaphore:
+                return await research_fn(topic)
+
+        tasks = [asyncio.ensure_future(research_one(topic)) for topic in topics]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Fail fast: don't leave orphaned topic research running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        wall_time = time.monotonic() - start
+        total_cost = sum(result.get("cost", 0.0) for result in results)
+        topic_time = sum(result.get("duration_sec", 0.0) for result in results)
+
+        logger.info(
+            "research_batch_complete",
+            topics_count=len(results),
+            total_cost=f"${total_cost:.4f}",
+            wall_time=f"{wall_time:.1f}s",
+            topic_time=f"{topic_time:.1f}s"
+        )
+
+        return {
+            "results": list(results),
+            "total_cost": total_cost,
+            "wall_time_sec": wall_time,
+            "topic_time_sec": topic_time,
+            "max_concurrent_topics": self.max_concurrent_topics
+        }
@@ -5,10 +5,25 @@ MinHash/LSH-based near-duplicate detection with canonical URL normalization.
 
 Target: <5% deduplication rate
 Uses: datasketch library for efficient similarity search
+
+Cross-run index (optional, index_path):
+- SQLite file (e.g. cache/dedup.db) with seen canonical URLs and LSH band
+  buckets, opened on first use and queried per document (nothing is loaded
+  into memory at startup)
+- Updated incrementally on every add(), so documents collected in earlier
+  runs are detected before they are fetched/inserted again
+- remove() takes documents back out (e.g. when storing them failed), so
+  they are collected again on the next run instead of being skipped
 """
 
-from typing import Dict, Set, List
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Set, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+import numpy as np
 from datasketch import MinHash, MinHashLSH
 
 from src.models.document import Document
@@ -26,6 +41,7 @@ class Deduplicator:
     - Canonical URL normalization
     - Statistics tracking
     - Configurable similarity threshold
+    - Optional persistent cross-run index (SQLite LSH band tables)
     """
 
     # Common tracking parameters to remove
@@ -35,16 +51,24 @@ class Deduplicator:
         '_ga', '_gl', 'mc_cid', 'mc_eid'
     }
 
-    def __init__(self, threshold: float = 0.7, num_perm: int = 128):
+    def __init__(
+        self,
+        threshold: float = 0.7,
+        num_perm: int = 128,
+        index_path: Optional[str] = None
+    ):
         """
         Initialize deduplicator
 
         Args:
             threshold: Jaccard similarity threshold (0.7 = 70% similar)
             num_perm: Number of permutations for MinHash (higher = more accurate, slower)
+            index_path: SQLite file for the persistent cross-run index
+                (default: None = in-memory only, forgotten between runs)
         """
         self.threshold = threshold
         self.num_perm = num_perm
+        self.index_path = index_path
 
         # LSH index for fast similarity search
         self.lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
@@ -52,11 +76,23 @@ class Deduplicator:
         # Track seen canonical URLs
         self.seen_urls: Set[str] = set()
 
+        # Persistent index connection (opened lazily, see _get_index)
+        self._index_conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+        # Last computed MinHash, keyed by content digest (is_duplicate -> add)
+        self._last_minhash: Optional[Tuple[str, MinHash]] = None
+
         # Statistics
         self.total_documents = 0
         self.duplicates_found = 0
 
-        logger.info("deduplicator_initialized", threshold=threshold, num_perm=num_perm)
+        logger.info(
+            "deduplicator_initialized",
+            threshold=threshold,
+            num_perm=num_perm,
+            persistent=index_path is not None
+        )
 
     def is_duplicate(self, doc: Document) -> bool:
         """
@@ -68,24 +104,41 @@ class Deduplicator:
         Returns:
             True if document is duplicate, False otherwise
         """
-        self.total_documents += 1
+        with self._lock:
+            self.total_documents += 1
+
+            # Check canonical URL first (fast)
+            if doc.canonical_url in self.seen_urls or self._index_has_url(doc.canonical_url):
+                logger.info("duplicate_detected_url", doc_id=doc.id, url=doc.canonical_url)
+                self.duplicates_found += 1
+                return True
 
-        # Check canonical URL first (fast)
-        if doc.canonical_url in self.seen_urls:
-            logger.info("duplicate_detected_url", doc_id=doc.id, url=doc.canonical_url)
-            self.duplicates_found += 1
-            return True
+            # Check content similarity (MinHash/LSH)
+            minhash = self._get_minhash(doc.content)
+            duplicates = self.lsh.query(minhash) or self._index_query(minhash)
 
-        # Check content similarity (MinHash/LSH)
-        minhash = self.compute_minhash(doc.content)
-        duplicates = self.lsh.query(minhash)
+            if len(duplicates) > 0:
+                logger.info("duplicate_detected_content", doc_id=doc.id, similar_to=duplicates)
+                self.duplicates_found += 1
+                return True
 
-        if len(duplicates) > 0:
-            logger.info("duplicate_detected_content", doc_id=doc.id, similar_to=duplicates)
-            self.duplicates_found += 1
-            return True
+            return False
 
-        return False
+    def has_seen_url(self, canonical_url: str) -> bool:
+        """
+        Check if a canonical URL is already indexed (no content needed)
+
+        Lets collectors skip fetching articles they have already seen.
+        Does not count towards duplicate statistics.
+
+        Args:
+            canonical_url: Canonical URL (see get_canonical_url)
+
+        Returns:
+            True if URL was added before (this run or, with index_path, earlier runs)
+        """
+        with self._lock:
+            return canonical_url in self.seen_urls or self._index_has_url(canonical_url)
 
     def add(self, doc: Document) -> None:
         """
@@ -94,15 +147,52 @@ class Deduplicator:
         Args:
             doc: Document to add
         """
-        # Add canonical URL
-        self.seen_urls.add(doc.canonical_url)
+        with self._lock:
+            # Add canonical URL
+            self.seen_urls.add(doc.canonical_url)
 
-        # Add content hash to LSH
-        minhash = self.compute_minhash(doc.content)
-        self.lsh.insert(doc.id, minhash)
+            # Add content hash to LSH (reuses the MinHash from is_duplicate)
+            minhash = self._get_minhash(doc.content)
+            self.lsh.insert(doc.id, minhash)
+
+            # Stored with the document (documents.minhash_signature)
+            doc.minhash_signature = self.encode_signature(minhash)
+
+            self._index_add(doc, minhash)
 
         logger.info("document_added_to_index", doc_id=doc.id)
 
+    def remove(self, documents: List[Document]) -> None:
+        """
+        Remove documents from the deduplication index
+
+        Use when documents returned by deduplicate() could not be stored:
+        otherwise their URLs and content would count as seen and the
+        documents would be skipped on every later run.
+
+        Args:
+            documents: Documents added before
+        """
+        with self._lock:
+            for doc in documents:
+                self.seen_urls.discard(doc.canonical_url)
+                if doc.id in self.lsh:
+                    self.lsh.remove(doc.id)
+
+            conn = self._get_index()
+            if conn is not None:
+                conn.executemany(
+                    "DELETE FROM seen_urls WHERE canonical_url = ? AND doc_id = ?",
+                    [(doc.canonical_url, doc.id) for doc in documents]
+                )
+                conn.executemany(
+                    "DELETE FROM lsh_buckets WHERE doc_id = ?",
+                    [(doc.id,) for doc in documents]
+                )
+                conn.commit()
+
+        logger.info("documents_removed_from_index", count=len(documents))
+
     def deduplicate(self, documents: List[Document]) -> List[Document]:
         """
         Deduplicate a list of documents.
@@ -175,6 +265,160 @@ class Deduplicator:
 
         return minhash
 
+    def _get_minhash(self, content: str) -> MinHash:
+        """
+        Compute MinHash for content once per document
+
+        is_duplicate() followed by add() for the same content reuses the
+        signature instead of hashing every word again.
+
+        Args:
+            content: Text content to hash
+
+        Returns:
+            MinHash object
+        """
+        digest = hashlib.sha1(content.encode('utf-8')).hexdigest()
+        if self._last_minhash and self._last_minhash[0] == digest:
+            return self._last_minhash[1]
+
+        minhash = self.compute_minhash(content)
+        self._last_minhash = (digest, minhash)
+        return minhash
+
+    @staticmethod
+    def encode_signature(minhash: MinHash) -> str:
+        """
+        Serialize MinHash hash values for storage (hex, little-endian uint64)
+
+        Args:
+            minhash: MinHash to serialize
+
+        Returns:
+            Hex string
+        """
+        return minhash.hashvalues.astype('<u8').tobytes().hex()
+
+    def decode_signature(self, signature: str) -> MinHash:
+        """
+        Restore a MinHash from encode_signature() output
+
+        Args:
+            signature: Hex string
+
+        Returns:
+            MinHash object
+        """
+        minhash = MinHash(num_perm=self.num_perm)
+        minhash.hashvalues = np.frombuffer(bytes.fromhex(signature), dtype='<u8').astype(np.uint64)
+        return minhash
+
+    # === Persistent index ===
+
+    def _get_index(self) -> Optional[sqlite3.Connection]:
+        """Open the persistent index on first use (None if not configured)"""
+        if self.index_path is None:
+            return None
+
+        if self._index_conn is None:
+            Path(self.index_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.index_path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_urls (
+                    canonical_url TEXT PRIMARY KEY,
+                    doc_id TEXT NOT NULL
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS lsh_buckets (
+                    band INTEGER NOT NULL,
+                    bucket BLOB NOT NULL,
+                    doc_id TEXT NOT NULL,
+                    PRIMARY KEY (band, bucket, doc_id)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS index_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+
+            # Band layout depends on threshold/num_perm - reset if it changed
+            params = f"{self.num_perm}:{self.lsh.b}:{self.lsh.r}"
+            row = conn.execute("SELECT value FROM index_meta WHERE key = 'lsh_params'").fetchone()
+            if row is not None and row[0] != params:
+                logger.warning("dedup_index_params_changed", old=row[0], new=params)
+                conn.execute("DELETE FROM lsh_buckets")
+            conn.execute(
+                "INSERT OR REPLACE INTO index_meta (key, value) VALUES ('lsh_params', ?)",
+                (params,)
+            )
+            conn.commit()
+
+            self._index_conn = conn
+            logger.info("dedup_index_opened", index_path=self.index_path)
+
+        return self._index_conn
+
+    def _band_buckets(self, minhash: MinHash) -> List[Tuple[int, bytes]]:
+        """LSH (band, bucket) keys for a MinHash, same banding as self.lsh"""
+        hashvalues = minhash.hashvalues.astype('<u8')
+        return [
+            (band, hashlib.blake2b(hashvalues[start:end].tobytes(), digest_size=16).digest())
+            for band, (start, end) in enumerate(self.lsh.hashranges)
+        ]
+
+    def _index_has_url(self, canonical_url: str) -> bool:
+        """Check the persistent index for a canonical URL"""
+        conn = self._get_index()
+        if conn is None:
+            return False
+        row = conn.execute(
+            "SELECT 1 FROM seen_urls WHERE canonical_url = ?", (canonical_url,)
+        ).fetchone()
+        return row is not None
+
+    def _index_query(self, minhash: MinHash) -> List[str]:
+        """Find indexed documents sharing at least one LSH band bucket"""
+        conn = self._get_index()
+        if conn is None:
+            return []
+
+        buckets = self._band_buckets(minhash)
+        where = " OR ".join(["(band = ? AND bucket = ?)"] * len(buckets))
+        rows = conn.execute(
+            f"SELECT DISTINCT doc_id FROM lsh_buckets WHERE {where} LIMIT 10",
+            [value for bucket in buckets for value in bucket]
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def _index_add(self, doc: Document, minhash: MinHash) -> None:
+        """Record a document's URL and band buckets in the persistent index"""
+        conn = self._get_index()
+        if conn is None:
+            return
+
+        conn.execute(
+            "INSERT OR IGNORE INTO seen_urls (canonical_url, doc_id) VALUES (?, ?)",
+            (doc.canonical_url, doc.id)
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO lsh_buckets (band, bucket, doc_id) VALUES (?, ?, ?)",
+            [(band, bucket, doc.id) for band, bucket in self._band_buckets(minhash)]
+        )
+        conn.commit()
+
+    def close(self) -> None:
+        """Close the persistent index connection (reopened on next use)"""
+        with self._lock:
+            if self._index_conn is not None:
+                self._index_conn.close()
+                self._index_conn = None
+
     def get_canonical_url(self, url: str) -> str:
         """
         Get canonical URL (alias for normalize_url for compatibility)
@@ -278,8 +522,17 @@ class Deduplicator:
         logger.info("stats_reset")
 
     def clear(self) -> None:
-        """Clear all stored data (URLs and LSH index)"""
-        self.seen_urls.clear()
-        self.lsh = MinHashLSH(threshold=self.threshold, num_perm=self.num_perm)
+        """Clear all stored data (URLs and LSH index, including the persistent index)"""
+        with self._lock:
+            self.seen_urls.clear()
+            self.lsh = MinHashLSH(threshold=self.threshold, num_perm=self.num_perm)
+            self._last_minhash = None
+
+            conn = self._get_index()
+            if conn is not None:
+                conn.execute("DELETE FROM seen_urls")
+                conn.execute("DELETE FROM lsh_buckets")
+                conn.commit()
+
         self.reset_stats()
         logger.info("deduplicator_cleared")
@@ -10,6 +10,7 @@ Features:
 - Focus: Trends, predictions, market shifts
 """
 
+import asyncio
 import traceback
 from typing import List, Optional
 import os
@@ -176,7 +177,9 @@ Format your response as a JSON array of sources."""
 
             # Execute with GeminiAgent
             # Note: GeminiAgent.generate() handles grounding automatically
-            response = self.agent.generate(
+            # Sync agent, run in thread pool so concurrent searches overlap
+            response = await asyncio.to_thread(
+                self.agent.generate,
                 prompt=prompt,
                 response_schema={
                     "type": "object",
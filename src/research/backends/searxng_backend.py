@@ -11,6 +11,7 @@ Features:
 - Focus: Breadth, recency, diverse perspectives
 """
 
+import asyncio
 import traceback
 from typing import List, Optional
 from urllib.parse import urlparse
@@ -138,7 +139,9 @@ class SearXNGBackend(SearchBackend):
             )
 
             # Execute search
-            search_results = self.client.search(
+            # Sync client, run in thread pool so concurrent searches overlap
+            search_results = await asyncio.to_thread(
+                self.client.search,
                 query=query,
                 config=config,
                 max_results=max_results
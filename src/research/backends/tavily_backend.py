@@ -10,6 +10,7 @@ Features:
 - Focus: Depth and quality over breadth
 """
 
+import asyncio
 import os
 import traceback
 from typing import List, Optional
@@ -138,7 +139,9 @@ class TavilyBackend(SearchBackend):
             include_domains = kwargs.get('include_domains', [])
             exclude_domains = kwargs.get('exclude_domains', [])
 
-            response = self.client.search(
+            # Sync client, run in thread pool so concurrent searches overlap
+            response = await asyncio.to_thread(
+                self.client.search,
                 query=query,
                 search_depth=search_depth,
                 max_results=max_results,
@@ -14,6 +14,7 @@ Metrics (0-100 scale):
 Pattern: Service class with pure scoring functions
 """
 
+import asyncio
 import re
 import hashlib
 import requests
@@ -25,6 +26,8 @@ from bs4 import BeautifulSoup
 import textstat
 
 from src.utils.logger import get_logger
+from src.utils.page_fetcher import AsyncPageFetcher, PageFetcher
+from src.utils.page_store import PageStore
 
 logger = get_logger(__name__)
 
@@ -84,7 +87,10 @@ class ContentScorer:
     def __init__(
         self,
         timeout: int = 30,
-        user_agent: str = "Mozilla/5.0 (compatible; ContentScorer/1.0)"
+        user_agent: str = "Mozilla/5.0 (compatible; ContentScorer/1.0)",
+        max_concurrency: int = 10,
+        max_per_host: int = 2,
+        page_store: Optional[PageStore] = None
     ):
         """
         Initialize content scorer.
@@ -92,9 +98,27 @@ class ContentScorer:
         Args:
             timeout: Request timeout in seconds (default: 30)
             user_agent: User agent string for requests
+            max_concurrency: Max concurrent connections in score_urls() (default: 10)
+            max_per_host: Max concurrent requests per host in score_urls() (default: 2)
+            page_store: Shared fetched-page store (None = always download)
         """
         self.timeout = timeout
         self.user_agent = user_agent
+
+        # Keep-alive session for score_url(), pooled async client for score_urls()
+        self.page_fetcher = PageFetcher(
+            timeout=timeout,
+            user_agent=user_agent,
+            page_store=page_store
+        )
+        self.async_page_fetcher = AsyncPageFetcher(
+            timeout=timeout,
+            max_connections=max_concurrency,
+            max_per_host=max_per_host,
+            user_agent=user_agent,
+            page_store=page_store
+        )
+
         logger.info("content_scorer_initialized", timeout=timeout)
 
     def score_url(
@@ -130,6 +154,78 @@ class ContentScorer:
         # Fetch HTML
         html = self._fetch_html(url)
 
+        return self.score_html(url, html, target_keyword)
+
+    async def score_urls(
+        self,
+        urls: List[str],
+        target_keyword: Optional[str] = None
+    ) -> List[Optional[ContentScore]]:
+        """
+        Score content quality for several URLs concurrently.
+
+        All pages are fetched over one pooled HTTP client (at most
+        max_per_host requests per host in flight) through the shared page
+        store. HTML parsing and scoring run in worker threads so they don't
+        block the event loop.
+
+        Args:
+            urls: URLs to analyze
+            target_keyword: Optional keyword to analyze density for
+
+        Returns:
+            List of ContentScore aligned with urls (None where fetch or
+            parsing failed; failures are logged, never raised)
+
+        Example:
+            >>> scorer = ContentScorer()
+            >>> scores = await scorer.score_urls(serp_urls, target_keyword="PropTech")
+            >>> scored = [s for s in scores if s is not None]
+        """
+        if not urls:
+            return []
+
+        logger.info("scoring_urls", url_count=len(urls), keyword=target_keyword)
+
+        async def score_one(url: str) -> Optional[ContentScore]:
+            html = await self.async_page_fetcher.fetch(url)
+            if html is None:
+                return None  # Fetch failure already logged
+            try:
+                return await asyncio.to_thread(self.score_html, url, html, target_keyword)
+            except Exception as e:
+                logger.warning("content_scoring_failed", url=url, error=str(e))
+                return None
+
+        scores = await asyncio.gather(*(score_one(url) for url in urls))
+
+        logger.info(
+            "urls_scored",
+            url_count=len(urls),
+            scored=sum(1 for score in scores if score is not None)
+        )
+
+        return list(scores)
+
+    def score_html(
+        self,
+        url: str,
+        html: str,
+        target_keyword: Optional[str] = None
+    ) -> ContentScore:
+        """
+        Score content quality for already-fetched HTML.
+
+        CPU-bound (BeautifulSoup + textstat), no network access.
+
+        Args:
+            url: URL the HTML was fetched from
+            html: Raw HTML content
+            target_keyword: Optional keyword to analyze density for
+
+        Returns:
+            ContentScore with all metrics
+        """
         # Parse HTML
         soup = BeautifulSoup(html, 'lxml')
 
@@ -226,12 +322,8 @@ class ContentScorer:
         Raises:
             requests.RequestException: If fetch fails
         """
-        headers = {"User-Agent": self.user_agent}
-
         try:
-            response = requests.get(url, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-            return response.text
+            return self.page_fetcher.fetch(url)
         except requests.RequestException as e:
             logger.error("html_fetch_failed", url=url, error=str(e))
             raise
@@ -280,7 +280,8 @@ class DeepResearcher:
                 cached_count, new_count = self._cache_sources(
                     sources=sources,
                     report=report,
-                    topic_id=topic_id
+                    topic_id=topic_id,
+                    scraped_contents=self._get_scraped_contents(researcher)
                 )
 
                 # Update cache statistics
@@ -437,19 +438,49 @@ class DeepResearcher:
         slug = re.sub(r'[-\s]+', '-', slug)
         return slug.strip('-')
 
+    def _get_scraped_contents(self, researcher) -> Dict[str, str]:
+        """
+        Collect page text gpt-researcher scraped during research
+
+        Args:
+            researcher: GPTResearcher instance after conduct_research()
+
+        Returns:
+            Dict mapping source URL to scraped text (empty if unavailable)
+        """
+        research_sources = getattr(researcher, 'research_sources', None)
+        if not isinstance(research_sources, list):
+            return {}
+
+        contents = {}
+        for item in research_sources:
+            if not isinstance(item, dict) or not item.get('url'):
+                continue
+            text = item.get('raw_content') or item.get('content')
+            if isinstance(text, str) and text.strip():
+                contents[item['url']] = text
+
+        return contents
+
     def _cache_sources(
         self,
         sources: List[str],
         report: str,
-        topic_id: str
+        topic_id: str,
+        scraped_contents: Optional[Dict[str, str]] = None
     ) -> tuple[int, int]:
         """
         Cache sources after research
 
+        Full scraped text is stored for reuse (ContentSynthesizer serves it
+        without refetching). Sources without scraped text only get a report
+        excerpt as preview, which is never stored as content.
+
         Args:
             sources: List of source URLs from research
             report: Generated report text
             topic_id: Topic identifier for tracking
+            scraped_contents: Optional URL -> scraped page text
 
         Returns:
             Tuple of (cached_count, new_count)
@@ -458,14 +489,25 @@ class DeepResearcher:
         """
         cached_count = 0
         new_count = 0
+        scraped_contents = scraped_contents or {}
 
         for url in sources:
             # Check if already cached
             existing = self.source_cache.get_source(url)
+            scraped = scraped_contents.get(url)
 
             if existing:
-                # Source already in cache - mark usage for this topic
-                self.source_cache.mark_usage(url, topic_id)
+                if scraped and not self.source_cache.get_content(url):
+                    # Cached without fresh content - keep the text just scraped
+                    self.source_cache.save_source(
+                        url=url,
+                        title=existing['title'],
+                        content=scraped,
+                        topic_id=topic_id
+                    )
+                else:
+                    # Source already in cache - mark usage for this topic
+                    self.source_cache.mark_usage(url, topic_id)
                 cached_count += 1
                 logger.debug("source_cache_hit", url=url[:50], topic_id=topic_id)
             else:
@@ -481,10 +523,11 @@ class DeepResearcher:
                 self.source_cache.save_source(
                     url=url,
                     title=title,
-                    content=content_preview,
+                    content=scraped or content_preview,
                     topic_id=topic_id,
                     author=None,
-                    published_at=None
+                    published_at=None,
+                    store_content=bool(scraped)
                 )
                 new_count += 1
                 logger.debug("source_cache_miss_saved", url=url[:50], topic_id=topic_id)
@@ -43,6 +43,7 @@ from src.research.backends.exceptions import BackendUnavailableError, Authentica
 from src.collectors.rss_collector import RSSCollector
 from src.collectors.thenewsapi_collector import TheNewsAPICollector, TheNewsAPIError
 from src.utils.logger import get_logger
+from src.utils.provider_limits import ProviderLimits, provider_slot
 
 logger = get_logger(__name__)
 
@@ -84,6 +85,7 @@ class DeepResearcher:
         enable_gemini: bool = True,
         enable_rss: bool = True,
         enable_thenewsapi: bool = True,
+        provider_limits: Optional[ProviderLimits] = None,
         _testing_mode: bool = False
     ):
         """
@@ -102,12 +104,14 @@ class DeepResearcher:
             enable_gemini: Enable Gemini API backend (default: True)
             enable_rss: Enable RSS collector (default: True)
             enable_thenewsapi: Enable TheNewsAPI collector (default: True)
+            provider_limits: Shared per-provider concurrency limits (backend searches)
             _testing_mode: Skip source validation for testing (default: False)
         """
         # Store dependencies for collectors
         self.config = config
         self.db_manager = db_manager
         self.deduplicator = deduplicator
+        self.provider_limits = provider_limits
 
         # Initialize backends (search)
         self.backends = {}
@@ -418,7 +422,8 @@ class DeepResearcher:
         )
 
         backend = self.backends[backend_name]
-        results = await backend.search(query, max_results=max_results)
+        async with provider_slot(self.provider_limits, backend_name):
+            results = await backend.search(query, max_results=max_results)
 
         logger.info(
             "backend_search_success",
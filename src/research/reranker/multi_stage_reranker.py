@@ -35,17 +35,20 @@ Example:
     print(f"Top source: {reranked[0]['url']} (score: {reranked[0]['final_score']:.3f})")
 """
 
+import asyncio
 import os
 from typing import List, Dict, Optional
 from datetime import datetime
 from urllib.parse import urlparse
 import math
 
+import numpy as np
 from rank_bm25 import BM25Okapi
 from datasketch import MinHash
 
 from src.utils.logger import get_logger
 from src.utils.config_loader import FullConfig
+from src.utils.provider_limits import ProviderLimits, provider_slot
 
 logger = get_logger(__name__)
 
@@ -55,6 +58,12 @@ class RerankingError(Exception):
     pass
 
 
+def _shingles(content: str) -> List[bytes]:
+    """Word 3-gram shingles of content (MinHash input)"""
+    words = content.lower().split()
+    return [' '.join(words[i:i+3]).encode('utf-8') for i in range(len(words) - 2)]
+
+
 class MultiStageReranker:
     """
     3-stage cascaded reranker for SEO-optimized source ranking
@@ -83,13 +92,17 @@ class MultiStageReranker:
     # Freshness decay parameters (Query Deserves Freshness)
     FRESHNESS_HALF_LIFE_DAYS = 30  # Score halves every 30 days
 
+    # MinHash permutations for novelty signatures
+    MINHASH_NUM_PERM = 128
+
     def __init__(
         self,
         voyage_api_key: Optional[str] = None,
         enable_voyage: bool = True,
         stage1_threshold: float = 0.0,
         stage2_threshold: float = 0.3,
-        stage3_final_count: int = 25
+        stage3_final_count: int = 25,
+        provider_limits: Optional[ProviderLimits] = None
     ):
         """
         Initialize multi-stage reranker
@@ -100,8 +113,10 @@ class MultiStageReranker:
             stage1_threshold: Minimum BM25 score to pass Stage 1 (default: 0.0 = keep all)
             stage2_threshold: Minimum Voyage Lite score to pass Stage 2 (default: 0.3)
             stage3_final_count: Number of final sources after Stage 3 (default: 25)
+            provider_limits: Shared per-provider concurrency limits (Voyage calls)
         """
         self.enable_voyage = enable_voyage
+        self.provider_limits = provider_limits
         self.stage1_threshold = stage1_threshold
         self.stage2_threshold = stage2_threshold
         self.stage3_final_count = stage3_final_count
@@ -326,13 +341,15 @@ class MultiStageReranker:
                 for s in sources
             ]
 
-            # Call Voyage Lite API
-            rerank_response = self.voyage_client.rerank(
-                query=query,
-                documents=documents,
-                model='rerank-lite-1',
-                top_k=len(sources)  # Return all, filter by threshold
-            )
+            # Call Voyage Lite API (sync client, run in thread pool for async)
+            async with provider_slot(self.provider_limits, "voyage"):
+                rerank_response = await asyncio.to_thread(
+                    self.voyage_client.rerank,
+                    query=query,
+                    documents=documents,
+                    model='rerank-lite-1',
+                    top_k=len(sources)  # Return all, filter by threshold
+                )
 
             # Build reranked results
             reranked_sources = []
@@ -400,12 +417,14 @@ class MultiStageReranker:
                     for s in sources
                 ]
 
-                rerank_response = self.voyage_client.rerank(
-                    query=query,
-                    documents=documents,
-                    model='rerank-2',  # Full model
-                    top_k=len(sources)
-                )
+                async with provider_slot(self.provider_limits, "voyage"):
+                    rerank_response = await asyncio.to_thread(
+                        self.voyage_client.rerank,
+                        query=query,
+                        documents=documents,
+                        model='rerank-2',  # Full model
+                        top_k=len(sources)
+                    )
 
                 for result in rerank_response.results:
                     voyage_full_scores[result.index] = float(result.relevance_score)
@@ -415,12 +434,16 @@ class MultiStageReranker:
             except Exception as e:
                 logger.warning("stage3_voyage_full_failed", error=str(e), using_bm25=True)
 
+        # MinHash signatures computed once per source, reused by novelty
+        source_copies = [source.copy() for source in sources]
+        self._attach_minhash_signatures(source_copies)
+
         # Calculate final scores with all metrics
         final_sources = []
         selected_sources = []  # For novelty/diversity calculations
 
         for idx, source in enumerate(sources):
-            source_copy = source.copy()
+            source_copy = source_copies[idx]
 
             # Get Voyage Full score (or fallback to Voyage Lite or BM25)
             relevance_score = voyage_full_scores.get(idx)
@@ -453,6 +476,10 @@ class MultiStageReranker:
             final_sources.append(source_copy)
             selected_sources.append(source_copy)
 
+        # Signatures are internal to scoring
+        for source_copy in final_sources:
+            source_copy.pop('_minhash', None)
+
         # Sort by final_score descending
         final_sources.sort(key=lambda x: x['final_score'], reverse=True)
 
@@ -477,6 +504,8 @@ class MultiStageReranker:
 
         Measures content diversity using MinHash similarity.
         Lower similarity to already-selected sources = higher novelty.
+        Uses signatures precomputed by _attach_minhash_signatures(); all
+        selected signatures are compared in one vectorized pass.
 
         Args:
             candidate: Source to evaluate
@@ -488,37 +517,63 @@ class MultiStageReranker:
         if not selected_sources:
             return 1.0  # First source is always novel
 
-        # Create MinHash for candidate
-        candidate_content = candidate.get('content', '')
-        if not candidate_content:
+        candidate_signature = self._minhash_signature(candidate)
+        if candidate_signature is None:
             return 0.5  # Neutral score for missing content
 
-        candidate_minhash = MinHash(num_perm=128)
-        words = candidate_content.lower().split()
-        shingles = [' '.join(words[i:i+3]) for i in range(len(words) - 2)]
-        for shingle in shingles:
-            candidate_minhash.update(shingle.encode('utf-8'))
-
-        # Calculate max similarity to selected sources
-        max_similarity = 0.0
-        for selected in selected_sources:
-            selected_content = selected.get('content', '')
-            if not selected_content:
-                continue
-
-            selected_minhash = MinHash(num_perm=128)
-            words = selected_content.lower().split()
-            shingles = [' '.join(words[i:i+3]) for i in range(len(words) - 2)]
-            for shingle in shingles:
-                selected_minhash.update(shingle.encode('utf-8'))
+        selected_signatures = [
+            signature for signature in map(self._minhash_signature, selected_sources)
+            if signature is not None
+        ]
+        if not selected_signatures:
+            return 1.0
 
-            similarity = candidate_minhash.jaccard(selected_minhash)
-            max_similarity = max(max_similarity, similarity)
+        # Estimated Jaccard = share of matching hash values per selected source
+        similarities = np.mean(np.vstack(selected_signatures) == candidate_signature, axis=1)
+        max_similarity = float(similarities.max())
 
         # Novelty = 1 - max_similarity
         novelty = 1.0 - max_similarity
         return max(0.0, min(1.0, novelty))
 
+    def _attach_minhash_signatures(self, sources: List[Dict]) -> None:
+        """
+        Compute MinHash signatures for all sources in one batch
+
+        Stores each signature (hash values array) on the source under
+        '_minhash'. Sources without content get no signature.
+
+        Args:
+            sources: Sources to sign (modified in place)
+        """
+        with_content = [source for source in sources if source.get('content')]
+        if not with_content:
+            return
+
+        minhashes = MinHash.bulk(
+            [_shingles(source['content']) for source in with_content],
+            num_perm=self.MINHASH_NUM_PERM
+        )
+        for source, minhash in zip(with_content, minhashes):
+            source['_minhash'] = minhash.hashvalues
+
+    def _minhash_signature(self, source: Dict) -> Optional[np.ndarray]:
+        """
+        Get the source's MinHash signature (computed on demand if not attached)
+
+        Args:
+            source: Source dict
+
+        Returns:
+            Hash values array, or None for sources without content
+        """
+        signature = source.get('_minhash')
+        if signature is None and source.get('content'):
+            signature = MinHash.bulk(
+                [_shingles(source['content'])], num_perm=self.MINHASH_NUM_PERM
+            )[0].hashvalues
+        return signature
+
     def _calculate_authority(self, source: Dict) -> float:
         """
         Calculate Authority metric with E-E-A-T signals
@@ -8,6 +8,9 @@ Features:
 - Quality scoring: E-E-A-T signals (domain authority, publication type, freshness)
 - Usage tracking: Monitor which topics use which sources
 - Freshness: Auto-detect stale sources (> 7 days old)
+- Content reuse: Full extracted text stored zlib-compressed, fresh content
+  served to ContentSynthesizer/DeepResearcher without refetching
+- Eviction: Stored content bounded by size, lowest quality/usage/oldest first
 
 Example:
     from src.research.source_cache import SourceCache
@@ -21,9 +24,14 @@ Example:
     else:
         result = await tavily.search(...)  # Paid API call
         cache.save_source(result, topic_id="proptech-2025")
+
+    # Reuse full extracted text instead of fetching the page again
+    content = cache.get_content("https://nytimes.com/article")
 """
 
 import json
+import threading
+import zlib
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
@@ -44,6 +52,9 @@ class SourceCache:
     # Freshness threshold: Sources older than 7 days are stale
     STALENESS_THRESHOLD_DAYS = 7
 
+    # Upper bound for stored (compressed) full content across all sources
+    DEFAULT_MAX_CONTENT_BYTES = 100 * 1024 * 1024  # 100 MB
+
     # Domain authority tiers (based on publication type)
     DOMAIN_AUTHORITY = {
         # Government and academic (highest trust)
@@ -73,24 +84,34 @@ class SourceCache:
         'unknown': 0.5,       # Default for unclassified
     }
 
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, max_content_bytes: int = DEFAULT_MAX_CONTENT_BYTES):
         """
         Initialize source cache with database manager
 
         Args:
             db_manager: SQLiteManager instance for database operations
+            max_content_bytes: Size budget for stored compressed content
+                (default: 100 MB). Exceeding it evicts content of the
+                lowest quality, least used, oldest sources first.
         """
         self.db = db_manager
-        logger.info("source_cache_initialized")
+        self.max_content_bytes = max_content_bytes
+
+        # Serializes cache access from worker threads (the synthesizer calls
+        # in via asyncio.to_thread; in-memory databases share one connection)
+        self._lock = threading.RLock()
+
+        logger.info("source_cache_initialized", max_content_bytes=max_content_bytes)
 
     def save_source(
         self,
         url: str,
         title: str,
         content: str,
-        topic_id: str,
+        topic_id: Optional[str],
         author: Optional[str] = None,
-        published_at: Optional[datetime] = None
+        published_at: Optional[datetime] = None,
+        store_content: bool = True
     ) -> Dict:
         """
         Save or update a source in the cache
@@ -99,9 +120,14 @@ class SourceCache:
             url: Source URL (unique identifier)
             title: Article/page title
             content: Full content text
-            topic_id: ID of topic that used this source
+            topic_id: ID of topic that used this source (None: cache the
+                source without counting a use, e.g. content fetched outside
+                a topic's research)
             author: Author name (optional)
             published_at: Publication date (optional)
+            store_content: Persist full content for reuse (default: True).
+                Pass False when content is only a stand-in (e.g. a report
+                excerpt) so it is never served as the page text.
 
         Returns:
             Dict with source data including quality_score
@@ -110,8 +136,10 @@ class SourceCache:
             - Increments fetch_count and usage_count if source exists
             - Recalculates quality_score on each save
             - Tracks topic_id in topic_ids array
+            - Replaces stored full content (store_content=True) and evicts
+              content beyond max_content_bytes
         """
-        with self.db._get_connection() as conn:
+        with self._lock, self.db._get_connection() as conn:
             cursor = conn.cursor()
 
             # Extract domain from URL
@@ -132,7 +160,7 @@ class SourceCache:
                 topic_ids = json.loads(topic_ids_json) if topic_ids_json else []
 
                 # Add topic_id if not already tracked
-                if topic_id not in topic_ids:
+                if topic_id is not None and topic_id not in topic_ids:
                     topic_ids.append(topic_id)
                     usage_count += 1
 
@@ -178,10 +206,11 @@ class SourceCache:
 
             else:
                 # Insert new source
+                topic_ids = [topic_id] if topic_id is not None else []
                 quality_score, e_e_a_t_signals = self.calculate_quality_score(
                     domain=domain,
                     published_at=published_at,
-                    usage_count=1,
+                    usage_count=len(topic_ids),
                     content=content
                 )
 
@@ -196,13 +225,25 @@ class SourceCache:
                 """, (
                     url, domain, title, content_preview,
                     now, now, 1,
-                    json.dumps([topic_id]), 1,
+                    json.dumps(topic_ids), len(topic_ids),
                     quality_score, json.dumps(e_e_a_t_signals),
                     author, published_at, now
                 ))
 
                 logger.info("source_saved", url=url[:50], quality_score=quality_score, domain=domain)
 
+            if store_content and content:
+                compressed = zlib.compress(content.encode('utf-8'))
+                cursor.execute("""
+                    UPDATE sources SET
+                        content_compressed = ?,
+                        content_size = ?,
+                        content_fetched_at = ?
+                    WHERE url = ?
+                """, (compressed, len(compressed), now, url))
+
+                self._evict_content(cursor, self.max_content_bytes)
+
             conn.commit()
 
         # Return source data (outside with block)
@@ -233,8 +274,9 @@ class SourceCache:
             - quality_score, e_e_a_t_signals
             - is_stale, usage_count, fetch_count
             - first_fetched_at, last_fetched_at
+            - has_content, content_fetched_at (full text via get_content)
         """
-        with self.db._get_connection(readonly=True) as conn:
+        with self._lock, self.db._get_connection(readonly=True) as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -243,7 +285,8 @@ class SourceCache:
                     first_fetched_at, last_fetched_at, fetch_count,
                     topic_ids, usage_count,
                     quality_score, e_e_a_t_signals,
-                    author, published_at, is_stale
+                    author, published_at, is_stale,
+                    content_size, content_fetched_at
                 FROM sources WHERE url = ?
             """, (url,))
 
@@ -277,9 +320,109 @@ class SourceCache:
                 'author': row[11],
                 'published_at': row[12],
                 'is_stale': is_stale,
-                'days_old': days_old
+                'days_old': days_old,
+                'has_content': bool(row[14]),
+                'content_fetched_at': row[15]
             }
 
+    def get_content(self, url: str, max_age_days: Optional[int] = None) -> Optional[str]:
+        """
+        Retrieve stored full content for a source if it is still fresh
+
+        Args:
+            url: Source URL to lookup
+            max_age_days: Freshness window (default: STALENESS_THRESHOLD_DAYS)
+
+        Returns:
+            Full content text, or None if not cached, evicted or stale
+        """
+        if max_age_days is None:
+            max_age_days = self.STALENESS_THRESHOLD_DAYS
+
+        with self._lock, self.db._get_connection(readonly=True) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT content_compressed, content_fetched_at FROM sources WHERE url = ?",
+                (url,)
+            )
+            row = cursor.fetchone()
+
+        if not row or row[0] is None:
+            return None
+
+        fetched_at = datetime.fromisoformat(row[1])
+        if (datetime.utcnow() - fetched_at).days > max_age_days:
+            logger.debug("source_content_stale", url=url[:50])
+            return None
+
+        logger.debug("source_content_hit", url=url[:50])
+        return zlib.decompress(row[0]).decode('utf-8')
+
+    def evict_content(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Drop stored content until the cache fits its size budget
+
+        Source rows (quality score, usage tracking) are kept; only the full
+        content is removed, so a later fetch can store it again.
+
+        Args:
+            max_bytes: Size budget (default: max_content_bytes)
+
+        Returns:
+            Number of sources whose content was evicted
+        """
+        if max_bytes is None:
+            max_bytes = self.max_content_bytes
+
+        with self._lock, self.db._get_connection() as conn:
+            evicted = self._evict_content(conn.cursor(), max_bytes)
+            conn.commit()
+
+        return evicted
+
+    def _evict_content(self, cursor, max_bytes: int) -> int:
+        """
+        Evict stored content beyond max_bytes (caller commits)
+
+        Eviction order: lowest quality_score, then lowest usage_count,
+        then oldest last_fetched_at.
+
+        Args:
+            cursor: Cursor on an open write connection
+            max_bytes: Size budget for compressed content
+
+        Returns:
+            Number of sources whose content was evicted
+        """
+        cursor.execute("SELECT COALESCE(SUM(content_size), 0) FROM sources WHERE content_compressed IS NOT NULL")
+        total_bytes = cursor.fetchone()[0]
+        if total_bytes <= max_bytes:
+            return 0
+
+        cursor.execute("""
+            SELECT url, content_size FROM sources
+            WHERE content_compressed IS NOT NULL
+            ORDER BY quality_score ASC, usage_count ASC, last_fetched_at ASC
+        """)
+
+        to_evict = []
+        for url, size in cursor.fetchall():
+            if total_bytes <= max_bytes:
+                break
+            to_evict.append((url,))
+            total_bytes -= size or 0
+
+        cursor.executemany("""
+            UPDATE sources SET
+                content_compressed = NULL,
+                content_size = 0,
+                content_fetched_at = NULL
+            WHERE url = ?
+        """, to_evict)
+
+        logger.info("source_content_evicted", count=len(to_evict), remaining_bytes=total_bytes)
+        return len(to_evict)
+
     def calculate_quality_score(
         self,
         domain: str,
@@ -410,7 +553,7 @@ class SourceCache:
         Returns:
             True if successful, False if source not found
         """
-        with self.db._get_connection() as conn:
+        with self._lock, self.db._get_connection() as conn:
             cursor = conn.cursor()
 
             # Get current topic_ids
@@ -451,7 +594,7 @@ class SourceCache:
         Returns:
             List of source dicts with url, domain, quality_score, days_old
         """
-        with self.db._get_connection(readonly=True) as conn:
+        with self._lock, self.db._get_connection(readonly=True) as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -483,9 +626,10 @@ class SourceCache:
         Get cache statistics
 
         Returns:
-            Dict with total_sources, avg_quality, stale_count, top_domains
+            Dict with total_sources, avg_quality, stale_count, top_domains,
+            content_count, content_bytes
         """
-        with self.db._get_connection(readonly=True) as conn:
+        with self._lock, self.db._get_connection(readonly=True) as conn:
             cursor = conn.cursor()
 
             # Total sources
@@ -500,6 +644,13 @@ class SourceCache:
             cursor.execute("SELECT COUNT(*) FROM sources WHERE is_stale = 1")
             stale_count = cursor.fetchone()[0]
 
+            # Stored full content
+            cursor.execute("""
+                SELECT COUNT(*), COALESCE(SUM(content_size), 0)
+                FROM sources WHERE content_compressed IS NOT NULL
+            """)
+            content_count, content_bytes = cursor.fetchone()
+
             # Top domains by usage
             cursor.execute("""
                 SELECT domain, COUNT(*) as count, AVG(quality_score) as avg_quality
@@ -518,5 +669,7 @@ class SourceCache:
                 'avg_quality': round(avg_quality, 3),
                 'stale_count': stale_count,
                 'fresh_count': total_sources - stale_count,
+                'content_count': content_count,
+                'content_bytes': content_bytes,
                 'top_domains': top_domains
             }
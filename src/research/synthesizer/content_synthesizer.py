@@ -34,18 +34,23 @@ import os
 import asyncio
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Dict, Optional
 from enum import Enum
 from datetime import datetime
 
 from rank_bm25 import BM25Okapi
-from trafilatura import fetch_url, extract
+from trafilatura import extract
 from google import genai
 
 from src.research.backends.base import SearchResult
+from src.research.source_cache import SourceCache
 from src.media.image_generator import ImageGenerator
 from src.utils.logger import get_logger
 from src.utils.config_loader import FullConfig
+from src.utils.page_fetcher import AsyncPageFetcher
+from src.utils.provider_limits import ProviderLimits, provider_slot
 
 logger = get_logger(__name__)
 
@@ -61,12 +66,30 @@ class SynthesisError(Exception):
     pass
 
 
+# Shared across synthesizer instances, created on first use
+_extract_pools: Dict[int, ProcessPoolExecutor] = {}
+
+
+def _get_extract_pool(workers: int) -> ProcessPoolExecutor:
+    """Get (or create) the shared trafilatura process pool"""
+    pool = _extract_pools.get(workers)
+    if pool is None:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        _extract_pools[workers] = pool
+    return pool
+
+
+def _extract_main_content(html: str) -> Optional[str]:
+    """Extract main article text from HTML (CPU-bound, runs off the event loop)"""
+    return extract(html, include_comments=False, include_tables=False)
+
+
 class ContentSynthesizer:
     """
     Content synthesizer for generating articles from research sources
 
     Features:
-    - Full content extraction with trafilatura (already in requirements)
+    - Full content extraction: pooled async fetching + trafilatura off the event loop
     - 2-stage passage extraction:
       - Primary (BM25→LLM): BM25 pre-filter → Gemini Flash selection
       - Fallback (LLM-only): Gemini Flash selects from all paragraphs
@@ -94,7 +117,11 @@ class ContentSynthesizer:
         gemini_api_key: Optional[str] = None,
         strategy: PassageExtractionStrategy = PassageExtractionStrategy.BM25_LLM,
         passages_per_source: int = 3,
-        max_article_words: int = 2000
+        max_article_words: int = 2000,
+        provider_limits: Optional[ProviderLimits] = None,
+        page_fetcher: Optional[AsyncPageFetcher] = None,
+        extract_workers: int = 0,
+        source_cache: Optional[SourceCache] = None
     ):
         """
         Initialize content synthesizer
@@ -104,6 +131,14 @@ class ContentSynthesizer:
             strategy: Passage extraction strategy (default: BM25_LLM)
             passages_per_source: Number of passages to select per source (default: 3)
             max_article_words: Target article length in words (default: 2000)
+            provider_limits: Shared per-provider concurrency limits (Gemini calls)
+            page_fetcher: Pooled async fetcher for source pages (default: new
+                AsyncPageFetcher with per-host limits and timeouts). If it has
+                a page_store, extracted text is shared through it too.
+            extract_workers: Processes for trafilatura extraction
+                (default: 0 = run in worker threads)
+            source_cache: Optional SourceCache. Sources with fresh stored
+                content skip fetching; newly extracted content is saved.
         """
         # Load API key
         self.gemini_api_key = gemini_api_key or os.environ.get('GEMINI_API_KEY')
@@ -117,6 +152,10 @@ class ContentSynthesizer:
         self.strategy = strategy
         self.passages_per_source = passages_per_source
         self.max_article_words = max_article_words
+        self.provider_limits = provider_limits
+        self.page_fetcher = page_fetcher or AsyncPageFetcher()
+        self.extract_workers = max(0, extract_workers)
+        self.source_cache = source_cache
 
         logger.info(
             "content_synthesizer_initialized",
@@ -177,7 +216,7 @@ class ContentSynthesizer:
             content_extraction_start = datetime.now()
 
             extraction_tasks = [
-                self._extract_content(source, source_id=idx + 1)
+                self._extract_content(source, source_id=idx + 1, topic_id=query)
                 for idx, source in enumerate(sources)
             ]
             extracted_sources = await asyncio.gather(*extraction_tasks)
@@ -287,20 +326,36 @@ class ContentSynthesizer:
             logger.error("synthesis_failed", error=str(e), error_type=type(e).__name__)
             raise SynthesisError(f"Synthesis failed: {str(e)}") from e
 
-    async def _extract_content(self, source: SearchResult, source_id: int) -> Dict:
+    async def _extract_content(
+        self,
+        source: SearchResult,
+        source_id: int,
+        topic_id: Optional[str] = None
+    ) -> Dict:
         """
         Extract full content from source using trafilatura
 
         Args:
             source: Search result to extract content from
             source_id: Source identifier (1-based)
+            topic_id: Topic recorded as using this source in the source cache
+                (None: the source is cached without counting a use)
 
         Returns:
             Dict with url, content, paragraphs, source_id
         """
         try:
-            # Fetch HTML content
-            html = fetch_url(source['url'])
+            # Fresh content from the source cache: no fetch, no extraction
+            if self.source_cache:
+                content = await asyncio.to_thread(self.source_cache.get_content, source['url'])
+                if content:
+                    if topic_id:
+                        await asyncio.to_thread(self.source_cache.mark_usage, source['url'], topic_id)
+                    logger.debug("source_cache_content_reused", url=source['url'])
+                    return self._build_extracted(source, source_id, content)
+
+            # Fetch HTML content (pooled, per-host limited, non-blocking)
+            html = await self.page_fetcher.fetch(source['url'])
             if not html:
                 logger.warning("fetch_failed", url=source['url'], reason="No HTML returned")
                 # Fallback to snippet
@@ -313,8 +368,14 @@ class ContentSynthesizer:
                     'extraction_failed': True
                 }
 
-            # Extract main content
-            content = extract(html, include_comments=False, include_tables=False)
+            # Extract main content (reuse text another component already
+            # extracted for this page, else CPU-bound extract off the loop)
+            page_store = self.page_fetcher.page_store
+            content = await asyncio.to_thread(page_store.get_text, source['url']) if page_store else None
+            if not content:
+                content = await self._run_extract(html)
+                if content and page_store:
+                    await asyncio.to_thread(page_store.save_text, source['url'], content)
             if not content:
                 logger.warning("extraction_failed", url=source['url'], reason="No content extracted")
                 # Fallback to snippet
@@ -327,24 +388,19 @@ class ContentSynthesizer:
                     'extraction_failed': True
                 }
 
-            # Split into paragraphs (double newline separator)
-            paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
+            if self.source_cache:
+                try:
+                    await asyncio.to_thread(
+                        self.source_cache.save_source,
+                        url=source['url'],
+                        title=source.get('title', ''),
+                        content=content,
+                        topic_id=topic_id
+                    )
+                except Exception as e:
+                    logger.warning("source_cache_save_failed", url=source['url'], error=str(e))
 
-            logger.debug(
-                "content_extracted_success",
-                url=source['url'],
-                num_paragraphs=len(paragraphs),
-                content_length=len(content)
-            )
-
-            return {
-                'url': source['url'],
-                'content': content,
-                'paragraphs': paragraphs,
-                'source_id': source_id,
-                'title': source.get('title', ''),
-                'extraction_failed': False
-            }
+            return self._build_extracted(source, source_id, content)
 
         except Exception as e:
             logger.warning(
@@ -363,6 +419,59 @@ class ContentSynthesizer:
                 'extraction_failed': True
             }
 
+    def _build_extracted(self, source: SearchResult, source_id: int, content: str) -> Dict:
+        """
+        Build the extracted-source dict from full content text
+
+        Args:
+            source: Search result the content belongs to
+            source_id: Source identifier (1-based)
+            content: Extracted main text
+
+        Returns:
+            Dict with url, content, paragraphs, source_id
+        """
+        # Split into paragraphs (double newline separator)
+        paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
+
+        logger.debug(
+            "content_extracted_success",
+            url=source['url'],
+            num_paragraphs=len(paragraphs),
+            content_length=len(content)
+        )
+
+        return {
+            'url': source['url'],
+            'content': content,
+            'paragraphs': paragraphs,
+            'source_id': source_id,
+            'title': source.get('title', ''),
+            'extraction_failed': False
+        }
+
+    async def _run_extract(self, html: str) -> Optional[str]:
+        """
+        Run trafilatura extraction in the process pool (or a worker thread)
+
+        Args:
+            html: Raw HTML
+
+        Returns:
+            Extracted main text or None
+        """
+        if self.extract_workers:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(
+                    _get_extract_pool(self.extract_workers), _extract_main_content, html
+                )
+            except BrokenProcessPool:
+                logger.warning("extract_pool_broken", fallback="thread")
+                _extract_pools.pop(self.extract_workers, None)
+
+        return await asyncio.to_thread(_extract_main_content, html)
+
     async def _extract_passages_bm25_llm(
         self,
         extracted_sources: List[Dict],
@@ -527,11 +636,12 @@ The indices must be from the passages above (0 to {len(paragraphs) - 1}).
 """
 
             # Call Gemini Flash (new SDK API - sync call, run in thread pool for async)
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
-                model=self.PASSAGE_SELECTION_MODEL,
-                contents=prompt
-            )
+            async with provider_slot(self.provider_limits, "gemini"):
+                response = await asyncio.to_thread(
+                    self.client.models.generate_content,
+                    model=self.PASSAGE_SELECTION_MODEL,
+                    contents=prompt
+                )
 
             # Parse response
             try:
@@ -631,11 +741,12 @@ Generate the article now:
 """
 
             # Call Gemini 2.5 Flash (new SDK API - sync call, run in thread pool for async)
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
-                model=self.ARTICLE_SYNTHESIS_MODEL,
-                contents=prompt
-            )
+            async with provider_slot(self.provider_limits, "gemini"):
+                response = await asyncio.to_thread(
+                    self.client.models.generate_content,
+                    model=self.ARTICLE_SYNTHESIS_MODEL,
+                    contents=prompt
+                )
 
             article = response.text.strip()
 
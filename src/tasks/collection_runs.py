@@ -0,0 +1,407 @@
+"""
+Collection Run Store
+
+Checkpoints for fanned-out collection runs (see huey_tasks.start_collection):
+a run is split into shards (one per feed, subreddit and keyword), each shard
+task stores its documents here when it finishes, and the last shard to
+finish triggers the reduce step (deduplication and bulk insert).
+
+Design:
+- SQLite file (default: cache/collection_runs.db), WAL mode, safe across
+  threads and Huey worker processes
+- One row per run (status, result) and per shard (status, attempts,
+  documents as JSON until the run is reduced)
+- Finished shards are never collected again: retries and re-triggered runs
+  only redo pending/failed shards
+- Completing the last shard and claiming the reduce step happen in one
+  transaction, so exactly one task enqueues the reduce; a reduce that gave
+  up (REDUCE_FAILED) can be claimed again by re-running the run
+
+Usage:
+    store = CollectionRunStore()
+    pending = store.create_run(run_id, config_path, shard_ids)
+    ...
+    if store.complete_shard(run_id, shard_id, documents, sources=1):
+        reduce_collection(run_id, config_path)   # This shard was the last one
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.models.document import Document
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Run statuses
+RUNNING = "running"
+REDUCING = "reducing"
+REDUCE_FAILED = "reduce_failed"
+COMPLETED = "completed"
+
+# Shard statuses
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+class CollectionRunStore:
+    """
+    SQLite-backed checkpoints of collection runs and their shards.
+
+    Thread-safe: every call opens its own short-lived connection.
+    """
+
+    def __init__(self, db_path: str = "cache/collection_runs.db"):
+        """
+        Initialize collection run store
+
+        Args:
+            db_path: SQLite file for the store (":memory:" not supported)
+        """
+        self.db_path = db_path
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (WAL, busy timeout), creating the tables on first use"""
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self._init_db()
+                    self._initialized = True
+
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self):
+        """Create collection_runs and collection_shards tables"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS collection_runs (
+                    run_id TEXT PRIMARY KEY,
+                    config_path TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    created_at TEXT NOT NULL,
+                    completed_at TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS collection_shards (
+                    run_id TEXT NOT NULL,
+                    shard_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    documents TEXT,
+                    sources INTEGER NOT NULL DEFAULT 0,
+                    errors INTEGER NOT NULL DEFAULT 0,
+                    error TEXT,
+                    updated_at TEXT,
+                    PRIMARY KEY (run_id, shard_id)
+                ) WITHOUT ROWID
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+        logger.info("collection_run_store_initialized", db_path=self.db_path)
+
+    def create_run(self, run_id: str, config_path: str, shard_ids: List[str]) -> List[str]:
+        """
+        Register a run and its shards (idempotent)
+
+        Re-creating an existing run keeps finished shards, adds new ones and
+        resets failed shards to pending.
+
+        Args:
+            run_id: Run identifier (e.g. "proptech_de:2026-10-17")
+            config_path: Market config the run collects
+            shard_ids: Shards of the run
+
+        Returns:
+            Shard ids still to collect (pending or failed before), in order
+        """
+        now = datetime.now().isoformat()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR IGNORE INTO collection_runs (run_id, config_path, status, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (run_id, config_path, RUNNING, now)
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO collection_shards (run_id, shard_id, status, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                [(run_id, shard_id, PENDING, now) for shard_id in shard_ids]
+            )
+            conn.execute(
+                "UPDATE collection_shards SET status = ?, error = NULL WHERE run_id = ? AND status = ?",
+                (PENDING, run_id, FAILED)
+            )
+            # A run with unfinished shards is collecting again (a completed
+            # run then only reduces the shards collected since)
+            conn.execute(
+                "UPDATE collection_runs SET status = ? WHERE run_id = ? AND status != ? "
+                "AND EXISTS (SELECT 1 FROM collection_shards WHERE run_id = ? AND status = ?)",
+                (RUNNING, run_id, RUNNING, run_id, PENDING)
+            )
+            rows = conn.execute(
+                "SELECT shard_id FROM collection_shards WHERE run_id = ? AND status = ?",
+                (run_id, PENDING)
+            ).fetchall()
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        pending = {row[0] for row in rows}
+        return [shard_id for shard_id in dict.fromkeys(shard_ids) if shard_id in pending] + sorted(
+            pending.difference(shard_ids)
+        )
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a run's status and shard counts
+
+        Returns:
+            Dict with run_id, config_path, status, result, shards (count per
+            shard status), or None if the run is unknown
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT run_id, config_path, status, result, created_at, completed_at "
+                "FROM collection_runs WHERE run_id = ?",
+                (run_id,)
+            ).fetchone()
+            counts = conn.execute(
+                "SELECT status, COUNT(*) FROM collection_shards WHERE run_id = ? GROUP BY status",
+                (run_id,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        if row is None:
+            return None
+        return {
+            'run_id': row[0],
+            'config_path': row[1],
+            'status': row[2],
+            'result': json.loads(row[3]) if row[3] else None,
+            'created_at': row[4],
+            'completed_at': row[5],
+            'shards': dict(counts)
+        }
+
+    def is_shard_done(self, run_id: str, shard_id: str) -> bool:
+        """Check if a shard was already collected"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT status FROM collection_shards WHERE run_id = ? AND shard_id = ?",
+                (run_id, shard_id)
+            ).fetchone()
+        finally:
+            conn.close()
+        return row is not None and row[0] == DONE
+
+    def complete_shard(
+        self,
+        run_id: str,
+        shard_id: str,
+        documents: List[Document],
+        sources: int = 1,
+        errors: int = 0
+    ) -> bool:
+        """
+        Checkpoint a collected shard
+
+        Args:
+            run_id: Run identifier
+            shard_id: Shard identifier
+            documents: Documents the shard collected
+            sources: Sources processed
+            errors: Non-fatal errors
+
+        Returns:
+            True if this was the last unfinished shard: the caller owns the
+            reduce step
+        """
+        payload = json.dumps([doc.model_dump(mode='json') for doc in documents])
+        return self._finish_shard(
+            run_id, shard_id,
+            "UPDATE collection_shards SET status = ?, attempts = attempts + 1, documents = ?, "
+            "sources = ?, errors = ?, error = NULL, updated_at = ? WHERE run_id = ? AND shard_id = ?",
+            (DONE, payload, sources, errors, datetime.now().isoformat(), run_id, shard_id)
+        )
+
+    def fail_shard(self, run_id: str, shard_id: str, error: str, final: bool) -> bool:
+        """
+        Record a failed shard attempt
+
+        Args:
+            run_id: Run identifier
+            shard_id: Shard identifier
+            error: Error message
+            final: No retries left (the shard is given up for this run)
+
+        Returns:
+            True if giving up this shard finished the run: the caller owns
+            the reduce step (the run is reduced without the failed shards)
+        """
+        status = FAILED if final else PENDING
+        query = (
+            "UPDATE collection_shards SET status = ?, attempts = attempts + 1, error = ?, "
+            "updated_at = ? WHERE run_id = ? AND shard_id = ?"
+        )
+        params = (status, error, datetime.now().isoformat(), run_id, shard_id)
+        if not final:
+            conn = self._connect()
+            try:
+                conn.execute(query, params)
+            finally:
+                conn.close()
+            return False
+        return self._finish_shard(run_id, shard_id, query, params)
+
+    def _finish_shard(self, run_id: str, shard_id: str, query: str, params: tuple) -> bool:
+        """Update a shard, then claim the reduce step if no shard is pending"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(query, params)
+            pending = conn.execute(
+                "SELECT COUNT(*) FROM collection_shards WHERE run_id = ? AND status = ?",
+                (run_id, PENDING)
+            ).fetchone()[0]
+            claimed = pending == 0 and conn.execute(
+                "UPDATE collection_runs SET status = ? WHERE run_id = ? AND status = ?",
+                (REDUCING, run_id, RUNNING)
+            ).rowcount == 1
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        if claimed:
+            logger.info("collection_run_shards_finished", run_id=run_id, last_shard=shard_id)
+        return claimed
+
+    def claim_reduce(self, run_id: str) -> bool:
+        """
+        Claim the reduce step of a run whose shards have all finished
+
+        Only an unclaimed run qualifies: still RUNNING with no pending shard,
+        or REDUCE_FAILED. A run being reduced (REDUCING) or COMPLETED is not
+        claimed again.
+
+        Returns:
+            True if the caller now owns the reduce step
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            claimed = conn.execute(
+                "UPDATE collection_runs SET status = ? WHERE run_id = ? AND status IN (?, ?) "
+                "AND NOT EXISTS (SELECT 1 FROM collection_shards WHERE run_id = ? AND status = ?)",
+                (REDUCING, run_id, RUNNING, REDUCE_FAILED, run_id, PENDING)
+            ).rowcount == 1
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return claimed
+
+    def fail_reduce(self, run_id: str) -> None:
+        """
+        Release a claimed reduce step that gave up (out of retries)
+
+        The run keeps its checkpointed documents and can be claimed again
+        (claim_reduce).
+        """
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE collection_runs SET status = ? WHERE run_id = ? AND status = ?",
+                (REDUCE_FAILED, run_id, REDUCING)
+            )
+        finally:
+            conn.close()
+
+    def load_results(self, run_id: str) -> Dict[str, Any]:
+        """
+        Load the checkpointed shards of a run for the reduce step
+
+        Returns:
+            Dict with documents (List[Document]), sources, errors (shard
+            errors plus failed shards) and failed_shards (shard ids)
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT shard_id, status, documents, sources, errors FROM collection_shards "
+                "WHERE run_id = ? ORDER BY shard_id",
+                (run_id,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        documents: List[Document] = []
+        sources = 0
+        errors = 0
+        failed_shards = []
+        for shard_id, status, payload, shard_sources, shard_errors in rows:
+            if status == DONE:
+                documents.extend(Document.model_validate(doc) for doc in json.loads(payload or "[]"))
+                sources += shard_sources
+                errors += shard_errors
+            else:
+                failed_shards.append(shard_id)
+                errors += 1
+
+        return {
+            'documents': documents,
+            'sources': sources,
+            'errors': errors,
+            'failed_shards': failed_shards
+        }
+
+    def complete_run(self, run_id: str, result: Dict[str, Any]) -> None:
+        """
+        Mark a run as reduced and drop the checkpointed documents
+
+        Args:
+            run_id: Run identifier
+            result: Run statistics
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "UPDATE collection_runs SET status = ?, result = ?, completed_at = ? WHERE run_id = ?",
+                (COMPLETED, json.dumps(result), datetime.now().isoformat(), run_id)
+            )
+            conn.execute("UPDATE collection_shards SET documents = NULL WHERE run_id = ?", (run_id,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
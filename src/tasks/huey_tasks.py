@@ -6,10 +6,16 @@ Component 7 (Week 1): Background task processing
 - DLQ (dead-letter queue) for failed jobs
 - Retry logic with exponential backoff
 - Periodic task scheduling
+- Fan-out collection: daily_collection starts one run per market config;
+  each run is split into per-feed, per-subreddit and per-keyword shard
+  tasks spread over the consumer's workers, checkpointed in
+  CollectionRunStore, and reduced (deduplication + bulk insert) once the
+  last shard finishes. Retries and re-triggered runs only redo shards
+  that have not finished.
 
 Usage:
-    # Start consumer:
-    huey_consumer src.tasks.huey_tasks.huey
+    # Start consumer (shard tasks run in parallel across workers):
+    huey_consumer src.tasks.huey_tasks.huey -w 8
 
     # Schedule task programmatically:
     from src.tasks.huey_tasks import collect_all_sources
@@ -18,11 +24,14 @@ Usage:
     # Periodic tasks run automatically when consumer is running
 """
 
+import os
+import threading
 from huey import SqliteHuey, crontab
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 import sqlite3
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
+from src.tasks.collection_runs import REDUCING, CollectionRunStore
 from src.utils.logger import get_logger
 
 # Initialize logger
@@ -36,6 +45,27 @@ huey = SqliteHuey(filename=str(HUEY_DB_PATH))
 # DLQ database path (separate from main tasks database)
 DLQ_DB_PATH = Path(__file__).parent.parent.parent / "dlq.db"
 
+# Notion rate budget shared by all worker processes (one Notion limit per
+# token, see src/notion_integration/rate_limiter.py); set when a consumer
+# worker starts, not on import
+NOTION_RATE_LIMIT_DB_PATH = Path(__file__).parent.parent.parent / "cache" / "notion_rate_limit.db"
+
+# Market configs collected by daily_collection (one run per *.yaml)
+MARKET_CONFIG_DIR = Path(__file__).parent.parent.parent / "config" / "markets"
+
+# Checkpoints of fanned-out collection runs (shared by all workers)
+COLLECTION_RUNS_DB_PATH = Path(__file__).parent.parent.parent / "cache" / "collection_runs.db"
+collection_runs = CollectionRunStore(str(COLLECTION_RUNS_DB_PATH))
+
+# Agents per worker thread and config (loading a config builds all collectors)
+_agents = threading.local()
+
+
+@huey.on_startup()
+def _configure_worker():
+    """Consumer worker startup: share the Notion rate budget across workers"""
+    os.environ.setdefault("NOTION_RATE_LIMIT_DB", str(NOTION_RATE_LIMIT_DB_PATH))
+
 
 def _init_dlq_db():
     """Initialize dead-letter queue database"""
@@ -163,21 +193,200 @@ def collect_all_sources(config_path: str = "config/markets/proptech_de.yaml") ->
         raise
 
 
+def _load_agent(config_path: str):
+    """Get this worker thread's agent for a market config (loaded once)"""
+    from src.agents.universal_topic_agent import UniversalTopicAgent
+
+    agents = getattr(_agents, "by_config", None)
+    if agents is None:
+        agents = _agents.by_config = {}
+    if config_path not in agents:
+        agents[config_path] = UniversalTopicAgent.load_config(config_path)
+    return agents[config_path]
+
+
+def market_config_paths() -> List[str]:
+    """
+    List market configs collected by daily_collection
+
+    Returns:
+        Paths of all config/markets/*.yaml files, sorted
+    """
+    return [str(path) for path in sorted(MARKET_CONFIG_DIR.glob("*.yaml"))]
+
+
+def collection_run_id(config_path: str, day: Optional[date] = None) -> str:
+    """Run id of a market's collection on a day (e.g. "proptech_de:2026-10-17")"""
+    return f"{Path(config_path).stem}:{(day or date.today()).isoformat()}"
+
+
+@huey.task(retries=2, retry_delay=60)
+def start_collection(config_path: str, run_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Background task: Fan out a market's collection into shard tasks
+
+    Plans the shards (feed discovery, see
+    UniversalTopicAgent.collection_shards), checkpoints them and enqueues
+    one collect_shard task per unfinished shard. Re-running a run (same
+    run_id) only enqueues shards that have not finished.
+
+    Args:
+        config_path: Path to market configuration file
+        run_id: Run identifier (default: market and today's date)
+
+    Returns:
+        Dict with run_id, shards (planned) and enqueued (shard tasks)
+    """
+    run_id = run_id or collection_run_id(config_path)
+    logger.info("start_collection_started", config_path=config_path, run_id=run_id)
+
+    try:
+        agent = _load_agent(config_path)
+        shard_ids = agent.collection_shards()
+        pending = collection_runs.create_run(run_id, config_path, shard_ids)
+
+        for shard_id in pending:
+            collect_shard(run_id, config_path, shard_id)
+
+        if not pending and collection_runs.claim_reduce(run_id):
+            # All shards finished before, but the reduce step gave up (a
+            # reduce still queued or running holds the claim)
+            reduce_collection(run_id, config_path)
+
+        logger.info(
+            "start_collection_completed",
+            run_id=run_id, shards=len(shard_ids), enqueued=len(pending)
+        )
+        return {'run_id': run_id, 'shards': len(shard_ids), 'enqueued': len(pending)}
+
+    except Exception as e:
+        logger.error("start_collection_failed", run_id=run_id, error=str(e))
+        log_to_dlq(
+            task_name="start_collection",
+            error=f"{run_id}: {e}",
+            timestamp=datetime.now()
+        )
+        raise
+
+
+@huey.task(retries=3, retry_delay=60, context=True)
+def collect_shard(run_id: str, config_path: str, shard_id: str, task=None) -> Dict[str, Any]:
+    """
+    Background task: Collect one shard of a run and checkpoint its documents
+
+    Huey retries only this shard. The task that finishes the last shard of
+    a run (successfully or out of retries) enqueues reduce_collection.
+
+    Args:
+        run_id: Run identifier
+        config_path: Path to market configuration file
+        shard_id: Shard to collect ("feed:<url>", "reddit:<subreddit>", ...)
+        task: Huey task (injected, for the remaining retries)
+
+    Returns:
+        Dict with shard_id, documents and skipped (already collected)
+    """
+    if collection_runs.is_shard_done(run_id, shard_id):
+        return {'shard_id': shard_id, 'documents': 0, 'skipped': True}
+
+    try:
+        output = _load_agent(config_path).collect_shard(shard_id)
+    except Exception as e:
+        final = task is None or not task.retries
+        logger.error("collect_shard_failed", run_id=run_id, shard=shard_id, error=str(e), final=final)
+        if final:
+            log_to_dlq(
+                task_name="collect_shard",
+                error=f"{run_id} {shard_id}: {e}",
+                timestamp=datetime.now()
+            )
+        if collection_runs.fail_shard(run_id, shard_id, str(e), final=final):
+            reduce_collection(run_id, config_path)
+        raise
+
+    if collection_runs.complete_shard(
+        run_id, shard_id, output.documents, sources=output.sources, errors=output.errors
+    ):
+        reduce_collection(run_id, config_path)
+
+    return {'shard_id': shard_id, 'documents': len(output.documents), 'skipped': False}
+
+
+@huey.task(retries=3, retry_delay=60, context=True)
+def reduce_collection(run_id: str, config_path: str, task=None) -> Dict[str, Any]:
+    """
+    Background task: Deduplicate and store all checkpointed shards of a run
+
+    Runs only for a run whose reduce step was claimed (REDUCING); out of
+    retries, the claim is released so re-running the run reduces it again.
+
+    Args:
+        run_id: Run identifier
+        config_path: Path to market configuration file
+        task: Huey task (injected, for the remaining retries)
+
+    Returns:
+        Collection stats (documents collected/saved, sources processed,
+        errors, failed shards), or run_id and skipped if the run is not
+        being reduced
+    """
+    run = collection_runs.get_run(run_id)
+    if run is None or run['status'] != REDUCING:
+        logger.info("reduce_collection_skipped", run_id=run_id, status=run and run['status'])
+        return {'run_id': run_id, 'skipped': True}
+
+    logger.info("reduce_collection_started", run_id=run_id)
+
+    try:
+        results = collection_runs.load_results(run_id)
+        stored = _load_agent(config_path).store_documents(results['documents'])
+
+        stats = {
+            'run_id': run_id,
+            'documents_total': len(results['documents']),
+            'documents_collected': stored['documents_collected'],
+            'documents_saved': stored['documents_saved'],
+            'sources_processed': results['sources'],
+            'errors': results['errors'] + stored['errors'],
+            'failed_shards': results['failed_shards']
+        }
+        collection_runs.complete_run(run_id, stats)
+
+        logger.info("reduce_collection_completed", **stats)
+        return stats
+
+    except Exception as e:
+        final = task is None or not task.retries
+        logger.error("reduce_collection_failed", run_id=run_id, error=str(e), final=final)
+        log_to_dlq(
+            task_name="reduce_collection",
+            error=f"{run_id}: {e}",
+            timestamp=datetime.now()
+        )
+        if final:
+            collection_runs.fail_reduce(run_id)
+        raise
+
+
 @huey.periodic_task(crontab(hour=2, minute=0))
 def daily_collection():
     """
     Scheduled task: Daily collection at 2 AM
 
     Automatically runs when Huey consumer is active.
-    Collects from all configured sources for the default config.
+    Starts a fanned-out collection run (start_collection) for every market
+    config in config/markets/ (RSS feeds only when due, see poll_due_feeds).
 
     Schedule: Daily at 2:00 AM server time
     """
     logger.info("daily_collection_triggered")
 
     try:
-        # Default to PropTech Germany config
-        result = collect_all_sources(config_path="config/markets/proptech_de.yaml")
+        config_paths = market_config_paths()
+        for config_path in config_paths:
+            start_collection(config_path)
+
+        result = {'configs': config_paths}
         logger.info("daily_collection_completed", result=result)
         return result
 
@@ -191,6 +400,44 @@ def daily_collection():
         raise
 
 
+@huey.periodic_task(crontab(minute=30))
+def poll_due_feeds():
+    """
+    Scheduled task: Hourly poll of configured RSS feeds that are due
+
+    The poll scheduler spaces each feed by its observed publish rate, so
+    fast news feeds are picked up within hours while weekly feeds are not
+    requested until they are due. Most runs request only a few feeds.
+
+    Polls every market config in config/markets/ (like daily_collection);
+    a failing market is logged to the DLQ and does not stop the others.
+
+    Schedule: Every hour at :30 (off the 2:00 daily collection)
+    """
+    logger.info("poll_due_feeds_triggered")
+
+    results = {}
+    failed = []
+    for config_path in market_config_paths():
+        try:
+            agent = _load_agent(config_path)
+            results[config_path] = agent.collect_due_feeds()
+            logger.info("poll_due_feeds_market_completed", config_path=config_path, **results[config_path])
+
+        except Exception as e:
+            logger.error("poll_due_feeds_failed", config_path=config_path, error=str(e))
+            log_to_dlq(
+                task_name="poll_due_feeds",
+                error=f"{config_path}: {e}",
+                timestamp=datetime.now()
+            )
+            failed.append(config_path)
+
+    result = {'configs': results, 'failed': failed}
+    logger.info("poll_due_feeds_completed", configs=len(results), failed=len(failed))
+    return result
+
+
 @huey.periodic_task(crontab(day_of_week='1', hour=9, minute=0))
 def weekly_notion_sync(config_path: str = "config/markets/proptech_de.yaml"):
     """
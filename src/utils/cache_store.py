@@ -0,0 +1,374 @@
+"""
+Cache Store
+
+Durable keyed cache shared by collectors (AutocompleteCollector,
+TrendsCollector), replacing in-memory dicts that were dumped to and reloaded
+from one JSON file as a whole.
+
+Design:
+- SQLite file, WAL mode, safe across threads and worker processes
+- One row per (namespace, key): JSON value, created_at, expires_at
+- Per-entry TTL; expired entries are misses and are never returned
+- Write-through: set() commits immediately, nothing to save on shutdown
+- Primary-key lookups, so opening the store costs the same at any size
+- Background sweeper thread deletes expired rows (indexed on expires_at);
+  one thread per (file, namespace), shared by every store on it, so stores
+  created per task run do not each start a thread
+- Hit/miss/write/expiry counters via get_stats()
+
+Usage:
+    store = CacheStore("cache/autocomplete/autocomplete_cache.db", namespace="autocomplete")
+    store.set("key", ["a", "b"], ttl=timedelta(days=30))
+    value = store.get("key")            # None if missing or expired
+    store.start_sweeper(interval=3600)  # Delete expired rows hourly
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+TTL = Union[timedelta, float, None]
+
+
+def _ttl_seconds(ttl: TTL) -> Optional[float]:
+    if isinstance(ttl, timedelta):
+        return ttl.total_seconds()
+    return ttl
+
+
+class _Sweeper:
+    """Sweeper thread of one (db_path, namespace), counted per store using it"""
+
+    def __init__(self, store: "CacheStore", interval: float):
+        self.users = 0
+        self.stop = threading.Event()
+        self.thread = threading.Thread(
+            target=self._run, args=(store, interval),
+            name=f"cache-sweeper-{store.namespace}", daemon=True
+        )
+
+    def _run(self, store: "CacheStore", interval: float):
+        while True:
+            try:
+                store.sweep_expired()
+            except sqlite3.Error as e:
+                logger.warning("cache_sweep_failed", db_path=store.db_path, error=str(e))
+            if self.stop.wait(interval):
+                return
+
+
+# Running sweepers by (absolute db_path, namespace)
+_sweepers: Dict[Tuple[str, str], _Sweeper] = {}
+_sweepers_lock = threading.Lock()
+
+
+class CacheStore:
+    """
+    SQLite-backed key/value cache with per-entry TTL.
+
+    Thread-safe: every call opens its own short-lived connection.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        namespace: str = "default",
+        default_ttl: TTL = None
+    ):
+        """
+        Initialize cache store
+
+        Args:
+            db_path: SQLite file for the store (":memory:" not supported)
+            namespace: Key namespace, so several caches can share one file
+            default_ttl: TTL for set() without ttl (timedelta or seconds,
+                None = never expires)
+        """
+        self.db_path = str(db_path)
+        self.namespace = namespace
+        self.default_ttl = _ttl_seconds(default_ttl)
+
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+        self._stats_lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0, 'expired': 0}
+
+        self._sweeper: Optional[_Sweeper] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (WAL, busy timeout), creating the table on first use"""
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self._init_db()
+                    self._initialized = True
+
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self):
+        """Create cache_entries table"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL,
+                    PRIMARY KEY (namespace, key)
+                ) WITHOUT ROWID
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at "
+                "ON cache_entries (expires_at) WHERE expires_at IS NOT NULL"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        logger.info("cache_store_initialized", db_path=self.db_path)
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[stat] += amount
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up an entry
+
+        Args:
+            key: Cache key
+            default: Returned if the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        if row is None:
+            self._count('misses')
+            return default
+
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            self._count('misses')
+            self.delete(key)
+            self._count('expired')
+            return default
+
+        self._count('hits')
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: TTL = None):
+        """
+        Store an entry (committed immediately)
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Time to live (timedelta or seconds, default: default_ttl)
+        """
+        self.set_many([(key, value)], ttl=ttl)
+
+    def set_many(self, items: Iterable[Tuple[str, Any]], ttl: TTL = None) -> int:
+        """
+        Store entries in one transaction
+
+        Args:
+            items: (key, value) pairs
+            ttl: Time to live for all entries (default: default_ttl)
+
+        Returns:
+            Number of entries written
+        """
+        ttl_s = _ttl_seconds(ttl) if ttl is not None else self.default_ttl
+        now = time.time()
+        expires_at = now + ttl_s if ttl_s is not None else None
+
+        params = [
+            (self.namespace, key, json.dumps(value), now, expires_at)
+            for key, value in items
+        ]
+        if not params:
+            return 0
+
+        conn = self._connect()
+        try:
+            conn.executemany(
+                """
+                INSERT INTO cache_entries (namespace, key, value, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(namespace, key) DO UPDATE SET
+                    value = excluded.value,
+                    created_at = excluded.created_at,
+                    expires_at = excluded.expires_at
+                """,
+                params
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        self._count('writes', len(params))
+        return len(params)
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove an entry
+
+        Returns:
+            True if the entry existed
+        """
+        conn = self._connect()
+        try:
+            removed = conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).rowcount
+            conn.commit()
+        finally:
+            conn.close()
+        return removed > 0
+
+    def clear(self) -> int:
+        """
+        Remove all entries of this namespace
+
+        Returns:
+            Number of entries removed
+        """
+        conn = self._connect()
+        try:
+            removed = conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,)
+            ).rowcount
+            conn.commit()
+        finally:
+            conn.close()
+        return removed
+
+    def sweep_expired(self) -> int:
+        """
+        Delete expired entries of this namespace
+
+        Returns:
+            Number of entries removed
+        """
+        conn = self._connect()
+        try:
+            removed = conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?",
+                (self.namespace, time.time())
+            ).rowcount
+            conn.commit()
+        finally:
+            conn.close()
+
+        if removed:
+            self._count('expired', removed)
+            logger.debug("cache_entries_swept", namespace=self.namespace, removed=removed)
+        return removed
+
+    def _sweeper_key(self) -> Tuple[str, str]:
+        return (os.path.abspath(self.db_path), self.namespace)
+
+    def start_sweeper(self, interval: float = 3600.0):
+        """
+        Sweep expired entries in a daemon thread: once now, then every interval
+
+        Joins the running sweeper of another store on the same file and
+        namespace instead of starting a second thread (its interval applies).
+
+        Args:
+            interval: Seconds between sweeps
+        """
+        with _sweepers_lock:
+            if self._sweeper is not None:
+                return
+
+            sweeper = _sweepers.get(self._sweeper_key())
+            if sweeper is None:
+                sweeper = _sweepers[self._sweeper_key()] = _Sweeper(self, interval)
+                sweeper.thread.start()
+            sweeper.users += 1
+            self._sweeper = sweeper
+
+    def close(self):
+        """Leave the sweeper, stopping it after its last store (entries are already on disk)"""
+        with _sweepers_lock:
+            sweeper, self._sweeper = self._sweeper, None
+            if sweeper is None:
+                return
+            sweeper.users -= 1
+            if sweeper.users:
+                return
+            del _sweepers[self._sweeper_key()]
+            sweeper.stop.set()
+
+        sweeper.thread.join(timeout=5.0)
+
+    def __contains__(self, key: str) -> bool:
+        """Check for a live entry (does not count as hit/miss)"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                """
+                SELECT 1 FROM cache_entries
+                WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)
+                """,
+                (self.namespace, key, time.time())
+            ).fetchone()
+        finally:
+            conn.close()
+        return row is not None
+
+    def __len__(self) -> int:
+        """Number of live entries"""
+        conn = self._connect()
+        try:
+            (count,) = conn.execute(
+                """
+                SELECT COUNT(*) FROM cache_entries
+                WHERE namespace = ? AND (expires_at IS NULL OR expires_at > ?)
+                """,
+                (self.namespace, time.time())
+            ).fetchone()
+        finally:
+            conn.close()
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with hits, misses, writes, expired and hit_rate
+        """
+        with self._stats_lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
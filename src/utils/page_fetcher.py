@@ -0,0 +1,266 @@
+"""
+Page Fetchers
+
+Fetch web pages, reading through an optional shared PageStore so each URL
+is downloaded once (and revalidated with ETag/Last-Modified afterwards).
+
+- AsyncPageFetcher: pooled httpx.AsyncClient with per-host concurrency caps
+  and timeouts, so a batch of fetches is bounded by the slowest page instead
+  of the sum of all of them. Returns None on failure.
+- PageFetcher: synchronous requests.Session counterpart. Raises
+  requests.RequestException on failure.
+
+Usage:
+    store = PageStore()
+    fetcher = AsyncPageFetcher(timeout=15.0, max_per_host=4, page_store=store)
+
+    pages = await asyncio.gather(*(fetcher.fetch(url) for url in urls))
+    # Each entry is the HTML text, or None if the fetch failed
+
+Async clients and semaphores are kept per event loop, so one fetcher can be
+reused across asyncio.run() calls (Streamlit, scripts, tests).
+"""
+
+import asyncio
+import weakref
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+import requests
+
+from src.utils.logger import get_logger
+from src.utils.page_store import PageStore, StoredPage, page_content_hash
+
+logger = get_logger(__name__)
+
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; ContentCreator/1.0)"
+
+
+class AsyncPageFetcher:
+    """
+    Pooled async HTTP fetcher for HTML pages.
+
+    Never raises on network/HTTP errors: fetch() returns None and logs,
+    mirroring trafilatura.fetch_url().
+    """
+
+    DEFAULT_USER_AGENT = DEFAULT_USER_AGENT
+
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        max_connections: int = 20,
+        max_per_host: int = 4,
+        max_bytes: int = 5 * 1024 * 1024,
+        user_agent: str = DEFAULT_USER_AGENT,
+        page_store: Optional[PageStore] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize page fetcher
+
+        Args:
+            timeout: Per-request timeout in seconds (default: 15.0)
+            max_connections: Connection pool size (default: 20)
+            max_per_host: Max concurrent requests per host (default: 4)
+            max_bytes: Pages larger than this are discarded (default: 5MB)
+            user_agent: User agent string for requests
+            page_store: Shared on-disk page store (None = always download)
+            transport: Custom httpx transport (e.g., httpx.MockTransport in tests)
+        """
+        self.timeout = timeout
+        self.max_connections = max(1, max_connections)
+        self.max_per_host = max(1, max_per_host)
+        self.max_bytes = max_bytes
+        self.user_agent = user_agent
+        self.page_store = page_store
+        self.transport = transport
+
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._host_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _client(self) -> httpx.AsyncClient:
+        """Get the pooled client for the running loop (created on first use)"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                headers={"User-Agent": self.user_agent},
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                follow_redirects=True,
+                transport=self.transport
+            )
+            self._clients[loop] = client
+        return client
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get the per-host semaphore for url on the running loop"""
+        loop = asyncio.get_running_loop()
+        semaphores = self._host_semaphores.setdefault(loop, {})
+        host = urlparse(url).netloc.lower()
+        if host not in semaphores:
+            semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return semaphores[host]
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """
+        Fetch HTML for a URL
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Decoded HTML text, or None on timeout, HTTP error or oversized page
+        """
+        page = await self.fetch_page(url)
+        return page.html if page else None
+
+    async def fetch_page(self, url: str) -> Optional[StoredPage]:
+        """
+        Fetch a page, reading through the page store if configured
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            StoredPage (with extracted text if another component stored it),
+            or None on timeout, HTTP error or oversized page
+        """
+        cached = None
+        if self.page_store:
+            cached, fresh = await asyncio.to_thread(self.page_store.lookup, url)
+            if fresh:
+                return cached
+
+        try:
+            async with self._host_semaphore(url):
+                response = await self._client().get(
+                    url, headers=PageStore.conditional_headers(cached)
+                )
+
+            if response.status_code == 304 and cached is not None:
+                revalidated = await asyncio.to_thread(self.page_store.mark_revalidated, url)
+                return revalidated or cached
+
+            response.raise_for_status()
+
+            if len(response.content) > self.max_bytes:
+                logger.warning("page_too_large", url=url, size_bytes=len(response.content))
+                return None
+
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
+            logger.warning("page_fetch_failed", url=url, error=str(e), error_type=type(e).__name__)
+            return None
+
+        if not self.page_store:
+            return StoredPage(url=url, html=response.text, content_hash=page_content_hash(response.text))
+
+        return await asyncio.to_thread(
+            self.page_store.store_response,
+            url,
+            response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified")
+        )
+
+    async def aclose(self):
+        """Close the pooled client for the running loop"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+class PageFetcher:
+    """
+    Synchronous page fetcher (keep-alive session, optional page store).
+
+    fetch() raises requests.RequestException on failure.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        user_agent: str = DEFAULT_USER_AGENT,
+        page_store: Optional[PageStore] = None
+    ):
+        """
+        Initialize page fetcher
+
+        Args:
+            timeout: Request timeout in seconds (default: 30.0)
+            user_agent: User agent string for requests
+            page_store: Shared on-disk page store (None = always download)
+        """
+        self.timeout = timeout
+        self.page_store = page_store
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = user_agent
+
+    def fetch(self, url: str, timeout: Optional[float] = None) -> str:
+        """
+        Fetch HTML for a URL
+
+        Args:
+            url: URL to fetch
+            timeout: Request timeout override (uses instance timeout if None)
+
+        Returns:
+            HTML content
+
+        Raises:
+            requests.RequestException: If fetch fails
+        """
+        return self.fetch_page(url, timeout=timeout).html
+
+    def fetch_page(self, url: str, timeout: Optional[float] = None) -> StoredPage:
+        """
+        Fetch a page, reading through the page store if configured
+
+        Args:
+            url: URL to fetch
+            timeout: Request timeout override (uses instance timeout if None)
+
+        Returns:
+            StoredPage
+
+        Raises:
+            requests.RequestException: If fetch fails
+        """
+        cached = None
+        if self.page_store:
+            cached, fresh = self.page_store.lookup(url)
+            if fresh:
+                return cached
+
+        response = self.session.get(
+            url,
+            headers=PageStore.conditional_headers(cached),
+            timeout=timeout or self.timeout
+        )
+
+        if response.status_code == 304 and cached is not None:
+            return self.page_store.mark_revalidated(url) or cached
+
+        response.raise_for_status()
+
+        if not self.page_store:
+            return StoredPage(url=url, html=response.text, content_hash=page_content_hash(response.text))
+
+        return self.page_store.store_response(
+            url,
+            response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified")
+        )
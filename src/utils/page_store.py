@@ -0,0 +1,460 @@
+"""
+Fetched-Page Store
+
+On-disk cache of fetched web pages shared by ContentSynthesizer,
+ContentScorer and RSSCollector, so a URL is downloaded (and its main text
+extracted) once per pipeline run instead of once per component.
+
+Design:
+- SQLite file (default: cache/pages.db), WAL mode, safe across threads and
+  worker processes
+- Keyed by canonical URL (lowercase scheme/host, no www, no fragment, no
+  tracking parameters)
+- Raw HTML and extracted text stored zlib-compressed
+- Fresh pages are served without network access; stale pages are
+  revalidated with If-None-Match / If-Modified-Since (304 = reuse)
+- TTL + max-entries eviction (least recently validated first)
+- Hit/revalidation/miss counters and bytes saved via get_stats()
+
+Usage:
+    store = PageStore()
+    page, fresh = store.lookup(url)
+    if not fresh:
+        response = session.get(url, headers=store.conditional_headers(page))
+        if response.status_code == 304 and page:
+            page = store.mark_revalidated(url)
+        else:
+            page = store.store_response(url, response.text, etag=..., last_modified=...)
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Same tracking parameters Deduplicator strips from canonical URLs
+TRACKING_PARAMS = {
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'ref', 'source', 'fbclid', 'gclid', 'msclkid',
+    '_ga', '_gl', 'mc_cid', 'mc_eid'
+}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical cache key for a URL
+
+    Lowercases scheme and host, strips "www.", fragments, tracking
+    parameters and trailing slashes. Path case is preserved.
+
+    Args:
+        url: URL to canonicalize
+
+    Returns:
+        Canonical URL string
+    """
+    parsed = urlparse(url.strip())
+
+    host = parsed.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if k not in TRACKING_PARAMS
+    ))
+    path = parsed.path.rstrip('/') or '/'
+
+    return urlunparse((parsed.scheme.lower(), host, path, '', query, ''))
+
+
+def page_content_hash(html: str) -> str:
+    """Short SHA-256 hash of page HTML (changes when the page changes)"""
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()[:16]
+
+
+@dataclass
+class StoredPage:
+    """Fetched page (raw HTML plus optional extracted main text)"""
+    url: str
+    html: str
+    content_hash: str
+    text: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+    validated_at: float = 0.0
+
+
+class PageStore:
+    """
+    Compressed on-disk page cache with HTTP revalidation.
+
+    Thread-safe: every call opens its own short-lived connection.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "cache/pages.db",
+        fresh_seconds: int = 6 * 3600,
+        ttl_seconds: int = 7 * 86400,
+        max_entries: int = 5000
+    ):
+        """
+        Initialize page store
+
+        Args:
+            db_path: SQLite file for the store (":memory:" not supported)
+            fresh_seconds: Serve without revalidation for this long (default: 6h)
+            ttl_seconds: Evict pages not validated for this long (default: 7 days)
+            max_entries: Max stored pages; oldest are evicted first (default: 5000)
+        """
+        self.db_path = db_path
+        self.fresh_seconds = fresh_seconds
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "hits": 0,           # Served fresh, no network
+            "revalidated": 0,    # 304 Not Modified, body reused
+            "misses": 0,         # Downloaded (new or changed)
+            "bytes_saved": 0,    # HTML bytes not downloaded thanks to the store
+        }
+        self._writes_since_evict = 0
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+        logger.info(
+            "page_store_initialized",
+            db_path=db_path,
+            fresh_seconds=fresh_seconds,
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (WAL, busy timeout for concurrent writers)"""
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self):
+        """Create pages table"""
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    url_key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    html BLOB NOT NULL,
+                    text BLOB,
+                    content_hash TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    size_bytes INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    validated_at REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_pages_validated_at ON pages(validated_at)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[stat] += amount
+
+    @staticmethod
+    def _row_to_page(row) -> StoredPage:
+        url, html, text, content_hash, etag, last_modified, fetched_at, validated_at = row
+        return StoredPage(
+            url=url,
+            html=zlib.decompress(html).decode('utf-8'),
+            text=zlib.decompress(text).decode('utf-8') if text is not None else None,
+            content_hash=content_hash,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+            validated_at=validated_at
+        )
+
+    def get(self, url: str) -> Optional[StoredPage]:
+        """
+        Get stored page regardless of freshness (no stats recorded)
+
+        Args:
+            url: Page URL
+
+        Returns:
+            StoredPage or None if not stored
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                """
+                SELECT url, html, text, content_hash, etag, last_modified, fetched_at, validated_at
+                FROM pages WHERE url_key = ?
+                """,
+                (canonicalize_url(url),)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        return self._row_to_page(row) if row else None
+
+    def lookup(self, url: str) -> Tuple[Optional[StoredPage], bool]:
+        """
+        Look up a page for a fetch
+
+        Args:
+            url: Page URL
+
+        Returns:
+            (page, fresh): page is None if not stored; fresh=True means it can
+            be used without touching the network (counted as a hit)
+        """
+        page = self.get(url)
+        if page is None:
+            return None, False
+
+        age = time.time() - page.validated_at
+        if age > self.ttl_seconds:
+            return None, False
+
+        if age <= self.fresh_seconds:
+            self._count("hits")
+            self._count("bytes_saved", len(page.html.encode('utf-8')))
+            return page, True
+
+        return page, False
+
+    @staticmethod
+    def conditional_headers(page: Optional[StoredPage]) -> Dict[str, str]:
+        """
+        Revalidation headers for a stale page
+
+        Args:
+            page: Stored page (or None)
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (empty if no validators)
+        """
+        headers = {}
+        if page is not None:
+            if page.etag:
+                headers["If-None-Match"] = page.etag
+            if page.last_modified:
+                headers["If-Modified-Since"] = page.last_modified
+        return headers
+
+    def mark_revalidated(self, url: str) -> Optional[StoredPage]:
+        """
+        Record a 304 Not Modified response (page stays, freshness restarts)
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Stored page, or None if it was evicted meanwhile
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE pages SET validated_at = ? WHERE url_key = ?",
+                (now, canonicalize_url(url))
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        page = self.get(url)
+        if page is not None:
+            self._count("revalidated")
+            self._count("bytes_saved", len(page.html.encode('utf-8')))
+        return page
+
+    def store_response(
+        self,
+        url: str,
+        html: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> StoredPage:
+        """
+        Store a freshly downloaded page
+
+        Extracted text is kept if the content is unchanged, dropped otherwise.
+
+        Args:
+            url: Page URL
+            html: Response body
+            etag: ETag response header
+            last_modified: Last-Modified response header
+
+        Returns:
+            StoredPage
+        """
+        self._count("misses")
+
+        now = time.time()
+        html_bytes = html.encode('utf-8')
+        content_hash = page_content_hash(html)
+
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT INTO pages (
+                    url_key, url, html, text, content_hash, etag, last_modified,
+                    size_bytes, fetched_at, validated_at
+                ) VALUES (?, ?, ?, NULL, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url_key) DO UPDATE SET
+                    url = excluded.url,
+                    html = excluded.html,
+                    text = CASE WHEN pages.content_hash = excluded.content_hash
+                                THEN pages.text ELSE NULL END,
+                    content_hash = excluded.content_hash,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    size_bytes = excluded.size_bytes,
+                    fetched_at = excluded.fetched_at,
+                    validated_at = excluded.validated_at
+                """,
+                (
+                    canonicalize_url(url), url, zlib.compress(html_bytes), content_hash,
+                    etag, last_modified, len(html_bytes), now, now
+                )
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        self._writes_since_evict += 1
+        if self._writes_since_evict >= 100:
+            self.evict()
+
+        return StoredPage(
+            url=url,
+            html=html,
+            content_hash=content_hash,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=now,
+            validated_at=now
+        )
+
+    def save_text(self, url: str, text: str):
+        """
+        Store extracted main text for an already stored page
+
+        Args:
+            url: Page URL
+            text: Extracted text (e.g., trafilatura output)
+        """
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE pages SET text = ? WHERE url_key = ?",
+                (zlib.compress(text.encode('utf-8')), canonicalize_url(url))
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_text(self, url: str) -> Optional[str]:
+        """
+        Get extracted main text for a stored page
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Extracted text or None
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT text FROM pages WHERE url_key = ?",
+                (canonicalize_url(url),)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        if row is None or row[0] is None:
+            return None
+        return zlib.decompress(row[0]).decode('utf-8')
+
+    def evict(self) -> int:
+        """
+        Remove expired pages and trim the store to max_entries
+
+        Returns:
+            Number of pages removed
+        """
+        self._writes_since_evict = 0
+        cutoff = time.time() - self.ttl_seconds
+
+        conn = self._connect()
+        try:
+            removed = conn.execute(
+                "DELETE FROM pages WHERE validated_at < ?", (cutoff,)
+            ).rowcount
+            removed += conn.execute(
+                """
+                DELETE FROM pages WHERE url_key IN (
+                    SELECT url_key FROM pages
+                    ORDER BY validated_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,)
+            ).rowcount
+            conn.commit()
+        finally:
+            conn.close()
+
+        if removed:
+            logger.info("page_store_evicted", removed=removed)
+        return removed
+
+    def get_stats(self) -> Dict:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with hits, revalidated, misses, bytes_saved, hit_rate,
+            total_pages, total_size_bytes
+        """
+        conn = self._connect()
+        try:
+            total_pages, total_size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM pages"
+            ).fetchone()
+        finally:
+            conn.close()
+
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        lookups = stats["hits"] + stats["revalidated"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["revalidated"]) / lookups if lookups else 0.0
+        stats["total_pages"] = total_pages
+        stats["total_size_bytes"] = total_size
+        return stats
@@ -0,0 +1,99 @@
+"""
+Per-Provider Concurrency Limits
+
+Caps the number of in-flight calls to each external API provider (Gemini,
+Tavily, Voyage, SearXNG) when several research tasks run concurrently.
+
+Usage:
+    limits = ProviderLimits({"gemini": 2, "tavily": 3})
+
+    async with limits.slot("gemini"):
+        response = await asyncio.to_thread(client.models.generate_content, ...)
+
+    # Components accept an optional ProviderLimits; provider_slot() is a
+    # no-op when none is configured
+    async with provider_slot(self.provider_limits, "voyage"):
+        ...
+"""
+
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+
+class ProviderLimits:
+    """
+    Concurrency caps per API provider, shared across concurrent tasks.
+
+    Semaphores are created per event loop (asyncio primitives are bound to
+    the loop they are first used on), so one instance can be reused across
+    asyncio.run() calls. Providers without a configured limit are unlimited.
+    """
+
+    DEFAULT_LIMITS = {
+        "gemini": 2,    # Free tier: low RPM, synthesis calls are long
+        "tavily": 3,    # Paid, per-key concurrency
+        "voyage": 2,    # Rerank calls (Stage 2 + Stage 3 per topic)
+        "searxng": 4,   # Public instances, be polite
+    }
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        """
+        Initialize provider limits
+
+        Args:
+            limits: Max concurrent calls per provider name
+                (default: DEFAULT_LIMITS). Values < 1 are treated as 1.
+        """
+        self.limits = {
+            provider: max(1, int(limit))
+            for provider, limit in (limits if limits is not None else self.DEFAULT_LIMITS).items()
+        }
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _semaphore(self, provider: str) -> Optional[asyncio.Semaphore]:
+        """Get the semaphore for provider on the running loop (None if unlimited)"""
+        if provider not in self.limits:
+            return None
+
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.setdefault(loop, {})
+        if provider not in semaphores:
+            semaphores[provider] = asyncio.Semaphore(self.limits[provider])
+        return semaphores[provider]
+
+    @asynccontextmanager
+    async def slot(self, provider: str):
+        """
+        Hold one concurrency slot for provider while the block runs
+
+        Args:
+            provider: Provider name (e.g., "gemini", "tavily", "voyage")
+        """
+        semaphore = self._semaphore(provider)
+        if semaphore is None:
+            yield
+            return
+
+        async with semaphore:
+            yield
+
+
+@asynccontextmanager
+async def provider_slot(limits: Optional[ProviderLimits], provider: str):
+    """
+    Hold a provider slot if limits are configured, otherwise no-op
+
+    Args:
+        limits: Shared ProviderLimits (or None for unlimited)
+        provider: Provider name
+    """
+    if limits is None:
+        yield
+        return
+
+    async with limits.slot(provider):
+        yield
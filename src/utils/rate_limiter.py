@@ -0,0 +1,92 @@
+"""
+Token Bucket Rate Limiter
+
+Caps the request rate to an external API while allowing short bursts, so
+concurrent callers proceed in parallel up to the burst size and are then
+spaced 1/rate apart.
+
+Each acquire reserves its tokens up front (the balance may go negative) and
+then waits for its reservation, so waiters are served in arrival order and
+never over-draw the budget. Reservation happens under a threading lock, so
+one bucket can be shared by threads and by coroutines on any event loop.
+
+Usage:
+    bucket = TokenBucket(rate=10.0, capacity=5)
+
+    bucket.acquire()              # Blocking (threads)
+    await bucket.acquire_async()  # Non-blocking wait (asyncio)
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize token bucket (starts full)
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum burst size (values < 1 are treated as 1)
+
+        Raises:
+            ValueError: If rate is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+
+        self.rate = float(rate)
+        self.capacity = max(float(capacity), 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """
+        Take tokens from the bucket
+
+        Returns:
+            Seconds the caller must wait before using them
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, sleeping until they are available
+
+        Args:
+            tokens: Tokens to take (default: 1)
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, awaiting until they are available
+
+        Args:
+            tokens: Tokens to take (default: 1)
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
@@ -4,7 +4,7 @@ Integration Test: Feed Discovery with Real Config
 
 Tests Feed Discovery pipeline with proptech_de.yaml configuration:
 - Stage 1: OPML seeds + Gemini expansion
-- Stage 2: SerpAPI + feedfinder2
+- Stage 2: SerpAPI + FeedFinder
 - Validates 20+ feeds discovered
 - Checks circuit breaker and caching
 """
@@ -78,9 +78,9 @@ def test_feed_discovery_integration():
         print(f"❌ Stage 1 failed: {e}")
         stage1_feeds = []
 
-    # Run Stage 2 (SerpAPI + feedfinder2)
+    # Run Stage 2 (SerpAPI + FeedFinder)
     print("=" * 70)
-    print("STAGE 2: SerpAPI Search + feedfinder2 Auto-Detection")
+    print("STAGE 2: SerpAPI Search + FeedFinder Auto-Detection")
     print("=" * 70)
     print(f"⚠ Note: Stage 2 uses SerpAPI (3 requests/day limit)")
     print(f"   This test will use 1-2 API requests for keywords")
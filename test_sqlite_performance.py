@@ -381,13 +381,19 @@ def verify_pragmas(db: SQLiteManager):
         return all_correct
 
 
-def main():
-    """Run all benchmarks and report results."""
+def run_benchmarks(pooled: bool = False) -> dict:
+    """
+    Run all benchmarks against a fresh database.
+
+    Args:
+        pooled: Use SQLiteManager connection pool mode (pooled=True)
+
+    Returns:
+        Dict of ops/sec per benchmark (empty if PRAGMA verification failed)
+    """
+    mode = "pooled" if pooled else "connect-per-call"
     print("\n" + "="*60)
-    print("SQLite Performance Benchmark")
-    print("="*60)
-    print("Based on: https://x.com/meln1k/status/1813314113705062774")
-    print("Target: 60K RPS on $5 VPS")
+    print(f"Connection mode: {mode}")
     print("="*60)
 
     # Create test database
@@ -395,13 +401,13 @@ def main():
     if Path(test_db_path).exists():
         Path(test_db_path).unlink()
 
-    db = SQLiteManager(db_path=test_db_path)
+    db = SQLiteManager(db_path=test_db_path, pooled=pooled)
 
     try:
         # Verify PRAGMAs
         if not verify_pragmas(db):
             print("\n❌ PRAGMA verification failed! Benchmark results may be inaccurate.")
-            return
+            return {}
 
         # Run benchmarks
         results = {}
@@ -423,7 +429,7 @@ def main():
 
         # Summary
         print(f"\n{'='*60}")
-        print("BENCHMARK SUMMARY")
+        print(f"BENCHMARK SUMMARY ({mode})")
         print(f"{'='*60}")
         print(f"Sequential Reads:      {results['sequential_reads']:>10,.0f} ops/sec")
         print(f"Sequential Writes:     {results['sequential_writes']:>10,.0f} ops/sec")
@@ -433,18 +439,7 @@ def main():
         print(f"  - Writes:            {results['mixed_writes']:>10,.0f} ops/sec")
         print(f"{'='*60}")
 
-        # Performance assessment
-        max_ops = max(results['sequential_reads'], results['concurrent_reads'])
-        target = 60000
-
-        if max_ops >= target:
-            print(f"\n🎉 EXCELLENT! Achieved {max_ops:,.0f} ops/sec (target: {target:,} ops/sec)")
-        elif max_ops >= target * 0.5:
-            print(f"\n✅ GOOD! Achieved {max_ops:,.0f} ops/sec (target: {target:,} ops/sec)")
-        else:
-            print(f"\n⚠️  Performance below target: {max_ops:,.0f} ops/sec (target: {target:,} ops/sec)")
-
-        print("\nNote: Performance depends on hardware. Results on $5 VPS may differ.")
+        return results
 
     finally:
         # Cleanup
@@ -461,5 +456,49 @@ def main():
         print("\nCleanup complete.")
 
 
+def main():
+    """Run all benchmarks in both connection modes and report results."""
+    print("\n" + "="*60)
+    print("SQLite Performance Benchmark")
+    print("="*60)
+    print("Based on: https://x.com/meln1k/status/1813314113705062774")
+    print("Target: 60K RPS on $5 VPS")
+    print("="*60)
+
+    before = run_benchmarks(pooled=False)
+    after = run_benchmarks(pooled=True)
+
+    if not before or not after:
+        return
+
+    # Before/after comparison
+    print(f"\n{'='*60}")
+    print("CONNECTION MODE COMPARISON (ops/sec)")
+    print(f"{'='*60}")
+    print(f"{'Benchmark':<22}{'per-call':>12}{'pooled':>12}{'speedup':>10}")
+    for key, label in [
+        ("sequential_reads", "Sequential Reads"),
+        ("sequential_writes", "Sequential Writes"),
+        ("concurrent_reads", "Concurrent Reads"),
+        ("mixed_total", "Mixed Workload"),
+    ]:
+        speedup = after[key] / before[key] if before[key] else 0.0
+        print(f"{label:<22}{before[key]:>12,.0f}{after[key]:>12,.0f}{speedup:>9.1f}x")
+    print(f"{'='*60}")
+
+    # Performance assessment
+    max_ops = max(after['sequential_reads'], after['concurrent_reads'])
+    target = 60000
+
+    if max_ops >= target:
+        print(f"\n🎉 EXCELLENT! Achieved {max_ops:,.0f} ops/sec (target: {target:,} ops/sec)")
+    elif max_ops >= target * 0.5:
+        print(f"\n✅ GOOD! Achieved {max_ops:,.0f} ops/sec (target: {target:,} ops/sec)")
+    else:
+        print(f"\n⚠️  Performance below target: {max_ops:,.0f} ops/sec (target: {target:,} ops/sec)")
+
+    print("\nNote: Performance depends on hardware. Results on $5 VPS may differ.")
+
+
 if __name__ == "__main__":
     main()
@@ -336,7 +336,7 @@ async def test_image_generation_silent_failure():
 
     with patch('src.research.synthesizer.content_synthesizer.ImageGenerator') as MockImageGen, \
          patch('src.research.synthesizer.content_synthesizer.genai') as mock_genai, \
-         patch('src.research.synthesizer.content_synthesizer.fetch_url') as mock_fetch, \
+         patch('src.research.synthesizer.content_synthesizer.AsyncPageFetcher.fetch', new_callable=AsyncMock) as mock_fetch, \
          patch('src.research.synthesizer.content_synthesizer.extract') as mock_extract:
 
         # Mock Gemini API
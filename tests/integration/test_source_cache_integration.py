@@ -406,3 +406,73 @@ class TestSourceCacheIntegration:
         assert 0 <= signals['publication_score'] <= 1
         assert 0 <= signals['freshness'] <= 1
         assert 0 <= signals['usage_popularity'] <= 1
+
+    # Test 14: Full content stored compressed and served while fresh
+    def test_full_content_round_trip(self, source_cache):
+        """Full content survives save/get beyond the 500-char preview"""
+        content = "Full article paragraph. " * 200
+        source_cache.save_source(
+            url="https://nytimes.com/full",
+            title="Full Article",
+            content=content,
+            topic_id="topic-1"
+        )
+
+        assert source_cache.get_content("https://nytimes.com/full") == content
+
+        cached = source_cache.get_source("https://nytimes.com/full")
+        assert cached['has_content'] is True
+        assert len(cached['content_preview']) == 500
+
+        stats = source_cache.get_stats()
+        assert stats['content_count'] == 1
+        assert 0 < stats['content_bytes'] < len(content)  # Compressed
+
+    # Test 15: Stale or stand-in content is not served
+    def test_get_content_skips_stale_and_preview_only(self, source_cache, db_manager):
+        """Stale content and store_content=False sources return None"""
+        source_cache.save_source(
+            url="https://test.com/old",
+            title="Old",
+            content="Old content",
+            topic_id="topic-1"
+        )
+        old_date = datetime.utcnow() - timedelta(days=10)
+        with db_manager._get_connection() as conn:
+            conn.execute("UPDATE sources SET content_fetched_at = ? WHERE url = ?", (old_date, "https://test.com/old"))
+            conn.commit()
+
+        source_cache.save_source(
+            url="https://test.com/preview",
+            title="Preview",
+            content="Report excerpt",
+            topic_id="topic-1",
+            store_content=False
+        )
+
+        assert source_cache.get_content("https://test.com/old") is None
+        assert source_cache.get_content("https://test.com/old", max_age_days=30) == "Old content"
+        assert source_cache.get_content("https://test.com/preview") is None
+        assert source_cache.get_content("https://test.com/missing") is None
+
+    # Test 16: Eviction by quality, usage and age
+    def test_content_eviction_order(self, db_manager):
+        """Content beyond the size budget is evicted lowest quality first"""
+        import os
+        cache = SourceCache(db_manager, max_content_bytes=10 ** 9)
+
+        # Incompressible content so sizes are predictable
+        cache.save_source(url="https://medium.com/blog", title="Blog",
+                          content=os.urandom(3000).hex(), topic_id="topic-1")
+        cache.save_source(url="https://cdc.gov/report", title="Report",
+                          content=os.urandom(3000).hex(), topic_id="topic-1")
+
+        per_source = cache.get_stats()['content_bytes'] // 2
+        evicted = cache.evict_content(max_bytes=per_source + 100)
+
+        assert evicted == 1
+        assert cache.get_content("https://medium.com/blog") is None
+        assert cache.get_content("https://cdc.gov/report") is not None
+
+        # Source row and usage tracking are kept
+        assert cache.get_source("https://medium.com/blog")['usage_count'] == 1
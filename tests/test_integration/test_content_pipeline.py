@@ -16,6 +16,7 @@ from src.agents.research_agent import ResearchAgent
 from src.agents.writing_agent import WritingAgent
 from src.cache_manager import CacheManager
 from src.notion_integration.sync_manager import SyncManager
+from src.utils.cache_store import CacheStore
 
 
 # ==================== Fixtures ====================
@@ -123,6 +124,12 @@ def mock_rate_limiter():
         yield mock_rl
 
 
+@pytest.fixture
+def block_store(tmp_path):
+    """Block store in a temp dir (keeps SyncManager out of the repo's cache/)"""
+    return CacheStore(str(tmp_path / "notion_blocks.db"), namespace="notion_blocks")
+
+
 # ==================== Full Pipeline Tests ====================
 
 def test_complete_pipeline_research_to_cache(
@@ -179,7 +186,8 @@ def test_complete_pipeline_research_to_notion(
     mock_gemini_cli,
     mock_openrouter_api,
     mock_notion_client,
-    mock_rate_limiter
+    mock_rate_limiter,
+    block_store
 ):
     """Test: Research → Writing → Cache → Notion Sync"""
 
@@ -207,7 +215,8 @@ def test_complete_pipeline_research_to_notion(
     sync_manager = SyncManager(
         cache_manager=cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     sync_results = sync_manager.sync_all_blog_posts()
@@ -226,7 +235,8 @@ def test_pipeline_with_progress_tracking(
     mock_gemini_cli,
     mock_openrouter_api,
     mock_notion_client,
-    mock_rate_limiter
+    mock_rate_limiter,
+    block_store
 ):
     """Test: Full pipeline with progress callbacks"""
 
@@ -251,7 +261,8 @@ def test_pipeline_with_progress_tracking(
     sync_manager = SyncManager(
         cache_manager=cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     sync_manager.sync_all_blog_posts(progress_callback=progress_callback)
@@ -352,7 +363,8 @@ def test_pipeline_multiple_posts_batch_sync(
     mock_gemini_cli,
     mock_openrouter_api,
     mock_notion_client,
-    mock_rate_limiter
+    mock_rate_limiter,
+    block_store
 ):
     """Test: Multiple posts → Batch sync to Notion"""
 
@@ -379,7 +391,8 @@ def test_pipeline_multiple_posts_batch_sync(
     sync_manager = SyncManager(
         cache_manager=cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     results = sync_manager.sync_all_blog_posts()
@@ -464,7 +477,8 @@ def test_pipeline_recovers_from_sync_failure(
     mock_gemini_cli,
     mock_openrouter_api,
     mock_notion_client,
-    mock_rate_limiter
+    mock_rate_limiter,
+    block_store
 ):
     """Test: Pipeline recovers from Notion sync failures"""
 
@@ -487,7 +501,8 @@ def test_pipeline_recovers_from_sync_failure(
         cache_manager=cache_manager,
         notion_client=mock_notion_client,
         rate_limiter=mock_rate_limiter,
-        max_retries=1  # Limit retries for test speed
+        max_retries=1,  # Limit retries for test speed
+        block_store=block_store
     )
 
     results = sync_manager.sync_all_blog_posts()
@@ -517,7 +532,8 @@ def test_pipeline_partial_sync_failure(
     mock_gemini_cli,
     mock_openrouter_api,
     mock_notion_client,
-    mock_rate_limiter
+    mock_rate_limiter,
+    block_store
 ):
     """Test: Pipeline handles partial sync failures"""
 
@@ -545,7 +561,8 @@ def test_pipeline_partial_sync_failure(
         cache_manager=cache_manager,
         notion_client=mock_notion_client,
         rate_limiter=mock_rate_limiter,
-        max_retries=1
+        max_retries=1,
+        block_store=block_store
     )
 
     results = sync_manager.sync_all_blog_posts()
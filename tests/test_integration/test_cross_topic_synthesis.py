@@ -138,7 +138,8 @@ def test_find_related_topics_integration(db_manager, sample_research_data):
     related = db_manager.find_related_topics(
         topic_id="proptech-technology-trends-2025",
         limit=5,
-        min_similarity=0.1  # Low threshold to find all related topics
+        min_similarity=0.1,  # Low threshold to find all related topics
+        include_report=True
     )
 
     # Should find 2 related topics
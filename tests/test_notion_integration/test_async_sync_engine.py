@@ -0,0 +1,323 @@
+"""
+Tests for AsyncNotionClient and AsyncSyncEngine
+
+Runs against a local fake Notion HTTP server (no network, no token).
+
+Test Coverage:
+- One request in flight, spaced by the rate limit
+- Retry on 429 (Retry-After), NotionError on 404
+- Pipelined sync: create, skip unchanged, block diff updates, failures
+- Throughput: preparation overlaps the network
+"""
+
+import asyncio
+import itertools
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.notion_integration.async_notion_client import AsyncNotionClient
+from src.notion_integration.async_sync_engine import AsyncSyncEngine
+from src.notion_integration.notion_client import NotionError
+from src.notion_integration.rate_limiter import RateLimiter
+from src.notion_integration.sync_manager import SyncManager
+from src.utils.cache_store import CacheStore
+
+
+# ==================== Fake Notion Server ====================
+
+class FakeNotion(ThreadingHTTPServer):
+    """Minimal Notion API: pages and blocks, with request log and fault injection"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeNotionHandler)
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.pages = {}          # page id -> list of block ids
+        self.requests = []       # (monotonic time, method, path)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_next = []      # Statuses to return for the next requests
+        self.latency = 0.0
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def new_id(self, prefix):
+        return f"{prefix}-{next(self.ids)}"
+
+
+class FakeNotionHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def _handle(self, method):
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.requests.append((time.monotonic(), method, self.path))
+            status = server.fail_next.pop(0) if server.fail_next else 200
+        try:
+            time.sleep(server.latency)
+            if status != 200:
+                self._send(status, {"object": "error", "status": status,
+                                    "code": "rate_limited" if status == 429 else "object_not_found",
+                                    "message": "injected"},
+                           headers={"Retry-After": "0.05"} if status == 429 else None)
+                return
+            with server.lock:
+                self._send(200, self._route(method, self.path.split("?")[0], body))
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _route(self, method, path, body):
+        server = self.server
+        if method == "POST" and path == "/v1/pages":
+            page_id = server.new_id("page")
+            server.pages[page_id] = [server.new_id("block") for _ in body.get("children", [])]
+            return {"object": "page", "id": page_id, "url": f"https://notion.so/{page_id}"}
+
+        if (match := re.fullmatch(r"/v1/pages/([\w-]+)", path)):
+            return {"object": "page", "id": match.group(1), "url": f"https://notion.so/{match.group(1)}"}
+
+        if (match := re.fullmatch(r"/v1/blocks/([\w-]+)/children", path)):
+            page = server.pages.setdefault(match.group(1), [])
+            if method == "GET":
+                return {"object": "list", "results": [{"id": b} for b in page],
+                        "has_more": False, "next_cursor": None}
+            new = [server.new_id("block") for _ in body["children"]]
+            after = body.get("after")
+            position = page.index(after) + 1 if after else len(page)
+            page[position:position] = new
+            return {"object": "list", "results": [{"id": b} for b in new]}
+
+        if (match := re.fullmatch(r"/v1/blocks/([\w-]+)", path)):
+            if method == "DELETE":
+                for page in server.pages.values():
+                    if match.group(1) in page:
+                        page.remove(match.group(1))
+            return {"object": "block", "id": match.group(1)}
+
+        raise AssertionError(f"Unexpected request: {method} {path}")
+
+    def _send(self, status, payload, headers=None):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def fake_notion():
+    server = FakeNotion()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(server, rate=50.0, **kwargs):
+    return AsyncNotionClient(
+        token="secret_test",
+        rate_limiter=RateLimiter(rate=rate),
+        base_url=server.base_url,
+        database_ids_path="nonexistent.json",
+        **kwargs
+    )
+
+
+# ==================== AsyncNotionClient ====================
+
+def test_client_single_flight_at_rate(fake_notion):
+    """Test concurrent calls are sent one at a time, spaced by the rate"""
+    fake_notion.latency = 0.01
+    client = make_client(fake_notion, rate=20.0)
+
+    async def main():
+        async with client:
+            await asyncio.gather(*(
+                client.create_page(parent_database_id="db", properties={}) for _ in range(6)
+            ))
+
+    asyncio.run(main())
+
+    assert fake_notion.max_in_flight == 1
+    times = [t for t, _, _ in fake_notion.requests]
+    assert len(times) == 6
+    # 5 intervals at 20/s (single gaps jitter with connection setup)
+    assert times[-1] - times[0] >= 5 / 20.0 - 0.02
+    assert client.get_stats()['total_api_calls'] == 6
+
+
+def test_client_retries_rate_limited_request(fake_notion):
+    """Test a 429 is retried after Retry-After"""
+    fake_notion.fail_next = [429]
+    client = make_client(fake_notion)
+
+    async def main():
+        async with client:
+            return await client.update_page(page_id="page-x", properties={})
+
+    page = asyncio.run(main())
+
+    assert page['id'] == "page-x"
+    assert client.get_stats()['total_retries'] == 1
+    assert len(fake_notion.requests) == 2
+
+
+def test_client_not_found_raises(fake_notion):
+    """Test 404 is not retried"""
+    fake_notion.fail_next = [404]
+    client = make_client(fake_notion)
+
+    async def main():
+        async with client:
+            await client.delete_block(block_id="missing")
+
+    with pytest.raises(NotionError, match="not found"):
+        asyncio.run(main())
+    assert len(fake_notion.requests) == 1
+
+
+# ==================== AsyncSyncEngine ====================
+
+def _paragraphs(markdown):
+    """Render each non-empty line as a paragraph block (no mistletoe needed)"""
+    return [
+        {'object': 'block', 'type': 'paragraph',
+         'paragraph': {'rich_text': [{'type': 'text', 'text': {'content': line}}]}}
+        for line in markdown.splitlines() if line.strip()
+    ]
+
+
+@pytest.fixture
+def posts():
+    """Cached posts; metadata written back by the sync"""
+    return {
+        f"post-{i}": {
+            'content': "\n".join(f"Post {i} paragraph {j}" for j in range(3)),
+            'metadata': {'topic': f'Topic {i}', 'language': 'de'}
+        }
+        for i in range(6)
+    }
+
+
+@pytest.fixture
+def sync_manager(posts, tmp_path):
+    cache_manager = Mock()
+    cache_manager.get_cached_blog_posts.side_effect = lambda: [{'slug': s, **p} for s, p in posts.items()]
+    cache_manager.read_blog_post.side_effect = lambda slug: dict(posts[slug])
+
+    def write_blog_post(slug, content, metadata):
+        posts[slug] = {'content': content, 'metadata': metadata}
+    cache_manager.write_blog_post.side_effect = write_blog_post
+
+    notion_client = Mock()
+    notion_client.rate_limiter = RateLimiter(rate=50.0)
+    return SyncManager(
+        cache_manager=cache_manager,
+        notion_client=notion_client,
+        block_store=CacheStore(str(tmp_path / "notion_blocks.db"), namespace="notion_blocks")
+    )
+
+
+def make_engine(server, sync_manager, rate=50.0, **kwargs):
+    client = make_client(server, rate=rate)
+    client.database_ids = {'blog_posts': 'db-blog'}
+    return AsyncSyncEngine(sync_manager, client, **kwargs)
+
+
+def test_engine_creates_then_skips(fake_notion, sync_manager, posts):
+    """Test new posts are created and an unchanged re-run makes no calls"""
+    with patch.object(SyncManager, '_markdown_to_blocks', side_effect=_paragraphs):
+        first = make_engine(fake_notion, sync_manager).run()
+        second = make_engine(fake_notion, sync_manager).run()
+
+    assert first['created'] == 6 and first['failed'] == 0
+    assert first['api_calls'] == 6
+    assert all(post['metadata']['notion_id'] in fake_notion.pages for post in posts.values())
+    assert fake_notion.max_in_flight == 1
+
+    assert second['skipped'] == 6
+    assert second['api_calls'] == 0
+
+
+def test_engine_updates_changed_blocks_only(fake_notion, sync_manager, posts):
+    """Test an edited post costs a listing and one block update"""
+    with patch.object(SyncManager, '_markdown_to_blocks', side_effect=_paragraphs):
+        make_engine(fake_notion, sync_manager).run()
+        posts['post-2']['content'] = posts['post-2']['content'].replace("paragraph 1", "paragraph one")
+        fake_notion.requests.clear()
+
+        result = make_engine(fake_notion, sync_manager).run()
+
+    assert result['updated'] == 1 and result['skipped'] == 5
+    # Ids of blocks created with the page are listed once, then one PATCH
+    assert [(method, path.split('/')[-1]) for _, method, path in fake_notion.requests] == [
+        ("GET", "children"), ("PATCH", fake_notion.pages[posts['post-2']['metadata']['notion_id']][1])
+    ]
+
+
+def test_engine_failure_does_not_stop_batch(fake_notion, sync_manager):
+    """Test a post that fails to render is counted, the others are synced"""
+    def render(markdown):
+        if "Post 3" in markdown:
+            raise ValueError("bad markdown")
+        return _paragraphs(markdown)
+
+    progress = []
+    with patch.object(SyncManager, '_markdown_to_blocks', side_effect=render):
+        result = make_engine(fake_notion, sync_manager).run(progress_callback=progress.append)
+
+    assert result['failed'] == 1 and result['created'] == 5
+    assert "post-3" in result['errors'][0]
+    assert [p['current'] for p in progress] == list(range(1, 7))
+
+
+def test_engine_overlaps_preparation_and_network(fake_notion, sync_manager):
+    """Test rendering runs while requests are sent, within the rate limit"""
+    def slow_render(markdown):
+        time.sleep(0.1)
+        return _paragraphs(markdown)
+
+    rate = 20.0
+    with patch.object(SyncManager, '_markdown_to_blocks', side_effect=slow_render):
+        result = make_engine(fake_notion, sync_manager, rate=rate, prepare_workers=3).run()
+
+    # Serial: 6 x 0.1s rendering + 6 requests at 20/s = 0.9s
+    serial = 6 * 0.1 + 6 / rate
+    assert result['created'] == 6
+    assert result['duration_sec'] < serial * 0.7
+    assert result['requests_per_sec'] <= rate * 1.05
+    assert fake_notion.max_in_flight == 1
@@ -0,0 +1,201 @@
+"""
+Tests for block-level diff sync
+
+Test Coverage:
+- Edit scripts for unchanged, changed, inserted and deleted blocks
+- Type changes, inserts at the start of a page
+- BlockSync: API calls issued, recorded state, id resolution, full replace
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.notion_integration.block_diff import BlockSync, diff_blocks
+from src.notion_integration.fingerprint import block_fingerprint
+from src.utils.cache_store import CacheStore
+
+
+def paragraph(text):
+    return {'object': 'block', 'type': 'paragraph',
+            'paragraph': {'rich_text': [{'type': 'text', 'text': {'content': text}}]}}
+
+
+def heading(text):
+    return {'object': 'block', 'type': 'heading_2',
+            'heading_2': {'rich_text': [{'type': 'text', 'text': {'content': text}}]}}
+
+
+def pushed_state(blocks, prefix='b'):
+    return [
+        {'id': f'{prefix}{i}', 'type': block['type'], 'hash': block_fingerprint(block)}
+        for i, block in enumerate(blocks)
+    ]
+
+
+@pytest.fixture
+def post():
+    """A 300-block post"""
+    return [heading(f"Section {i}") if i % 10 == 0 else paragraph(f"Paragraph {i}") for i in range(300)]
+
+
+# ==================== diff_blocks ====================
+
+def test_diff_unchanged_is_empty(post):
+    script = diff_blocks(pushed_state(post), post)
+
+    assert script.api_calls == 0
+    assert [entry['id'] for entry in script.state] == [f'b{i}' for i in range(300)]
+
+
+def test_diff_copy_edit_updates_in_place(post):
+    """Editing a few paragraphs costs one update call each"""
+    edited = list(post)
+    edited[5] = paragraph("Paragraph 5, reworded")
+    edited[151] = paragraph("Paragraph 151, reworded")
+
+    script = diff_blocks(pushed_state(post), edited)
+
+    assert [block_id for block_id, _ in script.updates] == ['b5', 'b151']
+    assert script.deletes == []
+    assert script.inserts == []
+    assert script.api_calls == 2
+
+
+def test_diff_insert_is_anchored(post):
+    """New blocks are inserted after the preceding block in one call"""
+    edited = post[:42] + [paragraph("New 1"), paragraph("New 2")] + post[42:]
+
+    script = diff_blocks(pushed_state(post), edited)
+
+    assert script.inserts == [('b41', [42, 43])]
+    assert script.updates == [] and script.deletes == []
+    assert script.state[42]['id'] is None
+    assert script.state[44]['id'] == 'b42'
+
+
+def test_diff_delete(post):
+    edited = post[:10] + post[13:]
+
+    script = diff_blocks(pushed_state(post), edited)
+
+    assert script.deletes == ['b10', 'b11', 'b12']
+    assert script.api_calls == 3
+
+
+def test_diff_type_change_deletes_and_inserts():
+    old = [paragraph("a"), paragraph("b"), paragraph("c")]
+    new = [paragraph("a"), heading("b"), paragraph("c")]
+
+    script = diff_blocks(pushed_state(old), new)
+
+    assert script.deletes == ['b1']
+    assert script.inserts == [('b0', [1])]
+
+
+def test_diff_insert_at_start_not_expressible():
+    old = [paragraph("a"), paragraph("b")]
+    new = [heading("intro"), paragraph("a"), paragraph("b")]
+
+    assert diff_blocks(pushed_state(old), new) is None
+
+
+def test_diff_rewrite_of_whole_page_appends_at_end():
+    old = [paragraph("a"), paragraph("b")]
+    new = [heading("x"), heading("y"), heading("z")]
+
+    script = diff_blocks(pushed_state(old), new)
+
+    assert script.deletes == ['b0', 'b1']
+    assert script.inserts == [(None, [0, 1, 2])]
+
+
+# ==================== BlockSync ====================
+
+@pytest.fixture
+def notion():
+    client = Mock()
+    client.append_blocks.side_effect = lambda block_id, children, after=None, retry=False: {
+        'results': [{'id': f'new-{i}'} for i in range(len(children))]
+    }
+    return client
+
+
+@pytest.fixture
+def block_sync(notion, tmp_path):
+    return BlockSync(notion, CacheStore(str(tmp_path / "blocks.db"), namespace="notion_blocks"))
+
+
+def test_push_copy_edit_uses_few_calls(block_sync, notion, post):
+    """A copy edit of a 300-block post costs a handful of calls, not a re-sync"""
+    block_sync.store.set('page', {'properties': 'p', 'blocks': pushed_state(post)})
+
+    edited = list(post)
+    edited[7] = paragraph("Paragraph 7, fixed typo")
+    edited.insert(100, paragraph("Added sentence"))
+    del edited[250]
+
+    stats = block_sync.push('page', edited, 'p')
+
+    assert stats == {'updated': 1, 'appended': 1, 'deleted': 1, 'api_calls': 3, 'full_replace': False}
+    notion.update_block.assert_called_once_with(block_id='b7', block=edited[7], retry=True)
+    assert notion.append_blocks.call_args.kwargs['after'] == 'b99'
+
+    # Recorded state matches the page: a second push is free
+    notion.reset_mock()
+    assert block_sync.push('page', edited, 'p')['api_calls'] == 0
+    assert block_sync.store.get('page')['blocks'][100]['id'] == 'new-0'
+
+
+def test_push_resolves_ids_after_record(block_sync, notion):
+    """Ids of blocks recorded at page creation are listed once on the first edit"""
+    blocks = [paragraph("a"), paragraph("b")]
+    block_sync.record('page', blocks, 'p')
+    notion.retrieve_block_children.return_value = {
+        'results': [{'id': 'x0'}, {'id': 'x1'}], 'has_more': False, 'next_cursor': None
+    }
+
+    stats = block_sync.push('page', [paragraph("a"), paragraph("b2")], 'p')
+
+    assert stats['api_calls'] == 2  # One listing, one update
+    notion.update_block.assert_called_once()
+    assert notion.update_block.call_args.kwargs['block_id'] == 'x1'
+
+
+def test_push_without_state_replaces_all(block_sync, notion):
+    notion.retrieve_block_children.return_value = {
+        'results': [{'id': 'old-0'}], 'has_more': False, 'next_cursor': None
+    }
+
+    stats = block_sync.push('page', [paragraph("a"), paragraph("b")], 'p')
+
+    assert stats['full_replace'] is True
+    notion.delete_block.assert_called_once_with(block_id='old-0', retry=True)
+    assert len(notion.append_blocks.call_args.kwargs['children']) == 2
+    assert block_sync.store.get('page')['properties'] == 'p'
+
+
+def test_properties_changed(block_sync):
+    assert block_sync.properties_changed('page', 'p') is True
+    block_sync.record('page', [], 'p')
+    assert block_sync.properties_changed('page', 'p') is False
+    assert block_sync.properties_changed('page', 'q') is True
+
+
+def test_push_failure_mid_script_forces_replace(block_sync, notion, post):
+    """A failed call drops the recorded state, so the next push replaces all blocks"""
+    block_sync.store.set('page', {'properties': 'p', 'blocks': pushed_state(post)})
+    edited = post[:10] + post[13:]
+    notion.delete_block.side_effect = [None, RuntimeError("HTTP 502")]
+
+    with pytest.raises(RuntimeError):
+        block_sync.push('page', edited, 'p')
+    assert block_sync.store.get('page') is None
+
+    notion.delete_block.side_effect = None
+    notion.retrieve_block_children.return_value = {
+        'results': [{'id': f'b{i}'} for i in range(299)], 'has_more': False, 'next_cursor': None
+    }
+    stats = block_sync.push('page', edited, 'p')
+
+    assert stats['full_replace'] is True
+    assert block_sync.store.get('page')['properties'] == 'p'
@@ -15,6 +15,7 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch
 from notion_client import APIResponseError
 from src.notion_integration.notion_client import NotionClient, NotionError
+from src.notion_integration.rate_limiter import RateLimiter
 
 
 @pytest.fixture
@@ -46,6 +47,22 @@ class TestNotionClientInitialization:
             client = NotionClient(token="test_token", rate_limit=5.0)
             assert client.rate_limiter.rate == 5.0
 
+    def test_clients_with_same_token_share_budget(self):
+        with patch('src.notion_integration.notion_client.Client'):
+            first = NotionClient(token="shared_token")
+            second = NotionClient(token="shared_token")
+            other = NotionClient(token="other_token")
+
+        assert first.rate_limiter.budget is second.rate_limiter.budget
+        assert first.rate_limiter.budget is not other.rate_limiter.budget
+
+    def test_uses_injected_rate_limiter(self):
+        limiter = RateLimiter(rate=1.0)
+        with patch('src.notion_integration.notion_client.Client'):
+            client = NotionClient(token="test_token", rate_limiter=limiter)
+
+        assert client.rate_limiter is limiter
+
     def test_validates_token_not_empty(self):
         with pytest.raises(ValueError, match="Token cannot be empty"):
             NotionClient(token="")
@@ -196,6 +213,36 @@ class TestBlockOperations:
         assert len(result["results"]) == 1
         mock_notion_sdk.blocks.children.list.assert_called_once_with(block_id="page-123")
 
+    def test_append_blocks_after_block(self, notion_client, mock_notion_sdk):
+        blocks = [{"type": "paragraph", "paragraph": {"rich_text": []}}]
+
+        notion_client.append_blocks(block_id="page-123", children=blocks, after="block-7")
+
+        mock_notion_sdk.blocks.children.append.assert_called_once_with(
+            block_id="page-123",
+            children=blocks,
+            after="block-7"
+        )
+
+    def test_update_block(self, notion_client, mock_notion_sdk):
+        block = {
+            "object": "block",
+            "type": "paragraph",
+            "paragraph": {"rich_text": [{"text": {"content": "Edited"}}]}
+        }
+
+        notion_client.update_block(block_id="block-1", block=block)
+
+        mock_notion_sdk.blocks.update.assert_called_once_with(
+            block_id="block-1",
+            paragraph=block["paragraph"]
+        )
+
+    def test_delete_block(self, notion_client, mock_notion_sdk):
+        notion_client.delete_block(block_id="block-1")
+
+        mock_notion_sdk.blocks.delete.assert_called_once_with(block_id="block-1")
+
 
 class TestErrorHandling:
     """Test error handling and retry logic"""
@@ -13,7 +13,12 @@ Rate limiter implements token bucket algorithm with:
 import time
 import pytest
 from threading import Thread
-from src.notion_integration.rate_limiter import RateLimiter
+from src.notion_integration.rate_limiter import (
+    RateLimiter,
+    RateBudget,
+    SQLiteRateBudget,
+    shared_budget,
+)
 
 
 class TestRateLimiterInitialization:
@@ -215,6 +220,69 @@ class TestContextManager:
         assert 0.08 < elapsed < 0.12
 
 
+class TestAsyncAcquire:
+    """Test acquire_async"""
+
+    def test_acquire_async_enforces_rate_without_blocking_loop(self):
+        import asyncio
+
+        limiter = RateLimiter(rate=10.0)
+        ticks = []
+
+        async def ticker():
+            # Keeps running while acquire_async waits
+            for _ in range(5):
+                ticks.append(time.time())
+                await asyncio.sleep(0.02)
+
+        async def requests():
+            for _ in range(3):
+                await limiter.acquire_async()
+
+        async def main():
+            start = time.time()
+            await asyncio.gather(ticker(), requests())
+            return time.time() - start
+
+        elapsed = asyncio.run(main())
+
+        assert 0.18 < elapsed < 0.3  # 3 requests at 10/s
+        assert len(ticks) == 5
+        assert limiter.get_stats()['total_requests'] == 3
+
+
+    def test_acquire_async_waits_for_sqlite_budget_off_loop(self, tmp_path):
+        import asyncio
+        import sqlite3
+
+        db_path = str(tmp_path / "limits.db")
+        limiter = RateLimiter(rate=10.0, budget=SQLiteRateBudget(db_path))
+        limiter.budget.backlog()  # Create the table
+
+        # Another process holds the budget's write lock for 0.2s
+        holder = sqlite3.connect(db_path, isolation_level=None)
+        holder.execute("BEGIN IMMEDIATE")
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.time())
+                await asyncio.sleep(0.02)
+
+        async def main():
+            asyncio.get_running_loop().call_later(0.2, holder.execute, "COMMIT")
+            await asyncio.gather(ticker(), limiter.acquire_async())
+
+        start = time.time()
+        asyncio.run(main())
+        holder.close()
+
+        # The loop kept ticking while the reservation waited on the lock
+        assert ticks[-1] - start < 0.15
+        assert time.time() - start >= 0.2
+        assert limiter.get_stats()['total_requests'] == 1
+
+
 class TestEdgeCases:
     """Test edge cases and error conditions"""
 
@@ -279,3 +347,81 @@ class TestStatistics:
 
         stats = limiter.get_stats()
         assert stats["total_requests"] == 0
+
+
+class TestSharedBudget:
+    """Test one rate budget shared by several limiters"""
+
+    def test_limiters_sharing_budget_space_requests(self):
+        budget = RateBudget()
+        first = RateLimiter(rate=10.0, budget=budget)
+        second = RateLimiter(rate=10.0, budget=budget)
+
+        first.acquire()
+        start = time.time()
+        second.acquire()
+        elapsed = time.time() - start
+
+        # Second limiter waits for the slot after the first one's request
+        assert 0.08 < elapsed < 0.12
+        assert first.get_stats()["total_requests"] == 1
+        assert second.get_stats()["total_requests"] == 1
+
+    def test_shared_budget_per_token(self, monkeypatch):
+        monkeypatch.delenv("NOTION_RATE_LIMIT_DB", raising=False)
+
+        assert shared_budget("token-a") is shared_budget("token-a")
+        assert shared_budget("token-a") is not shared_budget("token-b")
+
+    def test_shared_budget_uses_sqlite_when_configured(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("NOTION_RATE_LIMIT_DB", str(tmp_path / "limits.db"))
+
+        budget = shared_budget("token-a")
+
+        assert isinstance(budget, SQLiteRateBudget)
+        assert budget.db_path == str(tmp_path / "limits.db")
+
+    def test_sqlite_budget_shared_across_instances(self, tmp_path):
+        # Separate instances on one file behave like separate processes
+        db_path = str(tmp_path / "limits.db")
+        first = RateLimiter(rate=10.0, budget=SQLiteRateBudget(db_path, name="notion"))
+        second = RateLimiter(rate=10.0, budget=SQLiteRateBudget(db_path, name="notion"))
+        other = RateLimiter(rate=10.0, budget=SQLiteRateBudget(db_path, name="other"))
+
+        first.acquire()
+        start = time.time()
+        second.acquire()
+        elapsed = time.time() - start
+
+        assert 0.07 < elapsed < 0.13
+
+        # Different budget name: not throttled by the others
+        start = time.time()
+        other.acquire()
+        assert time.time() - start < 0.05
+
+    def test_reset_keeps_shared_budget(self):
+        budget = RateBudget()
+        first = RateLimiter(rate=10.0, budget=budget)
+        second = RateLimiter(rate=10.0, budget=budget)
+
+        first.acquire()
+        first.reset()
+        start = time.time()
+        second.acquire()
+        elapsed = time.time() - start
+
+        # Resetting one limiter does not free the slots it reserved
+        assert first.get_stats()["total_requests"] == 0
+        assert 0.08 < elapsed < 0.12
+
+    def test_eta_includes_reserved_slots(self):
+        budget = RateBudget()
+        busy = RateLimiter(rate=2.5, budget=budget)
+        idle = RateLimiter(rate=2.5, budget=budget)
+
+        for _ in range(2):
+            busy.acquire()
+
+        # One slot (0.4s) is still reserved ahead of idle's requests
+        assert idle.calculate_eta(10) == pytest.approx(4.4, abs=0.05)
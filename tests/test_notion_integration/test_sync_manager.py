@@ -15,10 +15,17 @@ Test Coverage:
 - Logging
 """
 
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from unittest.mock import Mock, patch
 
 from src.notion_integration.sync_manager import SyncManager, SyncError
+from src.utils.cache_store import CacheStore
 
 
 # ==================== Fixtures ====================
@@ -123,41 +130,55 @@ def mock_rate_limiter():
     mock_rl = Mock()
     mock_rl.rate = 2.5  # 2.5 req/sec
     mock_rl.acquire.return_value = None  # No delay
+    mock_rl.calculate_eta.side_effect = lambda num_requests: max(num_requests, 0) / mock_rl.rate
     return mock_rl
 
 
+@pytest.fixture
+def block_store(tmp_path):
+    """Block store in a temp dir (keeps SyncManager out of the repo's cache/)"""
+    return CacheStore(str(tmp_path / "notion_blocks.db"), namespace="notion_blocks")
+
+
 # ==================== Initialization Tests ====================
 
-def test_sync_manager_init(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_manager_init(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test SyncManager initialization"""
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     assert sync_manager.cache_manager == mock_cache_manager
     assert sync_manager.notion_client == mock_notion_client
     assert sync_manager.rate_limiter == mock_rate_limiter
 
+    # Injected limiter is the client's limiter (single budget)
+    assert mock_notion_client.rate_limiter is mock_rate_limiter
 
-def test_sync_manager_init_creates_components_if_not_provided():
+
+def test_sync_manager_init_creates_components_if_not_provided(block_store):
     """Test SyncManager creates default components if not provided"""
     with patch('src.notion_integration.sync_manager.CacheManager') as mock_cm, \
          patch('src.notion_integration.sync_manager.NotionClient') as mock_nc, \
          patch('src.notion_integration.sync_manager.RateLimiter') as mock_rl:
 
-        SyncManager()
+        sync_manager = SyncManager(block_store=block_store)
 
         # Should create default components
         mock_cm.assert_called_once()
         mock_nc.assert_called_once()
-        mock_rl.assert_called_once()
+
+        # Should reuse the NotionClient's limiter instead of a second one
+        mock_rl.assert_not_called()
+        assert sync_manager.rate_limiter is mock_nc.return_value.rate_limiter
 
 
 # ==================== Single Blog Post Sync Tests ====================
 
-def test_sync_blog_post_success(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_blog_post_success(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test successful single blog post sync"""
     # Mock cache_manager.read_blog_post to return test data
     mock_cache_manager.read_blog_post.return_value = {
@@ -171,7 +192,8 @@ def test_sync_blog_post_success(mock_cache_manager, mock_notion_client, mock_rat
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     result = sync_manager.sync_blog_post('test-post')
@@ -184,11 +206,11 @@ def test_sync_blog_post_success(mock_cache_manager, mock_notion_client, mock_rat
     # Verify NotionClient.create_page was called
     mock_notion_client.create_page.assert_called_once()
 
-    # Verify rate limiter was used
-    mock_rate_limiter.acquire.assert_called_once()
+    # Rate limit is applied by NotionClient, not a second time here
+    mock_rate_limiter.acquire.assert_not_called()
 
 
-def test_sync_blog_post_with_progress_callback(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_blog_post_with_progress_callback(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test blog post sync with progress callback"""
     # Mock cache_manager.read_blog_post
     mock_cache_manager.read_blog_post.return_value = {
@@ -199,7 +221,8 @@ def test_sync_blog_post_with_progress_callback(mock_cache_manager, mock_notion_c
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     progress_callback = Mock()
@@ -210,7 +233,7 @@ def test_sync_blog_post_with_progress_callback(mock_cache_manager, mock_notion_c
     progress_callback.assert_called()
 
 
-def test_sync_blog_post_handles_notion_error(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_blog_post_handles_notion_error(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test error handling when Notion API fails"""
     # Mock cache_manager.read_blog_post
     mock_cache_manager.read_blog_post.return_value = {
@@ -223,7 +246,8 @@ def test_sync_blog_post_handles_notion_error(mock_cache_manager, mock_notion_cli
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     with pytest.raises(SyncError, match="Failed to sync blog post"):
@@ -232,12 +256,13 @@ def test_sync_blog_post_handles_notion_error(mock_cache_manager, mock_notion_cli
 
 # ==================== Batch Blog Post Sync Tests ====================
 
-def test_sync_all_blog_posts_success(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_all_blog_posts_success(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test successful batch blog post sync"""
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     results = sync_manager.sync_all_blog_posts()
@@ -250,16 +275,17 @@ def test_sync_all_blog_posts_success(mock_cache_manager, mock_notion_client, moc
     # Verify NotionClient.create_page called twice (2 cached posts)
     assert mock_notion_client.create_page.call_count == 2
 
-    # Verify rate limiter called twice
-    assert mock_rate_limiter.acquire.call_count == 2
+    # Rate limit is applied by NotionClient, not a second time here
+    mock_rate_limiter.acquire.assert_not_called()
 
 
-def test_sync_all_blog_posts_with_progress_callback(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_all_blog_posts_with_progress_callback(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test batch sync with progress callback"""
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     progress_callback = Mock()
@@ -270,7 +296,7 @@ def test_sync_all_blog_posts_with_progress_callback(mock_cache_manager, mock_not
     assert progress_callback.call_count >= 2
 
 
-def test_sync_all_blog_posts_partial_failure(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_all_blog_posts_partial_failure(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test batch sync with some failures"""
     # First call succeeds, second fails
     mock_notion_client.create_page.side_effect = [
@@ -281,7 +307,8 @@ def test_sync_all_blog_posts_partial_failure(mock_cache_manager, mock_notion_cli
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     results = sync_manager.sync_all_blog_posts()
@@ -292,14 +319,15 @@ def test_sync_all_blog_posts_partial_failure(mock_cache_manager, mock_notion_cli
     assert results['failed'] == 1
 
 
-def test_sync_all_blog_posts_no_cached_posts(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_all_blog_posts_no_cached_posts(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test batch sync with no cached posts"""
     mock_cache_manager.get_cached_blog_posts.return_value = []
 
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     results = sync_manager.sync_all_blog_posts()
@@ -315,12 +343,13 @@ def test_sync_all_blog_posts_no_cached_posts(mock_cache_manager, mock_notion_cli
 
 # ==================== Social Posts Sync Tests ====================
 
-def test_sync_social_posts_success(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_social_posts_success(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test successful social posts sync"""
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     results = sync_manager.sync_all_social_posts()
@@ -336,14 +365,15 @@ def test_sync_social_posts_success(mock_cache_manager, mock_notion_client, mock_
 
 # ==================== ETA Calculation Tests ====================
 
-def test_calculate_eta(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_calculate_eta(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test ETA calculation"""
     mock_rate_limiter.rate = 2.5  # 2.5 req/sec
 
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     # 10 items at 2.5 req/sec = 4 seconds
@@ -352,12 +382,13 @@ def test_calculate_eta(mock_cache_manager, mock_notion_client, mock_rate_limiter
     assert eta == pytest.approx(4.0, rel=0.1)
 
 
-def test_calculate_eta_zero_items(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_calculate_eta_zero_items(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test ETA calculation with zero items"""
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     eta = sync_manager.calculate_eta(num_items=0)
@@ -367,12 +398,13 @@ def test_calculate_eta_zero_items(mock_cache_manager, mock_notion_client, mock_r
 
 # ==================== Progress Callback Tests ====================
 
-def test_progress_callback_format(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_progress_callback_format(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test progress callback receives correct format"""
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     progress_callback = Mock()
@@ -388,12 +420,13 @@ def test_progress_callback_format(mock_cache_manager, mock_notion_client, mock_r
         assert 'message' in progress_data
 
 
-def test_progress_callback_eta_decreases(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_progress_callback_eta_decreases(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test that ETA decreases as sync progresses"""
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     progress_callback = Mock()
@@ -410,7 +443,7 @@ def test_progress_callback_eta_decreases(mock_cache_manager, mock_notion_client,
 
 # ==================== Error Handling Tests ====================
 
-def test_sync_continues_after_error(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_continues_after_error(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test that batch sync continues after individual errors"""
     # Fail on first, succeed on second
     mock_notion_client.create_page.side_effect = [
@@ -421,7 +454,8 @@ def test_sync_continues_after_error(mock_cache_manager, mock_notion_client, mock
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     results = sync_manager.sync_all_blog_posts()
@@ -431,7 +465,7 @@ def test_sync_continues_after_error(mock_cache_manager, mock_notion_client, mock
     assert results['failed'] == 1
 
 
-def test_sync_logs_errors(mock_cache_manager, mock_notion_client, mock_rate_limiter, caplog):
+def test_sync_logs_errors(mock_cache_manager, mock_notion_client, mock_rate_limiter, caplog, block_store):
     """Test that sync errors are logged"""
     import logging
     caplog.set_level(logging.ERROR)
@@ -447,7 +481,8 @@ def test_sync_logs_errors(mock_cache_manager, mock_notion_client, mock_rate_limi
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     try:
@@ -461,7 +496,7 @@ def test_sync_logs_errors(mock_cache_manager, mock_notion_client, mock_rate_limi
 
 # ==================== Retry Logic Tests ====================
 
-def test_sync_retries_on_failure(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_retries_on_failure(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test retry logic on transient failures"""
     # Mock cache_manager.read_blog_post
     mock_cache_manager.read_blog_post.return_value = {
@@ -480,7 +515,8 @@ def test_sync_retries_on_failure(mock_cache_manager, mock_notion_client, mock_ra
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
         rate_limiter=mock_rate_limiter,
-        max_retries=3
+        max_retries=3,
+        block_store=block_store
     )
 
     result = sync_manager.sync_blog_post('test')
@@ -492,7 +528,7 @@ def test_sync_retries_on_failure(mock_cache_manager, mock_notion_client, mock_ra
     assert mock_notion_client.create_page.call_count == 3
 
 
-def test_sync_fails_after_max_retries(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_fails_after_max_retries(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test failure after exceeding max retries"""
     # Mock cache_manager.read_blog_post
     mock_cache_manager.read_blog_post.return_value = {
@@ -506,7 +542,8 @@ def test_sync_fails_after_max_retries(mock_cache_manager, mock_notion_client, mo
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
         rate_limiter=mock_rate_limiter,
-        max_retries=3
+        max_retries=3,
+        block_store=block_store
     )
 
     with pytest.raises(SyncError):
@@ -516,9 +553,162 @@ def test_sync_fails_after_max_retries(mock_cache_manager, mock_notion_client, mo
     assert mock_notion_client.create_page.call_count == 3
 
 
+# ==================== Incremental Sync Tests ====================
+
+def _paragraphs(markdown):
+    """Render each non-empty line as a paragraph block (no mistletoe needed)"""
+    return [
+        {'object': 'block', 'type': 'paragraph',
+         'paragraph': {'rich_text': [{'type': 'text', 'text': {'content': line}}]}}
+        for line in markdown.splitlines() if line.strip()
+    ]
+
+
+@pytest.fixture
+def cached_post():
+    """Single cached post whose metadata is written back by the sync"""
+    post = {
+        'content': '# Test Post\n\nFirst paragraph.',
+        'metadata': {'topic': 'Test Topic', 'language': 'de'}
+    }
+
+    mock_cm = Mock()
+    mock_cm.get_cached_blog_posts.side_effect = lambda: [{'slug': 'test-post', **post}]
+    mock_cm.read_blog_post.side_effect = lambda slug: dict(post)
+
+    def write_blog_post(slug, content, metadata):
+        post['content'] = content
+        post['metadata'] = metadata
+    mock_cm.write_blog_post.side_effect = write_blog_post
+
+    return post, mock_cm
+
+
+@pytest.fixture
+def incremental_sync_manager(cached_post, mock_notion_client, mock_rate_limiter, tmp_path):
+    _, mock_cm = cached_post
+    mock_notion_client.retrieve_block_children.return_value = {
+        'results': [{'id': 'block-1'}, {'id': 'block-2'}], 'has_more': False, 'next_cursor': None
+    }
+    mock_notion_client.append_blocks.return_value = {'results': [{'id': 'block-3'}]}
+    sync_manager = SyncManager(
+        cache_manager=mock_cm,
+        notion_client=mock_notion_client,
+        rate_limiter=mock_rate_limiter,
+        block_store=CacheStore(str(tmp_path / "notion_blocks.db"), namespace="notion_blocks")
+    )
+    with patch.object(SyncManager, '_markdown_to_blocks', side_effect=_paragraphs):
+        yield sync_manager
+
+
+def test_sync_records_fingerprint_in_metadata(incremental_sync_manager, cached_post):
+    """Test a created page stores notion_id, synced_at and fingerprint with the post"""
+    post, _ = cached_post
+
+    result = incremental_sync_manager.sync_blog_post('test-post')
+
+    assert result['action'] == 'created'
+    metadata = post['metadata']
+    assert metadata['notion_id'] == 'page-123'
+    assert metadata['notion_synced_at']
+    assert len(metadata['notion_fingerprint']) == 64
+    assert metadata['topic'] == 'Test Topic'
+
+
+def test_sync_skips_unchanged_posts(incremental_sync_manager, mock_notion_client):
+    """Test a second sync without changes makes no API calls"""
+    first = incremental_sync_manager.sync_all_blog_posts()
+    second = incremental_sync_manager.sync_all_blog_posts()
+
+    assert first['created'] == 1
+    assert second['skipped'] == 1
+    assert second['created'] == 0
+    assert second['updated'] == 0
+    assert second['successful'] == 1
+    mock_notion_client.create_page.assert_called_once()
+    mock_notion_client.update_page.assert_not_called()
+
+
+def test_sync_updates_changed_post_in_place(incremental_sync_manager, cached_post, mock_notion_client):
+    """Test a changed post updates its existing page with only the changed blocks"""
+    post, _ = cached_post
+    incremental_sync_manager.sync_blog_post('test-post')
+    first_fingerprint = post['metadata']['notion_fingerprint']
+
+    post['content'] += '\n\nSecond paragraph.'
+    results = incremental_sync_manager.sync_all_blog_posts()
+
+    assert results['updated'] == 1
+    mock_notion_client.create_page.assert_called_once()
+
+    # Title unchanged: no property update; one block appended after the last one
+    mock_notion_client.update_page.assert_not_called()
+    mock_notion_client.delete_block.assert_not_called()
+    append = mock_notion_client.append_blocks.call_args.kwargs
+    assert append['after'] == 'block-2'
+    assert len(append['children']) == 1
+
+    assert post['metadata']['notion_fingerprint'] != first_fingerprint
+
+
+def test_sync_updates_properties_when_title_changes(incremental_sync_manager, cached_post, mock_notion_client):
+    """Test changed properties are sent and a same-type block is updated in place"""
+    post, _ = cached_post
+    incremental_sync_manager.sync_blog_post('test-post')
+
+    post['content'] = post['content'].replace('# Test Post', '# Renamed Post')
+    result = incremental_sync_manager.sync_blog_post('test-post')
+
+    assert result['action'] == 'updated'
+    assert mock_notion_client.update_page.call_args.kwargs['page_id'] == 'page-123'
+    assert mock_notion_client.update_block.call_args.kwargs['block_id'] == 'block-1'
+    mock_notion_client.append_blocks.assert_not_called()
+
+
+# ==================== Rendering Tests ====================
+
+def test_markdown_rendering_is_serialized(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store, monkeypatch):
+    """Test threads never run mistletoe (module-global parser state) at the same time"""
+    active = []
+    overlaps = []
+    lock = threading.Lock()
+
+    class Document:
+        def __init__(self, markdown):
+            with lock:
+                active.append(markdown)
+                overlaps.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(markdown)
+
+    class BaseRenderer:
+        def render(self, token):
+            return []
+
+    mistletoe = types.ModuleType('mistletoe')
+    mistletoe.Document = Document
+    base_renderer = types.ModuleType('mistletoe.base_renderer')
+    base_renderer.BaseRenderer = BaseRenderer
+    monkeypatch.setitem(sys.modules, 'mistletoe', mistletoe)
+    monkeypatch.setitem(sys.modules, 'mistletoe.base_renderer', base_renderer)
+
+    sync_manager = SyncManager(
+        cache_manager=mock_cache_manager,
+        notion_client=mock_notion_client,
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
+    )
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(sync_manager._markdown_to_blocks, [f"# Post {i}" for i in range(8)]))
+
+    assert results == [[]] * 8
+    assert len(overlaps) == 8 and max(overlaps) == 1
+
+
 # ==================== Logging Tests ====================
 
-def test_sync_logs_start(mock_cache_manager, mock_notion_client, mock_rate_limiter, caplog):
+def test_sync_logs_start(mock_cache_manager, mock_notion_client, mock_rate_limiter, caplog, block_store):
     """Test that sync start is logged"""
     import logging
     caplog.set_level(logging.INFO)
@@ -526,7 +716,8 @@ def test_sync_logs_start(mock_cache_manager, mock_notion_client, mock_rate_limit
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     sync_manager.sync_all_blog_posts()
@@ -535,7 +726,7 @@ def test_sync_logs_start(mock_cache_manager, mock_notion_client, mock_rate_limit
     assert any("Syncing" in record.message or "sync" in record.message.lower() for record in caplog.records)
 
 
-def test_sync_logs_success(mock_cache_manager, mock_notion_client, mock_rate_limiter, caplog):
+def test_sync_logs_success(mock_cache_manager, mock_notion_client, mock_rate_limiter, caplog, block_store):
     """Test that successful sync is logged"""
     import logging
     caplog.set_level(logging.INFO)
@@ -543,7 +734,8 @@ def test_sync_logs_success(mock_cache_manager, mock_notion_client, mock_rate_lim
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     sync_manager.sync_all_blog_posts()
@@ -554,26 +746,29 @@ def test_sync_logs_success(mock_cache_manager, mock_notion_client, mock_rate_lim
 
 # ==================== Integration Tests ====================
 
-def test_sync_respects_rate_limit(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_respects_rate_limit(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test that sync respects rate limiting"""
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     sync_manager.sync_all_blog_posts()
 
-    # Verify rate limiter acquired for each sync
-    assert mock_rate_limiter.acquire.call_count == 2
+    # One budget: the client's limiter, which SyncManager does not acquire itself
+    assert mock_notion_client.rate_limiter is mock_rate_limiter
+    mock_rate_limiter.acquire.assert_not_called()
 
 
-def test_sync_batch_creates_correct_notion_pages(mock_cache_manager, mock_notion_client, mock_rate_limiter):
+def test_sync_batch_creates_correct_notion_pages(mock_cache_manager, mock_notion_client, mock_rate_limiter, block_store):
     """Test that batch sync creates pages with correct data"""
     sync_manager = SyncManager(
         cache_manager=mock_cache_manager,
         notion_client=mock_notion_client,
-        rate_limiter=mock_rate_limiter
+        rate_limiter=mock_rate_limiter,
+        block_store=block_store
     )
 
     sync_manager.sync_all_blog_posts()
@@ -0,0 +1,196 @@
+"""
+Tests for CollectionOrchestrator
+
+Tests concurrent collection stages, per-stage timeouts and budgets,
+streaming deduplication and batched storage.
+"""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.models.document import Document
+from src.orchestrator.collection_orchestrator import (
+    CollectionOrchestrator,
+    CollectionStage,
+    StageOutput,
+)
+from src.processors.deduplicator import Deduplicator
+
+
+def make_doc(source: str, index: int) -> Document:
+    url = f"https://{source}.example.com/article-{index}"
+    return Document(
+        id=f"{source}_{index}",
+        source=source,
+        source_url=url,
+        title=f"{source} article {index}",
+        content=f"Unique {source} content number {index} " + " ".join(f"{source}{index}w{i}" for i in range(20)),
+        language="de",
+        domain="SaaS",
+        market="Germany",
+        vertical="Proptech",
+        content_hash=f"hash_{source}_{index}",
+        canonical_url=url,
+        published_at=datetime.now(),
+        fetched_at=datetime.now()
+    )
+
+
+@pytest.fixture
+def db():
+    db = Mock()
+    db.insert_documents_bulk.side_effect = lambda docs: len(docs)
+    return db
+
+
+@pytest.fixture
+def orchestrator(db):
+    return CollectionOrchestrator(deduplicator=Deduplicator(threshold=0.7), db_manager=db)
+
+
+class TestCollectionOrchestrator:
+    """Test CollectionOrchestrator functionality"""
+
+    def test_stages_run_concurrently(self, orchestrator):
+        """Test all stages are running at the same time"""
+        barrier = threading.Barrier(3, timeout=2.0)
+
+        def stage(name):
+            def collect():
+                barrier.wait()  # Raises BrokenBarrierError if stages run sequentially
+                return [make_doc(name, 0)]
+            return CollectionStage(name, collect)
+
+        result = orchestrator.run([stage("a"), stage("b"), stage("c")])
+
+        assert result['errors'] == 0
+        assert result['documents_collected'] == 3
+        assert result['documents_saved'] == 3
+        assert {name: s['status'] for name, s in result['stages'].items()} == {
+            "a": "completed", "b": "completed", "c": "completed"
+        }
+
+    def test_documents_stored_before_slow_stage_finishes(self, db):
+        """Test a fast stage's documents are saved while a slow stage still runs"""
+        release = threading.Event()
+        saved_before_release = []
+
+        def insert(docs):
+            saved_before_release.append(not release.is_set())
+            return len(docs)
+        db.insert_documents_bulk.side_effect = insert
+
+        def fast():
+            return [make_doc("fast", i) for i in range(3)]
+
+        def slow():
+            # Finish only after the fast batch was stored
+            deadline = time.monotonic() + 2.0
+            while not saved_before_release and time.monotonic() < deadline:
+                time.sleep(0.01)
+            release.set()
+            return [make_doc("slow", 0)]
+
+        orchestrator = CollectionOrchestrator(Deduplicator(threshold=0.7), db, batch_size=2)
+        result = orchestrator.run([CollectionStage("fast", fast), CollectionStage("slow", slow)])
+
+        assert saved_before_release[0] is True
+        assert result['documents_saved'] == 4
+
+    def test_duplicates_across_stages_removed(self, orchestrator, db):
+        """Test documents are deduplicated across stages"""
+        result = orchestrator.run([
+            CollectionStage("a", lambda: [make_doc("same", 1)]),
+            CollectionStage("b", lambda: [make_doc("same", 1), make_doc("b", 2)]),
+        ])
+
+        assert result['documents_total'] == 3
+        assert result['documents_collected'] == 2
+        saved_ids = [doc.id for call in db.insert_documents_bulk.call_args_list for doc in call.args[0]]
+        assert sorted(saved_ids) == ["b_2", "same_1"]
+
+    def test_failed_stage_does_not_affect_others(self, orchestrator):
+        """Test a raising stage is recorded as failed and counted"""
+        def broken():
+            raise RuntimeError("API down")
+
+        result = orchestrator.run([
+            CollectionStage("broken", broken),
+            CollectionStage("ok", lambda: [make_doc("ok", 0)]),
+        ])
+
+        assert result['errors'] == 1
+        assert result['stages']['broken']['status'] == "failed"
+        assert "API down" in result['stages']['broken']['error']
+        assert result['documents_saved'] == 1
+
+    def test_stage_timeout(self, orchestrator):
+        """Test a stage past its timeout is abandoned without blocking the run"""
+        release = threading.Event()
+
+        def hang():
+            release.wait(2.0)
+            return [make_doc("late", 0)]
+
+        start = time.monotonic()
+        try:
+            result = orchestrator.run([
+                CollectionStage("hang", hang, timeout=0.1),
+                CollectionStage("ok", lambda: [make_doc("ok", 0)]),
+            ])
+        finally:
+            release.set()
+
+        assert time.monotonic() - start < 1.0
+        assert result['stages']['hang']['status'] == "timeout"
+        assert result['errors'] == 1
+        assert result['documents_collected'] == 1
+
+    def test_max_documents_budget(self, orchestrator):
+        """Test only max_documents documents are kept from a stage"""
+        result = orchestrator.run([
+            CollectionStage("many", lambda: [make_doc("many", i) for i in range(10)], max_documents=4),
+        ])
+
+        assert result['stages']['many']['documents'] == 4
+        assert result['documents_saved'] == 4
+
+    def test_stage_output_and_timings(self, orchestrator):
+        """Test StageOutput bookkeeping and per-stage timings"""
+        def collect():
+            time.sleep(0.05)
+            return StageOutput(documents=[make_doc("rss", 0)], sources=7, errors=1)
+
+        result = orchestrator.run([CollectionStage("rss", collect)])
+
+        assert result['sources_processed'] == 7
+        assert result['errors'] == 1
+        timings = result['stage_timings']
+        assert timings['rss'] >= 0.05
+        assert set(timings) == {"rss", "deduplication", "storage", "total"}
+        assert timings['total'] >= timings['rss']
+
+    def test_storage_failure_counted(self, orchestrator, db):
+        """Test a failing bulk insert is logged and counted, not raised"""
+        db.insert_documents_bulk.side_effect = RuntimeError("disk full")
+
+        result = orchestrator.run([CollectionStage("a", lambda: [make_doc("a", 0)])])
+
+        assert result['errors'] == 1
+        assert result['documents_saved'] == 0
+        assert result['documents_collected'] == 1
+
+    def test_failed_storage_forgets_documents(self, db):
+        """Test documents that could not be saved are collected again next run"""
+        db.insert_documents_bulk.side_effect = RuntimeError("disk full")
+        deduplicator = Deduplicator(threshold=0.7)
+        doc = make_doc("a", 0)
+
+        CollectionOrchestrator(deduplicator, db).run([CollectionStage("a", lambda: [doc])])
+
+        assert not deduplicator.has_seen_url(doc.canonical_url)
+        assert deduplicator.deduplicate([doc]) == [doc]
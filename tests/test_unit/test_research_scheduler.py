@@ -0,0 +1,209 @@
+"""
+Tests for ResearchScheduler and ProviderLimits
+
+Tests bounded-concurrency Stage 5 research and per-provider API limits.
+"""
+
+import asyncio
+
+import pytest
+
+from src.orchestrator.research_scheduler import ResearchScheduler
+from src.utils.provider_limits import ProviderLimits, provider_slot
+
+
+class ConcurrencyProbe:
+    """Records the peak number of concurrently running coroutines"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def hold(self, seconds: float = 0.01):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self.active -= 1
+
+
+class TestResearchScheduler:
+    """Test ResearchScheduler functionality"""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self):
+        """Test results are returned in topic order regardless of finish order"""
+        delays = {"slow": 0.05, "fast": 0.0, "medium": 0.02}
+
+        async def research(topic):
+            await asyncio.sleep(delays[topic])
+            return {"topic": topic, "cost": 0.01, "duration_sec": delays[topic]}
+
+        batch = await ResearchScheduler(max_concurrent_topics=3).run(
+            topics=["slow", "fast", "medium"],
+            research_fn=research
+        )
+
+        assert [r["topic"] for r in batch["results"]] == ["slow", "fast", "medium"]
+
+    @pytest.mark.asyncio
+    async def test_respects_max_concurrent_topics(self):
+        """Test no more than max_concurrent_topics run at once"""
+        probe = ConcurrencyProbe()
+
+        async def research(topic):
+            await probe.hold()
+            return {"topic": topic}
+
+        await ResearchScheduler(max_concurrent_topics=2).run(
+            topics=[f"topic {i}" for i in range(6)],
+            research_fn=research
+        )
+
+        assert probe.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_when_concurrency_is_one(self):
+        """Test max_concurrent_topics < 1 falls back to sequential"""
+        probe = ConcurrencyProbe()
+
+        async def research(topic):
+            await probe.hold()
+            return {"topic": topic}
+
+        scheduler = ResearchScheduler(max_concurrent_topics=0)
+        await scheduler.run(topics=["a", "b", "c"], research_fn=research)
+
+        assert scheduler.max_concurrent_topics == 1
+        assert probe.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_aggregates_cost_and_duration(self):
+        """Test cost and per-topic durations are summed, wall time measured"""
+        async def research(topic):
+            await asyncio.sleep(0.02)
+            return {"topic": topic, "cost": 0.01, "duration_sec": 1.5}
+
+        batch = await ResearchScheduler(max_concurrent_topics=4).run(
+            topics=["a", "b", "c", "d"],
+            research_fn=research
+        )
+
+        assert batch["total_cost"] == pytest.approx(0.04)
+        assert batch["topic_time_sec"] == pytest.approx(6.0)
+        assert 0.0 < batch["wall_time_sec"] < 1.0
+        assert batch["max_concurrent_topics"] == 4
+
+    @pytest.mark.asyncio
+    async def test_missing_cost_treated_as_zero(self):
+        """Test results without cost/duration don't break aggregation"""
+        async def research(topic):
+            return {"topic": topic}
+
+        batch = await ResearchScheduler().run(topics=["a"], research_fn=research)
+
+        assert batch["total_cost"] == 0.0
+        assert batch["topic_time_sec"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_topics(self):
+        """Test first failure is re-raised and pending topics are cancelled"""
+        cancelled = []
+
+        async def research(topic):
+            if topic == "bad":
+                raise RuntimeError("research failed")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(topic)
+                raise
+            return {"topic": topic}
+
+        with pytest.raises(RuntimeError, match="research failed"):
+            await ResearchScheduler(max_concurrent_topics=3).run(
+                topics=["a", "bad", "b"],
+                research_fn=research
+            )
+
+        assert sorted(cancelled) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_empty_topic_list(self):
+        """Test empty batch returns empty results"""
+        async def research(topic):
+            return {}
+
+        batch = await ResearchScheduler().run(topics=[], research_fn=research)
+
+        assert batch["results"] == []
+        assert batch["total_cost"] == 0.0
+
+
+class TestProviderLimits:
+    """Test per-provider concurrency limits"""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_calls_per_provider(self):
+        """Test each provider is capped at its configured limit"""
+        limits = ProviderLimits({"gemini": 2, "tavily": 1})
+        gemini_probe = ConcurrencyProbe()
+        tavily_probe = ConcurrencyProbe()
+
+        async def call(provider, probe):
+            async with limits.slot(provider):
+                await probe.hold()
+
+        await asyncio.gather(
+            *[call("gemini", gemini_probe) for _ in range(5)],
+            *[call("tavily", tavily_probe) for _ in range(5)]
+        )
+
+        assert gemini_probe.peak == 2
+        assert tavily_probe.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_provider_is_unlimited(self):
+        """Test providers without a limit are not throttled"""
+        limits = ProviderLimits({"gemini": 1})
+        probe = ConcurrencyProbe()
+
+        async def call():
+            async with limits.slot("searxng"):
+                await probe.hold()
+
+        await asyncio.gather(*[call() for _ in range(4)])
+
+        assert probe.peak == 4
+
+    @pytest.mark.asyncio
+    async def test_provider_slot_without_limits_is_noop(self):
+        """Test provider_slot(None, ...) doesn't throttle"""
+        probe = ConcurrencyProbe()
+
+        async def call():
+            async with provider_slot(None, "gemini"):
+                await probe.hold()
+
+        await asyncio.gather(*[call() for _ in range(3)])
+
+        assert probe.peak == 3
+
+    def test_default_limits(self):
+        """Test default limits cover Gemini, Tavily and Voyage"""
+        limits = ProviderLimits()
+
+        assert {"gemini", "tavily", "voyage"} <= set(limits.limits)
+
+    def test_reusable_across_event_loops(self):
+        """Test one instance works across separate asyncio.run() calls"""
+        limits = ProviderLimits({"gemini": 1})
+
+        async def call():
+            async with limits.slot("gemini"):
+                await asyncio.sleep(0)
+            return True
+
+        assert asyncio.run(call())
+        assert asyncio.run(call())
@@ -16,7 +16,7 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch
 from pydantic import HttpUrl
 
-from src.agents.universal_topic_agent import UniversalTopicAgent
+from src.agents.universal_topic_agent import UniversalTopicAgent, UniversalTopicAgentError
 from src.utils.config_loader import FullConfig, MarketConfig, CollectorsConfig
 from src.models.document import Document
 from src.database.sqlite_manager import SQLiteManager
@@ -325,3 +325,122 @@ class TestRSSCollectionIntegration:
         assert all(isinstance(url, str) for url in feed_urls)
         # Verify they're not HttpUrl objects
         assert not any(isinstance(url, HttpUrl) for url in feed_urls)
+
+    def test_collect_all_sources_polls_due_feeds_only(self, config_with_both_feeds, mock_components):
+        """Test full collection asks the RSS collector to skip feeds that are not due"""
+        mock_components['feed_discovery'].discover_feeds.return_value = []
+        mock_components['rss_collector'].collect_from_feeds.return_value = []
+        mock_components['autocomplete_collector'].collect_suggestions.return_value = []
+        mock_components['deduplicator'].deduplicate.return_value = []
+
+        agent = UniversalTopicAgent(
+            config=config_with_both_feeds,
+            reddit_collector=None,
+            trends_collector=None,
+            **mock_components
+        )
+
+        agent.collect_all_sources()
+
+        call_args = mock_components['rss_collector'].collect_from_feeds.call_args
+        assert call_args.kwargs['due_only'] is True
+
+    def test_collect_all_sources_reports_stage_timings(self, config_with_both_feeds, mock_components):
+        """Test full collection reports per-stage status and timing"""
+        mock_components['feed_discovery'].discover_feeds.side_effect = RuntimeError("search down")
+        mock_components['rss_collector'].collect_from_feeds.return_value = []
+        mock_components['autocomplete_collector'].collect_suggestions.return_value = []
+        mock_components['deduplicator'].deduplicate.return_value = []
+
+        agent = UniversalTopicAgent(
+            config=config_with_both_feeds,
+            reddit_collector=None,
+            trends_collector=None,
+            **mock_components
+        )
+
+        stats = agent.collect_all_sources()
+
+        assert set(stats['stages']) == {'feeds', 'autocomplete'}
+        assert all(stage['status'] == 'completed' for stage in stats['stages'].values())
+        assert {'feeds', 'autocomplete', 'deduplication', 'storage', 'total'} <= set(stats['stage_timings'])
+        # Discovery failure falls back to configured feeds and is counted
+        assert stats['errors'] == 1
+        assert stats['sources_processed'] == 4 + len(config_with_both_feeds.market.seed_keywords)
+
+    def test_collect_due_feeds(self, config_with_both_feeds, mock_components):
+        """Test between-run polling collects only due configured feeds and saves them"""
+        doc = Mock(spec=Document)
+        mock_components['rss_collector'].select_due_feeds.return_value = [
+            'https://example.com/market-feed1.xml'
+        ]
+        mock_components['rss_collector'].collect_from_feeds.return_value = [doc]
+        mock_components['deduplicator'].deduplicate.return_value = [doc]
+        mock_components['db_manager'].insert_documents_bulk.return_value = 1
+
+        agent = UniversalTopicAgent(
+            config=config_with_both_feeds,
+            reddit_collector=None,
+            trends_collector=None,
+            **mock_components
+        )
+
+        stats = agent.collect_due_feeds()
+
+        candidates = mock_components['rss_collector'].select_due_feeds.call_args.args[0]
+        assert len(candidates) == 4
+        mock_components['rss_collector'].collect_from_feeds.assert_called_once_with(
+            feed_urls=['https://example.com/market-feed1.xml']
+        )
+        mock_components['feed_discovery'].discover_feeds.assert_not_called()
+        assert stats == {
+            'documents_collected': 1,
+            'documents_saved': 1,
+            'feeds_configured': 4,
+            'feeds_polled': 1,
+            'errors': 0
+        }
+
+    def test_collection_shards(self, config_with_both_feeds, mock_components):
+        """Test collection is split into one shard per feed and keyword"""
+        discovered = Mock()
+        discovered.url = 'https://example.com/custom-feed1.xml'  # Also configured
+        mock_components['feed_discovery'].discover_feeds.return_value = [discovered]
+
+        agent = UniversalTopicAgent(
+            config=config_with_both_feeds,
+            reddit_collector=None,
+            trends_collector=None,
+            **mock_components
+        )
+
+        assert agent.collection_shards() == [
+            'feed:https://example.com/custom-feed1.xml',
+            'feed:https://example.com/market-feed1.xml',
+            'feed:https://example.com/market-feed2.xml',
+            'feed:https://example.com/custom-feed2.xml',
+            'autocomplete:PropTech',
+        ]
+
+    def test_collect_shard(self, config_with_both_feeds, mock_components):
+        """Test a shard collects a single source without saving"""
+        doc = Mock(spec=Document)
+        mock_components['rss_collector'].collect_from_feeds.return_value = [doc]
+
+        agent = UniversalTopicAgent(
+            config=config_with_both_feeds,
+            reddit_collector=None,
+            trends_collector=None,
+            **mock_components
+        )
+
+        output = agent.collect_shard('feed:https://example.com/feed.xml')
+
+        assert output.documents == [doc]
+        mock_components['rss_collector'].collect_from_feeds.assert_called_once_with(
+            feed_urls=['https://example.com/feed.xml'], skip_errors=False, due_only=True
+        )
+        mock_components['db_manager'].insert_documents_bulk.assert_not_called()
+
+        with pytest.raises(UniversalTopicAgentError):
+            agent.collect_shard('reddit:proptech')  # Reddit disabled
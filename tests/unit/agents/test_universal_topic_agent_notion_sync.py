@@ -136,6 +136,43 @@ class TestSyncToNotionSuccess:
         assert result['notion_pages_created'] == 3
         assert result['notion_pages_updated'] == 2
 
+    @pytest.mark.asyncio
+    async def test_sync_records_pushed_state_and_counts_skipped(self, mock_config, mock_components, sample_topics):
+        """Should persist notion state for pushed topics and report skipped ones"""
+        mock_db = mock_components['db_manager']
+        topics = sample_topics[:3]
+        mock_db.get_topics_by_priority.return_value = topics
+
+        def sync_batch(batch, update_existing, skip_errors):
+            batch[0].notion_id = 'notion_0'
+            batch[0].notion_fingerprint = 'fp_0'
+            batch[0].notion_synced_at = datetime(2025, 11, 10)
+            return [
+                {'action': 'created', 'id': 'notion_0', 'topic_id': 'topic_0'},
+                {'action': 'skipped', 'reason': 'unchanged', 'id': 'notion_1', 'topic_id': 'topic_1'},
+                {'action': 'skipped', 'reason': 'unchanged', 'id': 'notion_2', 'topic_id': 'topic_2'},
+            ]
+
+        mock_notion_sync = Mock()
+        mock_notion_sync.sync_batch.side_effect = sync_batch
+
+        agent = UniversalTopicAgent(
+            config=mock_config,
+            notion_sync=mock_notion_sync,
+            **mock_components
+        )
+
+        result = await agent.sync_to_notion(limit=3)
+
+        assert result['topics_synced'] == 1
+        assert result['notion_pages_skipped'] == 2
+        mock_db.mark_topic_synced.assert_called_once_with(
+            'topic_0',
+            notion_id='notion_0',
+            fingerprint='fp_0',
+            synced_at=datetime(2025, 11, 10)
+        )
+
     @pytest.mark.asyncio
     async def test_sync_custom_limit(self, mock_config, mock_components, sample_topics):
         """Should respect custom limit parameter"""
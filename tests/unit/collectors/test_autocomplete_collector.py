@@ -12,6 +12,7 @@ Test Coverage:
 - Document model creation with all required fields
 - Deduplication integration
 - Language support (de, en, fr, etc.)
+- Async expansion (pooled client, token bucket, early stop)
 """
 
 import pytest
@@ -19,6 +20,7 @@ from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 from pathlib import Path
 import hashlib
+import json
 import httpx
 
 from src.collectors.autocomplete_collector import (
@@ -111,7 +113,7 @@ def test_autocomplete_collector_initialization(autocomplete_collector, temp_cach
     assert autocomplete_collector.language == "de"
     assert autocomplete_collector.rate_limit == 10.0
     assert autocomplete_collector.last_request_time is None
-    assert autocomplete_collector._cache == {}
+    assert len(autocomplete_collector._cache) == 0
 
 
 def test_autocomplete_collector_creates_cache_dir(mock_config, mock_db_manager, mock_deduplicator, tmp_path):
@@ -322,8 +324,8 @@ def test_suggestions_cache_expiry(mock_httpx_get, autocomplete_collector):
 
     # Manually expire cache
     cache_key = "autocomplete_test_questions"
-    if cache_key in autocomplete_collector._cache:
-        autocomplete_collector._cache[cache_key]['timestamp'] = datetime.now() - timedelta(days=31)
+    assert cache_key in autocomplete_collector._cache
+    autocomplete_collector._cache.set(cache_key, ["suggestion"], ttl=timedelta(days=-1))
 
     # Second call - should fetch from API again
     autocomplete_collector.collect_suggestions(
@@ -347,7 +349,7 @@ def test_rate_limiting_enforcement(mock_sleep, mock_httpx_get, autocomplete_coll
     )
 
     # Clear cache to force requests
-    autocomplete_collector._cache = {}
+    autocomplete_collector._cache.clear()
 
     # Make multiple requests
     autocomplete_collector.collect_suggestions(
@@ -610,3 +612,148 @@ def test_save_and_load_suggestions_cache(mock_httpx_get, autocomplete_collector)
 
     # Should find cached data
     assert len(new_collector._cache) > 0
+
+
+# ==================== Async Expansion Tests ====================
+
+def make_async_collector(mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir, handler, **kwargs):
+    """Create collector in async mode with a mock transport"""
+    return AutocompleteCollector(
+        config=mock_config,
+        db_manager=mock_db_manager,
+        deduplicator=mock_deduplicator,
+        cache_dir=temp_cache_dir,
+        language="de",
+        transport=httpx.MockTransport(handler),
+        **{"max_concurrent_requests": 4, "rate_limit": 1000.0, **kwargs}
+    )
+
+
+def test_async_expansion_concurrent(mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir):
+    """Test async mode fetches queries concurrently over one client"""
+    import asyncio
+    in_flight = 0
+    max_in_flight = 0
+    queries = []
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        query = request.url.params["q"]
+        queries.append(query)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return httpx.Response(200, json=[query, [f"{query} 1", f"{query} 2", "shared"], [], {}])
+
+    collector = make_async_collector(
+        mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir, handler
+    )
+    docs = collector.collect_suggestions(
+        seed_keywords=['PropTech', 'Smart Building'],
+        expansion_types=[ExpansionType.QUESTIONS, ExpansionType.PREPOSITIONS]
+    )
+
+    assert len(queries) == 24
+    assert 1 < max_in_flight <= 4
+    # "shared" appears once across all expansions; documents keep sequential order
+    titles = [doc.title for doc in docs]
+    assert len(titles) == 24 * 2 + 1
+    assert titles[:3] == ["what PropTech 1", "what PropTech 2", "shared"]
+    assert collector.get_statistics()['cache_misses'] == 24
+
+    # Second run served from cache
+    collector.collect_suggestions(
+        seed_keywords=['PropTech'],
+        expansion_types=[ExpansionType.QUESTIONS]
+    )
+    assert len(queries) == 24
+    assert collector.get_statistics()['cache_hits'] == 1
+
+
+def test_async_expansion_stops_at_max_per_keyword(mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir):
+    """Test pending queries are cancelled once enough unique suggestions arrive"""
+    queries = []
+
+    def handler(request):
+        query = request.url.params["q"]
+        queries.append(query)
+        return httpx.Response(200, json=[query, [f"{query} a", f"{query} b", f"{query} c"], [], {}])
+
+    collector = make_async_collector(
+        mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir, handler,
+        max_concurrent_requests=1
+    )
+    docs = collector.collect_suggestions(
+        seed_keywords=['PropTech'],
+        expansion_types=[ExpansionType.QUESTIONS],
+        max_per_keyword=3
+    )
+
+    assert len(queries) < len(AutocompleteCollector.QUESTION_PREFIXES)
+    assert [doc.title for doc in docs][:3] == ["what PropTech a", "what PropTech b", "what PropTech c"]
+
+
+def test_async_expansion_rate_limited(mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir):
+    """Test the token bucket paces requests beyond the burst"""
+    import time
+
+    def handler(request):
+        return httpx.Response(200, json=["q", [request.url.params["q"]], [], {}])
+
+    collector = make_async_collector(
+        mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir, handler,
+        rate_limit=50.0, max_concurrent_requests=2
+    )
+
+    start = time.monotonic()
+    collector.collect_suggestions(seed_keywords=['PropTech'], expansion_types=[ExpansionType.QUESTIONS])
+    elapsed = time.monotonic() - start
+
+    # 6 requests, burst of 2, then 1/50s apart
+    assert elapsed >= 4 / 50.0 * 0.9
+
+
+def test_async_expansion_all_failed_raises(mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir):
+    """Test single keyword + expansion re-raises when every query fails"""
+    collector = make_async_collector(
+        mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir,
+        lambda request: httpx.Response(500, text="error")
+    )
+
+    with pytest.raises(AutocompleteCollectorError):
+        collector.collect_suggestions(seed_keywords=['PropTech'], expansion_types=[ExpansionType.QUESTIONS])
+
+    # Several pairs: failures are logged and skipped
+    docs = collector.collect_suggestions(
+        seed_keywords=['PropTech', 'Smart Building'], expansion_types=[ExpansionType.QUESTIONS]
+    )
+    assert docs == []
+    assert collector.get_statistics()['failed_requests'] == 3
+
+
+def test_load_cache_imports_legacy_json(mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir):
+    """Test legacy autocomplete_cache.json is imported once, dropping expired entries"""
+    legacy = {
+        'autocomplete_fresh_questions': {
+            'timestamp': (datetime.now() - timedelta(days=1)).isoformat(),
+            'suggestions': ['fresh suggestion']
+        },
+        'autocomplete_stale_questions': {
+            'timestamp': (datetime.now() - timedelta(days=40)).isoformat(),
+            'suggestions': ['stale suggestion']
+        },
+    }
+    cache_file = Path(temp_cache_dir) / "autocomplete_cache.json"
+    cache_file.write_text(json.dumps(legacy))
+
+    collector = AutocompleteCollector(
+        config=mock_config,
+        db_manager=mock_db_manager,
+        deduplicator=mock_deduplicator,
+        cache_dir=temp_cache_dir
+    )
+
+    assert not cache_file.exists()
+    assert collector._get_from_cache('autocomplete_fresh_questions') == ['fresh suggestion']
+    assert 'autocomplete_stale_questions' not in collector._cache
@@ -271,7 +271,7 @@ def test_e2e_cache_persistence_across_instances(mock_config, mock_db_manager, mo
     )
 
     # Should find cache
-    cache_file = Path(temp_cache_dir) / "autocomplete_cache.json"
+    cache_file = Path(temp_cache_dir) / "autocomplete_cache.db"
     assert cache_file.exists()
 
     # Load cache and verify
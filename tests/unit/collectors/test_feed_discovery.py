@@ -3,7 +3,7 @@ Tests for Feed Discovery Pipeline
 
 Test Coverage:
 - Stage 1: OPML seed loading + Gemini CLI expansion
-- Stage 2: SerpAPI search + feedfinder2 auto-detection
+- Stage 2: SerpAPI search + FeedFinder auto-detection (parallel, cached per domain)
 - Circuit breaker (3/day SerpAPI limit)
 - 30-day caching
 - Fallback logic (Gemini CLI failure)
@@ -11,6 +11,8 @@ Test Coverage:
 """
 
 import pytest
+import threading
+import time
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 import json
@@ -129,8 +131,8 @@ def mock_serpapi_response():
 
 @pytest.fixture
 def mock_feedfinder():
-    """Mock feedfinder2 feed detection"""
-    with patch('feedfinder2.find_feeds') as mock_find:
+    """Mock FeedFinder feed detection"""
+    with patch('src.collectors.feed_finder.FeedFinder.find_feeds') as mock_find:
         mock_find.return_value = [
             "https://www.proptech.de/feed",
             "https://www.proptech.de/rss"
@@ -308,7 +310,7 @@ def test_serpapi_cache_expires_after_30_days(feed_discovery, mock_serpapi_respon
 
 
 def test_feedfinder_discovers_feeds_from_domain(feed_discovery, mock_feedfinder):
-    """Test feedfinder2 auto-detects RSS feeds from domain"""
+    """Test FeedFinder auto-detects RSS feeds from domain"""
     domain = "proptech.de"
 
     feeds = feed_discovery._discover_feeds_from_domain(domain)
@@ -324,7 +326,7 @@ def test_feedfinder_discovers_feeds_from_domain(feed_discovery, mock_feedfinder)
 
 def test_feedfinder_handles_no_feeds_found(feed_discovery):
     """Test graceful handling when domain has no RSS feeds"""
-    with patch('feedfinder2.find_feeds', return_value=[]):
+    with patch('src.collectors.feed_finder.FeedFinder.find_feeds', return_value=[]):
         feeds = feed_discovery._discover_feeds_from_domain("no-feeds.com")
 
         # Should return empty list, not crash
@@ -347,6 +349,46 @@ def test_stage2_integrates_serpapi_and_feedfinder(
     assert len(feeds) > 0
 
 
+def test_domain_feeds_cached_per_domain(feed_discovery, mock_config, temp_cache_dir, mock_feedfinder):
+    """Test each domain is searched once; results persist across instances"""
+    with patch.object(feed_discovery, '_search_with_serpapi', return_value=["proptech.de"]):
+        first = feed_discovery.run_stage2(["PropTech"])
+        second = feed_discovery.run_stage2(["PropTech"])
+
+    assert [f.url for f in first] == [f.url for f in second]
+    mock_feedfinder.assert_called_once()
+
+    restarted = FeedDiscovery(config=mock_config, cache_dir=temp_cache_dir)
+    feeds = restarted._discover_feeds_from_domain("proptech.de")
+    assert len(feeds) == 2
+    mock_feedfinder.assert_called_once()
+
+
+def test_stage2_searches_domains_in_parallel(feed_discovery):
+    """Test domains are searched concurrently and results keep SERP order"""
+    domains = [f"site{i}.de" for i in range(6)]
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def find_feeds(url):
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return [f"{url}/feed"]
+
+    with patch.object(feed_discovery, '_search_with_serpapi', side_effect=[domains[:3], domains[2:]]), \
+            patch.object(feed_discovery.feed_finder, 'find_feeds', side_effect=find_feeds):
+        feeds = feed_discovery.run_stage2(["PropTech", "Smart Building"])
+
+    assert [f.domain for f in feeds] == domains
+    assert max_active > 1
+
+
 # ==================== Full Pipeline Tests ====================
 
 def test_discover_feeds_runs_both_stages(
@@ -445,7 +487,7 @@ def test_serpapi_handles_rate_limit_error(feed_discovery):
 
 def test_feedfinder_handles_network_timeout(feed_discovery):
     """Test handling of network timeout during feed discovery"""
-    with patch('feedfinder2.find_feeds', side_effect=TimeoutError("Network timeout")):
+    with patch('src.collectors.feed_finder.FeedFinder.find_feeds', side_effect=TimeoutError("Network timeout")):
         feeds = feed_discovery._discover_feeds_from_domain("slow-site.com")
 
         # Should return empty list, not crash
@@ -0,0 +1,118 @@
+"""
+Tests for FeedFinder
+
+Test Coverage:
+- Autodiscovery link tags (verified)
+- Fallback to same-site links and common feed paths
+- Page that is itself a feed
+- Per-request timeouts and per-site deadline
+"""
+
+from itertools import chain, repeat
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.collectors.feed_finder import FeedFinder
+
+
+RSS = b'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title></channel></rss>'
+ATOM = b'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>T</title></feed>'
+
+
+def make_response(url, body=b"", status=200):
+    response = Mock()
+    response.url = url
+    response.status_code = status
+    response.content = body
+    response.text = body.decode()
+    return response
+
+
+def fake_site(pages):
+    """Session.get replacement serving pages {url: body}; everything else 404"""
+    calls = []
+
+    def get(self, url, timeout=None, **kwargs):
+        calls.append((url, timeout))
+        if url not in pages:
+            return make_response(url, status=404)
+        return make_response(url, pages[url])
+
+    return get, calls
+
+
+@pytest.fixture
+def finder():
+    return FeedFinder(timeout=2.0, site_timeout=10.0)
+
+
+def test_link_tags_verified(finder):
+    """Test autodiscovery links are returned only if they are feeds"""
+    html = (
+        b'<html><head>'
+        b'<link rel="alternate" type="application/rss+xml" href="/feed.xml">'
+        b'<link rel="alternate" type="application/atom+xml" href="https://example.com/atom">'
+        b'<link rel="alternate" type="application/rss+xml" href="/broken.xml">'
+        b'<link rel="stylesheet" href="/style.css">'
+        b'</head></html>'
+    )
+    get, calls = fake_site({
+        "https://example.com": html,
+        "https://example.com/feed.xml": RSS,
+        "https://example.com/atom": ATOM,
+    })
+
+    with patch.object(requests.Session, "get", get):
+        feeds = finder.find_feeds("example.com")
+
+    assert feeds == ["https://example.com/feed.xml", "https://example.com/atom"]
+    assert all(timeout == 2.0 for _, timeout in calls)
+    # No guessing once autodiscovery found feeds
+    assert "https://example.com/rss" not in [url for url, _ in calls]
+
+
+def test_falls_back_to_anchors_and_common_paths(finder):
+    """Test same-site feed-looking links, then common paths; first hit wins"""
+    html = (
+        b'<html><body>'
+        b'<a href="https://other.com/rss">Other site</a>'
+        b'<a href="/news/rss.xml">RSS</a>'
+        b'</body></html>'
+    )
+    get, _ = fake_site({"https://example.com": html, "https://example.com/rss": RSS})
+    with patch.object(requests.Session, "get", get):
+        assert finder.find_feeds("https://example.com") == ["https://example.com/rss"]
+
+    get, calls = fake_site({"https://example.com": html, "https://example.com/news/rss.xml": RSS})
+    with patch.object(requests.Session, "get", get):
+        assert finder.find_feeds("https://example.com") == ["https://example.com/news/rss.xml"]
+    assert "https://other.com/rss" not in [url for url, _ in calls]
+
+
+def test_page_is_feed(finder):
+    """Test a feed URL is returned as-is"""
+    get, _ = fake_site({"https://example.com/feed": RSS})
+    with patch.object(requests.Session, "get", get):
+        assert finder.find_feeds("https://example.com/feed") == ["https://example.com/feed"]
+
+
+def test_unreachable_site(finder):
+    """Test network errors return no feeds"""
+    with patch.object(requests.Session, "get", side_effect=requests.ConnectTimeout("timeout")):
+        assert finder.find_feeds("https://slow.example.com") == []
+
+
+def test_site_deadline_stops_probing():
+    """Test no request starts after the site budget is used up"""
+    finder = FeedFinder(timeout=2.0, site_timeout=5.0)
+    get, calls = fake_site({"https://example.com": b"<html></html>"})
+    clock = chain([100.0, 101.0, 104.0], repeat(106.0))
+
+    with patch.object(requests.Session, "get", get), \
+            patch("src.collectors.feed_finder.time.monotonic", side_effect=lambda: next(clock)):
+        assert finder.find_feeds("https://example.com") == []
+
+    # Page at t=101 (2s timeout), first probe at t=104 capped to the 1s left
+    assert calls == [("https://example.com", 2.0), ("https://example.com/feed", 1.0)]
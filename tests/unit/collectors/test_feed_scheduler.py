@@ -0,0 +1,104 @@
+"""
+Tests for FeedPollScheduler
+
+Test Coverage:
+- Publish interval estimation from entry timestamps
+- Interval bounds, smoothing and 304 stretching
+- Due-feed selection
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from src.collectors.feed_scheduler import FeedPollScheduler
+from src.collectors.feed_state_store import FeedState
+
+
+NOW_UTC = datetime(2025, 11, 10, 12, 0, 0)
+
+
+@pytest.fixture
+def scheduler():
+    """Create scheduler with default bounds (1h - 7 days)"""
+    return FeedPollScheduler()
+
+
+def entries_every(gap: timedelta, count: int = 10, newest_age: timedelta = timedelta(0)):
+    """Entry timestamps spaced by gap, newest published newest_age ago"""
+    newest = NOW_UTC - newest_age
+    return [newest - gap * i for i in range(count)]
+
+
+def test_estimate_publish_interval(scheduler):
+    """Test mean gap between entries is the publish interval"""
+    estimate = scheduler.estimate_publish_interval(entries_every(timedelta(hours=6)), now=NOW_UTC)
+    assert estimate == timedelta(hours=6)
+
+
+def test_estimate_stretched_by_silence(scheduler):
+    """Test a feed that stopped publishing is estimated by its silence"""
+    times = entries_every(timedelta(hours=6), newest_age=timedelta(days=3))
+    assert scheduler.estimate_publish_interval(times, now=NOW_UTC) == timedelta(days=3)
+
+
+def test_estimate_needs_two_timestamps(scheduler):
+    """Test no estimate without enough dated entries"""
+    assert scheduler.estimate_publish_interval([None, NOW_UTC], now=NOW_UTC) is None
+    assert scheduler.estimate_publish_interval([], now=NOW_UTC) is None
+
+
+def test_schedule_targets_two_polls_per_publish(scheduler, monkeypatch):
+    """Test weekly feeds are polled every few days, news feeds hourly"""
+    monkeypatch.setattr(scheduler, "estimate_publish_interval", lambda times: timedelta(days=7))
+    weekly = FeedState(url="https://weekly.de/feed")
+    now = datetime(2025, 11, 10, 2, 0, 0)
+    assert scheduler.schedule(weekly, entry_times=[], now=now) == now + timedelta(days=3.5)
+
+    monkeypatch.setattr(scheduler, "estimate_publish_interval", lambda times: timedelta(minutes=20))
+    news = FeedState(url="https://news.de/feed")
+    scheduler.schedule(news, entry_times=[], now=now)
+    assert news.poll_interval_s == timedelta(hours=1).total_seconds()  # min_interval
+
+
+def test_schedule_smooths_and_bounds(scheduler, monkeypatch):
+    """Test new estimates are averaged with the previous interval and capped"""
+    state = FeedState(url="https://example.com/feed", poll_interval_s=timedelta(days=2).total_seconds())
+    monkeypatch.setattr(scheduler, "estimate_publish_interval", lambda times: timedelta(days=2))
+    scheduler.schedule(state, entry_times=[])
+    assert state.poll_interval_s == timedelta(days=1.5).total_seconds()
+
+    monkeypatch.setattr(scheduler, "estimate_publish_interval", lambda times: timedelta(days=60))
+    scheduler.schedule(state, entry_times=[])
+    assert state.poll_interval_s == timedelta(days=7).total_seconds()  # max_interval
+
+
+def test_not_modified_stretches_interval(scheduler):
+    """Test 304 responses grow the interval; no history uses the default"""
+    state = FeedState(url="https://example.com/feed")
+    now = datetime(2025, 11, 10, 2, 0, 0)
+
+    scheduler.schedule(state, not_modified=True, now=now)
+    assert state.poll_interval_s == timedelta(days=1.5).total_seconds()
+    assert state.next_poll_at == now + timedelta(days=1.5)
+
+    scheduler.schedule(state, entry_times=[None], now=now)  # No usable dates: keep interval
+    assert state.poll_interval_s == timedelta(days=1.5).total_seconds()
+
+
+def test_due_feeds(scheduler):
+    """Test only unknown, unscheduled and overdue feeds are due"""
+    now = datetime(2025, 11, 10, 2, 0, 0)
+    states = {
+        "https://overdue.com/feed": FeedState(url="https://overdue.com/feed", next_poll_at=now - timedelta(hours=1)),
+        "https://soon.com/feed": FeedState(url="https://soon.com/feed", next_poll_at=now + timedelta(minutes=10)),
+        "https://later.com/feed": FeedState(url="https://later.com/feed", next_poll_at=now + timedelta(days=2)),
+        "https://unscheduled.com/feed": FeedState(url="https://unscheduled.com/feed"),
+    }
+    urls = list(states) + ["https://new.com/feed", "https://new.com/feed"]
+
+    assert scheduler.due_feeds(urls, states, now=now) == [
+        "https://overdue.com/feed",
+        "https://soon.com/feed",  # Within grace
+        "https://unscheduled.com/feed",
+        "https://new.com/feed",
+    ]
@@ -0,0 +1,231 @@
+"""
+Tests for FeedStateStore
+
+Test Coverage:
+- Round trip of all feed state fields
+- Batched upserts and filtered loads
+- Moving average of entries per fetch
+- Backoff scheduling for unhealthy feeds
+- Merging concurrent writers
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from src.collectors.feed_state_store import FeedState, FeedStateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create FeedStateStore in a temp directory"""
+    return FeedStateStore(db_path=str(tmp_path / "state" / "feed_state.db"))
+
+
+def test_database_created_on_first_use(tmp_path):
+    """Test the store does not touch disk until used"""
+    db_path = tmp_path / "state" / "feed_state.db"
+    store = FeedStateStore(db_path=str(db_path))
+    assert not db_path.exists()
+
+    assert store.load() == {}
+    assert db_path.exists()
+
+
+def test_round_trip(store):
+    """Test all fields survive save/load"""
+    now = datetime.now().replace(microsecond=0)
+    state = FeedState(
+        url="https://example.com/feed.xml",
+        success_count=3,
+        failure_count=1,
+        consecutive_failures=0,
+        last_success=now,
+        last_failure=now - timedelta(days=1),
+        last_etag='"abc"',
+        last_modified="Mon, 04 Nov 2025 12:00:00 GMT",
+        cached_at=now,
+        avg_entries=12.5,
+        next_poll_at=now + timedelta(hours=6)
+    )
+    store.save(state)
+
+    assert store.get("https://example.com/feed.xml") == state
+    assert store.get("https://example.com/other.xml") is None
+
+
+def test_save_many_upserts_and_filtered_load(store):
+    """Test batched upserts and loading a subset of feeds"""
+    states = [FeedState(url=f"https://example.com/{i}.xml") for i in range(3)]
+    assert store.save_many(states) == 3
+
+    states[0].record_failure()
+    store.save_many([states[0]])
+
+    loaded = store.load(["https://example.com/0.xml", "https://example.com/2.xml"])
+    assert set(loaded) == {"https://example.com/0.xml", "https://example.com/2.xml"}
+    assert loaded["https://example.com/0.xml"].consecutive_failures == 1
+    assert len(store.load()) == 3
+
+    assert store.delete(["https://example.com/1.xml"]) == 1
+    assert len(store.load()) == 2
+
+
+def test_concurrent_writers_merge(store):
+    """Test two writers saving the same feed keep each other's changes"""
+    url = "https://example.com/feed.xml"
+    store.save(FeedState(url=url, success_count=2))
+
+    collector_state = store.get(url)
+    discoverer_state = store.get(url)
+
+    collector_state.record_success(entries=5)
+    collector_state.last_etag = '"v2"'
+    store.save(collector_state)
+
+    discoverer_state.record_success(entries=5)
+    discoverer_state.record_failure()
+    store.save(discoverer_state)
+
+    merged = store.get(url)
+    assert merged.success_count == 4
+    assert merged.failure_count == 1
+    assert merged.consecutive_failures == 1
+    assert merged.last_etag == '"v2"'
+
+    # Saved states track the merged row: saving again adds nothing
+    store.save(collector_state)
+    assert store.get(url).success_count == 4
+
+
+def test_avg_entries_moving_average():
+    """Test entries per fetch average ignores 304 responses"""
+    state = FeedState(url="https://example.com/feed.xml")
+    state.record_success(entries=10)
+    assert state.avg_entries == 10.0
+
+    state.record_success(entries=20)
+    assert state.avg_entries == pytest.approx(13.0)
+
+    state.record_success()  # 304 Not Modified
+    assert state.avg_entries == pytest.approx(13.0)
+    assert state.success_count == 3
+
+
+def test_backoff_schedule():
+    """Test unhealthy feeds back off exponentially and reset on success"""
+    state = FeedState(url="https://example.com/feed.xml")
+    for _ in range(4):
+        state.record_failure()
+        state.schedule_retry(max_consecutive_failures=5)
+    assert state.next_poll_at is None
+    assert not state.in_backoff(5)
+
+    state.record_failure()
+    state.schedule_retry(max_consecutive_failures=5)
+    assert state.next_poll_at == state.last_failure + timedelta(days=1)
+    assert state.in_backoff(5)
+
+    state.record_failure()
+    state.schedule_retry(max_consecutive_failures=5)
+    assert state.next_poll_at == state.last_failure + timedelta(days=2)
+    assert not state.in_backoff(5, now=state.next_poll_at)
+
+    state.record_success(entries=5)
+    assert state.next_poll_at is None
+    assert not state.in_backoff(5)
+
+
+# ==================== Test Sharing ====================
+
+def _failing_state(url):
+    state = FeedState(url=url)
+    for _ in range(5):
+        state.record_failure()
+    state.schedule_retry(max_consecutive_failures=5)
+    return state
+
+
+def test_feed_database_filters_unhealthy_feeds(store, tmp_path):
+    """Test RSSFeedDatabase attaches health and drops feeds in backoff"""
+    from src.collectors.rss_feed_database import RSSFeedDatabase
+    from src.collectors.rss_feed_discoverer import RSSFeed
+
+    database = RSSFeedDatabase(database_path=str(tmp_path / "feeds.json"), feed_state_store=store)
+    for name, score in [("good", 0.9), ("broken", 0.8)]:
+        database.add_feed("technology", "saas", RSSFeed(
+            url=f"https://{name}.com/feed", source_url=f"https://{name}.com", quality_score=score
+        ))
+
+    healthy = FeedState(url="https://good.com/feed")
+    healthy.record_success(entries=7)
+    store.save_many([healthy, _failing_state("https://broken.com/feed")])
+
+    all_feeds = database.get_feeds(domain="technology")
+    assert [f["url"] for f in all_feeds] == ["https://good.com/feed", "https://broken.com/feed"]
+    assert all_feeds[0]["avg_entries"] == 7.0
+    assert all_feeds[1]["consecutive_failures"] == 5
+
+    healthy_feeds = database.get_feeds(domain="technology", healthy_only=True)
+    assert [f["url"] for f in healthy_feeds] == ["https://good.com/feed"]
+
+
+@pytest.mark.asyncio
+async def test_discoverer_skips_and_records_feeds(store):
+    """Test RSSFeedDiscoverer skips feeds in backoff and records outcomes"""
+    from unittest.mock import patch
+    from src.collectors.rss_feed_discoverer import RSSFeedDiscoverer, RSSFeed
+
+    store.save(_failing_state("https://broken.com/feed"))
+    discoverer = RSSFeedDiscoverer(feed_state_store=store)
+
+    async def fake_validate(feed):
+        feed.is_valid = feed.url.startswith("https://good")
+        feed.article_count = 10
+        return feed
+
+    feeds = [
+        RSSFeed(url="https://good.com/feed", source_url="https://good.com"),
+        RSSFeed(url="https://bad.com/feed", source_url="https://bad.com"),
+        RSSFeed(url="https://broken.com/feed", source_url="https://broken.com")
+    ]
+    with patch.object(discoverer, "_validate_feed", side_effect=fake_validate) as mock_validate:
+        validated = await discoverer._validate_feeds(feeds)
+
+    assert mock_validate.call_count == 2
+    assert len(validated) == 3
+    assert "Skipped" in validated[2].error
+
+    states = store.load()
+    assert states["https://good.com/feed"].avg_entries == 10.0
+    assert states["https://bad.com/feed"].consecutive_failures == 1
+    assert states["https://broken.com/feed"].consecutive_failures == 5
+    assert states["https://good.com/feed"].last_etag is None
+
+
+@pytest.mark.asyncio
+async def test_discoverer_validation_keeps_poll_schedule(store):
+    """Test validating a scheduled feed keeps its adaptive next poll time"""
+    from unittest.mock import patch
+    from src.collectors.feed_scheduler import FeedPollScheduler
+    from src.collectors.rss_feed_discoverer import RSSFeedDiscoverer, RSSFeed
+
+    scheduler = FeedPollScheduler()
+    state = FeedState(url="https://good.com/feed")
+    state.record_success(entries=10)
+    next_poll_at = scheduler.schedule(state, entry_times=[])
+    store.save(state)
+
+    discoverer = RSSFeedDiscoverer(feed_state_store=store)
+
+    async def fake_validate(feed):
+        feed.is_valid = True
+        feed.article_count = 10
+        return feed
+
+    with patch.object(discoverer, "_validate_feed", side_effect=fake_validate):
+        await discoverer._validate_feeds([RSSFeed(url="https://good.com/feed", source_url="https://good.com")])
+
+    validated = store.get("https://good.com/feed")
+    assert validated.success_count == 2
+    assert validated.next_poll_at == next_poll_at
+    assert not scheduler.is_due(validated)
@@ -13,6 +13,7 @@ Test Coverage:
 """
 
 import pytest
+import httpx
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 import hashlib
@@ -23,6 +24,8 @@ from src.collectors.rss_collector import (
     FeedHealth,
 )
 from src.models.document import Document
+from src.utils.page_fetcher import PageFetcher
+from src.utils.page_store import PageStore, StoredPage
 
 
 # ==================== Fixtures ====================
@@ -60,6 +63,7 @@ def mock_deduplicator():
     """Mock Deduplicator"""
     dedup = Mock()
     dedup.is_duplicate = Mock(return_value=False)
+    dedup.has_seen_url = Mock(return_value=False)
     dedup.get_canonical_url = Mock(side_effect=lambda url: url.lower().rstrip('/'))
     dedup.compute_content_hash = Mock(side_effect=lambda content: hashlib.md5(content.encode()).hexdigest())
     return dedup
@@ -227,32 +231,37 @@ def test_collect_from_feed_with_etag(mock_parse, rss_collector):
 
 # ==================== Test Content Extraction ====================
 
-@patch('trafilatura.fetch_url')
+@patch('src.utils.page_fetcher.PageFetcher.fetch_page')
 @patch('trafilatura.extract')
 def test_extract_full_content_success(mock_extract, mock_fetch, rss_collector, mock_trafilatura_content):
     """Test successful content extraction with trafilatura"""
-    mock_fetch.return_value = "<html><body>Article content</body></html>"
+    mock_fetch.return_value = StoredPage(
+        url='https://example.com/article-1',
+        html="<html><body>Article content</body></html>",
+        content_hash="abc"
+    )
     mock_extract.return_value = mock_trafilatura_content
 
     content = rss_collector._extract_full_content('https://example.com/article-1', 'Summary...')
 
     assert content == mock_trafilatura_content
-    mock_fetch.assert_called_once_with('https://example.com/article-1')
+    mock_fetch.assert_called_once_with('https://example.com/article-1', timeout=rss_collector.request_timeout)
     mock_extract.assert_called_once()
 
 
-@patch('trafilatura.fetch_url')
+@patch('src.utils.page_fetcher.PageFetcher.fetch_page')
 @patch('trafilatura.extract')
 def test_extract_full_content_fallback_to_summary(mock_extract, mock_fetch, rss_collector):
     """Test fallback to summary when extraction fails"""
-    mock_fetch.return_value = None  # Fetch failed
+    mock_fetch.return_value = StoredPage(url='https://example.com/article-1', html="", content_hash="abc")
+    mock_extract.return_value = None  # Nothing extracted
 
     content = rss_collector._extract_full_content('https://example.com/article-1', 'Fallback summary')
 
     assert content == 'Fallback summary'
 
 
-@patch('trafilatura.fetch_url')
+@patch('src.utils.page_fetcher.PageFetcher.fetch_page')
 @patch('trafilatura.extract')
 def test_extract_full_content_timeout(mock_extract, mock_fetch, rss_collector):
     """Test timeout handling during content extraction"""
@@ -263,6 +272,22 @@ def test_extract_full_content_timeout(mock_extract, mock_fetch, rss_collector):
     assert content == 'Summary fallback'
 
 
+@patch('trafilatura.extract')
+def test_extract_full_content_reuses_stored_text(mock_extract, rss_collector, mock_trafilatura_content, tmp_path):
+    """Test stored pages and their extracted text are reused without refetching"""
+    store = PageStore(db_path=str(tmp_path / "pages.db"))
+    store.store_response('https://example.com/article-1', "<html><body>Article</body></html>")
+    store.save_text('https://example.com/article-1', mock_trafilatura_content)
+    rss_collector.page_fetcher = PageFetcher(page_store=store)
+
+    with patch.object(rss_collector.page_fetcher.session, 'get') as mock_get:
+        content = rss_collector._extract_full_content('https://example.com/article-1', 'Summary...')
+
+    assert content == mock_trafilatura_content
+    mock_get.assert_not_called()
+    mock_extract.assert_not_called()
+
+
 # ==================== Test Feed Health Tracking ====================
 
 def test_feed_health_initialization(rss_collector):
@@ -425,6 +450,45 @@ def test_skip_duplicate_documents(mock_parse, rss_collector, mock_feedparser_res
     assert documents[0].title == 'Smart Building IoT'
 
 
+@patch('feedparser.parse')
+def test_known_urls_skip_fetch(mock_parse, rss_collector, mock_feedparser_response):
+    """Test seen and already-stored entries are skipped before the article fetch"""
+    mock_parse.return_value = mock_feedparser_response
+
+    # Entry 1 is in the seen-URL index, entry 2 is already stored
+    rss_collector.deduplicator.has_seen_url = Mock(
+        side_effect=lambda url: url.endswith('article-1')
+    )
+    rss_collector.db_manager.get_document_by_url = Mock(
+        side_effect=lambda url: Mock() if url.endswith('article-2') else None
+    )
+
+    with patch.object(rss_collector, '_extract_full_content', return_value="Content") as mock_extract:
+        documents = rss_collector.collect_from_feed('https://example.com/feed.xml')
+
+    assert documents == []
+    mock_extract.assert_not_called()
+    rss_collector.deduplicator.is_duplicate.assert_not_called()
+
+    stats = rss_collector.get_statistics()
+    assert stats['total_skipped_fetches'] == 2
+    assert stats['total_skipped_duplicates'] == 2
+
+
+@patch('feedparser.parse')
+def test_new_urls_are_fetched(mock_parse, rss_collector, mock_feedparser_response):
+    """Test unseen entries still go through fetch and content dedup"""
+    mock_parse.return_value = mock_feedparser_response
+
+    with patch.object(rss_collector, '_extract_full_content', return_value="Content") as mock_extract:
+        documents = rss_collector.collect_from_feed('https://example.com/feed.xml')
+
+    assert len(documents) == 2
+    assert mock_extract.call_count == 2
+    rss_collector.db_manager.get_document_by_url.assert_any_call('https://example.com/article-1')
+    assert rss_collector.get_statistics()['total_skipped_fetches'] == 0
+
+
 # ==================== Test Batch Collection ====================
 
 @patch('feedparser.parse')
@@ -468,6 +532,158 @@ def test_collect_from_feeds_with_failures(mock_parse, rss_collector, mock_feedpa
     assert len(all_documents) == 4
 
 
+# ==================== Test Async Batch Collection ====================
+
+RSS_XML = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>PropTech News</title><link>https://example.com</link>
+<item><title>PropTech Trends 2025</title><link>https://{host}/article-1</link>
+<description>Summary of PropTech trends...</description></item>
+<item><title>Smart Building IoT</title><link>https://{host}/article-2</link>
+<description>IoT devices in smart buildings...</description></item>
+</channel></rss>"""
+
+
+def make_async_collector(mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir, handler, **kwargs):
+    """Create an RSSCollector in async batch mode backed by a mock transport"""
+    return RSSCollector(
+        config=mock_config,
+        db_manager=mock_db_manager,
+        deduplicator=mock_deduplicator,
+        cache_dir=temp_cache_dir,
+        max_concurrent_feeds=4,
+        extract_workers=2,
+        transport=httpx.MockTransport(handler),
+        **kwargs
+    )
+
+
+def test_collect_from_feeds_async_mode(mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir):
+    """Test collect_from_feeds dispatches to concurrent collection and reports timings"""
+    def handler(request):
+        if request.url.path == "/broken.xml":
+            return httpx.Response(500)
+        return httpx.Response(200, text=RSS_XML.format(host=request.url.host), headers={"ETag": '"v1"', "Content-Type": "application/rss+xml"})
+
+    collector = make_async_collector(mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir, handler)
+    feed_urls = [
+        'https://a.example.com/feed.xml',
+        'https://b.example.com/broken.xml',
+        'https://c.example.com/feed.xml'
+    ]
+
+    with patch.object(collector, '_extract_full_content', return_value="Content") as mock_extract:
+        documents = collector.collect_from_feeds(feed_urls)
+
+    # Feed order is preserved, the failed feed is skipped
+    assert [doc.source_url for doc in documents] == [
+        'https://a.example.com/article-1',
+        'https://a.example.com/article-2',
+        'https://c.example.com/article-1',
+        'https://c.example.com/article-2'
+    ]
+    assert mock_extract.call_count == 4
+
+    stats = collector.get_statistics()
+    assert stats['total_feeds_collected'] == 2
+    assert stats['total_documents_collected'] == 4
+    assert stats['total_failures'] == 1
+    assert set(stats['last_batch_timings']) == {
+        'rate_limit_wait_s', 'download_s', 'parse_s', 'extract_s', 'wall_s'
+    }
+    assert collector._load_feed_cache('https://a.example.com/feed.xml')['etag'] == '"v1"'
+
+
+def test_collect_from_feeds_async_raises_without_skip_errors(mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir):
+    """Test async mode propagates feed errors when skip_errors=False"""
+    collector = make_async_collector(
+        mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir,
+        lambda request: httpx.Response(404)
+    )
+
+    with pytest.raises(RSSCollectorError):
+        collector.collect_from_feeds(['https://example.com/feed.xml'], skip_errors=False)
+
+
+def test_collect_from_feeds_async_conditional_get(mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir):
+    """Test async mode sends cached ETag and handles 304 Not Modified"""
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers.get("If-None-Match"))
+        return httpx.Response(304)
+
+    collector = make_async_collector(mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir, handler)
+    collector._save_feed_cache('https://example.com/feed.xml', etag='"v1"')
+
+    documents = collector.collect_from_feeds(['https://example.com/feed.xml'])
+
+    assert documents == []
+    assert seen_headers == ['"v1"']
+    assert collector.get_feed_health_report()[0]['success_count'] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_rate_limit_spaces_same_host(rss_collector):
+    """Test non-blocking rate limit reserves per-host slots without delaying other hosts"""
+    with patch('asyncio.sleep') as mock_sleep:
+        mock_sleep.return_value = None
+        first = await rss_collector._apply_rate_limit_async('https://example.com/feed1.xml')
+        second = await rss_collector._apply_rate_limit_async('https://example.com/feed2.xml')
+        other = await rss_collector._apply_rate_limit_async('https://other.com/feed.xml')
+
+    assert first == 0
+    assert second == pytest.approx(0.5, abs=0.05)  # 2 req/sec per host
+    assert other == 0
+    mock_sleep.assert_called_once()
+
+
+# ==================== Test Adaptive Polling ====================
+
+@patch('feedparser.parse')
+def test_poll_scheduler_skips_feeds_not_due(mock_parse, mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir, mock_feedparser_response):
+    """Test due_only polls a feed again only once its next poll time is reached"""
+    from src.collectors.feed_scheduler import FeedPollScheduler
+
+    mock_parse.return_value = mock_feedparser_response
+    collector = RSSCollector(
+        config=mock_config, db_manager=mock_db_manager, deduplicator=mock_deduplicator,
+        cache_dir=temp_cache_dir, poll_scheduler=FeedPollScheduler()
+    )
+    feed_urls = ['https://example.com/feed.xml', 'https://other.com/feed.xml']
+
+    with patch.object(collector, '_extract_full_content', return_value="Content"):
+        first = collector.collect_from_feeds(feed_urls, due_only=True)
+        second = collector.collect_from_feeds(feed_urls, due_only=True)
+
+    assert len(first) == 4
+    assert second == []
+    assert mock_parse.call_count == 2
+    assert collector.get_statistics()['total_feeds_not_due'] == 2
+
+    health = collector._get_feed_health('https://example.com/feed.xml')
+    assert health.next_poll_at > datetime.now()
+    assert health.poll_interval_s > 0
+
+    # Schedule persists across instances
+    restarted = RSSCollector(
+        config=mock_config, db_manager=mock_db_manager, deduplicator=mock_deduplicator,
+        cache_dir=temp_cache_dir, poll_scheduler=FeedPollScheduler()
+    )
+    assert restarted.select_due_feeds(feed_urls) == []
+
+    # Without due_only every feed is polled
+    with patch.object(collector, '_extract_full_content', return_value="Content"):
+        collector.collect_from_feeds(feed_urls)
+    assert mock_parse.call_count == 4
+
+
+def test_entry_timestamp(rss_collector):
+    """Test entry publication time falls back to updated and ignores missing dates"""
+    assert rss_collector._entry_timestamp({'published_parsed': (2025, 11, 4, 12, 0, 0, 0, 0, 0)}) == datetime(2025, 11, 4, 12, 0, 0)
+    assert rss_collector._entry_timestamp({'updated_parsed': (2025, 11, 3, 8, 0, 0, 0, 0, 0)}) == datetime(2025, 11, 3, 8, 0, 0)
+    assert rss_collector._entry_timestamp({'title': 'Undated'}) is None
+
+
 # ==================== Test Caching ====================
 
 def test_save_and_load_feed_cache(rss_collector):
@@ -489,22 +705,56 @@ def test_cache_expiry(rss_collector):
     feed_url = 'https://example.com/feed.xml'
 
     # Save cache with old timestamp
-    old_time = datetime.now() - timedelta(days=31)
-    cache_data = {
-        'etag': 'old123',
-        'modified': 'Old date',
-        'cached_at': old_time.isoformat()
-    }
-
-    cache_file = rss_collector.cache_dir / f"{hashlib.md5(feed_url.encode()).hexdigest()}.json"
-    import json
-    cache_file.write_text(json.dumps(cache_data))
+    rss_collector._save_feed_cache(feed_url, etag='old123', modified='Old date')
+    rss_collector._get_feed_health(feed_url).cached_at = datetime.now() - timedelta(days=31)
 
     # Should return None (expired)
     cached = rss_collector._load_feed_cache(feed_url, ttl_days=30)
     assert cached is None
 
 
+@patch('feedparser.parse')
+def test_feed_state_persists_across_instances(mock_parse, mock_config, mock_db_manager, mock_deduplicator, temp_cache_dir, mock_feedparser_response):
+    """Test validators and health survive a new collector (worker restart)"""
+    mock_parse.return_value = mock_feedparser_response
+
+    first = RSSCollector(
+        config=mock_config, db_manager=mock_db_manager,
+        deduplicator=mock_deduplicator, cache_dir=temp_cache_dir
+    )
+    with patch.object(first, '_extract_full_content', return_value="Content"):
+        first.collect_from_feed('https://example.com/feed.xml')
+
+    mock_parse.side_effect = Exception("Network error")
+    for _ in range(5):
+        with pytest.raises(RSSCollectorError):
+            first.collect_from_feed('https://broken.example.com/feed.xml')
+
+    second = RSSCollector(
+        config=mock_config, db_manager=mock_db_manager,
+        deduplicator=mock_deduplicator, cache_dir=temp_cache_dir
+    )
+
+    assert second._load_feed_cache('https://example.com/feed.xml')['etag'] == 'abc123'
+    assert second._get_feed_health('https://example.com/feed.xml').avg_entries == 2.0
+
+    # Failing feed stays in backoff after the restart
+    broken = second._get_feed_health('https://broken.example.com/feed.xml')
+    assert broken.consecutive_failures == 5
+    assert broken.next_poll_at > datetime.now()
+    assert second._should_skip_feed('https://broken.example.com/feed.xml') is True
+
+
+def test_unhealthy_feed_retried_after_backoff(rss_collector):
+    """Test unhealthy feeds are polled again once their retry time passed"""
+    feed_url = 'https://example.com/feed.xml'
+    health = rss_collector._get_feed_health(feed_url)
+    health.consecutive_failures = 5
+    health.next_poll_at = datetime.now() - timedelta(minutes=1)
+
+    assert rss_collector._should_skip_feed(feed_url) is False
+
+
 # ==================== Test Error Handling ====================
 
 @patch('feedparser.parse')
@@ -0,0 +1,155 @@
+"""
+Tests for RSSFeedDatabase (SQLite feed catalog)
+
+Test Coverage:
+- Incremental adds, duplicate handling and upserts
+- Indexed queries (domain, vertical, quality, limit)
+- Statistics and removal
+- One-shot migration from the legacy JSON database
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from src.collectors.rss_feed_database import RSSFeedDatabase
+from src.collectors.rss_feed_discoverer import RSSFeed
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Create empty catalog"""
+    return RSSFeedDatabase(database_path=str(tmp_path / "rss_feeds.db"))
+
+
+def make_feed(name: str, score: float = 0.5, title: str = None) -> RSSFeed:
+    return RSSFeed(
+        url=f"https://{name}.com/feed",
+        source_url=f"https://{name}.com",
+        title=title or name.title(),
+        quality_score=score,
+        is_valid=True
+    )
+
+
+def test_add_feed_and_duplicates(database):
+    """Test duplicate URLs are rejected per vertical and upserted on request"""
+    assert database.add_feed("technology", "saas", make_feed("alpha", 0.4)) is True
+    assert database.add_feed("technology", "saas", make_feed("alpha", 0.9)) is False
+    assert database.get_feeds(domain="technology")[0]["quality_score"] == 0.4
+
+    # Same URL in another vertical is a separate entry
+    assert database.add_feed("technology", "ai", make_feed("alpha")) is True
+
+    # allow_duplicates updates the stored feed in place
+    assert database.add_feed("technology", "saas", make_feed("alpha", 0.9, "Alpha v2"), allow_duplicates=True) is True
+    saas = database.get_feeds(domain="technology", vertical="saas")
+    assert len(saas) == 1
+    assert saas[0]["quality_score"] == 0.9
+    assert saas[0]["title"] == "Alpha v2"
+    assert saas[0]["is_valid"] is True
+
+    assert database.has_feed("https://alpha.com/feed")
+    assert database.has_feed("https://alpha.com/feed", domain="technology", vertical="ai")
+    assert not database.has_feed("https://alpha.com/feed", vertical="cardiology")
+
+
+def test_add_feeds_batch(database):
+    """Test batch add counts only new feeds"""
+    feeds = [make_feed("alpha"), make_feed("beta"), make_feed("alpha")]
+    assert database.add_feeds("technology", "saas", feeds) == 2
+    assert database.add_feeds("technology", "saas", [make_feed("beta"), make_feed("gamma")]) == 1
+
+
+def test_get_feeds_filters_and_order(database):
+    """Test query filters, quality ordering and limit"""
+    database.add_feeds("technology", "saas", [make_feed("low", 0.2), make_feed("high", 0.9)])
+    database.add_feeds("technology", "ai", [make_feed("mid", 0.6)])
+    database.add_feeds("medicine", "cardiology", [make_feed("heart", 0.7)])
+
+    assert [f["url"] for f in database.get_feeds()] == [
+        "https://high.com/feed", "https://heart.com/feed",
+        "https://mid.com/feed", "https://low.com/feed"
+    ]
+    tech = database.get_feeds(domain="technology", min_quality_score=0.5)
+    assert [(f["vertical"], f["url"]) for f in tech] == [
+        ("saas", "https://high.com/feed"), ("ai", "https://mid.com/feed")
+    ]
+    assert len(database.get_feeds(limit=2)) == 2
+    assert database.get_feeds(domain="unknown") == []
+
+    assert database.get_domains() == ["medicine", "technology"]
+    assert database.get_verticals("technology") == ["ai", "saas"]
+    assert database.get_verticals("unknown") == []
+    assert database.export_feeds_list(domain="medicine", output_format="titles") == ["Heart"]
+
+
+def test_statistics_and_removal(database):
+    """Test statistics are aggregated in SQL and low-quality feeds removed"""
+    database.add_feeds("technology", "saas", [make_feed("a", 0.2), make_feed("b", 0.8)])
+    database.add_feeds("technology", "ai", [make_feed("c", 0.5)])
+    assert database.save() is True
+
+    stats = database.get_statistics()
+    assert stats["total_feeds"] == 3
+    assert stats["total_domains"] == 1
+    assert stats["total_verticals"] == 2
+    assert stats["last_updated"] is not None
+    assert stats["domains"]["technology"]["feeds"] == 3
+    assert stats["domains"]["technology"]["avg_quality"] == pytest.approx(0.5)
+
+    assert database.remove_low_quality_feeds(min_quality_score=0.3) == 1
+    assert database.get_statistics()["total_feeds"] == 2
+
+
+def test_catalog_indexes(database):
+    """Test query and uniqueness indexes exist"""
+    conn = sqlite3.connect(database.database_path)
+    indexes = {row[1]: row[2] for row in conn.execute("PRAGMA index_list(feeds)")}
+    columns = [row[2] for row in conn.execute("PRAGMA index_info(idx_feeds_domain_vertical_quality)")]
+    conn.close()
+
+    assert indexes["idx_feeds_url"] == 1  # unique
+    assert columns == ["domain", "vertical", "quality_score"]
+
+
+def test_migrates_legacy_json_once(tmp_path):
+    """Test legacy JSON database is imported into an empty catalog once"""
+    legacy_path = tmp_path / "rss_feeds_database.json"
+    legacy_path.write_text(json.dumps({
+        "domains": {
+            "technology": {
+                "saas": [
+                    {"url": "https://a.com/feed", "title": "A", "quality_score": 0.7, "is_valid": True},
+                    {"url": "https://b.com/feed", "title": "B", "quality_score": 0.3, "is_valid": False}
+                ]
+            },
+            "gaming": {"news": [{"url": "https://a.com/feed", "title": "A"}]}
+        },
+        "metadata": {"created_at": "2025-11-16T18:30:55", "total_feeds": 3}
+    }))
+
+    database = RSSFeedDatabase(database_path=str(tmp_path / "feeds.db"), json_path=str(legacy_path))
+    assert database.get_statistics()["total_feeds"] == 3
+    assert database.get_feeds(domain="technology")[1]["is_valid"] is False
+
+    # Removing everything does not trigger a second import
+    database.remove_low_quality_feeds(min_quality_score=1.0)
+    reopened = RSSFeedDatabase(database_path=str(tmp_path / "feeds.db"), json_path=str(legacy_path))
+    assert reopened.get_feeds() == []
+
+    # A ".json" database path keeps working: the catalog sits next to it
+    legacy = RSSFeedDatabase(database_path=str(legacy_path))
+    assert legacy.database_path == str(tmp_path / "rss_feeds_database.db")
+    assert len(legacy.get_feeds()) == 3
+
+
+def test_default_path_is_independent_of_cwd(tmp_path, monkeypatch):
+    """The default catalog lives in the project data/ directory wherever we run"""
+    from pathlib import Path
+    from src.collectors import rss_feed_database
+
+    monkeypatch.chdir(tmp_path)
+    project_data = Path(rss_feed_database.__file__).resolve().parents[2] / "data"
+    assert Path(rss_feed_database.DEFAULT_DB_PATH).resolve() == project_data / "rss_feeds.db"
@@ -0,0 +1,126 @@
+"""
+Tests for RSSFeedDiscoverer batch discovery
+
+Runs against a local aiohttp fixture server (one port per site).
+
+Test Coverage:
+- Concurrent batch discovery with progress callbacks
+- Feed validation deduplicated across sites
+- Per-host request limit
+"""
+
+import asyncio
+from collections import Counter
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from src.collectors.rss_feed_discoverer import RSSFeedDiscoverer
+
+
+RSS_XML = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel>
+<title>Fixture Feed</title><description>Fixture</description>
+<item><title>Entry</title><link>https://example.com/a</link></item>
+</channel></rss>"""
+
+
+class FixtureSites:
+    """Local sites: each links its own /feed.xml plus one shared feed"""
+
+    def __init__(self, site_count: int, latency: float = 0.05):
+        self.site_count = site_count
+        self.latency = latency
+        self.hits = Counter()
+        self.in_flight = Counter()
+        self.max_in_flight = Counter()
+        self.max_total_in_flight = 0
+        self.urls = []
+        self._runner = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        host = request.host
+        self.hits[(host, request.method, request.path)] += 1
+        self.in_flight[host] += 1
+        self.max_in_flight[host] = max(self.max_in_flight[host], self.in_flight[host])
+        self.max_total_in_flight = max(self.max_total_in_flight, sum(self.in_flight.values()))
+        try:
+            await asyncio.sleep(self.latency)
+            if request.path == "/":
+                return web.Response(content_type="text/html", text=(
+                    '<html><head>'
+                    '<link rel="alternate" type="application/rss+xml" href="/feed.xml">'
+                    f'<link rel="alternate" type="application/rss+xml" href="{self.urls[0]}shared.xml">'
+                    '</head></html>'
+                ))
+            if request.path in ("/feed.xml", "/shared.xml"):
+                return web.Response(body=RSS_XML, content_type="application/rss+xml")
+            return web.Response(status=404)
+        finally:
+            self.in_flight[host] -= 1
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        for _ in range(self.site_count):
+            site = web.TCPSite(self._runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            self.urls.append(f"http://127.0.0.1:{port}/")
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+@pytest_asyncio.fixture
+async def sites():
+    fixture = FixtureSites(site_count=6)
+    await fixture.start()
+    yield fixture
+    await fixture.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_discover_concurrent_and_deduplicated(sites):
+    """Test sites are processed concurrently and shared feeds validated once"""
+    discoverer = RSSFeedDiscoverer(max_concurrent_requests=20, min_host_interval=0)
+    progress = []
+
+    results = await discoverer.batch_discover(
+        sites.urls + [sites.urls[0]],
+        progress_callback=lambda current, total, url: progress.append((current, total)),
+        max_concurrent_sites=6
+    )
+
+    assert list(results) == sites.urls
+    assert progress == [(i, 6) for i in range(1, 7)]
+
+    shared_url = f"{sites.urls[0]}shared.xml"
+    for url, feeds in results.items():
+        by_url = {f.url: f for f in feeds}
+        assert set(by_url) == {f"{url}feed.xml", shared_url}
+        assert by_url[shared_url].is_valid
+        assert by_url[shared_url].title == "Fixture Feed"
+        assert by_url[shared_url].source_url == url
+
+    shared_host = sites.urls[0][len("http://"):-1]
+    assert sites.hits[(shared_host, "GET", "/shared.xml")] == 1
+    assert sites.max_total_in_flight > 2
+
+    # Batch state is cleared afterwards
+    assert discoverer._session is None
+    assert discoverer._validation_tasks is None
+
+
+@pytest.mark.asyncio
+async def test_batch_discover_per_host_limit(sites):
+    """Test requests to one host never exceed per_host_limit"""
+    discoverer = RSSFeedDiscoverer(max_concurrent_requests=20, per_host_limit=1, min_host_interval=0.01)
+
+    results = await discoverer.batch_discover(sites.urls[:3], max_concurrent_sites=3)
+
+    assert all(len(feeds) == 2 for feeds in results.values())
+    assert max(sites.max_in_flight.values()) == 1
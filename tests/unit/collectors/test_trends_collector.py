@@ -18,7 +18,7 @@ Test Coverage:
 
 import pytest
 from unittest.mock import Mock, patch
-from datetime import datetime, timedelta
+from datetime import timedelta
 from pathlib import Path
 import hashlib
 import json
@@ -29,6 +29,7 @@ from src.collectors.trends_collector import (
     TrendsCollectorError,
 )
 from src.models.document import Document
+from src.utils.cache_store import CacheStore
 
 
 # ==================== Fixtures ====================
@@ -155,6 +156,42 @@ def test_trends_collector_creates_cache_dir(mock_config, mock_db_manager, mock_d
     assert cache_dir.exists()
 
 
+def test_trends_collector_uses_given_empty_cache_store(mock_config, mock_db_manager, mock_deduplicator, mock_gemini_agent, tmp_path):
+    """Test an empty cache store passed in is used, not replaced by the default"""
+    store = CacheStore(str(tmp_path / "shared.db"), namespace="trends")
+
+    collector = TrendsCollector(
+        config=mock_config,
+        db_manager=mock_db_manager,
+        deduplicator=mock_deduplicator,
+        gemini_agent=mock_gemini_agent,
+        cache_dir=str(tmp_path / "trends_cache"),
+        cache_store=store
+    )
+
+    assert collector._cache is store
+    assert not (tmp_path / "trends_cache" / "trends_cache.db").exists()
+
+
+def test_trends_collectors_share_cache_sweeper(mock_config, mock_db_manager, mock_deduplicator, mock_gemini_agent, temp_cache_dir):
+    """Test a collector built per run does not start another sweeper thread"""
+    collectors = [
+        TrendsCollector(
+            config=mock_config,
+            db_manager=mock_db_manager,
+            deduplicator=mock_deduplicator,
+            gemini_agent=mock_gemini_agent,
+            cache_dir=temp_cache_dir
+        )
+        for _ in range(2)
+    ]
+    try:
+        assert collectors[0]._cache._sweeper is collectors[1]._cache._sweeper
+    finally:
+        for collector in collectors:
+            collector._cache.close()
+
+
 # ==================== Trending Searches Tests ====================
 
 def test_collect_trending_searches_success(trends_collector, mock_gemini_trending_response):
@@ -304,7 +341,7 @@ def test_trending_searches_cache_expiry(trends_collector, mock_gemini_trending_r
 
     # Expire cache manually
     cache_key = "trending_searches_germany"
-    trends_collector._cache[cache_key]['timestamp'] = datetime.now() - timedelta(hours=2)
+    trends_collector._cache.set(cache_key, [], ttl=timedelta(hours=-1))
 
     # Second call - cache expired, should hit Gemini API again
     trends_collector.collect_trending_searches(pn='germany')
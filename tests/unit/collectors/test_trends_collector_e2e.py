@@ -237,9 +237,9 @@ def test_e2e_multiple_requests_sequential(trends_collector):
     """
     # Make 3 sequential requests
     docs1 = trends_collector.collect_trending_searches(pn='germany')
-    trends_collector._cache = {}  # Clear cache
+    trends_collector._cache.clear()  # Clear cache
     docs2 = trends_collector.collect_trending_searches(pn='united_states')
-    trends_collector._cache = {}  # Clear cache
+    trends_collector._cache.clear()  # Clear cache
     docs3 = trends_collector.collect_trending_searches(pn='france')
 
     # All requests should succeed (may return 0 results if no trends available)
@@ -279,7 +279,7 @@ def test_e2e_cache_persistence_across_instances(mock_config, mock_db_manager, mo
     )
 
     # Should find cache
-    cache_file = Path(temp_cache_dir) / "trends_cache.json"
+    cache_file = Path(temp_cache_dir) / "trends_cache.db"
     assert cache_file.exists()
 
     # Load cache and verify
@@ -344,7 +344,7 @@ def test_e2e_statistics_tracking(trends_collector):
     Expected: Stats show queries, documents, cache hits/misses
     """
     # Clear cache to force miss
-    trends_collector._cache = {}
+    trends_collector._cache.clear()
 
     # First request (cache miss)
     trends_collector.collect_trending_searches(pn='germany')
@@ -159,6 +159,15 @@ class TestSQLiteManagerDocuments:
         doc = manager.get_document("nonexistent_id")
         assert doc is None
 
+    def test_get_document_by_url(self, manager, sample_document):
+        """Should find document by canonical URL"""
+        manager.insert_document(sample_document)
+
+        doc = manager.get_document_by_url("https://heise.de/article/123")
+        assert doc is not None
+        assert doc.id == sample_document.id
+        assert manager.get_document_by_url("https://heise.de/article/999") is None
+
     def test_update_document(self, manager, sample_document):
         """Should update document successfully"""
         manager.insert_document(sample_document)
@@ -323,6 +332,28 @@ class TestSQLiteManagerTopics:
         assert topics[1].priority == 8
         assert topics[2].priority == 5
 
+    def test_mark_topic_synced(self, manager, sample_topic):
+        """Should store Notion sync state without touching updated_at"""
+        manager.insert_topic(sample_topic)
+        before = manager.get_topic(sample_topic.id)
+        assert before.notion_id is None
+
+        synced_at = datetime(2025, 11, 10, 9, 0, 0)
+        manager.mark_topic_synced(
+            sample_topic.id, notion_id="page_1", fingerprint="abc123", synced_at=synced_at
+        )
+
+        topic = manager.get_topic(sample_topic.id)
+        assert topic.notion_id == "page_1"
+        assert topic.notion_fingerprint == "abc123"
+        assert topic.notion_synced_at == synced_at
+        assert topic.updated_at == before.updated_at
+
+        # Regular updates keep the sync state
+        topic.priority = 9
+        manager.update_topic(topic)
+        assert manager.get_topic(sample_topic.id).notion_fingerprint == "abc123"
+
 
 class TestSQLiteManagerTransactions:
     """Test transaction handling"""
@@ -384,3 +415,353 @@ class TestSQLiteManagerTransactions:
 
         # Verify document was rolled back
         assert manager.get_document("test_doc") is None
+
+
+class TestSQLiteManagerConnectionPool:
+    """Test pooled connection mode (pooled=True)"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create pooled SQLiteManager for tests"""
+        db_path = tmp_path / "test.db"
+        manager = SQLiteManager(db_path=str(db_path), pooled=True)
+        yield manager
+        manager.close()
+
+    @pytest.fixture
+    def sample_topic(self):
+        """Create sample topic for tests"""
+        return Topic(
+            id="topic_123",
+            title="PropTech in Germany 2025",
+            source=TopicSource.RSS,
+            domain="proptech",
+            market="de",
+            language="de",
+            status=TopicStatus.DISCOVERED,
+            priority=8,
+        )
+
+    def test_in_memory_database_is_not_pooled(self):
+        """Should ignore pooled option for in-memory databases"""
+        manager = SQLiteManager(db_path=":memory:", pooled=True)
+
+        assert manager.pooled is False
+        manager.close()
+
+    def test_reader_connection_reused_within_thread(self, manager):
+        """Should reuse the same read-only connection for the calling thread"""
+        with manager._get_connection(readonly=True) as first:
+            pass
+        with manager._get_connection(readonly=True) as second:
+            pass
+
+        assert first is second
+
+    def test_reader_connections_are_per_thread(self, manager):
+        """Should give each thread its own read-only connection"""
+        import threading
+
+        seen = []
+
+        def read():
+            with manager._get_connection(readonly=True) as conn:
+                seen.append(conn)
+
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(conn) for conn in seen}) == 3
+
+    def test_writer_connection_reused(self, manager, sample_topic):
+        """Should reuse a single writer connection across writes"""
+        with manager._get_connection() as first:
+            pass
+        manager.insert_topic(sample_topic)
+        with manager._get_connection() as second:
+            pass
+
+        assert first is second
+
+    def test_reader_connection_is_read_only(self, manager):
+        """Should reject writes on pooled read-only connections"""
+        with pytest.raises(sqlite3.OperationalError):
+            with manager._get_connection(readonly=True) as conn:
+                conn.execute("DELETE FROM topics")
+
+    def test_writes_visible_to_reused_reader(self, manager, sample_topic):
+        """Should not hold read snapshots between calls"""
+        assert manager.get_topic("topic_123") is None
+
+        manager.insert_topic(sample_topic)
+
+        assert manager.get_topic("topic_123") is not None
+
+    def test_write_rolled_back_on_error(self, manager, sample_topic):
+        """Should rollback pooled writes on error"""
+        manager.insert_topic(sample_topic)
+
+        with pytest.raises(RuntimeError):
+            with manager._get_connection() as conn:
+                conn.execute("DELETE FROM topics WHERE id = ?", ("topic_123",))
+                raise RuntimeError("Simulated error")
+
+        assert manager.get_topic("topic_123") is not None
+
+    def test_row_factory_reset_between_uses(self, manager, sample_topic):
+        """Should hand out connections with the default row factory"""
+        manager.insert_topic(sample_topic)
+        manager.get_topic("topic_123")  # Sets row_factory = sqlite3.Row
+
+        with manager._get_connection(readonly=True) as conn:
+            row = conn.execute("SELECT id FROM topics").fetchone()
+
+        assert row == ("topic_123",)
+
+    def test_concurrent_reads_and_writes(self, manager):
+        """Should serialize concurrent writes without SQLITE_BUSY errors"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def write_and_read(i):
+            topic = Topic(
+                id=f"topic_{i}",
+                title=f"Topic {i}",
+                source=TopicSource.MANUAL,
+                domain="test",
+                market="test",
+                language="en",
+            )
+            manager.insert_topic(topic)
+            return manager.get_topic(f"topic_{i}")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(write_and_read, range(50)))
+
+        assert all(topic is not None for topic in results)
+        assert len(manager.get_topics_by_priority(limit=100)) == 50
+
+    def test_close_releases_pool(self, manager, sample_topic):
+        """Should close pooled connections and reopen on next use"""
+        manager.insert_topic(sample_topic)
+        with manager._get_connection(readonly=True) as reader:
+            pass
+
+        manager.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            reader.execute("SELECT 1")
+        assert manager.get_topic("topic_123") is not None
+
+
+class TestSQLiteManagerBulkInsert:
+    """Test bulk document ingestion"""
+
+    @pytest.fixture(params=[False, True], ids=["per_call", "pooled"])
+    def manager(self, request, tmp_path):
+        """Create SQLiteManager for tests (both connection modes)"""
+        db_path = tmp_path / "test.db"
+        manager = SQLiteManager(db_path=str(db_path), pooled=request.param)
+        yield manager
+        manager.close()
+
+    def _make_document(self, i: int, title: str = None) -> Document:
+        return Document(
+            id=f"rss_doc_{i}",
+            source="rss_test",
+            source_url=f"https://example.com/{i}",
+            title=title or f"Article {i}",
+            content=f"Content of article {i} about proptech",
+            language="de",
+            domain="SaaS",
+            market="Germany",
+            vertical="Proptech",
+            content_hash=f"hash_{i}",
+            canonical_url=f"https://example.com/{i}",
+            published_at=datetime(2025, 11, 3, 12, 0, 0),
+            fetched_at=datetime(2025, 11, 3, 12, 5, 0),
+        )
+
+    def test_bulk_insert_documents(self, manager):
+        """Should insert all documents and return inserted count"""
+        docs = [self._make_document(i) for i in range(50)]
+
+        inserted = manager.insert_documents_bulk(docs)
+
+        assert inserted == 50
+        assert len(manager.get_documents_by_language("de")) == 50
+        assert manager.get_document("rss_doc_7").title == "Article 7"
+
+    def test_bulk_insert_empty_list(self, manager):
+        """Should return 0 for empty input"""
+        assert manager.insert_documents_bulk([]) == 0
+
+    def test_bulk_insert_skips_existing_ids(self, manager):
+        """Should skip documents already in the database"""
+        manager.insert_document(self._make_document(1, title="Original"))
+
+        inserted = manager.insert_documents_bulk(
+            [self._make_document(1, title="Replacement"), self._make_document(2)]
+        )
+
+        assert inserted == 1
+        assert manager.get_document("rss_doc_1").title == "Original"
+        assert manager.get_document("rss_doc_2") is not None
+
+    def test_bulk_insert_skips_duplicates_within_batch(self, manager):
+        """Should keep the first occurrence of a repeated ID"""
+        inserted = manager.insert_documents_bulk(
+            [self._make_document(1, title="First"), self._make_document(1, title="Second")]
+        )
+
+        assert inserted == 1
+        assert manager.get_document("rss_doc_1").title == "First"
+
+    def test_bulk_insert_indexes_fts(self, manager):
+        """Should index only newly inserted documents for full-text search"""
+        manager.insert_document(self._make_document(1, title="Smart Building"))
+        manager.insert_documents_bulk(
+            [self._make_document(1, title="Smart Building"), self._make_document(2, title="Smart Metering")]
+        )
+
+        results = manager.search_documents("Smart")
+
+        assert sorted(doc.id for doc in results) == ["rss_doc_1", "rss_doc_2"]
+
+    def test_transaction_groups_multiple_statements(self, manager):
+        """Should commit inserts and updates in one transaction"""
+        doc = self._make_document(1)
+
+        with manager.transaction():
+            manager.insert_document(doc)
+            # Reads inside the transaction see uncommitted writes
+            assert manager.get_document("rss_doc_1") is not None
+            doc.status = "processed"
+            manager.update_document(doc)
+
+        assert manager.get_document("rss_doc_1").status == "processed"
+
+    def test_transaction_rolls_back_all_statements(self, manager):
+        """Should rollback every statement in the block on error"""
+        with pytest.raises(ValueError):
+            with manager.transaction():
+                manager.insert_document(self._make_document(1))
+                manager.insert_documents_bulk([self._make_document(2)])
+                # Duplicate ID raises inside the transaction
+                manager.insert_document(self._make_document(1))
+
+        assert manager.get_document("rss_doc_1") is None
+        assert manager.get_document("rss_doc_2") is None
+        assert manager.search_documents("proptech") == []
+
+    def test_nested_transaction_raises(self, manager):
+        """Should reject nested transactions"""
+        with pytest.raises(RuntimeError):
+            with manager.transaction():
+                with manager.transaction():
+                    pass
+
+
+class TestSQLiteManagerRelatedTopics:
+    """Test keyword-indexed related topic lookup"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create SQLiteManager for tests"""
+        db_path = tmp_path / "test.db"
+        return SQLiteManager(db_path=str(db_path))
+
+    def _make_topic(self, topic_id: str, title: str, report: str = "Research report") -> Topic:
+        return Topic(
+            id=topic_id,
+            title=title,
+            source=TopicSource.MANUAL,
+            domain="proptech",
+            market="de",
+            language="de",
+            research_report=report,
+        )
+
+    def _index_rows(self, manager, topic_id: str) -> set:
+        with manager._get_connection(readonly=True) as conn:
+            cursor = conn.execute(
+                "SELECT keyword FROM topic_keywords WHERE topic_id = ?", (topic_id,)
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    def test_insert_topic_indexes_title_keywords(self, manager):
+        """Should index title keywords of researched topics"""
+        manager.insert_topic(self._make_topic("t1", "PropTech Smart Building Technology"))
+
+        assert self._index_rows(manager, "t1") == {"proptech", "smart", "building", "technology"}
+
+    def test_unresearched_topic_not_indexed(self, manager):
+        """Should skip topics without research report"""
+        manager.insert_topic(self._make_topic("t1", "PropTech Smart Building", report=None))
+
+        assert self._index_rows(manager, "t1") == set()
+
+    def test_update_topic_reindexes(self, manager):
+        """Should replace index entries when title changes"""
+        topic = self._make_topic("t1", "PropTech Smart Building")
+        manager.insert_topic(topic)
+
+        topic.title = "Facility Management Software"
+        manager.update_topic(topic)
+
+        assert self._index_rows(manager, "t1") == {"facility", "management", "software"}
+
+    def test_find_related_topics_scores_shared_keywords(self, manager):
+        """Should return Jaccard-scored topics sharing keywords, most similar first"""
+        manager.insert_topic(self._make_topic("source", "PropTech Technology Trends"))
+        manager.insert_topic(self._make_topic("close", "PropTech Technology Platforms"))
+        manager.insert_topic(self._make_topic("far", "PropTech Investment Funds Germany"))
+        manager.insert_topic(self._make_topic("unrelated", "Gardening Tips"))
+
+        related = manager.find_related_topics("source", limit=5, min_similarity=0.0)
+
+        assert [(topic.id, round(score, 2)) for topic, score in related] == [
+            ("close", 0.5),   # 2 shared / 4 total
+            ("far", 0.17),    # 1 shared / 6 total
+        ]
+
+    def test_find_related_topics_respects_min_similarity_and_limit(self, manager):
+        """Should filter by min_similarity and cap at limit"""
+        manager.insert_topic(self._make_topic("source", "PropTech Technology Trends"))
+        manager.insert_topic(self._make_topic("a", "PropTech Technology Platforms"))
+        manager.insert_topic(self._make_topic("b", "PropTech Technology Startups"))
+        manager.insert_topic(self._make_topic("c", "PropTech Investment Funds Germany"))
+
+        assert len(manager.find_related_topics("source", min_similarity=0.3)) == 2
+        assert len(manager.find_related_topics("source", limit=1, min_similarity=0.0)) == 1
+
+    def test_find_related_topics_excludes_report_by_default(self, manager):
+        """Should only load research_report when include_report=True"""
+        manager.insert_topic(self._make_topic("source", "PropTech Technology Trends"))
+        manager.insert_topic(self._make_topic("other", "PropTech Technology Platforms", report="Full report"))
+
+        without_report = manager.find_related_topics("source")
+        with_report = manager.find_related_topics("source", include_report=True)
+
+        assert without_report[0][0].research_report is None
+        assert with_report[0][0].research_report == "Full report"
+
+    def test_find_related_topics_unknown_source(self, manager):
+        """Should return empty list for unknown topic"""
+        assert manager.find_related_topics("missing") == []
+
+    def test_migration_backfills_existing_topics(self, tmp_path):
+        """Should build the index for databases created before topic_keywords"""
+        db_path = tmp_path / "test.db"
+        manager = SQLiteManager(db_path=str(db_path))
+        manager.insert_topic(self._make_topic("source", "PropTech Technology Trends"))
+        manager.insert_topic(self._make_topic("other", "PropTech Technology Platforms"))
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DROP TABLE topic_keywords")
+
+        reopened = SQLiteManager(db_path=str(db_path))
+
+        assert [topic.id for topic, _ in reopened.find_related_topics("source")] == ["other"]
@@ -130,6 +130,57 @@ class TestTopicsSyncSingle:
             assert result['action'] == 'skipped'
             assert result['reason'] == 'already_synced'
 
+    def test_sync_topic_records_notion_state(self, sample_topic, mock_notion_response):
+        """Should set notion_id, fingerprint and synced_at after a push"""
+        with patch('src.notion_integration.topics_sync.NotionClient') as mock_notion_class:
+            mock_notion = Mock()
+            mock_notion_class.return_value = mock_notion
+            mock_notion.create_page.return_value = mock_notion_response
+
+            sync = TopicsSync(notion_token="test_token", database_id="db_123")
+            result = sync.sync_topic(sample_topic)
+
+            assert sample_topic.notion_id == 'notion_page_123'
+            assert sample_topic.notion_fingerprint == result['fingerprint']
+            assert sample_topic.notion_synced_at is not None
+
+    def test_sync_topic_unchanged_skipped(self, sample_topic, mock_notion_response):
+        """Should skip a synced topic whose properties did not change"""
+        with patch('src.notion_integration.topics_sync.NotionClient') as mock_notion_class:
+            mock_notion = Mock()
+            mock_notion_class.return_value = mock_notion
+            mock_notion.create_page.return_value = mock_notion_response
+
+            sync = TopicsSync(notion_token="test_token", database_id="db_123")
+            sync.sync_topic(sample_topic)
+            result = sync.sync_topic(sample_topic)
+
+            assert result['action'] == 'skipped'
+            assert result['reason'] == 'unchanged'
+            assert result['id'] == 'notion_page_123'
+            mock_notion.create_page.assert_called_once()
+            mock_notion.update_page.assert_not_called()
+            assert sync.get_statistics()['total_skipped'] == 1
+
+    def test_sync_topic_changed_updates_existing_page(self, sample_topic, mock_notion_response):
+        """Should update the recorded page when the topic's properties changed"""
+        with patch('src.notion_integration.topics_sync.NotionClient') as mock_notion_class:
+            mock_notion = Mock()
+            mock_notion_class.return_value = mock_notion
+            mock_notion.create_page.return_value = mock_notion_response
+            mock_notion.update_page.return_value = mock_notion_response
+
+            sync = TopicsSync(notion_token="test_token", database_id="db_123")
+            first = sync.sync_topic(sample_topic)
+
+            sample_topic.priority = 10
+            result = sync.sync_topic(sample_topic)
+
+            assert result['action'] == 'updated'
+            assert result['fingerprint'] != first['fingerprint']
+            assert mock_notion.update_page.call_args[1]['page_id'] == 'notion_page_123'
+            mock_notion.create_page.assert_called_once()
+
     def test_sync_topic_no_database_id(self, sample_topic):
         """Should raise error if database_id not set"""
         with patch('src.notion_integration.topics_sync.NotionClient'):
@@ -332,3 +332,88 @@ class TestStatistics:
         stats = dedup.get_stats()
         assert stats['total_documents'] == 0
         assert stats['duplicates_found'] == 0
+
+
+class TestPersistentIndex:
+    """Test cross-run persistent dedup index"""
+
+    def _doc(self, doc_id, url, content):
+        return Document(
+            id=doc_id, source="test", source_url=url,
+            title=f"Title {doc_id}", content=content,
+            language="en", domain="Tech", market="US", vertical="AI",
+            content_hash=f"hash_{doc_id}", canonical_url=url,
+            published_at=datetime.now(), fetched_at=datetime.now()
+        )
+
+    def test_index_survives_new_instance(self, tmp_path):
+        """Documents added in an earlier run are duplicates in the next run"""
+        index_path = str(tmp_path / "dedup.db")
+        content = "PropTech platforms help landlords manage buildings with sensors and analytics"
+
+        first_run = Deduplicator(index_path=index_path)
+        first_run.add(self._doc("doc_1", "https://a.com/1", content))
+        first_run.close()
+
+        second_run = Deduplicator(index_path=index_path)
+        assert second_run._index_conn is None  # Opened lazily
+
+        # Same URL, different content
+        assert second_run.is_duplicate(self._doc("doc_2", "https://a.com/1", "Unrelated text about cooking"))
+        # Different URL, same content
+        assert second_run.is_duplicate(self._doc("doc_3", "https://b.com/3", content))
+        # Unrelated document
+        assert not second_run.is_duplicate(
+            self._doc("doc_4", "https://c.com/4", "Cloud security best practices for enterprise teams")
+        )
+
+    def test_has_seen_url_checks_index_without_counting(self, tmp_path):
+        """URL-only lookups see earlier runs and leave statistics alone"""
+        index_path = str(tmp_path / "dedup.db")
+        first_run = Deduplicator(index_path=index_path)
+        first_run.add(self._doc("doc_1", "https://a.com/1", "AI and machine learning in real estate"))
+        first_run.close()
+
+        second_run = Deduplicator(index_path=index_path)
+        assert second_run.has_seen_url("https://a.com/1")
+        assert not second_run.has_seen_url("https://a.com/2")
+        assert second_run.total_documents == 0
+
+    def test_minhash_computed_once_and_stored_on_document(self, tmp_path, monkeypatch):
+        """is_duplicate + add hash the content once; signature is kept on the document"""
+        dedup = Deduplicator(index_path=str(tmp_path / "dedup.db"))
+        doc = self._doc("doc_1", "https://a.com/1", "AI and machine learning in real estate")
+
+        calls = []
+        original = dedup.compute_minhash
+        monkeypatch.setattr(dedup, "compute_minhash", lambda content: calls.append(content) or original(content))
+
+        assert not dedup.is_duplicate(doc)
+        dedup.add(doc)
+
+        assert len(calls) == 1
+        restored = dedup.decode_signature(doc.minhash_signature)
+        assert restored.jaccard(original(doc.content)) == 1.0
+
+    def test_clear_resets_persistent_index(self, tmp_path):
+        """clear() empties the on-disk index too"""
+        index_path = str(tmp_path / "dedup.db")
+        dedup = Deduplicator(index_path=index_path)
+        doc = self._doc("doc_1", "https://a.com/1", "AI and machine learning in real estate")
+        dedup.add(doc)
+        dedup.clear()
+
+        assert not Deduplicator(index_path=index_path).is_duplicate(doc)
+
+    def test_remove_forgets_unstored_documents(self, tmp_path):
+        """remove() takes documents out of memory and the on-disk index"""
+        index_path = str(tmp_path / "dedup.db")
+        dedup = Deduplicator(index_path=index_path)
+        doc = self._doc("doc_1", "https://a.com/1", "AI and machine learning in real estate")
+        assert dedup.deduplicate([doc]) == [doc]
+
+        dedup.remove([doc])
+
+        assert not dedup.has_seen_url("https://a.com/1")
+        assert not dedup.is_duplicate(doc)
+        assert not Deduplicator(index_path=index_path).is_duplicate(doc)
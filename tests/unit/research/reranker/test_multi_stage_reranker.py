@@ -351,6 +351,29 @@ class TestStage3VoyageFullMetrics:
         # Should return lower score for similar content
         assert 0 <= novelty_score <= 1
 
+    @pytest.mark.asyncio
+    async def test_stage3_computes_minhash_signatures_once(self, sample_sources, reranker_config):
+        """Should sign every source once per rerank, not once per comparison"""
+        from datasketch import MinHash
+
+        reranker = MultiStageReranker(enable_voyage=False)
+        sample_sources[1]['content'] = sample_sources[0]['content']  # Duplicate
+
+        with patch(
+            'src.research.reranker.multi_stage_reranker.MinHash.bulk',
+            side_effect=MinHash.bulk
+        ) as mock_bulk:
+            result = await reranker._stage3_voyage_full_metrics(
+                sample_sources, "PropTech", reranker_config
+            )
+
+        mock_bulk.assert_called_once()
+        assert all('_minhash' not in source for source in result)
+
+        novelty = {source['url']: source['metrics']['novelty'] for source in result}
+        assert novelty[sample_sources[0]['url']] == 1.0
+        assert novelty[sample_sources[1]['url']] == 0.0  # Exact duplicate of first
+
     @pytest.mark.asyncio
     async def test_stage3_calculates_authority_metric(self, sample_sources):
         """Should calculate Authority metric (20% weight) with E-E-A-T"""
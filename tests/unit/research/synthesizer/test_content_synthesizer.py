@@ -7,6 +7,9 @@ Tests the 2-stage passage extraction and article synthesis:
 - Article synthesis with inline citations [Source N]
 """
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime
@@ -123,7 +126,7 @@ class TestContentExtraction:
             mock_html = "<html><body><p>Full article content here.</p></body></html>"
             mock_content = "Full article content here.\n\nThis is paragraph 2.\n\nParagraph 3."
 
-            with patch('src.research.synthesizer.content_synthesizer.fetch_url', return_value=mock_html):
+            with patch('src.research.synthesizer.content_synthesizer.AsyncPageFetcher.fetch', new_callable=AsyncMock, return_value=mock_html):
                 with patch('src.research.synthesizer.content_synthesizer.extract', return_value=mock_content):
                     result = await synthesizer._extract_content(sample_sources[0], source_id=1)
 
@@ -139,7 +142,7 @@ class TestContentExtraction:
             synthesizer = ContentSynthesizer(gemini_api_key="test_key")
 
             # Mock trafilatura failure
-            with patch('src.research.synthesizer.content_synthesizer.fetch_url', side_effect=Exception("Network error")):
+            with patch('src.research.synthesizer.content_synthesizer.AsyncPageFetcher.fetch', new_callable=AsyncMock, side_effect=Exception("Network error")):
                 result = await synthesizer._extract_content(sample_sources[0], source_id=1)
 
                 # Should fallback to snippet
@@ -148,6 +151,94 @@ class TestContentExtraction:
                 assert result['source_id'] == 1
                 assert len(result['paragraphs']) > 0
 
+    @pytest.mark.asyncio
+    async def test_extract_content_fetches_concurrently(self, sample_sources):
+        """Test extraction of many sources overlaps fetches instead of serializing"""
+        with patch('src.research.synthesizer.content_synthesizer.genai'):
+            synthesizer = ContentSynthesizer(gemini_api_key="test_key")
+
+            async def slow_fetch(url):
+                await asyncio.sleep(0.1)
+                return "<html></html>"
+
+            synthesizer.page_fetcher.fetch = slow_fetch
+            sources = sample_sources * 5
+
+            with patch('src.research.synthesizer.content_synthesizer.extract', return_value="Para 1.\n\nPara 2."):
+                start = time.perf_counter()
+                results = await asyncio.gather(*[
+                    synthesizer._extract_content(source, source_id=idx + 1)
+                    for idx, source in enumerate(sources)
+                ])
+                elapsed = time.perf_counter() - start
+
+            assert len(results) == 10
+            assert all(not r['extraction_failed'] for r in results)
+            assert elapsed < 0.5  # Sequential would take ~1.0s
+
+    @pytest.mark.asyncio
+    async def test_extract_content_in_process_pool(self, sample_sources):
+        """Test trafilatura extraction runs in worker processes"""
+        with patch('src.research.synthesizer.content_synthesizer.genai'):
+            synthesizer = ContentSynthesizer(gemini_api_key="test_key", extract_workers=1)
+
+            paragraph = "PropTech platforms help landlords manage buildings more efficiently. " * 5
+            html = f"<html><body><article><p>{paragraph}</p><p>{paragraph}</p></article></body></html>"
+            synthesizer.page_fetcher.fetch = AsyncMock(return_value=html)
+
+            result = await synthesizer._extract_content(sample_sources[0], source_id=1)
+
+            assert result['extraction_failed'] is False
+            assert "PropTech platforms" in result['content']
+
+    @pytest.mark.asyncio
+    async def test_extract_content_uses_source_cache(self, sample_sources):
+        """Test fresh cached content skips fetching, new content is saved"""
+        from src.database.sqlite_manager import SQLiteManager
+        from src.research.source_cache import SourceCache
+
+        source_cache = SourceCache(SQLiteManager(':memory:'))
+        source_cache.save_source(
+            url=sample_sources[0]['url'],
+            title="Article 1",
+            content="Cached paragraph 1.\n\nCached paragraph 2.",
+            topic_id="earlier-topic"
+        )
+
+        with patch('src.research.synthesizer.content_synthesizer.genai'):
+            synthesizer = ContentSynthesizer(gemini_api_key="test_key", source_cache=source_cache)
+            synthesizer.page_fetcher.fetch = AsyncMock(return_value="<html></html>")
+
+            with patch('src.research.synthesizer.content_synthesizer.extract', return_value="Fresh 1.\n\nFresh 2."):
+                cached = await synthesizer._extract_content(sample_sources[0], source_id=1, topic_id="PropTech")
+                fetched = await synthesizer._extract_content(sample_sources[1], source_id=2, topic_id="PropTech")
+
+        assert cached['paragraphs'] == ['Cached paragraph 1.', 'Cached paragraph 2.']
+        synthesizer.page_fetcher.fetch.assert_awaited_once_with(sample_sources[1]['url'])
+        assert fetched['content'] == "Fresh 1.\n\nFresh 2."
+        assert source_cache.get_content(sample_sources[1]['url']) == "Fresh 1.\n\nFresh 2."
+        assert "PropTech" in source_cache.get_source(sample_sources[0]['url'])['topic_ids']
+
+    @pytest.mark.asyncio
+    async def test_extract_content_without_topic_counts_no_usage(self, sample_sources):
+        """Test content cached outside a topic is not recorded as a use"""
+        from src.database.sqlite_manager import SQLiteManager
+        from src.research.source_cache import SourceCache
+
+        source_cache = SourceCache(SQLiteManager(':memory:'))
+
+        with patch('src.research.synthesizer.content_synthesizer.genai'):
+            synthesizer = ContentSynthesizer(gemini_api_key="test_key", source_cache=source_cache)
+            synthesizer.page_fetcher.fetch = AsyncMock(return_value="<html></html>")
+
+            with patch('src.research.synthesizer.content_synthesizer.extract', return_value="Fresh 1.\n\nFresh 2."):
+                await synthesizer._extract_content(sample_sources[0], source_id=1)
+
+        cached = source_cache.get_source(sample_sources[0]['url'])
+        assert source_cache.get_content(sample_sources[0]['url']) == "Fresh 1.\n\nFresh 2."
+        assert cached['topic_ids'] == []
+        assert cached['usage_count'] == 0
+
 
 class TestBM25PassageFilter:
     """Test BM25 passage pre-filtering (Stage 1)"""
@@ -316,7 +407,7 @@ class TestFullPipeline:
 
             # Mock content extraction
             mock_content = "Para 1 about PropTech.\n\nPara 2 about AI.\n\nPara 3 about trends."
-            with patch('src.research.synthesizer.content_synthesizer.fetch_url', return_value="<html></html>"):
+            with patch('src.research.synthesizer.content_synthesizer.AsyncPageFetcher.fetch', new_callable=AsyncMock, return_value="<html></html>"):
                 with patch('src.research.synthesizer.content_synthesizer.extract', return_value=mock_content):
                     # Mock BM25 filtering
                     with patch.object(synthesizer, '_bm25_filter_passages', return_value=["Para 1", "Para 2"]):
@@ -355,7 +446,7 @@ class TestFullPipeline:
 
             # Mock content extraction
             mock_content = "Para 1.\n\nPara 2.\n\nPara 3."
-            with patch('src.research.synthesizer.content_synthesizer.fetch_url', return_value="<html></html>"):
+            with patch('src.research.synthesizer.content_synthesizer.AsyncPageFetcher.fetch', new_callable=AsyncMock, return_value="<html></html>"):
                 with patch('src.research.synthesizer.content_synthesizer.extract', return_value=mock_content):
                     # Mock LLM selection (no BM25)
                     with patch.object(synthesizer, '_llm_select_passages', return_value=["Para 1"]):
@@ -393,7 +484,7 @@ class TestImageGenerationIntegration:
     ):
         """Test synthesis with image generation enabled"""
         with patch('src.research.synthesizer.content_synthesizer.genai') as mock_genai, \
-             patch('src.research.synthesizer.content_synthesizer.fetch_url') as mock_fetch, \
+             patch('src.research.synthesizer.content_synthesizer.AsyncPageFetcher.fetch', new_callable=AsyncMock) as mock_fetch, \
              patch('src.research.synthesizer.content_synthesizer.extract') as mock_extract, \
              patch('src.research.synthesizer.content_synthesizer.ImageGenerator') as mock_img_gen:
 
@@ -460,7 +551,7 @@ class TestImageGenerationIntegration:
     ):
         """Test synthesis with image generation disabled"""
         with patch('src.research.synthesizer.content_synthesizer.genai') as mock_genai, \
-             patch('src.research.synthesizer.content_synthesizer.fetch_url') as mock_fetch, \
+             patch('src.research.synthesizer.content_synthesizer.AsyncPageFetcher.fetch', new_callable=AsyncMock) as mock_fetch, \
              patch('src.research.synthesizer.content_synthesizer.extract') as mock_extract, \
              patch('src.research.synthesizer.content_synthesizer.ImageGenerator') as mock_img_gen:
 
@@ -503,7 +594,7 @@ class TestImageGenerationIntegration:
     ):
         """Test synthesis continues when image generation fails (silent failure)"""
         with patch('src.research.synthesizer.content_synthesizer.genai') as mock_genai, \
-             patch('src.research.synthesizer.content_synthesizer.fetch_url') as mock_fetch, \
+             patch('src.research.synthesizer.content_synthesizer.AsyncPageFetcher.fetch', new_callable=AsyncMock) as mock_fetch, \
              patch('src.research.synthesizer.content_synthesizer.extract') as mock_extract, \
              patch('src.research.synthesizer.content_synthesizer.ImageGenerator') as mock_img_gen:
 
@@ -553,7 +644,7 @@ class TestImageGenerationIntegration:
     ):
         """Test synthesis with no brand tone defaults to Professional"""
         with patch('src.research.synthesizer.content_synthesizer.genai') as mock_genai, \
-             patch('src.research.synthesizer.content_synthesizer.fetch_url') as mock_fetch, \
+             patch('src.research.synthesizer.content_synthesizer.AsyncPageFetcher.fetch', new_callable=AsyncMock) as mock_fetch, \
              patch('src.research.synthesizer.content_synthesizer.extract') as mock_extract, \
              patch('src.research.synthesizer.content_synthesizer.ImageGenerator') as mock_img_gen:
 
@@ -601,7 +692,7 @@ class TestImageGenerationIntegration:
     ):
         """Test image cost tracking is accurate across all scenarios"""
         with patch('src.research.synthesizer.content_synthesizer.genai') as mock_genai, \
-             patch('src.research.synthesizer.content_synthesizer.fetch_url') as mock_fetch, \
+             patch('src.research.synthesizer.content_synthesizer.AsyncPageFetcher.fetch', new_callable=AsyncMock) as mock_fetch, \
              patch('src.research.synthesizer.content_synthesizer.extract') as mock_extract, \
              patch('src.research.synthesizer.content_synthesizer.ImageGenerator') as mock_img_gen:
 
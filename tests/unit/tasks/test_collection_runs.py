@@ -0,0 +1,113 @@
+"""
+Tests for CollectionRunStore
+
+Tests shard checkpoints, reduce claiming and resuming runs.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.models.document import Document
+from src.tasks.collection_runs import COMPLETED, REDUCE_FAILED, REDUCING, RUNNING, CollectionRunStore
+
+
+def make_doc(index: int) -> Document:
+    url = f"https://example.com/article-{index}"
+    return Document(
+        id=f"doc_{index}",
+        source="rss_example",
+        source_url=url,
+        title=f"Article {index}",
+        content=f"Content number {index}",
+        language="de",
+        domain="SaaS",
+        market="Germany",
+        vertical="Proptech",
+        content_hash=f"hash_{index}",
+        canonical_url=url,
+        published_at=datetime(2026, 10, 1, 12, 0),
+        fetched_at=datetime(2026, 10, 17, 2, 0)
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CollectionRunStore(str(tmp_path / "collection_runs.db"))
+
+
+class TestCollectionRunStore:
+    """Test CollectionRunStore functionality"""
+
+    def test_last_shard_claims_reduce(self, store):
+        """Test only the shard finishing the run claims the reduce step"""
+        assert store.create_run("run", "config.yaml", ["a", "b"]) == ["a", "b"]
+
+        assert store.complete_shard("run", "a", [make_doc(1)]) is False
+        assert store.complete_shard("run", "b", [make_doc(2), make_doc(3)]) is True
+        # Duplicate delivery of a finished shard does not claim again
+        assert store.complete_shard("run", "b", [make_doc(2)]) is False
+
+        results = store.load_results("run")
+        assert [doc.id for doc in results['documents']] == ["doc_1", "doc_2"]
+        assert results['sources'] == 2
+        assert results['failed_shards'] == []
+
+    def test_documents_round_trip(self, store):
+        """Test checkpointed documents load back unchanged"""
+        store.create_run("run", "config.yaml", ["a"])
+        store.complete_shard("run", "a", [make_doc(1)])
+
+        assert store.load_results("run")['documents'] == [make_doc(1)]
+
+    def test_retryable_failure_keeps_shard_pending(self, store):
+        """Test a failure with retries left does not finish the run"""
+        store.create_run("run", "config.yaml", ["a"])
+
+        assert store.fail_shard("run", "a", "timeout", final=False) is False
+        assert store.get_run("run")['shards'] == {"pending": 1}
+
+        assert store.fail_shard("run", "a", "timeout", final=True) is True
+        results = store.load_results("run")
+        assert results['failed_shards'] == ["a"]
+        assert results['errors'] == 1
+
+    def test_resume_redoes_only_unfinished_shards(self, store):
+        """Test re-creating a run returns failed and pending shards only"""
+        store.create_run("run", "config.yaml", ["a", "b", "c"])
+        store.complete_shard("run", "a", [make_doc(1)])
+        store.fail_shard("run", "b", "HTTP 503", final=True)
+
+        assert store.create_run("run", "config.yaml", ["a", "b", "c", "d"]) == ["b", "c", "d"]
+        assert store.is_shard_done("run", "a") is True
+        assert store.get_run("run")['status'] == RUNNING
+
+    def test_complete_run_drops_documents(self, store):
+        """Test a reduced run keeps its stats but not the documents"""
+        store.create_run("run", "config.yaml", ["a"])
+        store.complete_shard("run", "a", [make_doc(1)])
+        store.complete_run("run", {'documents_saved': 1})
+
+        run = store.get_run("run")
+        assert run['status'] == COMPLETED
+        assert run['result'] == {'documents_saved': 1}
+        assert store.load_results("run")['documents'] == []
+        assert store.create_run("run", "config.yaml", ["a"]) == []
+
+    def test_claim_reduce_only_when_unclaimed(self, store):
+        """Test a reduce in progress is not claimed again, a failed one is"""
+        store.create_run("run", "config.yaml", ["a", "b"])
+        store.complete_shard("run", "a", [make_doc(1)])
+        assert store.claim_reduce("run") is False  # Shard b pending
+
+        assert store.complete_shard("run", "b", [make_doc(2)]) is True
+        assert store.get_run("run")['status'] == REDUCING
+        assert store.claim_reduce("run") is False
+
+        store.fail_reduce("run")
+        assert store.get_run("run")['status'] == REDUCE_FAILED
+        assert store.claim_reduce("run") is True
+        assert store.claim_reduce("run") is False
+
+        store.complete_run("run", {})
+        assert store.claim_reduce("run") is False
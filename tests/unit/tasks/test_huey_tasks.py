@@ -14,9 +14,11 @@ Requirements:
 """
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from datetime import datetime
 
+import pytest
+
 
 class TestHueyInitialization:
     """Test Huey initialization and configuration"""
@@ -311,6 +313,24 @@ class TestTaskConfiguration:
 
         assert test_huey.storage_kwargs['filename'] == str(custom_path)
 
+    def test_notion_rate_budget_configured_on_worker_startup(self, monkeypatch):
+        """Should share the Notion rate budget only in consumer workers, not on import"""
+        import os
+        import subprocess
+        import sys
+        from src.tasks import huey_tasks
+
+        monkeypatch.delenv("NOTION_RATE_LIMIT_DB", raising=False)
+        imported = subprocess.run(
+            [sys.executable, "-c",
+             "import os, src.tasks.huey_tasks; print(os.environ.get('NOTION_RATE_LIMIT_DB'))"],
+            capture_output=True, text=True, check=True
+        )
+        assert imported.stdout.strip() == "None"
+
+        huey_tasks._configure_worker()
+        assert os.environ["NOTION_RATE_LIMIT_DB"] == str(huey_tasks.NOTION_RATE_LIMIT_DB_PATH)
+
     def test_default_config_location(self):
         """Should use sensible default location for tasks database"""
         from src.tasks.huey_tasks import huey
@@ -571,3 +591,159 @@ class TestDLQIntegration:
 
         # Should have at least 3 entries
         assert len(entries) >= 3
+
+
+class TestCollectionFanOut:
+    """Test per-shard collection tasks with checkpointed reduce"""
+
+    @pytest.fixture
+    def fan_out(self, tmp_path):
+        """Immediate-mode Huey, temporary run store and a fake agent"""
+        from src.orchestrator.collection_orchestrator import StageOutput
+        from src.tasks import huey_tasks
+        from src.tasks.collection_runs import CollectionRunStore
+
+        agent = Mock()
+        agent.collection_shards.return_value = ["feed:https://a.example/rss", "feed:https://b.example/rss", "autocomplete:proptech"]
+        agent.collect_shard.side_effect = lambda shard_id: StageOutput(documents=[], sources=1)
+        agent.store_documents.return_value = {'documents_collected': 0, 'documents_saved': 0, 'errors': 0}
+
+        huey_tasks.huey.immediate = True
+        try:
+            with patch.object(huey_tasks, 'collection_runs', CollectionRunStore(str(tmp_path / "runs.db"))), \
+                    patch.object(huey_tasks, '_load_agent', return_value=agent), \
+                    patch.object(huey_tasks, 'log_to_dlq'):
+                yield huey_tasks, agent
+        finally:
+            huey_tasks.huey.immediate = False
+
+    def test_daily_collection_starts_every_market(self):
+        """Should start one collection run per config in config/markets/"""
+        from src.tasks import huey_tasks
+
+        with patch.object(huey_tasks, 'start_collection') as start:
+            result = huey_tasks.daily_collection.call_local()
+
+        started = [call.args[0] for call in start.call_args_list]
+        assert [Path(path).name for path in started] == ["fashion_fr.yaml", "proptech_de.yaml"]
+        assert result == {'configs': started}
+
+    def test_poll_due_feeds_polls_every_market(self):
+        """Should poll due feeds of every market, continuing past a failing one"""
+        from src.tasks import huey_tasks
+
+        agent = Mock()
+        agent.collect_due_feeds.return_value = {'feeds_polled': 2}
+
+        def load_agent(config_path):
+            if config_path.endswith("fashion_fr.yaml"):
+                raise ValueError("invalid config")
+            return agent
+
+        with patch.object(huey_tasks, '_load_agent', side_effect=load_agent), \
+                patch.object(huey_tasks, 'log_to_dlq') as log_to_dlq:
+            result = huey_tasks.poll_due_feeds.call_local()
+
+        assert [Path(path).name for path in result['configs']] == ["proptech_de.yaml"]
+        assert list(result['configs'].values()) == [{'feeds_polled': 2}]
+        assert [Path(path).name for path in result['failed']] == ["fashion_fr.yaml"]
+        log_to_dlq.assert_called_once()
+
+    def test_shards_collected_and_reduced_once(self, fan_out):
+        """Should collect every shard separately and reduce after the last one"""
+        huey_tasks, agent = fan_out
+
+        result = huey_tasks.start_collection("config/markets/proptech_de.yaml", run_id="run-1")()
+
+        assert result == {'run_id': "run-1", 'shards': 3, 'enqueued': 3}
+        assert [call.args[0] for call in agent.collect_shard.call_args_list] == agent.collection_shards.return_value
+        agent.store_documents.assert_called_once()
+        run = huey_tasks.collection_runs.get_run("run-1")
+        assert run['status'] == "completed"
+        assert run['result']['sources_processed'] == 3
+
+    def test_rerun_redoes_only_failed_shards(self, fan_out):
+        """Should only re-collect the shard that failed, then reduce"""
+        from src.orchestrator.collection_orchestrator import StageOutput
+
+        huey_tasks, agent = fan_out
+        failing = {"feed:https://b.example/rss"}
+
+        def collect(shard_id):
+            if shard_id in failing:
+                raise RuntimeError("HTTP 503")
+            return StageOutput(documents=[], sources=1)
+        agent.collect_shard.side_effect = collect
+
+        huey_tasks.start_collection("config/markets/proptech_de.yaml", run_id="run-1")
+        agent.store_documents.assert_not_called()  # Failed shard still has retries
+
+        failing.clear()
+        agent.collect_shard.reset_mock()
+        result = huey_tasks.start_collection("config/markets/proptech_de.yaml", run_id="run-1")()
+
+        assert result['enqueued'] == 1
+        agent.collect_shard.assert_called_once_with("feed:https://b.example/rss")
+        agent.store_documents.assert_called_once()
+        assert huey_tasks.collection_runs.get_run("run-1")['status'] == "completed"
+
+    def test_rerun_does_not_reduce_run_being_reduced(self, fan_out):
+        """Should reduce again only once a claimed reduce has given up"""
+        huey_tasks, agent = fan_out
+        store = huey_tasks.collection_runs
+        store.create_run("run-1", "config/markets/proptech_de.yaml", agent.collection_shards.return_value)
+        for shard_id in agent.collection_shards.return_value:
+            claimed = store.complete_shard("run-1", shard_id, [])
+        assert claimed  # Reduce enqueued elsewhere, still running
+
+        result = huey_tasks.start_collection("config/markets/proptech_de.yaml", run_id="run-1")()
+        assert result['enqueued'] == 0
+        agent.store_documents.assert_not_called()
+
+        store.fail_reduce("run-1")  # Out of retries
+        huey_tasks.start_collection("config/markets/proptech_de.yaml", run_id="run-1")
+        agent.store_documents.assert_called_once()
+        assert store.get_run("run-1")['status'] == "completed"
+
+    def test_failed_feed_shard_stays_pending_and_is_retried(self, fan_out, tmp_path):
+        """Should not finish a feed shard whose fetch failed, and collect it on retry"""
+        import httpx
+        from src.agents.universal_topic_agent import UniversalTopicAgent
+        from src.collectors.feed_state_store import FeedStateStore
+        from src.collectors.rss_collector import RSSCollector
+
+        huey_tasks, agent = fan_out
+        feed_url = "https://a.example/rss"
+        requests = []
+
+        def handler(request):
+            requests.append(request.url)
+            if len(requests) == 1:
+                return httpx.Response(503)
+            return httpx.Response(
+                200,
+                text='<?xml version="1.0"?><rss version="2.0"><channel><title>News</title></channel></rss>',
+                headers={"Content-Type": "application/rss+xml"}
+            )
+
+        agent.SHARD_KINDS = UniversalTopicAgent.SHARD_KINDS
+        agent.rss_collector = RSSCollector(
+            config=Mock(),
+            db_manager=Mock(),
+            deduplicator=Mock(),
+            feed_state_store=FeedStateStore(str(tmp_path / "feed_state.db")),
+            max_concurrent_feeds=1,
+            transport=httpx.MockTransport(handler)
+        )
+        agent.collection_shards.return_value = [f"feed:{feed_url}"]
+        agent.collect_shard.side_effect = lambda shard_id: UniversalTopicAgent.collect_shard(agent, shard_id)
+
+        huey_tasks.start_collection("config/markets/proptech_de.yaml", run_id="run-1")
+        assert huey_tasks.collection_runs.get_run("run-1")['shards'] == {"pending": 1}
+        agent.store_documents.assert_not_called()
+
+        huey_tasks.start_collection("config/markets/proptech_de.yaml", run_id="run-1")
+
+        assert len(requests) == 2
+        agent.store_documents.assert_called_once()
+        assert huey_tasks.collection_runs.get_run("run-1")['status'] == "completed"
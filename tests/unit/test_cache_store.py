@@ -0,0 +1,142 @@
+"""
+Tests for CacheStore
+
+Test Coverage:
+- Write-through persistence across instances
+- Per-entry TTL and default TTL
+- Namespaces sharing one file
+- Expiry sweeps (direct and background thread)
+- Hit/miss statistics
+"""
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from src.utils.cache_store import CacheStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "cache" / "store.db")
+
+
+def test_set_get_persists_across_instances(db_path):
+    """Test entries are on disk as soon as set() returns"""
+    CacheStore(db_path).set("key", {"items": [1, 2, 3]})
+
+    assert CacheStore(db_path).get("key") == {"items": [1, 2, 3]}
+
+
+def test_missing_key_returns_default(db_path):
+    """Test unknown keys return the default"""
+    store = CacheStore(db_path)
+
+    assert store.get("missing") is None
+    assert store.get("missing", []) == []
+
+
+def test_expired_entry_is_miss_and_removed(db_path):
+    """Test entries past their TTL are not returned"""
+    store = CacheStore(db_path)
+    store.set("old", "value", ttl=timedelta(seconds=-1))
+    store.set("fresh", "value", ttl=timedelta(hours=1))
+
+    assert store.get("old") is None
+    assert "old" not in store
+    assert store.get("fresh") == "value"
+    assert store.get_stats()['expired'] == 1
+
+
+def test_default_ttl_applies(db_path):
+    """Test set() without ttl uses default_ttl"""
+    store = CacheStore(db_path, default_ttl=0.05)
+    store.set("key", "value")
+    assert "key" in store
+
+    time.sleep(0.1)
+
+    assert "key" not in store
+
+
+def test_namespaces_are_isolated(db_path):
+    """Test stores sharing a file only see and clear their own keys"""
+    first = CacheStore(db_path, namespace="first")
+    second = CacheStore(db_path, namespace="second")
+    first.set("key", 1)
+    second.set("key", 2)
+
+    assert first.get("key") == 1
+    assert second.get("key") == 2
+
+    first.clear()
+
+    assert len(first) == 0
+    assert second.get("key") == 2
+
+
+def test_sweep_expired(db_path):
+    """Test sweep deletes only expired entries"""
+    store = CacheStore(db_path)
+    store.set_many([("a", 1), ("b", 2)], ttl=-1)
+    store.set("c", 3)
+
+    assert store.sweep_expired() == 2
+    assert len(store) == 1
+    assert store.get("c") == 3
+
+
+def test_background_sweeper(db_path):
+    """Test the sweeper thread removes expired entries without lookups"""
+    store = CacheStore(db_path)
+    store.set("old", 1, ttl=-1)
+
+    store.start_sweeper(interval=0.05)
+    try:
+        deadline = time.monotonic() + 2.0
+        while store.get_stats()['expired'] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        store.close()
+
+    assert store.get_stats()['expired'] == 1
+    assert store._sweeper is None
+
+
+def test_stores_share_one_sweeper(db_path):
+    """Test stores on one file and namespace share a thread until the last closes"""
+    first = CacheStore(db_path)
+    second = CacheStore(db_path)
+    other = CacheStore(db_path, namespace="other")
+
+    first.start_sweeper(interval=60)
+    second.start_sweeper(interval=60)
+    other.start_sweeper(interval=60)
+    try:
+        assert first._sweeper is second._sweeper
+        assert other._sweeper is not first._sweeper
+
+        thread = first._sweeper.thread
+        first.close()
+        assert thread.is_alive()
+        second.close()
+        assert not thread.is_alive()
+    finally:
+        other.close()
+
+
+def test_stats_track_hits_and_misses(db_path):
+    """Test hit/miss counters and hit rate"""
+    store = CacheStore(db_path)
+    store.set("key", "value")
+
+    store.get("key")
+    store.get("key")
+    store.get("missing")
+
+    stats = store.get_stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['writes'] == 1
+    assert stats['hit_rate'] == pytest.approx(2 / 3)
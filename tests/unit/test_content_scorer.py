@@ -11,10 +11,15 @@ Tests:
 - Overall score calculation
 """
 
+import asyncio
+
+import httpx
 import pytest
 from datetime import datetime, timezone, timedelta
 from bs4 import BeautifulSoup
 from src.research.content_scorer import ContentScorer, WEIGHTS
+from src.utils.page_fetcher import AsyncPageFetcher
+from src.utils.page_store import PageStore
 
 
 class TestContentScorer:
@@ -321,3 +326,96 @@ class TestContentScorer:
         """Test that all weights sum to 1.0"""
         total = sum(WEIGHTS.values())
         assert abs(total - 1.0) < 0.001  # Allow small floating point error
+
+
+SAMPLE_HTML = """
+<html><head><meta property="article:published_time" content="2025-01-15"></head>
+<body><h1>PropTech Guide</h1><h2>Overview</h2>
+<p>PropTech is changing how Berlin landlords manage buildings. PropTech tools help.</p>
+<ul><li>One</li></ul><img src="a.png"></body></html>
+"""
+
+
+class TestContentScorerBatch:
+    """Test score_html() and concurrent score_urls()"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.scorer = ContentScorer()
+
+    def test_score_html_without_network(self):
+        """Test score_html scores already-fetched HTML"""
+        score = self.scorer.score_html("https://example.com/a", SAMPLE_HTML, "PropTech")
+
+        assert score.url == "https://example.com/a"
+        assert score.h1_count == 1
+        assert score.keyword_density > 0
+        assert 0 <= score.quality_score <= 100
+
+    @pytest.mark.asyncio
+    async def test_score_urls_preserves_order_and_skips_failures(self):
+        """Test batch results align with input URLs, failures are None"""
+        def handler(request):
+            if request.url.path == "/missing":
+                return httpx.Response(404)
+            return httpx.Response(200, text=SAMPLE_HTML)
+
+        self.scorer.async_page_fetcher = AsyncPageFetcher(transport=httpx.MockTransport(handler))
+        scores = await self.scorer.score_urls(
+            ["https://a.example.com/1", "https://b.example.com/missing", "https://c.example.com/3"],
+            target_keyword="PropTech"
+        )
+
+        assert len(scores) == 3
+        assert scores[0].url == "https://a.example.com/1"
+        assert scores[1] is None
+        assert scores[2].url == "https://c.example.com/3"
+
+    @pytest.mark.asyncio
+    async def test_score_urls_fetches_concurrently_with_per_host_limit(self):
+        """Test fetches overlap across hosts but respect max_per_host"""
+        active = {"total": 0, "peak": 0}
+        per_host = {}
+
+        async def handler(request):
+            host = request.url.host
+            per_host[host] = per_host.get(host, 0) + 1
+            active["total"] += 1
+            active["peak"] = max(active["peak"], active["total"])
+            assert per_host[host] <= 1
+            await asyncio.sleep(0.02)
+            per_host[host] -= 1
+            active["total"] -= 1
+            return httpx.Response(200, text=SAMPLE_HTML)
+
+        urls = [f"https://host{i % 3}.example.com/{i}" for i in range(6)]
+        scorer = ContentScorer(max_per_host=1)
+        scorer.async_page_fetcher.transport = httpx.MockTransport(handler)
+        scores = await scorer.score_urls(urls)
+
+        assert all(score is not None for score in scores)
+        assert active["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_score_urls_empty(self):
+        """Test empty URL list returns empty result"""
+        assert await self.scorer.score_urls([]) == []
+
+    @pytest.mark.asyncio
+    async def test_score_urls_reads_through_page_store(self, tmp_path):
+        """Test a stored page is scored without downloading it again"""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(str(request.url))
+            return httpx.Response(200, text=SAMPLE_HTML)
+
+        scorer = ContentScorer(page_store=PageStore(db_path=str(tmp_path / "pages.db")))
+        scorer.async_page_fetcher.transport = httpx.MockTransport(handler)
+
+        first = await scorer.score_urls(["https://example.com/a"])
+        second = await scorer.score_urls(["https://www.example.com/a/"])
+
+        assert len(requests_seen) == 1
+        assert first[0].content_hash == second[0].content_hash
+        assert scorer.page_fetcher.page_store.get_stats()["hits"] == 1
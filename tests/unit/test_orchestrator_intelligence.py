@@ -129,7 +129,7 @@ class TestOrchestratorIntelligence:
             mock_serp.analyze_serp = Mock(return_value={"avg_position": 5.0, "total_domains": 10})
             mock_serp.db_manager.save_serp_results = Mock()
 
-            mock_content.score_url = AsyncMock(return_value={"url": "https://example.com", "quality_score": 75})
+            mock_content.score_urls = AsyncMock(return_value=[None])
 
             mock_diff.calculate_difficulty = Mock(return_value={
                 "difficulty_score": 50,
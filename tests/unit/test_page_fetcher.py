@@ -0,0 +1,78 @@
+"""
+Tests for AsyncPageFetcher
+
+Pooled async page fetching with per-host limits, timeouts and graceful failures.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.utils.page_fetcher import AsyncPageFetcher
+
+
+class TestAsyncPageFetcher:
+    """Test AsyncPageFetcher functionality"""
+
+    @pytest.mark.asyncio
+    async def test_fetch_returns_html(self):
+        """Test successful fetch returns decoded HTML"""
+        fetcher = AsyncPageFetcher(transport=httpx.MockTransport(lambda request: httpx.Response(200, text="<html>ok</html>")))
+
+        assert await fetcher.fetch("https://example.com/a") == "<html>ok</html>"
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_fetch_http_error_returns_none(self):
+        """Test HTTP errors return None instead of raising"""
+        fetcher = AsyncPageFetcher(transport=httpx.MockTransport(lambda request: httpx.Response(503)))
+
+        assert await fetcher.fetch("https://example.com/a") is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_invalid_url_returns_none(self):
+        """Test unsupported URLs return None"""
+        fetcher = AsyncPageFetcher()
+
+        assert await fetcher.fetch("not-a-url") is None
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_fetch_oversized_page_returns_none(self):
+        """Test pages above max_bytes are discarded"""
+        fetcher = AsyncPageFetcher(max_bytes=10, transport=httpx.MockTransport(lambda request: httpx.Response(200, text="x" * 100)))
+
+        assert await fetcher.fetch("https://example.com/big") is None
+
+    @pytest.mark.asyncio
+    async def test_fetches_overlap_with_per_host_limit(self):
+        """Test fetches run concurrently but respect max_per_host"""
+        active = {"total": 0, "peak": 0}
+        per_host = {}
+
+        async def handler(request):
+            host = request.url.host
+            per_host[host] = per_host.get(host, 0) + 1
+            active["total"] += 1
+            active["peak"] = max(active["peak"], active["total"])
+            assert per_host[host] <= 2
+            await asyncio.sleep(0.02)
+            per_host[host] -= 1
+            active["total"] -= 1
+            return httpx.Response(200, text="<html></html>")
+
+        fetcher = AsyncPageFetcher(max_per_host=2, transport=httpx.MockTransport(handler))
+
+        urls = [f"https://host{i % 2}.example.com/{i}" for i in range(8)]
+        pages = await asyncio.gather(*(fetcher.fetch(url) for url in urls))
+
+        assert all(page == "<html></html>" for page in pages)
+        assert active["peak"] == 4
+
+    def test_reusable_across_event_loops(self):
+        """Test one fetcher works across separate asyncio.run() calls"""
+        fetcher = AsyncPageFetcher(transport=httpx.MockTransport(lambda request: httpx.Response(200, text="ok")))
+
+        assert asyncio.run(fetcher.fetch("https://example.com/1")) == "ok"
+        assert asyncio.run(fetcher.fetch("https://example.com/2")) == "ok"
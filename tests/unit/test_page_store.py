@@ -0,0 +1,185 @@
+"""
+Tests for PageStore
+
+Compressed on-disk page cache with ETag/Last-Modified revalidation,
+TTL/size eviction and hit-rate statistics.
+"""
+
+import sqlite3
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from src.utils.page_fetcher import AsyncPageFetcher, PageFetcher
+from src.utils.page_store import PageStore, canonicalize_url
+
+
+HTML = "<html><body>" + "<p>PropTech article paragraph.</p>" * 200 + "</body></html>"
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Page store in a temporary directory"""
+    return PageStore(db_path=str(tmp_path / "pages.db"))
+
+
+def make_stale(store: PageStore, url: str, age_seconds: float):
+    """Backdate a stored page's validation time"""
+    conn = sqlite3.connect(store.db_path)
+    conn.execute(
+        "UPDATE pages SET validated_at = ? WHERE url_key = ?",
+        (time.time() - age_seconds, canonicalize_url(url))
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestCanonicalizeUrl:
+    """Test cache key normalization"""
+
+    def test_strips_www_fragment_tracking_and_trailing_slash(self):
+        """Test equivalent URLs share one key"""
+        assert canonicalize_url("https://WWW.Example.com/Article/?utm_source=x&id=2#top") == \
+            canonicalize_url("https://example.com/Article?id=2")
+
+    def test_preserves_path_case(self):
+        """Test path case is significant"""
+        assert canonicalize_url("https://example.com/A") != canonicalize_url("https://example.com/a")
+
+
+class TestPageStore:
+    """Test PageStore functionality"""
+
+    def test_store_and_lookup_fresh(self, store):
+        """Test a freshly stored page is served as a hit"""
+        store.store_response("https://example.com/a", HTML, etag='"v1"')
+
+        page, fresh = store.lookup("https://www.example.com/a/")
+
+        assert fresh is True
+        assert page.html == HTML
+        assert page.etag == '"v1"'
+        assert len(page.content_hash) == 16
+
+    def test_lookup_missing(self, store):
+        """Test unknown URLs are a miss"""
+        assert store.lookup("https://example.com/missing") == (None, False)
+
+    def test_html_is_compressed(self, store):
+        """Test stored HTML blob is smaller than the raw page"""
+        store.store_response("https://example.com/a", HTML)
+
+        conn = sqlite3.connect(store.db_path)
+        blob_size, size_bytes = conn.execute("SELECT LENGTH(html), size_bytes FROM pages").fetchone()
+        conn.close()
+
+        assert size_bytes == len(HTML)
+        assert blob_size < size_bytes / 5
+
+    def test_stale_page_needs_revalidation(self, store):
+        """Test pages past fresh_seconds are returned but not fresh"""
+        store.store_response("https://example.com/a", HTML, etag='"v1"')
+        make_stale(store, "https://example.com/a", store.fresh_seconds + 10)
+
+        page, fresh = store.lookup("https://example.com/a")
+
+        assert page is not None
+        assert fresh is False
+        assert store.conditional_headers(page) == {"If-None-Match": '"v1"'}
+
+    def test_expired_page_is_a_miss(self, store):
+        """Test pages past ttl_seconds are not used"""
+        store.store_response("https://example.com/a", HTML)
+        make_stale(store, "https://example.com/a", store.ttl_seconds + 10)
+
+        assert store.lookup("https://example.com/a") == (None, False)
+
+    def test_text_kept_when_unchanged_dropped_when_changed(self, store):
+        """Test extracted text survives identical refetches only"""
+        url = "https://example.com/a"
+        store.store_response(url, HTML)
+        store.save_text(url, "extracted")
+
+        store.store_response(url, HTML)
+        assert store.get_text(url) == "extracted"
+
+        store.store_response(url, HTML + "<p>update</p>")
+        assert store.get_text(url) is None
+
+    def test_evict_expired_and_over_capacity(self, tmp_path):
+        """Test eviction removes expired pages, then the least recently validated"""
+        store = PageStore(db_path=str(tmp_path / "pages.db"), max_entries=2)
+        for i in range(4):
+            store.store_response(f"https://example.com/{i}", HTML)
+        make_stale(store, "https://example.com/0", store.ttl_seconds + 10)
+        make_stale(store, "https://example.com/1", 100)
+
+        removed = store.evict()
+
+        assert removed == 2
+        assert store.get("https://example.com/0") is None
+        assert store.get("https://example.com/1") is None
+        assert store.get("https://example.com/3") is not None
+
+    def test_stats_hit_rate(self, store):
+        """Test hit rate counts fresh hits and revalidations"""
+        store.store_response("https://example.com/a", HTML)
+        store.lookup("https://example.com/a")
+        store.mark_revalidated("https://example.com/a")
+
+        stats = store.get_stats()
+
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["revalidated"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+        assert stats["bytes_saved"] == 2 * len(HTML)
+        assert stats["total_pages"] == 1
+
+
+class TestFetchersWithPageStore:
+    """Test PageFetcher / AsyncPageFetcher read-through and revalidation"""
+
+    @pytest.mark.asyncio
+    async def test_async_revalidates_with_etag(self, store):
+        """Test stale pages send If-None-Match and reuse the body on 304"""
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text=HTML, headers={"ETag": '"v1"'})
+
+        fetcher = AsyncPageFetcher(page_store=store, transport=httpx.MockTransport(handler))
+
+        assert await fetcher.fetch("https://example.com/a") == HTML
+        assert await fetcher.fetch("https://example.com/a") == HTML  # Fresh, no request
+        make_stale(store, "https://example.com/a", store.fresh_seconds + 10)
+        assert await fetcher.fetch("https://example.com/a") == HTML  # 304
+
+        assert seen_headers == [None, '"v1"']
+        stats = store.get_stats()
+        assert (stats["misses"], stats["hits"], stats["revalidated"]) == (1, 1, 1)
+
+    def test_sync_fetcher_shares_store(self, store):
+        """Test sync fetcher serves pages the async fetcher stored"""
+        store.store_response("https://example.com/a", HTML)
+        fetcher = PageFetcher(page_store=store)
+        fetcher.session.get = Mock()
+
+        assert fetcher.fetch("https://example.com/a") == HTML
+        fetcher.session.get.assert_not_called()
+
+    def test_sync_fetcher_revalidates_with_last_modified(self, store):
+        """Test 304 on a stale page reuses the stored body"""
+        store.store_response("https://example.com/a", HTML, last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+        make_stale(store, "https://example.com/a", store.fresh_seconds + 10)
+        fetcher = PageFetcher(page_store=store)
+        fetcher.session.get = Mock(return_value=Mock(status_code=304))
+
+        assert fetcher.fetch("https://example.com/a") == HTML
+        headers = fetcher.session.get.call_args.kwargs["headers"]
+        assert headers == {"If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"}
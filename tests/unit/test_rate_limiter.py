@@ -0,0 +1,70 @@
+"""
+Tests for TokenBucket
+
+Test Coverage:
+- Burst up to capacity without waiting
+- Reservations spaced 1/rate apart (sync and async)
+- Refill over time
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.utils.rate_limiter import TokenBucket
+
+
+def test_burst_then_spaced():
+    """Test capacity requests pass immediately, later ones wait their turn"""
+    bucket = TokenBucket(rate=10.0, capacity=3)
+
+    waits = [bucket._reserve(1) for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.1, abs=0.01)
+    assert waits[4] == pytest.approx(0.2, abs=0.01)
+
+
+def test_refill_capped_at_capacity():
+    """Test idle time refills the bucket but not beyond capacity"""
+    bucket = TokenBucket(rate=100.0, capacity=2)
+    bucket._reserve(2)
+
+    time.sleep(0.1)  # Would refill 10 tokens
+
+    assert bucket._reserve(2) == 0.0
+    assert bucket._reserve(1) == pytest.approx(0.01, abs=0.005)
+
+
+def test_invalid_rate():
+    """Test rate must be positive"""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_shared_across_threads():
+    """Test threads sharing a bucket are paced together"""
+    bucket = TokenBucket(rate=50.0, capacity=1)
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start >= 5 / 50.0 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_acquire_async_paces_coroutines():
+    """Test concurrent coroutines are spaced without blocking the loop"""
+    bucket = TokenBucket(rate=50.0, capacity=2)
+
+    start = time.monotonic()
+    waits = await asyncio.gather(*(bucket.acquire_async() for _ in range(6)))
+
+    assert sorted(waits)[:2] == [0.0, 0.0]
+    assert time.monotonic() - start >= 4 / 50.0 * 0.9
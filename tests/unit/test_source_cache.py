@@ -369,6 +369,7 @@ class TestSourceCache:
             (150,),  # total_sources
             (0.75,),  # avg_quality
             (30,),   # stale_count
+            (0, 0),  # content_count, content_bytes
         ]
         mock_cursor.fetchall.return_value = [
             ('nytimes.com', 25, 0.9),